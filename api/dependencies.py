@@ -1,4 +1,13 @@
-"""Shared dependencies for FastAPI endpoints."""
+"""Shared dependencies for FastAPI endpoints.
+
+Routers whose work is database queries are ``async def`` and use
+``execute_query_async`` on the API's async engine, so a request waiting on
+Postgres holds neither a threadpool worker nor a connection beyond its
+query. The pool is sized for the API (API_DB_POOL_SIZE,
+API_DB_MAX_OVERFLOW, API_DB_POOL_TIMEOUT) and opened and disposed by the
+application lifespan (``init_async_db`` / ``close_async_db``).
+``execute_query`` stays for sync routers and CLI use.
+"""
 
 import hmac  # noqa: F401 — used in verify_api_key
 from typing import Any
@@ -8,6 +17,8 @@ from fastapi.security import APIKeyHeader
 from sqlalchemy import text
 
 from shit.config.shitpost_settings import settings
+from shit.db.database_client import DatabaseClient
+from shit.db.database_config import DatabaseConfig
 from shit.db.sync_session import SessionLocal
 from shit.logging import get_service_logger
 
@@ -42,3 +53,47 @@ def execute_query(
     except Exception as e:
         logger.error(f"Database query error: {e}")
         raise
+
+
+_async_db: DatabaseClient | None = None
+
+
+async def init_async_db() -> DatabaseClient:
+    """Create the API's async engine and pool (idempotent)."""
+    global _async_db
+    if _async_db is None:
+        client = DatabaseClient(
+            DatabaseConfig(
+                database_url=settings.DATABASE_URL.strip('"').strip("'"),
+                pool_size=settings.API_DB_POOL_SIZE,
+                max_overflow=settings.API_DB_MAX_OVERFLOW,
+                pool_timeout=settings.API_DB_POOL_TIMEOUT,
+                pool_recycle=1800,
+                pool_pre_ping=True,
+            )
+        )
+        await client.initialize(create_tables=False)
+        _async_db = client
+    return _async_db
+
+
+async def close_async_db() -> None:
+    """Dispose of the async engine's connections."""
+    global _async_db
+    if _async_db is not None:
+        await _async_db.cleanup()
+        _async_db = None
+
+
+async def execute_query_async(
+    query: str, params: dict[str, Any] | None = None
+) -> tuple[list, list]:
+    """Async ``execute_query``: run raw SQL and return (rows, column_names)."""
+    db = await init_async_db()
+    try:
+        async with db.get_session() as session:
+            result = await session.execute(text(query), params or {})
+            return result.fetchall(), list(result.keys())
+    except Exception as e:
+        logger.error(f"Database query error: {e}")
+        raise
@@ -4,6 +4,7 @@ Serves the React frontend and JSON API for the single-post feed experience.
 """
 
 import os
+from contextlib import asynccontextmanager
 
 from fastapi import Depends, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
@@ -12,16 +13,29 @@ from fastapi.staticfiles import StaticFiles
 from slowapi import _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
 
+from api.dependencies import close_async_db, init_async_db
 from api.dependencies import verify_api_key  # noqa: F401 — used in router deps
 from api.middleware import SecurityHeadersMiddleware
 from api.rate_limit import limiter
-from api.routers import calibration, echoes, feed, prices, telegram
+from api.routers import calibration, echoes, events, feed, prices, telegram
+from api.services.feed_cache import feed_cache_listener
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Open the async DB pool and listen for feed cache invalidations."""
+    await init_async_db()
+    feed_cache_listener.start()
+    yield
+    feed_cache_listener.stop()
+    await close_async_db()
 
 
 app = FastAPI(
     title="Shitpost Alpha API",
     description="Weaponizing Shitposts for American Profit",
     version="2.0.0",
+    lifespan=lifespan,
 )
 
 # Rate limiting
@@ -60,6 +74,9 @@ app.include_router(
 app.include_router(
     echoes.router, prefix="/api/echoes", tags=["echoes"], dependencies=_auth
 )
+app.include_router(
+    events.router, prefix="/api/events", tags=["events"], dependencies=_auth
+)
 app.include_router(feed.router, prefix="/api/feed", tags=["feed"], dependencies=_auth)
 app.include_router(
     prices.router, prefix="/api/prices", tags=["prices"], dependencies=_auth
@@ -1,80 +1,123 @@
 """Feed queries for the single-post-at-a-time API.
 
 Only returns posts with completed LLM analysis and non-empty assets.
+
+Navigation runs against the narrow ``feed_index`` table (maintained by
+shitvault/feed_index.py), ordered newest first by
+``(published_at, prediction_id)``: a keyset step from a cursor costs the
+same at any depth, and the full post row is joined for the one target
+prediction only. The total post count is cached for
+``TOTAL_COUNT_TTL_SECONDS``.
 """
 
 import json
+import threading
+import time
+from datetime import datetime
 from typing import Any, Optional
 
-from api.dependencies import execute_query
+from api.dependencies import execute_query_async
 
+# Seconds a feed total count is reused before it is recounted
+TOTAL_COUNT_TTL_SECONDS = 60
 
-def get_analyzed_post_at_offset(
-    offset: int = 0,
-) -> Optional[tuple[dict[str, Any], int]]:
-    """Get the Nth most recent analyzed post and the total count.
+_TARGET_AT_OFFSET = """
+    SELECT prediction_id FROM feed_index
+    WHERE has_assets
+    ORDER BY published_at DESC, prediction_id DESC
+    OFFSET :offset
+    LIMIT 1
+"""
 
-    Uses COUNT(*) OVER() to get both in a single query, avoiding
-    a separate round trip for the total count.
+_TARGET_OLDER = """
+    SELECT prediction_id FROM feed_index
+    WHERE has_assets
+        AND (published_at, prediction_id) < (:published_at, :prediction_id)
+    ORDER BY published_at DESC, prediction_id DESC
+    LIMIT 1
+"""
 
-    Args:
-        offset: 0 = latest, 1 = one older, etc.
+_TARGET_NEWER = """
+    SELECT prediction_id FROM feed_index
+    WHERE has_assets
+        AND (published_at, prediction_id) > (:published_at, :prediction_id)
+    ORDER BY published_at ASC, prediction_id ASC
+    LIMIT 1
+"""
+
+_POST_QUERY = """
+    WITH target AS ({target})
+    SELECT
+        s.signal_id,
+        s.text,
+        s.content_html,
+        s.published_at AS timestamp,
+        s.author_username AS username,
+        s.source_url AS url,
+        s.replies_count,
+        s.shares_count AS reblogs_count,
+        s.likes_count AS favourites_count,
+        (s.platform_data->>'upvotes_count')::int AS upvotes_count,
+        (s.platform_data->>'downvotes_count')::int AS downvotes_count,
+        s.author_verified AS account_verified,
+        s.author_followers AS account_followers_count,
+        s.platform_data->'card' AS card,
+        s.platform_data->'media_attachments' AS media_attachments,
+        s.platform_data->>'in_reply_to_id' AS in_reply_to_id,
+        s.platform_data->'in_reply_to' AS in_reply_to,
+        s.platform_data->'reblog' AS reblog,
+        p.id AS prediction_id,
+        p.assets,
+        p.market_impact,
+        p.confidence,
+        p.calibrated_confidence,
+        p.thesis,
+        p.analysis_status,
+        p.engagement_score,
+        p.viral_score,
+        p.sentiment_score,
+        p.urgency_score,
+        p.ensemble_results,
+        p.ensemble_metadata
+    FROM target t
+    INNER JOIN predictions p ON p.id = t.prediction_id
+    INNER JOIN signals s ON s.signal_id = p.signal_id
+"""
+
+_total_lock = threading.Lock()
+_total_cache: dict[str, Any] = {"value": None, "expires_at": 0.0}
+
+
+async def get_feed_total() -> int:
+    """Number of posts in the feed, recounted at most every TTL seconds."""
+    with _total_lock:
+        fresh = time.monotonic() < _total_cache["expires_at"]
+        if fresh and _total_cache["value"] is not None:
+            return _total_cache["value"]
+
+    rows, _ = await execute_query_async("SELECT COUNT(*) FROM feed_index WHERE has_assets")
+    total = int(rows[0][0]) if rows else 0
+
+    with _total_lock:
+        _total_cache["value"] = total
+        _total_cache["expires_at"] = time.monotonic() + TOTAL_COUNT_TTL_SECONDS
+    return total
+
+
+def clear_feed_total_cache() -> None:
+    """Forget the cached total so the next request recounts."""
+    with _total_lock:
+        _total_cache["value"] = None
+        _total_cache["expires_at"] = 0.0
 
-    Returns:
-        Tuple of (post+prediction dict, total_count), or None if out of range.
-    """
-    query = """
-        SELECT
-            s.signal_id,
-            s.text,
-            s.content_html,
-            s.published_at AS timestamp,
-            s.author_username AS username,
-            s.source_url AS url,
-            s.replies_count,
-            s.shares_count AS reblogs_count,
-            s.likes_count AS favourites_count,
-            (s.platform_data->>'upvotes_count')::int AS upvotes_count,
-            (s.platform_data->>'downvotes_count')::int AS downvotes_count,
-            s.author_verified AS account_verified,
-            s.author_followers AS account_followers_count,
-            s.platform_data->'card' AS card,
-            s.platform_data->'media_attachments' AS media_attachments,
-            s.platform_data->>'in_reply_to_id' AS in_reply_to_id,
-            s.platform_data->'in_reply_to' AS in_reply_to,
-            s.platform_data->'reblog' AS reblog,
-            p.id AS prediction_id,
-            p.assets,
-            p.market_impact,
-            p.confidence,
-            p.calibrated_confidence,
-            p.thesis,
-            p.analysis_status,
-            p.engagement_score,
-            p.viral_score,
-            p.sentiment_score,
-            p.urgency_score,
-            p.ensemble_results,
-            p.ensemble_metadata,
-            COUNT(*) OVER() AS total_count
-        FROM signals s
-        INNER JOIN predictions p ON s.signal_id = p.signal_id
-        WHERE p.analysis_status = 'completed'
-            AND p.confidence IS NOT NULL
-            AND p.assets IS NOT NULL
-            AND p.assets::text <> '[]'
-            AND p.assets::text <> 'null'
-        ORDER BY s.published_at DESC
-        OFFSET :offset
-        LIMIT 1
-    """
 
-    rows, columns = execute_query(query, {"offset": offset})
+async def _fetch_post(target: str, params: dict[str, Any]) -> Optional[dict[str, Any]]:
+    """Run the post query for a feed_index target subquery."""
+    rows, columns = await execute_query_async(_POST_QUERY.format(target=target), params)
     if not rows:
         return None
 
     row = dict(zip(columns, rows[0]))
-    total = row.pop("total_count", 0)
 
     # Parse JSON fields
     json_keys = (
@@ -89,10 +132,54 @@ def get_analyzed_post_at_offset(
         if isinstance(row.get(key), str):
             row[key] = json.loads(row[key])
 
-    return row, int(total)
+    return row
+
+
+async def get_analyzed_post_at_offset(
+    offset: int = 0,
+) -> Optional[tuple[dict[str, Any], int]]:
+    """Get the Nth most recent analyzed post and the total count.
+
+    The OFFSET walks only the narrow feed_index order index; cursor
+    navigation (``get_analyzed_post_from``) avoids even that.
+
+    Args:
+        offset: 0 = latest, 1 = one older, etc.
+
+    Returns:
+        Tuple of (post+prediction dict, total_count), or None if out of range.
+    """
+    row = await _fetch_post(_TARGET_AT_OFFSET, {"offset": offset})
+    if row is None:
+        return None
+    return row, await get_feed_total()
+
+
+async def get_analyzed_post_from(
+    published_at: datetime,
+    prediction_id: int,
+    direction: str = "older",
+) -> Optional[tuple[dict[str, Any], int]]:
+    """Get the post adjacent to a feed position, and the total count.
+
+    Args:
+        published_at: Publish time of the current post (cursor position).
+        prediction_id: Prediction id of the current post (tie-breaker).
+        direction: "older" or "newer".
+
+    Returns:
+        Tuple of (post+prediction dict, total_count), or None at the end.
+    """
+    target = _TARGET_OLDER if direction == "older" else _TARGET_NEWER
+    row = await _fetch_post(
+        target, {"published_at": published_at, "prediction_id": prediction_id}
+    )
+    if row is None:
+        return None
+    return row, await get_feed_total()
 
 
-def get_outcomes_for_prediction(prediction_id: int) -> list[dict[str, Any]]:
+async def get_outcomes_for_prediction(prediction_id: int) -> list[dict[str, Any]]:
     """Get all prediction_outcomes with ticker fundamentals and price snapshots.
 
     Single query joins outcomes, ticker_registry, and price_snapshots,
@@ -163,5 +250,5 @@ def get_outcomes_for_prediction(prediction_id: int) -> list[dict[str, Any]]:
         ORDER BY po.symbol
     """
 
-    rows, columns = execute_query(query, {"prediction_id": prediction_id})
+    rows, columns = await execute_query_async(query, {"prediction_id": prediction_id})
     return [dict(zip(columns, row)) for row in rows]
@@ -2,14 +2,34 @@
 
 Fetches live OHLCV data from yfinance for fresh charts.
 Falls back to the market_prices database table if yfinance fails.
+
+Candles and live quotes go through ``SharedCache`` (api/shared_cache.py):
+concurrent misses for a key share one yfinance call across threads and
+uvicorn workers, and stale entries are served while they refresh. Candles
+are also kept in a per-process LRU so hot keys skip the SQLite read.
+
+The batch functions resolve many symbols per request: cache misses cost
+one multi-ticker yfinance download and one ``market_prices`` query for
+whatever yfinance lacks. Candles are cached per symbol, shared with the
+single-symbol path; batch live quotes are derived from daily bars rather
+than ``fast_info`` and have their own cache namespace. Batch candles come back columnar (parallel
+date/OHLCV arrays) to keep the payload compact.
+
+The public functions are coroutines: blocking yfinance calls (and the
+SharedCache they go through) run in ``asyncio.to_thread``, and the
+``market_prices`` fallback runs on the async engine
+(``execute_query_async``). Database fallback candles are kept in the
+per-process LRU only; SharedCache holds what yfinance returned.
 """
 
+import asyncio
 import time
 from collections import OrderedDict
 from datetime import datetime, timedelta, date
 from typing import Any, Optional
 
-from api.dependencies import execute_query, logger
+from api.dependencies import execute_query_async, logger
+from api.shared_cache import SharedCache
 
 # Bounded TTL cache: avoid hammering yfinance on repeated requests. LRU-evicts
 # past _CACHE_MAX so distinct (symbol, days) keys can't grow the dict forever.
@@ -17,8 +37,37 @@ _price_cache: OrderedDict[
     tuple[str, int], tuple[list[dict[str, Any]], float]
 ] = OrderedDict()
 _CACHE_TTL = 300  # 5 minutes
+_CACHE_STALE = 900  # served while refreshing for up to 15 more minutes
 _CACHE_MAX = 256  # max distinct (symbol, days) entries retained
 
+_LIVE_TTL = 15  # seconds
+_LIVE_STALE = 45
+
+BATCH_MAX_SYMBOLS = 50  # symbols per batch request (one yfinance download)
+
+_candle_store = SharedCache("candles", ttl_seconds=_CACHE_TTL, stale_seconds=_CACHE_STALE)
+_live_store = SharedCache("live", ttl_seconds=_LIVE_TTL, stale_seconds=_LIVE_STALE)
+# Batch quotes come from daily bars, not fast_info, so they are cached apart
+_batch_live_store = SharedCache(
+    "live_batch", ttl_seconds=_LIVE_TTL, stale_seconds=_LIVE_STALE
+)
+
+
+def _candle(row_date, open_, high, low, close, volume) -> dict[str, Any]:
+    """A Candle dict, with missing values as 0."""
+    return {
+        "date": str(row_date),
+        "open": float(open_) if open_ is not None else 0,
+        "high": float(high) if high is not None else 0,
+        "low": float(low) if low is not None else 0,
+        "close": float(close) if close is not None else 0,
+        "volume": int(volume) if volume is not None else 0,
+    }
+
+
+def _record_candles(records) -> list[dict[str, Any]]:
+    return [_candle(r.date, r.open, r.high, r.low, r.close, r.volume) for r in records]
+
 
 def _fetch_from_yfinance(symbol: str, start: date, end: date) -> list[dict[str, Any]]:
     """Fetch OHLCV candles via the existing YFinanceProvider."""
@@ -27,79 +76,224 @@ def _fetch_from_yfinance(symbol: str, start: date, end: date) -> list[dict[str,
 
     try:
         provider = YFinanceProvider()
-        records = provider.fetch_prices(symbol, start, end)
-        return [
-            {
-                "date": str(r.date),
-                "open": float(r.open) if r.open is not None else 0,
-                "high": float(r.high) if r.high is not None else 0,
-                "low": float(r.low) if r.low is not None else 0,
-                "close": float(r.close) if r.close is not None else 0,
-                "volume": int(r.volume) if r.volume is not None else 0,
-            }
-            for r in records
-        ]
+        return _record_candles(provider.fetch_prices(symbol, start, end))
     except ProviderError as e:
         logger.warning(f"YFinanceProvider failed for {symbol}: {e}")
         return []
 
 
-def _fetch_from_database(symbol: str, start: date) -> list[dict[str, Any]]:
-    """Fallback: fetch from market_prices database table."""
+def _fetch_bulk_from_yfinance(
+    symbols: list[str], start: date, end: date
+) -> dict[str, list[dict[str, Any]]]:
+    """Fetch candles for many symbols with one multi-ticker download."""
+    from shit.market_data.yfinance_provider import YFinanceProvider
+    from shit.market_data.price_provider import ProviderError
+
+    try:
+        records = YFinanceProvider().fetch_prices_bulk(symbols, start, end)
+    except ProviderError as e:
+        logger.warning(f"YFinanceProvider bulk fetch failed for {symbols}: {e}")
+        return {}
+    return {symbol: _record_candles(recs) for symbol, recs in records.items()}
+
+
+async def _load_symbol_rows(symbol: str) -> list:
+    """Load a symbol's full market_prices history for the shared price cache."""
     query = """
         SELECT date, open, high, low, close, volume
         FROM market_prices
-        WHERE symbol = :symbol AND date >= :start_date
+        WHERE symbol = :symbol
         ORDER BY date ASC
     """
-    rows, columns = execute_query(
-        query, {"symbol": symbol.upper(), "start_date": start}
-    )
+    rows, _ = await execute_query_async(query, {"symbol": symbol})
+    return rows
 
-    return [
-        {
-            "date": str(row_dict["date"]),
-            "open": float(row_dict["open"]) if row_dict["open"] is not None else 0,
-            "high": float(row_dict["high"]) if row_dict["high"] is not None else 0,
-            "low": float(row_dict["low"]) if row_dict["low"] is not None else 0,
-            "close": float(row_dict["close"]) if row_dict["close"] is not None else 0,
-            "volume": int(row_dict["volume"]) if row_dict["volume"] is not None else 0,
-        }
-        for row_dict in (dict(zip(columns, row)) for row in rows)
-    ]
 
+async def _fetch_from_database(symbol: str, start: date) -> list[dict[str, Any]]:
+    """Fallback: read from market_prices via the shared in-process price cache."""
+    from shit.market_data.price_cache import price_cache
 
-def _get_candles(symbol: str, days: int) -> list[dict[str, Any]]:
-    """Get candles with TTL caching. Tries yfinance first, DB fallback."""
-    cache_key = (symbol.upper(), days)
-    now = time.time()
+    series = await price_cache.aget(symbol.upper(), _load_symbol_rows)
 
-    if cache_key in _price_cache:
-        cached_candles, cached_at = _price_cache[cache_key]
-        if now - cached_at < _CACHE_TTL:
-            _price_cache.move_to_end(cache_key)  # mark most-recently-used
-            return cached_candles
+    return [_candle(*row) for row in series.rows_since(start)]
+
+
+async def _fetch_bulk_from_database(
+    symbols: list[str], start: date
+) -> dict[str, list[dict[str, Any]]]:
+    """Fallback for many symbols: one market_prices query for all of them."""
+    params: dict[str, Any] = {f"symbol_{i}": symbol for i, symbol in enumerate(symbols)}
+    params["start"] = start
+    placeholders = ", ".join(f":symbol_{i}" for i in range(len(symbols)))
+    query = f"""
+        SELECT symbol, date, open, high, low, close, volume
+        FROM market_prices
+        WHERE symbol IN ({placeholders})
+            AND date >= :start
+        ORDER BY symbol, date ASC
+    """
+    rows, _ = await execute_query_async(query, params)
+
+    candles: dict[str, list[dict[str, Any]]] = {symbol: [] for symbol in symbols}
+    for symbol, *row in rows:
+        candles[symbol].append(_candle(*row))
+    return candles
 
-    start_date = (datetime.now() - timedelta(days=days)).date()
-    end_date = datetime.now().date()
 
-    candles = _fetch_from_yfinance(symbol.upper(), start_date, end_date)
+def _start_date(days: int) -> date:
+    return (datetime.now() - timedelta(days=days)).date()
+
+
+def _fetch_candles(symbol: str, days: int) -> list[dict[str, Any]]:
+    """Fetch candles from yfinance (blocking); empty if it has none."""
+    candles = _fetch_from_yfinance(symbol, _start_date(days), datetime.now().date())
     if candles:
         logger.info(
             f"Fetched {len(candles)} candles from yfinance for {symbol}",
             extra={"symbol": symbol, "count": len(candles)},
         )
-    else:
-        candles = _fetch_from_database(symbol.upper(), start_date)
+    return candles
+
+
+def _fetch_candles_bulk(
+    symbols: list[str], days: int
+) -> dict[str, list[dict[str, Any]]]:
+    """``_fetch_candles`` for many symbols with one download."""
+    candles = _fetch_bulk_from_yfinance(
+        symbols, _start_date(days), datetime.now().date()
+    )
+    logger.info(
+        f"Fetched candles from yfinance for {len(candles)}/{len(symbols)} symbols",
+        extra={"symbols": symbols, "count": len(candles)},
+    )
+    return {symbol: candles.get(symbol, []) for symbol in symbols}
+
+
+def _cached_candles(symbol: str, days: int) -> Optional[list[dict[str, Any]]]:
+    """Candles from the per-process LRU, if fresh."""
+    cache_key = (symbol, days)
+    if cache_key in _price_cache:
+        cached_candles, cached_at = _price_cache[cache_key]
+        if time.time() - cached_at < _CACHE_TTL:
+            _price_cache.move_to_end(cache_key)  # mark most-recently-used
+            return cached_candles
+    return None
+
 
-    _price_cache[cache_key] = (candles, now)
+def _remember_candles(
+    symbol: str, days: int, candles: list[dict[str, Any]], fetched_at: float
+) -> None:
+    cache_key = (symbol, days)
+    _price_cache[cache_key] = (candles, fetched_at)
     _price_cache.move_to_end(cache_key)  # mark most-recently-used
     while len(_price_cache) > _CACHE_MAX:
         _price_cache.popitem(last=False)  # evict least-recently-used
+
+
+async def _get_candles(symbol: str, days: int) -> list[dict[str, Any]]:
+    """Get candles with TTL caching. Tries yfinance first, DB fallback."""
+    symbol = symbol.upper()
+    cached = _cached_candles(symbol, days)
+    if cached is not None:
+        return cached
+
+    candles, fetched_at = await asyncio.to_thread(
+        _candle_store.get_entry,
+        f"{symbol}:{days}",
+        lambda: _fetch_candles(symbol, days),
+    )
+    if not candles:
+        candles = await _fetch_from_database(symbol, _start_date(days))
+        fetched_at = time.time()
+    _remember_candles(symbol, days, candles, fetched_at)
+    return candles
+
+
+async def _get_candles_batch(
+    symbols: list[str], days: int
+) -> dict[str, list[dict[str, Any]]]:
+    """``_get_candles`` for many symbols, fetching all misses together."""
+    candles: dict[str, list[dict[str, Any]]] = {}
+    keys: dict[str, str] = {}
+    for symbol in symbols:
+        cached = _cached_candles(symbol, days)
+        if cached is not None:
+            candles[symbol] = cached
+        else:
+            keys[f"{symbol}:{days}"] = symbol
+    if not keys:
+        return candles
+
+    def fetch_many(due: list[str]) -> dict[str, list[dict[str, Any]]]:
+        fetched = _fetch_candles_bulk([keys[key] for key in due], days)
+        return {f"{symbol}:{days}": rows for symbol, rows in fetched.items()}
+
+    entries = await asyncio.to_thread(_candle_store.get_many, list(keys), fetch_many)
+    missing = []
+    for key, symbol in keys.items():
+        rows, fetched_at = entries.get(key, ([], 0.0))
+        if rows:
+            _remember_candles(symbol, days, rows, fetched_at)
+            candles[symbol] = rows
+        else:
+            missing.append(symbol)
+
+    if missing:
+        fetched_at = time.time()
+        fallback = await _fetch_bulk_from_database(missing, _start_date(days))
+        for symbol in missing:
+            _remember_candles(symbol, days, fallback[symbol], fetched_at)
+            candles[symbol] = fallback[symbol]
     return candles
 
 
-def get_price_data(
+def _quote_dict(quote) -> dict[str, Any]:
+    """A LiveQuote as LiveQuoteResponse fields."""
+    return {
+        "symbol": quote.symbol,
+        "price": quote.price,
+        "previous_close": quote.previous_close,
+        "day_high": quote.day_high,
+        "day_low": quote.day_low,
+        "volume": quote.volume,
+        "captured_at": quote.captured_at.isoformat(),
+    }
+
+
+def _fetch_live_quote(symbol: str) -> Optional[dict[str, Any]]:
+    """Fetch a live quote from yfinance as a LiveQuoteResponse dict."""
+    from shit.market_data.yfinance_provider import fetch_live_quote
+
+    quote = fetch_live_quote(symbol)
+    return _quote_dict(quote) if quote is not None else None
+
+
+def _fetch_live_quotes(symbols: list[str]) -> dict[str, Optional[dict[str, Any]]]:
+    """Fetch live quotes for many symbols with one yfinance call (None if missing)."""
+    from shit.market_data.yfinance_provider import fetch_live_quotes
+
+    quotes = fetch_live_quotes(symbols)
+    return {
+        symbol: _quote_dict(quotes[symbol]) if symbol in quotes else None
+        for symbol in symbols
+    }
+
+
+async def get_live_quote_data(symbol: str) -> Optional[dict[str, Any]]:
+    """Get the live quote for a symbol, shared and refreshed every few seconds.
+
+    Misses are cached too, so a bad symbol costs one yfinance call per TTL.
+
+    Returns:
+        LiveQuoteResponse fields, or None if yfinance has no quote.
+    """
+    symbol = symbol.upper()
+    return await asyncio.to_thread(
+        _live_store.get, symbol, lambda: _fetch_live_quote(symbol)
+    )
+
+
+async def get_price_data(
     symbol: str,
     days: int = 30,
     post_timestamp: Optional[str] = None,
@@ -109,7 +303,7 @@ def get_price_data(
     Fetches directly from yfinance for fresh data (with 5-min TTL cache).
     Falls back to the market_prices database if yfinance is unavailable.
     """
-    candles = _get_candles(symbol, days)
+    candles = await _get_candles(symbol, days)
 
     # Find the candle index closest to the post timestamp
     post_date_index = None
@@ -137,3 +331,68 @@ def get_price_data(
         "candles": candles,
         "post_date_index": post_date_index,
     }
+
+
+async def get_batch_price_data(symbols: list[str], days: int = 30) -> dict[str, Any]:
+    """Get OHLCV candles for many symbols as columnar series.
+
+    Args:
+        symbols: Upper-case ticker symbols, without duplicates.
+        days: Calendar days of data.
+
+    Returns:
+        BatchPriceResponse fields: a series of parallel date/OHLCV arrays
+        per symbol with data, and the symbols without any.
+    """
+    candles = await _get_candles_batch(symbols, days)
+    series = {}
+    missing = []
+    for symbol in symbols:
+        rows = candles.get(symbol)
+        if not rows:
+            missing.append(symbol)
+            continue
+        series[symbol] = {
+            "dates": [c["date"] for c in rows],
+            "open": [c["open"] for c in rows],
+            "high": [c["high"] for c in rows],
+            "low": [c["low"] for c in rows],
+            "close": [c["close"] for c in rows],
+            "volume": [c["volume"] for c in rows],
+        }
+    return {"days": days, "series": series, "missing": missing}
+
+
+async def get_batch_live_quote_data(symbols: list[str]) -> dict[str, Any]:
+    """Get live quotes for many symbols as parallel arrays.
+
+    Misses are fetched with one multi-ticker yfinance call. The quotes are
+    read from daily bars: outside market hours ``previous_close`` is the
+    close before the latest session, not the ``fast_info`` value that
+    ``get_live_quote_data`` returns, so the two are cached separately.
+
+    Args:
+        symbols: Upper-case ticker symbols, without duplicates.
+
+    Returns:
+        BatchLiveQuoteResponse fields: one array per quote field, indexed
+        like ``symbols``, and the symbols yfinance has no quote for.
+    """
+    entries = await asyncio.to_thread(
+        _batch_live_store.get_many, symbols, _fetch_live_quotes
+    )
+    quotes = []
+    missing = []
+    for symbol in symbols:
+        quote = entries[symbol][0] if symbol in entries else None
+        if quote is None:
+            missing.append(symbol)
+        else:
+            quotes.append(quote)
+
+    fields = ("price", "previous_close", "day_high", "day_low", "volume", "captured_at")
+    return {
+        "symbols": [q["symbol"] for q in quotes],
+        **{field: [q[field] for q in quotes] for field in fields},
+        "missing": missing,
+    }
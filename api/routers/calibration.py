@@ -8,6 +8,8 @@ from api.schemas.calibration import CalibrationCurveResponse
 router = APIRouter()
 
 
+# Plain def: CalibrationService loads the curve through a sync ORM session,
+# so FastAPI runs this on its threadpool rather than the event loop
 @router.get("/curve", response_model=CalibrationCurveResponse)
 @limiter.limit("10/minute")
 def get_calibration_curve(
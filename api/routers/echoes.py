@@ -7,6 +7,8 @@ from api.rate_limit import limiter
 router = APIRouter()
 
 
+# Plain def: EchoService queries through sync ORM sessions, so FastAPI runs
+# this on its threadpool rather than the event loop
 @router.get("/for-prediction/{prediction_id}")
 @limiter.limit("30/minute")
 def get_echoes(
@@ -0,0 +1,32 @@
+"""Event queue metrics API endpoint."""
+
+from fastapi import APIRouter, Query, Request
+
+from api.rate_limit import limiter
+from api.schemas.events import QueueMetricsResponse
+
+router = APIRouter()
+
+
+@router.get("/metrics", response_model=QueueMetricsResponse)
+@limiter.limit("30/minute")
+def get_queue_metrics(
+    request: Request,
+    window_minutes: int = Query(default=60, ge=1, le=1440),
+):
+    """Per-consumer-group queue depth, lag, throughput and latency.
+
+    Args:
+        window_minutes: Window for throughput, failures and latency
+            (default 60, max 1440).
+    """
+    from shit.db.sync_session import get_session
+    from shit.events.metrics import collect_queue_metrics
+
+    with get_session() as session:
+        metrics = collect_queue_metrics(session, window_minutes=window_minutes)
+
+    return QueueMetricsResponse(
+        window_minutes=window_minutes,
+        consumer_groups=[m.to_dict() for m in metrics],
+    )
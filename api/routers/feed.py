@@ -1,9 +1,12 @@
 """Feed API router — single-post-at-a-time endpoint."""
 
-from fastapi import APIRouter, HTTPException, Query, Request
+from typing import Literal, Optional
+
+from fastapi import APIRouter, HTTPException, Query, Request, Response
 
 from api.rate_limit import limiter
 from api.schemas.feed import FeedResponse
+from api.services.feed_cache import CachedResponse
 from api.services.feed_service import FeedService
 
 router = APIRouter()
@@ -12,9 +15,40 @@ _service = FeedService()
 
 @router.get("/at", response_model=FeedResponse)
 @limiter.limit("60/minute")
-def get_post_at_offset(request: Request, offset: int = Query(default=0, ge=0)):
-    """Get the Nth most recent analyzed shitpost."""
-    result = _service.get_feed_response(offset)
+async def get_post_at_offset(
+    request: Request,
+    offset: int = Query(default=0, ge=0),
+    cursor: Optional[str] = Query(default=None),
+    direction: Literal["older", "newer"] = Query(default="older"),
+):
+    """Get the Nth most recent analyzed shitpost.
+
+    With ``cursor`` (a previous response's ``navigation.cursor``), returns
+    the post one step ``direction`` from it instead; ``offset`` is ignored.
+    Cursor steps cost the same at any scroll depth.
+
+    Responses are cached and carry an ``ETag``; a matching
+    ``If-None-Match`` gets a 304.
+    """
+    if cursor is not None:
+        try:
+            result = await _service.cached_feed_response_from_cursor(cursor, direction)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        if result is None:
+            raise HTTPException(status_code=404, detail=f"No {direction} post")
+        return _respond(request, result)
+
+    result = await _service.cached_feed_response(offset)
     if result is None:
         raise HTTPException(status_code=404, detail="No post found at this offset")
-    return result
+    return _respond(request, result)
+
+
+def _respond(request: Request, cached: CachedResponse) -> Response:
+    """The cached JSON body, or a 304 if the client already has it."""
+    # no-cache: clients may store the response but must revalidate it
+    headers = {"ETag": cached.etag, "Cache-Control": "no-cache"}
+    if cached.matches(request.headers.get("if-none-match")):
+        return Response(status_code=304, headers=headers)
+    return Response(content=cached.body, media_type="application/json", headers=headers)
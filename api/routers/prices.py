@@ -4,40 +4,90 @@ from typing import Optional
 
 from fastapi import APIRouter, HTTPException, Query, Request
 
-from api.queries.price_queries import get_price_data
+from api.queries.price_queries import (
+    BATCH_MAX_SYMBOLS,
+    get_batch_live_quote_data,
+    get_batch_price_data,
+    get_live_quote_data,
+    get_price_data,
+)
 from api.rate_limit import limiter
-from api.schemas.feed import LiveQuoteResponse, PriceResponse
+from api.schemas.feed import (
+    BatchLiveQuoteResponse,
+    BatchPriceResponse,
+    LiveQuoteResponse,
+    PriceResponse,
+)
 
 router = APIRouter()
 
 
+def _parse_symbols(symbols: str) -> list[str]:
+    """Upper-case, de-duplicated symbols from a comma-separated list."""
+    parsed = [s.strip().upper() for s in symbols.split(",") if s.strip()]
+    parsed = list(dict.fromkeys(parsed))
+    if not parsed:
+        raise HTTPException(status_code=400, detail="No symbols given")
+    if len(parsed) > BATCH_MAX_SYMBOLS:
+        raise HTTPException(
+            status_code=400, detail=f"At most {BATCH_MAX_SYMBOLS} symbols per request"
+        )
+    return parsed
+
+
+# Batch routes must precede /{symbol}, which would otherwise match "batch"
+@router.get("/batch", response_model=BatchPriceResponse)
+@limiter.limit("30/minute")
+async def get_prices_batch(
+    request: Request,
+    symbols: str = Query(..., description="Comma-separated tickers, e.g. AAPL,TSLA"),
+    days: int = Query(default=30, ge=1, le=365),
+):
+    """Get OHLCV price data for many symbols in one request.
+
+    Misses are fetched with one multi-ticker yfinance download, falling
+    back to one market_prices query. Each symbol's candles come back as
+    parallel date/OHLCV arrays; symbols without data are listed in
+    ``missing``.
+    """
+    data = await get_batch_price_data(_parse_symbols(symbols), days)
+    return BatchPriceResponse(**data)
+
+
+@router.get("/live/batch", response_model=BatchLiveQuoteResponse)
+@limiter.limit("30/minute")
+async def get_live_quotes_batch(
+    request: Request,
+    symbols: str = Query(..., description="Comma-separated tickers, e.g. AAPL,TSLA"),
+):
+    """Get live prices for many symbols in one request.
+
+    Misses are fetched with one multi-ticker yfinance call from daily
+    bars, cached apart from the single-symbol quotes. Symbols without a
+    quote are listed in ``missing``.
+    """
+    data = await get_batch_live_quote_data(_parse_symbols(symbols))
+    return BatchLiveQuoteResponse(**data)
+
+
 @router.get("/{symbol}/live", response_model=LiveQuoteResponse)
 @limiter.limit("30/minute")
-def get_live_quote(request: Request, symbol: str):
+async def get_live_quote(request: Request, symbol: str):
     """Get the current live price for a symbol.
 
-    Uses yfinance fast_info for a lightweight single HTTP call (~300ms).
+    Uses yfinance fast_info for a lightweight single HTTP call (~300ms),
+    shared by concurrent requests and cached for a few seconds.
     Returns 404 if the symbol is invalid or yfinance is unavailable.
     """
-    from shit.market_data.yfinance_provider import fetch_live_quote
-
-    quote = fetch_live_quote(symbol.upper())
+    quote = await get_live_quote_data(symbol)
     if quote is None:
         raise HTTPException(status_code=404, detail=f"No quote available for {symbol}")
-    return LiveQuoteResponse(
-        symbol=quote.symbol,
-        price=quote.price,
-        previous_close=quote.previous_close,
-        day_high=quote.day_high,
-        day_low=quote.day_low,
-        volume=quote.volume,
-        captured_at=quote.captured_at.isoformat(),
-    )
+    return LiveQuoteResponse(**quote)
 
 
 @router.get("/{symbol}", response_model=PriceResponse)
 @limiter.limit("30/minute")
-def get_prices(
+async def get_prices(
     request: Request,
     symbol: str,
     days: int = Query(default=30, ge=1, le=365),
@@ -50,5 +100,5 @@ def get_prices(
         days: Calendar days of data (default 30, max 365).
         post_timestamp: ISO timestamp to mark on the chart.
     """
-    data = get_price_data(symbol, days, post_timestamp)
+    data = await get_price_data(symbol, days, post_timestamp)
     return PriceResponse(**data)
@@ -0,0 +1,31 @@
+"""Pydantic response models for the event queue metrics API."""
+
+from pydantic import BaseModel
+from typing import Optional
+
+
+class LatencyHistogram(BaseModel):
+    count: int
+    p50: Optional[float] = None
+    p95: Optional[float] = None
+    p99: Optional[float] = None
+    max: Optional[float] = None
+    buckets: dict[str, int]
+
+
+class ConsumerGroupMetrics(BaseModel):
+    consumer_group: str
+    pending: int
+    claimed: int
+    oldest_pending_age_seconds: Optional[float] = None
+    completed: int
+    failed: int
+    dead_lettered: int
+    throughput_per_minute: float
+    failure_rate: Optional[float] = None
+    latency: LatencyHistogram
+
+
+class QueueMetricsResponse(BaseModel):
+    window_minutes: int
+    consumer_groups: list[ConsumerGroupMetrics]
@@ -133,6 +133,8 @@ class Navigation(BaseModel):
     has_older: bool
     current_offset: int
     total_posts: int
+    # Opaque position of this post; pass back as ?cursor=...&direction=older|newer
+    cursor: Optional[str] = None
 
 
 class FeedResponse(BaseModel):
@@ -166,3 +168,31 @@ class PriceResponse(BaseModel):
     post_timestamp: Optional[str] = None
     candles: list[Candle]
     post_date_index: Optional[int] = None
+
+
+class PriceSeries(BaseModel):
+    # Parallel arrays, one element per trading day
+    dates: list[str]
+    open: list[float]
+    high: list[float]
+    low: list[float]
+    close: list[float]
+    volume: list[int]
+
+
+class BatchPriceResponse(BaseModel):
+    days: int
+    series: dict[str, PriceSeries]
+    missing: list[str]
+
+
+class BatchLiveQuoteResponse(BaseModel):
+    # Parallel arrays, one element per symbol with a quote
+    symbols: list[str]
+    price: list[float]
+    previous_close: list[Optional[float]]
+    day_high: list[Optional[float]]
+    day_low: list[Optional[float]]
+    volume: list[Optional[int]]
+    captured_at: list[str]
+    missing: list[str]
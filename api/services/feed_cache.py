@@ -0,0 +1,217 @@
+"""Feed response cache — serialized /api/feed/at responses, invalidated by events.
+
+Feed posts don't change once their outcomes mature, yet every request
+re-ran the post and outcome queries, market timing and Pydantic
+construction. The cache keeps each response as its JSON bytes plus a
+strong ETag (a hash of those bytes), keyed by the request (offset, or
+cursor and direction) and tagged with the prediction it shows, so a hot
+page is served without touching Postgres and a client revalidating with
+``If-None-Match`` gets a 304.
+
+Entries are invalidated by the events that change what the feed shows,
+received on the LISTEN/NOTIFY broadcast channel (``shit.events.notify``)
+by ``FeedCacheListener``:
+
+- ``prediction_created``: a new post shifts every offset and the total, so
+  everything is dropped (including the cached feed total);
+- ``outcomes_matured``: the payload is aggregate, so everything is dropped;
+- ``prices_backfilled``: only entries showing that prediction are dropped.
+
+On backends without LISTEN/NOTIFY (SQLite) and as a backstop for
+notifications missed while reconnecting, entries also expire after
+API_FEED_CACHE_TTL_SECONDS.
+"""
+
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Hashable, Iterable, Optional
+
+from api.queries.feed_queries import clear_feed_total_cache
+from api.schemas.feed import FeedResponse
+from shit.config.shitpost_settings import settings
+from shit.events.event_types import EventType
+from shit.logging import get_service_logger
+
+logger = get_service_logger("feed_cache")
+
+# Seconds the listener blocks per receive; bounds how long stop() waits
+LISTEN_TIMEOUT_SECONDS = 5.0
+
+# Seconds between reconnect attempts after the listening connection fails
+RECONNECT_DELAY_SECONDS = 10.0
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """A serialized feed response."""
+
+    prediction_id: int
+    body: bytes
+    etag: str
+    created_at: float
+
+    @classmethod
+    def from_response(cls, response: FeedResponse) -> "CachedResponse":
+        body = response.model_dump_json().encode()
+        etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+        return cls(response.prediction.prediction_id, body, etag, time.monotonic())
+
+    def matches(self, if_none_match: Optional[str]) -> bool:
+        """Whether an ``If-None-Match`` header value covers this response."""
+        if not if_none_match:
+            return False
+        tags = [tag.strip() for tag in if_none_match.split(",")]
+        return "*" in tags or any(tag.removeprefix("W/") == self.etag for tag in tags)
+
+
+class FeedResponseCache:
+    """Thread-safe LRU of CachedResponse keyed by request."""
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[Hashable, CachedResponse]" = OrderedDict()
+        self._generation = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    async def get(
+        self, key: Hashable, build: Callable[[], Awaitable[Optional[FeedResponse]]]
+    ) -> Optional[CachedResponse]:
+        """Return the cached response for *key*, calling *build* on a miss.
+
+        A None from *build* (no post) is returned but not cached.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and time.monotonic() - entry.created_at < self.ttl_seconds:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry
+            self.misses += 1
+            generation = self._generation
+
+        response = await build()
+        if response is None:
+            return None
+        entry = CachedResponse.from_response(response)
+
+        with self._lock:
+            # An invalidation during the build means it may show stale data
+            if generation == self._generation:
+                self._entries[key] = entry
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        return entry
+
+    def invalidate(self, prediction_ids: Iterable[int]) -> None:
+        """Drop entries showing any of *prediction_ids*."""
+        ids = set(prediction_ids)
+        with self._lock:
+            self._generation += 1
+            for key in [k for k, e in self._entries.items() if e.prediction_id in ids]:
+                del self._entries[key]
+
+    def invalidate_all(self) -> None:
+        """Drop every entry, and the feed total they were built with."""
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+        clear_feed_total_cache()
+
+    def apply_event(self, event_type: str, prediction_id: Optional[int] = None) -> None:
+        """Invalidate for a broadcast event (see the module docstring)."""
+        if event_type == EventType.PRICES_BACKFILLED and prediction_id is not None:
+            self.invalidate([prediction_id])
+        elif event_type in (
+            EventType.PREDICTION_CREATED,
+            EventType.OUTCOMES_MATURED,
+            EventType.PRICES_BACKFILLED,
+        ):
+            self.invalidate_all()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+class FeedCacheListener:
+    """Background thread applying broadcast events to a FeedResponseCache."""
+
+    def __init__(self, cache: FeedResponseCache):
+        self.cache = cache
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> bool:
+        """Start listening; False if the backend has no LISTEN/NOTIFY."""
+        from shit.db.sync_session import engine
+        from shit.events.notify import supports_notify
+
+        if not supports_notify(engine):
+            logger.info("No LISTEN/NOTIFY; feed cache relies on its TTL")
+            return False
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, args=(engine,), name="feed-cache-listener", daemon=True
+        )
+        self._thread.start()
+        return True
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=LISTEN_TIMEOUT_SECONDS + 1)
+            self._thread = None
+
+    def handle(self, payload: str) -> None:
+        """Apply one broadcast payload; malformed payloads are logged and ignored."""
+        try:
+            message = json.loads(payload)
+            self.cache.apply_event(message["event_type"], message.get("prediction_id"))
+        except (TypeError, ValueError, KeyError):
+            logger.warning(f"Ignoring malformed broadcast payload: {payload!r}")
+
+    def _run(self, engine) -> None:
+        from shit.events.notify import BROADCAST_CHANNEL, EventListener
+
+        while not self._stop.is_set():
+            listener = None
+            try:
+                listener = EventListener.open_channel(engine, BROADCAST_CHANNEL)
+                # Anything may have changed while we weren't listening
+                self.cache.invalidate_all()
+                while not self._stop.is_set():
+                    for payload in listener.receive(LISTEN_TIMEOUT_SECONDS):
+                        self.handle(payload)
+            except Exception:
+                logger.warning("Feed cache listener failed; reconnecting", exc_info=True)
+                self._stop.wait(RECONNECT_DELAY_SECONDS)
+            finally:
+                if listener:
+                    listener.close()
+
+
+# Process-wide cache shared by the feed router
+feed_response_cache = FeedResponseCache(
+    max_entries=settings.API_FEED_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.API_FEED_CACHE_TTL_SECONDS,
+)
+feed_cache_listener = FeedCacheListener(feed_response_cache)
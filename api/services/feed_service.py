@@ -1,10 +1,13 @@
 """Feed service — transforms raw query data into API response models."""
 
+import base64
+import json
 from datetime import datetime
 from typing import Any
 
 from api.queries.feed_queries import (
     get_analyzed_post_at_offset,
+    get_analyzed_post_from,
     get_outcomes_for_prediction,
 )
 from api.schemas.feed import (
@@ -23,26 +26,82 @@ from api.schemas.feed import (
     Returns,
     Scores,
 )
+from api.services.feed_cache import CachedResponse, feed_response_cache
 from shit.market_data.market_timing import (
     compute_market_timing,
     compute_marker_dates,
 )
 
 
+def encode_cursor(timestamp: Any, prediction_id: int, offset: int) -> str:
+    """Opaque feed position: the post's keyset key plus its display offset."""
+    ts = timestamp.isoformat() if hasattr(timestamp, "isoformat") else str(timestamp)
+    raw = json.dumps([ts, prediction_id, offset]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int, int]:
+    """Inverse of encode_cursor; raises ValueError for a malformed cursor."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        ts, prediction_id, offset = json.loads(base64.urlsafe_b64decode(padded))
+        return datetime.fromisoformat(ts), int(prediction_id), max(int(offset), 0)
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"Invalid feed cursor: {cursor!r}") from e
+
+
 class FeedService:
     """Assembles feed responses from query data and enrichment services."""
 
-    def get_feed_response(self, offset: int) -> FeedResponse | None:
+    async def get_feed_response(self, offset: int) -> FeedResponse | None:
         """Build a complete feed response for a given offset.
 
         Returns None if no post exists at the given offset.
         """
-        result = get_analyzed_post_at_offset(offset)
+        result = await get_analyzed_post_at_offset(offset)
         if result is None:
             return None
 
         row, total = result
-        outcomes_raw = get_outcomes_for_prediction(row["prediction_id"])
+        return await self.build_response(row, offset, total)
+
+    async def get_feed_response_from_cursor(
+        self, cursor: str, direction: str = "older"
+    ) -> FeedResponse | None:
+        """Build the feed response for the post next to a cursor.
+
+        Returns None when there is no post in that direction. Raises
+        ValueError for a malformed cursor.
+        """
+        published_at, prediction_id, offset = decode_cursor(cursor)
+        result = await get_analyzed_post_from(published_at, prediction_id, direction)
+        if result is None:
+            return None
+
+        row, total = result
+        offset = offset + 1 if direction == "older" else max(offset - 1, 0)
+        return await self.build_response(row, offset, total)
+
+    async def cached_feed_response(self, offset: int) -> CachedResponse | None:
+        """``get_feed_response`` served from the feed response cache."""
+        return await feed_response_cache.get(
+            ("offset", offset), lambda: self.get_feed_response(offset)
+        )
+
+    async def cached_feed_response_from_cursor(
+        self, cursor: str, direction: str = "older"
+    ) -> CachedResponse | None:
+        """``get_feed_response_from_cursor`` served from the feed response cache."""
+        return await feed_response_cache.get(
+            ("cursor", cursor, direction),
+            lambda: self.get_feed_response_from_cursor(cursor, direction),
+        )
+
+    async def build_response(
+        self, row: dict[str, Any], offset: int, total: int
+    ) -> FeedResponse:
+        """Assemble a FeedResponse for a post row at a feed offset."""
+        outcomes_raw = await get_outcomes_for_prediction(row["prediction_id"])
 
         # Compute market timing from post timestamp
         ts = row["timestamp"]
@@ -67,7 +126,11 @@ class FeedService:
                 k: v for k, v in prediction.market_impact.items() if k in valid_symbols
             }
 
-        navigation = self.build_navigation(offset, total)
+        navigation = self.build_navigation(
+            offset,
+            total,
+            cursor=encode_cursor(row["timestamp"], row["prediction_id"], offset),
+        )
 
         return FeedResponse(
             post=post,
@@ -231,13 +294,16 @@ class FeedService:
         }
 
     @staticmethod
-    def build_navigation(offset: int, total: int) -> Navigation:
+    def build_navigation(
+        offset: int, total: int, cursor: str | None = None
+    ) -> Navigation:
         """Build navigation metadata."""
         return Navigation(
             has_newer=offset > 0,
             has_older=offset < total - 1,
             current_offset=offset,
             total_posts=total,
+            cursor=cursor,
         )
 
     @staticmethod
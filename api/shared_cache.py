@@ -0,0 +1,309 @@
+"""Cross-worker response cache with single-flight fetches.
+
+Used by the yfinance-backed price endpoints. When an alert goes out,
+dozens of clients ask for the same ticker at once, across every uvicorn
+worker in the container. ``SharedCache`` makes that cost one upstream call:
+
+- values live in a SQLite file (WAL mode) shared by all workers on the
+  host (API_SHARED_CACHE_PATH, default in the temp dir), stored as JSON
+  with their fetch time;
+- on a miss, one thread per process fetches while the others wait for its
+  result, and a lease row in the same file stops the other workers from
+  fetching the same key; they poll for the leader's value instead;
+- an entry past ``ttl_seconds`` but within ``stale_seconds`` more is
+  returned immediately while a background thread refreshes it
+  (stale-while-revalidate), so a slow upstream call never blocks readers
+  of a key that has been fetched before.
+
+``get_many`` serves batch endpoints: every key that is due is fetched with
+one multi-key call, and the results are stored per key so batch and
+single-key lookups share entries.
+
+If the SQLite file can't be used, the cache degrades to in-process
+single-flight fetching.
+"""
+
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+from shit.config.shitpost_settings import settings
+from shit.logging import get_service_logger
+
+logger = get_service_logger("shared_cache")
+
+# Seconds a worker may hold a fetch lease before others take over
+LEASE_SECONDS = 30.0
+
+# Seconds between store polls while another worker holds the lease
+POLL_INTERVAL_SECONDS = 0.05
+
+# Writes between sweeps of entries too old to serve even stale
+PRUNE_EVERY = 200
+
+_SCHEMA = (
+    """CREATE TABLE IF NOT EXISTS cache_entries (
+        key TEXT PRIMARY KEY, value TEXT NOT NULL, fetched_at REAL NOT NULL
+    )""",
+    """CREATE TABLE IF NOT EXISTS cache_leases (
+        key TEXT PRIMARY KEY, expires_at REAL NOT NULL
+    )""",
+)
+
+# Background revalidation threads shared by every SharedCache
+_refresh_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="cache-refresh")
+
+
+def default_cache_path() -> str:
+    """The SQLite file shared by API workers on this host."""
+    return settings.API_SHARED_CACHE_PATH or os.path.join(
+        tempfile.gettempdir(), "shitpost_alpha_api_cache.sqlite3"
+    )
+
+
+class SharedCache:
+    """TTL cache of JSON values in a SQLite file shared across processes."""
+
+    def __init__(
+        self,
+        namespace: str,
+        ttl_seconds: float,
+        stale_seconds: float,
+        path: Optional[str] = None,
+    ):
+        self.namespace = namespace
+        self.ttl_seconds = ttl_seconds
+        self.stale_seconds = stale_seconds
+        self.path = path or default_cache_path()
+        self._local = threading.local()
+        self._inflight: dict[str, Future] = {}
+        self._refreshing: set[str] = set()
+        self._lock = threading.Lock()
+        self._writes = 0
+
+    def get(self, key: str, fetch: Callable[[], Any]) -> Any:
+        """Cached value for *key*, calling *fetch* (at most once at a time) when due.
+
+        Returns:
+            The cached or freshly fetched value (as JSON round-trips it).
+        """
+        return self.get_entry(key, fetch)[0]
+
+    def get_entry(self, key: str, fetch: Callable[[], Any]) -> tuple[Any, float]:
+        """Like ``get``, but returns ``(value, fetched_at)``.
+
+        ``fetched_at`` is the ``time.time()`` of the upstream fetch; a stale
+        value keeps its old timestamp while it is being revalidated.
+        """
+        entry = self.peek(key)
+        if entry is not None:
+            age = time.time() - entry[1]
+            if age < self.ttl_seconds:
+                return entry
+            if age < self.ttl_seconds + self.stale_seconds:
+                self._revalidate(key, fetch)
+                return entry
+        return self._single_flight(key, fetch).result()
+
+    def get_many(
+        self, keys: list[str], fetch_many: Callable[[list[str]], dict[str, Any]]
+    ) -> dict[str, tuple[Any, float]]:
+        """``get_entry`` for many keys, with one *fetch_many* call for the misses.
+
+        *fetch_many* receives the keys to fetch and returns their values by
+        key; keys it leaves out are neither cached nor returned. Stale keys
+        are refreshed together in the background. Batch fetches skip the
+        lease: they already cost one upstream call for many keys.
+
+        Returns:
+            ``{key: (value, fetched_at)}`` for every key with a value.
+        """
+        entries: dict[str, tuple[Any, float]] = {}
+        stale, missing = [], []
+        now = time.time()
+        for key in keys:
+            entry = self.peek(key)
+            age = now - entry[1] if entry is not None else None
+            if age is None or age >= self.ttl_seconds + self.stale_seconds:
+                missing.append(key)
+                continue
+            entries[key] = entry
+            if age >= self.ttl_seconds:
+                stale.append(key)
+
+        if stale:
+            self._revalidate_many(stale, fetch_many)
+        if missing:
+            entries.update(self._fetch_many(missing, fetch_many))
+        return entries
+
+    def peek(self, key: str) -> Optional[tuple[Any, float]]:
+        """``(value, fetched_at)`` stored for *key*, fresh or not, or None."""
+        try:
+            row = self._conn().execute(
+                "SELECT value, fetched_at FROM cache_entries WHERE key = ?",
+                (self._key(key),),
+            ).fetchone()
+        except sqlite3.Error:
+            logger.warning("Shared cache read failed", exc_info=True)
+            return None
+        return (json.loads(row[0]), row[1]) if row else None
+
+    def clear(self) -> None:
+        """Drop this namespace's entries and leases."""
+        try:
+            with self._conn() as conn:
+                for table in ("cache_entries", "cache_leases"):
+                    conn.execute(
+                        f"DELETE FROM {table} WHERE key LIKE ?", (f"{self.namespace}:%",)
+                    )
+        except sqlite3.Error:
+            logger.warning("Shared cache clear failed", exc_info=True)
+
+    def _single_flight(self, key: str, fetch: Callable[[], Any]) -> Future:
+        """The in-flight fetch for *key*, starting one if none is running."""
+        with self._lock:
+            future = self._inflight.get(key)
+            if future is not None:
+                return future
+            future = Future()
+            self._inflight[key] = future
+
+        try:
+            future.set_result(self._fetch_once(key, fetch))
+        except Exception as e:
+            future.set_exception(e)
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+        return future
+
+    def _revalidate(self, key: str, fetch: Callable[[], Any]) -> None:
+        with self._lock:
+            if key in self._inflight:
+                return
+        _refresh_pool.submit(self._single_flight, key, fetch)
+
+    def _revalidate_many(
+        self, keys: list[str], fetch_many: Callable[[list[str]], dict[str, Any]]
+    ) -> None:
+        with self._lock:
+            busy = self._refreshing | self._inflight.keys()
+            keys = [k for k in keys if k not in busy]
+            self._refreshing.update(keys)
+        if keys:
+            _refresh_pool.submit(self._refresh_many, keys, fetch_many)
+
+    def _refresh_many(
+        self, keys: list[str], fetch_many: Callable[[list[str]], dict[str, Any]]
+    ) -> None:
+        try:
+            self._fetch_many(keys, fetch_many)
+        except Exception:
+            logger.warning(
+                f"Background refresh of {len(keys)} keys failed", exc_info=True
+            )
+        finally:
+            with self._lock:
+                self._refreshing.difference_update(keys)
+
+    def _fetch_many(
+        self, keys: list[str], fetch_many: Callable[[list[str]], dict[str, Any]]
+    ) -> dict[str, tuple[Any, float]]:
+        values = fetch_many(keys)
+        fetched_at = time.time()
+        entries = {}
+        for key in keys:
+            if key in values:
+                self._store(key, values[key], fetched_at)
+                entries[key] = (json.loads(json.dumps(values[key])), fetched_at)
+        return entries
+
+    def _fetch_once(self, key: str, fetch: Callable[[], Any]) -> tuple[Any, float]:
+        """Fetch under the cross-process lease, or wait for its holder's value."""
+        started = time.time()
+        deadline = time.monotonic() + LEASE_SECONDS
+        while not self._acquire_lease(key):
+            entry = self.peek(key)
+            if entry is not None and entry[1] >= started:
+                return entry
+            if time.monotonic() >= deadline:
+                break  # The holder died or hung; fetch anyway
+            time.sleep(POLL_INTERVAL_SECONDS)
+
+        try:
+            # The previous holder may have stored and released between polls
+            entry = self.peek(key)
+            if entry is not None and entry[1] >= started:
+                return entry
+            value = fetch()
+            fetched_at = time.time()
+            self._store(key, value, fetched_at)
+            # Return what other workers will read, not the pre-JSON object
+            return json.loads(json.dumps(value)), fetched_at
+        finally:
+            self._release_lease(key)
+
+    def _acquire_lease(self, key: str) -> bool:
+        now = time.time()
+        try:
+            with self._conn() as conn:
+                conn.execute(
+                    "DELETE FROM cache_leases WHERE key = ? AND expires_at < ?",
+                    (self._key(key), now),
+                )
+                cursor = conn.execute(
+                    "INSERT OR IGNORE INTO cache_leases (key, expires_at) VALUES (?, ?)",
+                    (self._key(key), now + LEASE_SECONDS),
+                )
+                return cursor.rowcount == 1
+        except sqlite3.Error:
+            logger.warning("Shared cache lease failed; fetching locally", exc_info=True)
+            return True
+
+    def _release_lease(self, key: str) -> None:
+        try:
+            with self._conn() as conn:
+                conn.execute("DELETE FROM cache_leases WHERE key = ?", (self._key(key),))
+        except sqlite3.Error:
+            logger.warning("Shared cache lease release failed", exc_info=True)
+
+    def _store(self, key: str, value: Any, now: float) -> None:
+        try:
+            with self._conn() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO cache_entries (key, value, fetched_at) "
+                    "VALUES (?, ?, ?)",
+                    (self._key(key), json.dumps(value), now),
+                )
+                self._writes += 1
+                if self._writes % PRUNE_EVERY == 0:
+                    conn.execute(
+                        "DELETE FROM cache_entries WHERE key LIKE ? AND fetched_at < ?",
+                        (
+                            f"{self.namespace}:%",
+                            now - self.ttl_seconds - self.stale_seconds,
+                        ),
+                    )
+        except sqlite3.Error:
+            logger.warning("Shared cache write failed", exc_info=True)
+
+    def _key(self, key: str) -> str:
+        return f"{self.namespace}:{key}"
+
+    def _conn(self) -> sqlite3.Connection:
+        """This thread's connection to the cache file (reopened if the path changed)."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None or self._local.path != self.path:
+            conn = sqlite3.connect(self.path, timeout=5.0)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            for statement in _SCHEMA:
+                conn.execute(statement)
+            self._local.conn, self._local.path = conn, self.path
+        return conn
@@ -1,6 +1,12 @@
 /** API client — fetch wrapper with base URL handling. */
 
-import type { CalibrationCurveData, FeedResponse, LiveQuote, PriceResponse } from "../types/api";
+import type {
+  BatchLiveQuoteResponse,
+  BatchPriceResponse,
+  CalibrationCurveData,
+  FeedDirection,
+  FeedResponse,
+} from "../types/api";
 
 const BASE_URL = "";
 const API_KEY = import.meta.env.VITE_API_KEY ?? "";
@@ -21,18 +27,26 @@ export function fetchFeedPost(offset: number): Promise<FeedResponse> {
   return fetchJson<FeedResponse>(`/api/feed/at?offset=${offset}`);
 }
 
-export function fetchPriceData(
-  symbol: string,
+/** The post one step `direction` from a previous response's cursor. */
+export function fetchFeedPostFromCursor(
+  cursor: string,
+  direction: FeedDirection,
+): Promise<FeedResponse> {
+  const params = new URLSearchParams({ cursor, direction });
+  return fetchJson<FeedResponse>(`/api/feed/at?${params}`);
+}
+
+export function fetchPriceDataBatch(
+  symbols: string[],
   days: number,
-  postTimestamp?: string,
-): Promise<PriceResponse> {
-  const params = new URLSearchParams({ days: String(days) });
-  if (postTimestamp) params.set("post_timestamp", postTimestamp);
-  return fetchJson<PriceResponse>(`/api/prices/${symbol}?${params}`);
+): Promise<BatchPriceResponse> {
+  const params = new URLSearchParams({ symbols: symbols.join(","), days: String(days) });
+  return fetchJson<BatchPriceResponse>(`/api/prices/batch?${params}`);
 }
 
-export function fetchLiveQuote(symbol: string): Promise<LiveQuote> {
-  return fetchJson<LiveQuote>(`/api/prices/${symbol}/live`);
+export function fetchLiveQuotesBatch(symbols: string[]): Promise<BatchLiveQuoteResponse> {
+  const params = new URLSearchParams({ symbols: symbols.join(",") });
+  return fetchJson<BatchLiveQuoteResponse>(`/api/prices/live/batch?${params}`);
 }
 
 export function fetchCalibrationCurve(
@@ -2,61 +2,153 @@
 
 import { useQuery, useQueryClient } from "@tanstack/react-query";
 import { useEffect } from "react";
-import { fetchFeedPost, fetchLiveQuote, fetchPriceData } from "./client";
+import type {
+  BatchLiveQuoteResponse,
+  BatchPriceResponse,
+  FeedDirection,
+  LiveQuote,
+  Navigation,
+  PriceResponse,
+} from "../types/api";
+import {
+  fetchFeedPost,
+  fetchFeedPostFromCursor,
+  fetchLiveQuotesBatch,
+  fetchPriceDataBatch,
+} from "./client";
 
-export function useFeedPost(offset: number) {
+/** A step to `offset` from the post at `cursor`, one position `direction`. */
+export interface FeedStep {
+  offset: number;
+  cursor: string;
+  direction: FeedDirection;
+}
+
+/**
+ * The post at `offset`. Fetched from the previous post's cursor when `step`
+ * leads to it, so deep scrolling costs the same as the first page; plain
+ * offsets are only used for deep links.
+ */
+export function useFeedPost(offset: number, step?: FeedStep | null) {
   return useQuery({
     queryKey: ["feed", offset],
-    queryFn: () => fetchFeedPost(offset),
+    queryFn: () =>
+      step && step.offset === offset
+        ? fetchFeedPostFromCursor(step.cursor, step.direction)
+        : fetchFeedPost(offset),
     staleTime: 60_000,
     gcTime: 10 * 60_000,
   });
 }
 
+/** Index of the post's trading day in `dates` (or the day before it). */
+function postDateIndex(dates: string[], postTimestamp?: string): number | null {
+  const postDate = postTimestamp?.match(/^\d{4}-\d{2}-\d{2}/)?.[0];
+  if (!postDate || dates.length === 0) return null;
+  const after = dates.findIndex((d) => d >= postDate);
+  if (after === -1) return dates.length - 1;
+  return dates[after] === postDate ? after : Math.max(0, after - 1);
+}
+
+function selectPrices(
+  batch: BatchPriceResponse,
+  symbol: string,
+  postTimestamp?: string,
+): PriceResponse {
+  const series = batch.series[symbol.toUpperCase()];
+  const dates = series ? series.dates : [];
+  const candles = series
+    ? dates.map((date, i) => ({
+        date,
+        open: series.open[i],
+        high: series.high[i],
+        low: series.low[i],
+        close: series.close[i],
+        volume: series.volume[i],
+      }))
+    : [];
+  return {
+    symbol: symbol.toUpperCase(),
+    post_timestamp: postTimestamp ?? null,
+    candles,
+    post_date_index: postDateIndex(dates, postTimestamp),
+  };
+}
+
+function selectQuote(batch: BatchLiveQuoteResponse, symbol: string): LiveQuote | null {
+  const i = batch.symbols.indexOf(symbol.toUpperCase());
+  if (i === -1) return null;
+  return {
+    symbol: batch.symbols[i],
+    price: batch.price[i],
+    previous_close: batch.previous_close[i],
+    day_high: batch.day_high[i],
+    day_low: batch.day_low[i],
+    volume: batch.volume[i],
+    captured_at: batch.captured_at[i],
+  };
+}
+
+/** Candles for `symbol`, fetched together with the post's other tickers. */
 export function usePriceData(
+  symbols: string[],
   symbol: string | undefined,
   days: number,
   postTimestamp?: string,
 ) {
   return useQuery({
-    queryKey: ["prices", symbol, days, postTimestamp],
-    queryFn: () => fetchPriceData(symbol!, days, postTimestamp),
+    queryKey: ["prices", symbols, days],
+    queryFn: () => fetchPriceDataBatch(symbols, days),
+    select: (batch) => (symbol ? selectPrices(batch, symbol, postTimestamp) : undefined),
     staleTime: 5 * 60_000,
-    enabled: !!symbol,
+    enabled: symbols.length > 0,
   });
 }
 
-export function useLiveQuote(symbol: string | undefined) {
+/** Live quote for `symbol` (null if none), polled with the post's other tickers. */
+export function useLiveQuote(symbols: string[], symbol: string | undefined) {
   return useQuery({
-    queryKey: ["liveQuote", symbol],
-    queryFn: () => fetchLiveQuote(symbol!),
-    enabled: !!symbol,
+    queryKey: ["liveQuotes", symbols],
+    queryFn: () => fetchLiveQuotesBatch(symbols),
+    select: (batch) => (symbol ? selectQuote(batch, symbol) : null),
+    enabled: symbols.length > 0,
     staleTime: 10_000,
     refetchInterval: 15_000,
   });
 }
 
-export function usePrefetchAdjacentPosts(
-  currentOffset: number,
-  hasNewer: boolean,
-  hasOlder: boolean,
-) {
+/** The step from the current post to its neighbour, or null without a cursor. */
+export function stepFrom(
+  navigation: Navigation | undefined,
+  direction: FeedDirection,
+): FeedStep | null {
+  if (!navigation?.cursor) return null;
+  const delta = direction === "older" ? 1 : -1;
+  return {
+    offset: navigation.current_offset + delta,
+    cursor: navigation.cursor,
+    direction,
+  };
+}
+
+export function usePrefetchAdjacentPosts(navigation: Navigation | undefined) {
   const queryClient = useQueryClient();
 
   useEffect(() => {
-    if (hasNewer && currentOffset > 0) {
-      queryClient.prefetchQuery({
-        queryKey: ["feed", currentOffset - 1],
-        queryFn: () => fetchFeedPost(currentOffset - 1),
-        staleTime: 60_000,
-      });
-    }
-    if (hasOlder) {
+    if (!navigation) return;
+    const prefetch = (direction: FeedDirection) => {
+      const step = stepFrom(navigation, direction);
+      const offset = navigation.current_offset + (direction === "older" ? 1 : -1);
       queryClient.prefetchQuery({
-        queryKey: ["feed", currentOffset + 1],
-        queryFn: () => fetchFeedPost(currentOffset + 1),
+        queryKey: ["feed", offset],
+        queryFn: () =>
+          step
+            ? fetchFeedPostFromCursor(step.cursor, step.direction)
+            : fetchFeedPost(offset),
         staleTime: 60_000,
       });
-    }
-  }, [currentOffset, hasNewer, hasOlder, queryClient]);
+    };
+    if (navigation.has_newer && navigation.current_offset > 0) prefetch("newer");
+    if (navigation.has_older) prefetch("older");
+  }, [navigation, queryClient]);
 }
@@ -1,7 +1,14 @@
 import { useState, useCallback, CSSProperties } from "react";
 import { useSearchParams } from "react-router-dom";
 import { AnimatePresence, motion } from "framer-motion";
-import { useFeedPost, useLiveQuote, usePrefetchAdjacentPosts, usePriceData } from "../api/hooks";
+import {
+  stepFrom,
+  useFeedPost,
+  useLiveQuote,
+  usePrefetchAdjacentPosts,
+  usePriceData,
+  type FeedStep,
+} from "../api/hooks";
 import { useKeyboardNav } from "../hooks/useKeyboardNav";
 import { Header } from "../components/Header";
 import { Footer } from "../components/Footer";
@@ -67,29 +74,32 @@ export function FeedPage() {
   const [selectedTicker, setSelectedTicker] = useState<string>("");
   const [timeframe, setTimeframe] = useState<Timeframe>("7d");
   const [direction, setDirection] = useState(0);
+  // How the next post is reached from the current one; offsets stay in the
+  // URL for deep links
+  const [step, setStep] = useState<FeedStep | null>(null);
 
-  const { data, isLoading, error } = useFeedPost(offset);
+  const { data, isLoading, error } = useFeedPost(offset, step);
 
-  // Prefetch adjacent posts
-  usePrefetchAdjacentPosts(
-    offset,
-    data?.navigation.has_newer ?? false,
-    data?.navigation.has_older ?? false,
-  );
+  // Prefetch adjacent posts from this post's cursor
+  usePrefetchAdjacentPosts(data?.navigation);
+
+  const navigation = data?.navigation;
 
   const navigateNewer = useCallback(() => {
     if (offset > 0) {
       setDirection(-1);
       setSelectedTicker("");
+      setStep(stepFrom(navigation, "newer"));
       setSearchParams({ offset: String(offset - 1) });
     }
-  }, [offset, setSearchParams]);
+  }, [offset, navigation, setSearchParams]);
 
   const navigateOlder = useCallback(() => {
     setDirection(1);
     setSelectedTicker("");
+    setStep(stepFrom(navigation, "older"));
     setSearchParams({ offset: String(offset + 1) });
-  }, [offset, setSearchParams]);
+  }, [offset, navigation, setSearchParams]);
 
   useKeyboardNav(
     navigateNewer,
@@ -103,12 +113,15 @@ export function FeedPage() {
   const activeOutcome = data?.outcomes.find((o) => o.symbol === activeTicker);
 
   // All hooks must be called before any early returns (React hooks rule)
+  // One batch request per post covers every ticker, so switching is instant
+  const assets = data?.prediction.assets ?? [];
   const priceQuery = usePriceData(
+    assets,
     activeTicker || undefined,
     timeframeToDays[timeframe],
     data?.post.timestamp,
   );
-  const liveQuote = useLiveQuote(activeTicker || undefined);
+  const liveQuote = useLiveQuote(assets, activeTicker || undefined);
   const currentPrice = liveQuote.data?.price
     ?? (priceQuery.data?.candles?.length
       ? priceQuery.data.candles[priceQuery.data.candles.length - 1].close
@@ -178,8 +178,12 @@ export interface Navigation {
   has_older: boolean;
   current_offset: number;
   total_posts: number;
+  /** Opaque position of this post; pass back to step to a neighbour. */
+  cursor: string | null;
 }
 
+export type FeedDirection = "older" | "newer";
+
 export interface FeedResponse {
   post: Post;
   prediction: Prediction;
@@ -212,3 +216,31 @@ export interface PriceResponse {
   candles: Candle[];
   post_date_index: number | null;
 }
+
+/** Candles as parallel arrays, one element per trading day. */
+export interface PriceSeries {
+  dates: string[];
+  open: number[];
+  high: number[];
+  low: number[];
+  close: number[];
+  volume: number[];
+}
+
+export interface BatchPriceResponse {
+  days: number;
+  series: Record<string, PriceSeries>;
+  missing: string[];
+}
+
+/** Live quotes as parallel arrays, one element per symbol with a quote. */
+export interface BatchLiveQuoteResponse {
+  symbols: string[];
+  price: number[];
+  previous_close: (number | null)[];
+  day_high: (number | null)[];
+  day_low: (number | null)[];
+  volume: (number | null)[];
+  captured_at: string[];
+  missing: string[];
+}
@@ -8,6 +8,7 @@ Runs as a standalone worker via ``python -m notifications.event_consumer --once`
 import sys
 
 from shit.events.event_types import ConsumerGroup
+from shit.events.tracing import trace_span
 from shit.events.worker import EventWorker, run_worker_main
 from shit.logging import get_service_logger
 
@@ -18,12 +19,13 @@ class NotificationsWorker(EventWorker):
     """Processes prediction_created events by dispatching alerts."""
 
     consumer_group = ConsumerGroup.NOTIFICATIONS
+    concurrency = 4  # Telegram sends are I/O bound
 
     def process_event(self, event_type: str, payload: dict) -> dict:
         """Process a prediction_created event.
 
         Formats the prediction as an alert and dispatches it to all
-        matching subscribers via Telegram.
+        matching subscribers via Telegram, traced as an ``alert`` span.
 
         Args:
             event_type: Should be EventType.PREDICTION_CREATED.
@@ -66,72 +68,79 @@ class NotificationsWorker(EventWorker):
             "ensemble_metadata": payload.get("ensemble_metadata"),
         }
 
-        # Enrich alert with calibrated confidence and historical echoes
-        from notifications.alert_engine import enrich_alert
-
-        alert = enrich_alert(alert)
-
-        results = {"alerts_sent": 0, "alerts_failed": 0, "filtered": 0}
-
-        subscriptions = get_active_subscriptions()
-        if not subscriptions:
-            logger.info("No active subscribers")
+        with trace_span(
+            "alert",
+            prediction_id=prediction_id,
+            signal_id=payload.get("signal_id"),
+            post_published_at=payload.get("post_published_at"),
+        ) as span:
+            # Enrich alert with calibrated confidence and historical echoes
+            from notifications.alert_engine import enrich_alert
+
+            alert = enrich_alert(alert)
+
+            results = {"alerts_sent": 0, "alerts_failed": 0, "filtered": 0}
+
+            subscriptions = get_active_subscriptions()
+            if not subscriptions:
+                logger.info("No active subscribers")
+                return results
+
+            for sub in subscriptions:
+                prefs = sub.get("alert_preferences", {})
+                if isinstance(prefs, str):
+                    try:
+                        prefs = json.loads(prefs)
+                    except json.JSONDecodeError:
+                        prefs = {}
+
+                matched = filter_predictions_by_preferences([alert], prefs)
+                if not matched:
+                    results["filtered"] += 1
+                    continue
+
+                chat_id = sub["chat_id"]
+                for a in matched:
+                    message = format_telegram_alert(a)
+                    reply_markup = (
+                        build_vote_keyboard(prediction_id) if prediction_id else None
+                    )
+                    success, error = send_telegram_message(
+                        chat_id, message, reply_markup=reply_markup
+                    )
+
+                    if success:
+                        record_alert_sent(chat_id)
+                        results["alerts_sent"] += 1
+
+                        # Create follow-up tracking (fail-open)
+                        if prediction_id:
+                            try:
+                                from notifications.followups import (
+                                    create_followup_tracking,
+                                )
+                                from datetime import datetime, timezone
+
+                                create_followup_tracking(
+                                    prediction_id=prediction_id,
+                                    chat_id=chat_id,
+                                    alert_sent_at=datetime.now(timezone.utc),
+                                )
+                            except Exception:
+                                logger.debug(
+                                    f"Follow-up tracking failed for prediction {prediction_id}"
+                                )
+                    else:
+                        record_error(chat_id, error or "Unknown error")
+                        results["alerts_failed"] += 1
+
+            span.update(alerts_sent=results["alerts_sent"], filtered=results["filtered"])
+            logger.info(
+                f"Notification dispatch: {results['alerts_sent']} sent, "
+                f"{results['alerts_failed']} failed, {results['filtered']} filtered"
+            )
             return results
 
-        for sub in subscriptions:
-            prefs = sub.get("alert_preferences", {})
-            if isinstance(prefs, str):
-                try:
-                    prefs = json.loads(prefs)
-                except json.JSONDecodeError:
-                    prefs = {}
-
-            matched = filter_predictions_by_preferences([alert], prefs)
-            if not matched:
-                results["filtered"] += 1
-                continue
-
-            chat_id = sub["chat_id"]
-            for a in matched:
-                message = format_telegram_alert(a)
-                reply_markup = (
-                    build_vote_keyboard(prediction_id) if prediction_id else None
-                )
-                success, error = send_telegram_message(
-                    chat_id, message, reply_markup=reply_markup
-                )
-
-                if success:
-                    record_alert_sent(chat_id)
-                    results["alerts_sent"] += 1
-
-                    # Create follow-up tracking (fail-open)
-                    if prediction_id:
-                        try:
-                            from notifications.followups import (
-                                create_followup_tracking,
-                            )
-                            from datetime import datetime, timezone
-
-                            create_followup_tracking(
-                                prediction_id=prediction_id,
-                                chat_id=chat_id,
-                                alert_sent_at=datetime.now(timezone.utc),
-                            )
-                        except Exception:
-                            logger.debug(
-                                f"Follow-up tracking failed for prediction {prediction_id}"
-                            )
-                else:
-                    record_error(chat_id, error or "Unknown error")
-                    results["alerts_failed"] += 1
-
-        logger.info(
-            f"Notification dispatch: {results['alerts_sent']} sent, "
-            f"{results['alerts_failed']} failed, {results['filtered']} filtered"
-        )
-        return results
-
 
 def main() -> int:
     """CLI entry point for the notifications event consumer."""
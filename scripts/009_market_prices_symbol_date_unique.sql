@@ -0,0 +1,22 @@
+-- Migration: Unique (symbol, date) on market_prices
+-- Date: 2026-10-16
+-- Context: MarketDataClient now stores prices with INSERT ... ON CONFLICT (symbol, date),
+--          which needs a unique index on those columns. The model always intended
+--          one row per symbol per day but the constraint was never created.
+-- Run: psql $DATABASE_URL -f scripts/009_market_prices_symbol_date_unique.sql
+
+-- 1. Remove duplicate (symbol, date) rows, keeping the most recently updated one
+DELETE FROM market_prices a
+    USING market_prices b
+    WHERE a.symbol = b.symbol
+      AND a.date = b.date
+      AND (COALESCE(a.last_updated, 'epoch'), a.id)
+          < (COALESCE(b.last_updated, 'epoch'), b.id);
+
+-- 2. Build the unique index without blocking writes, then attach it as a constraint
+CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS uq_market_prices_symbol_date
+    ON market_prices (symbol, date);
+
+ALTER TABLE market_prices
+    ADD CONSTRAINT uq_market_prices_symbol_date
+    UNIQUE USING INDEX uq_market_prices_symbol_date;
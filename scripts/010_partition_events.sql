@@ -0,0 +1,71 @@
+-- Migration: Range-partition the events table by created_at
+-- Date: 2026-10-16
+-- Context: Event retention deleted completed and dead-letter rows one by one, bloating
+--          ix_events_claimable while workers claim. events becomes a weekly range-partitioned
+--          table so retention drops whole partitions (shit/events/partitions.py) and the claim
+--          query is pruned to the hot partitions. Existing rows move into one events_legacy
+--          partition that is dropped like any other once it expires. The primary key becomes
+--          (id, created_at) because it must include the partition key.
+--          Stop event producers and workers while this runs. Workers (at startup) and
+--          `python -m shit.events cleanup` (daily cron) keep creating partitions ahead after
+--          this. Rows outside every range land in events_default instead of failing; the
+--          next partition run moves them into their weekly partition.
+-- Run: psql $DATABASE_URL -f scripts/010_partition_events.sql
+
+BEGIN;
+
+-- 1. Move the current table and its indexes out of the way
+ALTER TABLE events RENAME TO events_legacy;
+ALTER INDEX IF EXISTS events_pkey RENAME TO events_legacy_pkey;
+ALTER INDEX IF EXISTS ix_events_id RENAME TO ix_events_legacy_id;
+ALTER INDEX IF EXISTS ix_events_claimable RENAME TO ix_events_legacy_claimable;
+ALTER INDEX IF EXISTS ix_events_type_status RENAME TO ix_events_legacy_type_status;
+ALTER INDEX IF EXISTS ix_events_completed_at RENAME TO ix_events_legacy_completed_at;
+ALTER INDEX IF EXISTS ix_events_event_type RENAME TO ix_events_legacy_event_type;
+ALTER INDEX IF EXISTS ix_events_status RENAME TO ix_events_legacy_status;
+ALTER INDEX IF EXISTS ix_events_correlation_id RENAME TO ix_events_legacy_correlation_id;
+
+-- 2. Partitioned parent with the same columns (the id default keeps using events_id_seq)
+CREATE TABLE events (LIKE events_legacy INCLUDING DEFAULTS)
+    PARTITION BY RANGE (created_at);
+
+ALTER TABLE events ADD CONSTRAINT events_pkey PRIMARY KEY (id, created_at);
+ALTER SEQUENCE events_id_seq OWNED BY events.id;
+
+-- Partitioned indexes; id lookups use the primary key
+CREATE INDEX ix_events_claimable ON events (consumer_group, status, next_retry_at);
+CREATE INDEX ix_events_type_status ON events (event_type, status);
+CREATE INDEX ix_events_completed_at ON events (completed_at);
+CREATE INDEX ix_events_event_type ON events (event_type);
+CREATE INDEX ix_events_status ON events (status);
+CREATE INDEX ix_events_correlation_id ON events (correlation_id);
+
+-- 3. Existing rows become the first partition (up to tomorrow, UTC), followed by
+--    weekly partitions through four weeks past the current one and a DEFAULT partition
+DO $$
+DECLARE
+    boundary timestamp := date_trunc('day', now() AT TIME ZONE 'UTC') + interval '1 day';
+    horizon timestamp := date_trunc('week', now() AT TIME ZONE 'UTC') + interval '5 weeks';
+    week_end timestamp;
+BEGIN
+    EXECUTE format(
+        'ALTER TABLE events ATTACH PARTITION events_legacy FOR VALUES FROM (MINVALUE) TO (%L)',
+        boundary
+    );
+
+    WHILE boundary < horizon LOOP
+        week_end := date_trunc('week', boundary) + interval '1 week';
+        EXECUTE format(
+            'CREATE TABLE %I PARTITION OF events FOR VALUES FROM (%L) TO (%L)',
+            'events_p' || to_char(boundary, 'YYYYMMDD'), boundary, week_end
+        );
+        boundary := week_end;
+    END LOOP;
+END $$;
+
+CREATE TABLE events_default PARTITION OF events DEFAULT;
+
+COMMIT;
+
+-- 4. Refresh planner statistics for the new parent
+ANALYZE events;
@@ -0,0 +1,27 @@
+-- Migration: Create pipeline_spans for end-to-end latency tracing
+-- Date: 2026-10-16
+-- Context: Pipeline stages (harvest, s3_processor, analysis, backfill, alert) record one
+--          timed span per run, keyed by the event chain's correlation_id
+--          (shit/events/tracing.py). `python -m shit.events trace-report` reads them and
+--          `python -m shit.events cleanup` prunes them (--span-days, default 14).
+-- Run: psql $DATABASE_URL -f scripts/011_create_pipeline_spans.sql
+
+-- 1. Span table
+CREATE TABLE IF NOT EXISTS pipeline_spans (
+    id SERIAL PRIMARY KEY,
+    correlation_id VARCHAR(255) NOT NULL,
+    stage VARCHAR(50) NOT NULL,
+    status VARCHAR(20) NOT NULL DEFAULT 'ok',
+    started_at TIMESTAMP NOT NULL,
+    ended_at TIMESTAMP NOT NULL,
+    duration_ms DOUBLE PRECISION NOT NULL,
+    attributes JSON NOT NULL DEFAULT '{}',
+    created_at TIMESTAMP NOT NULL DEFAULT now(),
+    updated_at TIMESTAMP NOT NULL DEFAULT now()
+);
+
+-- 2. Trace lookup and time-window scans
+CREATE INDEX IF NOT EXISTS ix_pipeline_spans_correlation_id
+    ON pipeline_spans (correlation_id);
+CREATE INDEX IF NOT EXISTS ix_pipeline_spans_started_at
+    ON pipeline_spans (started_at);
@@ -0,0 +1,17 @@
+-- Migration: HNSW index on post_embeddings.embedding
+-- Date: 2026-10-16
+-- Context: Echo lookups (EchoService.find_similar_posts) ran a sequential <=> scan
+--          over every stored embedding. The lookup is now an ORDER BY <=> LIMIT
+--          top-k with the status/threshold filters applied afterwards, which an
+--          HNSW index on cosine distance can serve directly. Query-time recall is
+--          tuned with hnsw.ef_search (ECHO_HNSW_EF_SEARCH).
+--          Equivalent to: python -m shit.echoes.ann create
+-- Run: psql $DATABASE_URL -f scripts/012_post_embeddings_hnsw_index.sql
+
+-- 1. Build the index without blocking embedding inserts
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_post_embeddings_embedding_hnsw
+    ON post_embeddings USING hnsw (embedding vector_cosine_ops)
+    WITH (m = 16, ef_construction = 64);
+
+-- 2. Refresh planner statistics
+ANALYZE post_embeddings;
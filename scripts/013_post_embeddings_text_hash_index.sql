@@ -0,0 +1,9 @@
+-- Migration: Index post_embeddings.text_hash
+-- Date: 2026-10-16
+-- Context: EchoService reuses a stored embedding when the same text (same SHA-256
+--          text_hash) was already embedded, instead of calling the embeddings API
+--          again. The lookup runs before every embed and needs an index.
+-- Run: psql $DATABASE_URL -f scripts/013_post_embeddings_text_hash_index.sql
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_post_embeddings_text_hash
+    ON post_embeddings (text_hash);
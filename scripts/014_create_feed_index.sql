@@ -0,0 +1,40 @@
+-- Migration: Create feed_index for keyset feed navigation
+-- Date: 2026-10-16
+-- Context: /api/feed/at ran the full signals JOIN predictions with JSON-text
+--          filters, COUNT(*) OVER() and OFFSET per request, so cost grew with
+--          scroll depth. feed_index is a narrow (published_at, prediction_id)
+--          table with a precomputed has_assets flag, kept in sync by
+--          shitvault/feed_index.py when predictions are stored.
+--          Equivalent rebuild: python -m shitvault sync-feed-index
+-- Run: psql $DATABASE_URL -f scripts/014_create_feed_index.sql
+
+-- 1. Table
+CREATE TABLE IF NOT EXISTS feed_index (
+    prediction_id INTEGER PRIMARY KEY REFERENCES predictions (id) ON DELETE CASCADE,
+    signal_id VARCHAR(255) NOT NULL,
+    published_at TIMESTAMP NOT NULL,
+    has_assets BOOLEAN NOT NULL DEFAULT FALSE
+);
+
+-- 2. Feed order (newest first via backward scan); only posts with assets
+CREATE INDEX IF NOT EXISTS ix_feed_index_feed_order
+    ON feed_index (published_at, prediction_id)
+    WHERE has_assets;
+
+-- 3. Backfill from existing predictions
+INSERT INTO feed_index (prediction_id, signal_id, published_at, has_assets)
+SELECT
+    p.id,
+    p.signal_id,
+    s.published_at,
+    (p.assets IS NOT NULL AND p.assets::text NOT IN ('[]', 'null'))
+FROM predictions p
+JOIN signals s ON s.signal_id = p.signal_id
+WHERE p.analysis_status = 'completed'
+    AND p.confidence IS NOT NULL
+ON CONFLICT (prediction_id) DO UPDATE SET
+    signal_id = excluded.signal_id,
+    published_at = excluded.published_at,
+    has_assets = excluded.has_assets;
+
+ANALYZE feed_index;
@@ -39,6 +39,16 @@ class Settings(BaseSettings):
     LLM_BASE_URL: Optional[str] = Field(
         default=None
     )  # Custom base URL for OpenAI-compatible APIs
+    LLM_REQUESTS_PER_MINUTE: Optional[int] = Field(
+        default=None
+    )  # Per-provider request budget; None = provider's rate_limit_rpm
+    LLM_TOKENS_PER_MINUTE: int = Field(default=0)  # Per-provider token budget, 0 = unlimited
+    LLM_CACHE_ENABLED: bool = Field(default=True)  # Reuse responses for identical prompts
+    LLM_CACHE_PATH: str = Field(default="./.cache/llm_responses.db")  # Local SQLite file
+    LLM_CACHE_TTL_HOURS: int = Field(default=720)
+    LLM_CACHE_MAX_ENTRIES: int = Field(default=50000)  # LRU-trimmed beyond this
+    LLM_BATCH_POLL_SECONDS: int = Field(default=30)  # Batch API status check interval
+    LLM_BATCH_TIMEOUT_HOURS: int = Field(default=24)  # Give up waiting on a batch after this
 
     # Ensemble Configuration
     ENSEMBLE_ENABLED: bool = Field(
@@ -60,6 +70,7 @@ class Settings(BaseSettings):
     # Analysis Configuration
     CONFIDENCE_THRESHOLD: float = Field(default=0.7)
     MAX_SHITPOST_LENGTH: int = Field(default=4000)
+    ANALYSIS_CONCURRENCY: int = Field(default=4)  # LLM calls in flight per analyzer batch
 
     # System Launch Configuration
     SYSTEM_LAUNCH_DATE: str = Field(default="2025-01-01T00:00:00Z")
@@ -91,6 +102,18 @@ class Settings(BaseSettings):
     # API Authentication
     API_KEY: Optional[str] = Field(default=None)
 
+    # API Shared Cache (price endpoints; one SQLite file per host, shared by workers)
+    API_SHARED_CACHE_PATH: Optional[str] = Field(default=None)  # default: temp dir
+
+    # API Database Pool (async engine serving the API routers)
+    API_DB_POOL_SIZE: int = Field(default=20)  # connections held per API process
+    API_DB_MAX_OVERFLOW: int = Field(default=20)  # burst connections above the pool
+    API_DB_POOL_TIMEOUT: int = Field(default=10)  # seconds to wait for a connection
+
+    # API Response Cache
+    API_FEED_CACHE_MAX_ENTRIES: int = Field(default=2048)  # cached /api/feed/at responses
+    API_FEED_CACHE_TTL_SECONDS: int = Field(default=300)  # backstop for missed invalidations
+
     # Market Data Resilience Configuration
     ALPHA_VANTAGE_API_KEY: Optional[str] = Field(default=None)
     MARKET_DATA_PRIMARY_PROVIDER: str = Field(default="yfinance")
@@ -101,6 +124,13 @@ class Settings(BaseSettings):
     MARKET_DATA_STALENESS_THRESHOLD_HOURS: int = Field(default=48)
     MARKET_DATA_HEALTH_CHECK_SYMBOLS: str = Field(default="SPY,AAPL")
     MARKET_DATA_FAILURE_ALERT_CHAT_ID: Optional[str] = Field(default=None)
+    MARKET_DATA_MAX_CONCURRENCY: int = Field(default=8)  # parallel symbol fetches
+    MARKET_DATA_BULK_CHUNK_SIZE: int = Field(default=50)  # tickers per multi-ticker download
+    MARKET_DATA_YFINANCE_RATE_LIMIT: float = Field(default=120.0)  # requests/min, 0 = unlimited
+    MARKET_DATA_ALPHAVANTAGE_RATE_LIMIT: float = Field(default=5.0)  # requests/min (free tier)
+    MARKET_DATA_COPY_THRESHOLD: int = Field(default=20000)  # rows; COPY fast path above this (PostgreSQL)
+    MARKET_DATA_PRICE_CACHE_MB: int = Field(default=64)  # in-process price cache budget
+    MARKET_DATA_PRICE_CACHE_TTL_SECONDS: int = Field(default=300)
 
     # ScrapeCreators API Configuration
     SCRAPECREATORS_API_KEY: Optional[str] = Field(default=None)
@@ -131,6 +161,14 @@ class Settings(BaseSettings):
     FILE_LOGGING: bool = Field(default=False)
     LOG_FILE_PATH: Optional[str] = Field(default=None)
 
+    # Historical Echoes
+    ECHO_VECTOR_INDEX_ENABLED: bool = Field(default=False)  # in-process top-k index for echo lookups
+    ECHO_VECTOR_INDEX_REFRESH_SECONDS: int = Field(default=60)  # pick up embeddings stored elsewhere
+    ECHO_HNSW_EF_SEARCH: int = Field(default=100)  # pgvector hnsw.ef_search per echo query
+
+    # Pipeline Tracing
+    PIPELINE_TRACING_ENABLED: bool = Field(default=True)  # per-stage spans keyed by correlation_id
+
     # Neon CLI (used by db-admin tooling, not by application code)
     NEON_PROJECT_ID: Optional[str] = Field(default=None)
     NEON_ORG_ID: Optional[str] = Field(default=None)
@@ -28,8 +28,13 @@ class DatabaseClient:
         self.engine = None
         self.SessionLocal = None
     
-    async def initialize(self):
-        """Initialize database connection and create tables."""
+    async def initialize(self, create_tables: bool = True):
+        """Initialize database connection and create tables.
+
+        Args:
+            create_tables: Run ``create_all`` (read-only users such as the
+                API pass False).
+        """
         # Hide sensitive information in logs
         safe_url = self._mask_database_url(self.config.database_url)
         logger.info(f"Initializing database connection: {safe_url}")
@@ -55,7 +60,8 @@ class DatabaseClient:
                 pool_size=self.config.pool_size,
                 max_overflow=self.config.max_overflow,
                 pool_timeout=self.config.pool_timeout,
-                pool_recycle=self.config.pool_recycle
+                pool_recycle=self.config.pool_recycle,
+                pool_pre_ping=self.config.pool_pre_ping
             )
         
         self.SessionLocal = sessionmaker(
@@ -64,6 +70,10 @@ class DatabaseClient:
             expire_on_commit=False
         )
         
+        if not create_tables:
+            logger.info("Database connection initialized")
+            return
+
         # Create tables
         async with self.engine.begin() as conn:
             await conn.run_sync(Base.metadata.create_all)
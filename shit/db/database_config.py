@@ -17,6 +17,7 @@ class DatabaseConfig:
     max_overflow: int = 10
     pool_timeout: int = 30
     pool_recycle: int = 3600
+    pool_pre_ping: bool = False
     
     # Connection Options
     connect_args: Optional[dict] = None
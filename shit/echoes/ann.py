@@ -0,0 +1,181 @@
+"""
+Manage and benchmark the pgvector HNSW index behind echo lookups.
+
+Usage:
+    python -m shit.echoes.ann status
+    python -m shit.echoes.ann create [--m 16] [--ef-construction 64]
+    python -m shit.echoes.ann reindex
+    python -m shit.echoes.ann benchmark [--queries 50] [--limit 5] [--ef-search 40 100 200]
+
+The benchmark samples stored embeddings as queries and compares HNSW
+top-k results at each ``ef_search`` against an exact sequential scan:
+recall@k (share of the exact top-k the index also returned) and p50/p95
+latency.
+"""
+
+import argparse
+import json
+import time
+
+import numpy as np
+from sqlalchemy import func
+
+from shit.db.sync_session import get_session
+from shit.echoes.echo_service import HNSW_EF_CONSTRUCTION, HNSW_M, EchoService
+from shit.logging import get_service_logger, setup_cli_logging
+
+logger = get_service_logger("echo_ann")
+
+DEFAULT_EF_SEARCH_VALUES = (40, 100, 200)
+
+
+def sample_query_embeddings(count: int) -> list[tuple[int, list[float]]]:
+    """Random ``(prediction_id, embedding)`` pairs to use as benchmark queries."""
+    from shit.echoes.models import PostEmbedding
+
+    with get_session() as session:
+        rows = (
+            session.query(PostEmbedding.prediction_id, PostEmbedding.embedding)
+            .order_by(func.random())
+            .limit(count)
+            .all()
+        )
+    return [(pid, [float(x) for x in embedding]) for pid, embedding in rows]
+
+
+def _latency(samples_ms: list[float]) -> dict:
+    if not samples_ms:
+        return {"p50_ms": None, "p95_ms": None}
+    return {
+        "p50_ms": round(float(np.percentile(samples_ms, 50)), 2),
+        "p95_ms": round(float(np.percentile(samples_ms, 95)), 2),
+    }
+
+
+def benchmark_ann(
+    service: EchoService,
+    queries: list[tuple[int, list[float]]],
+    limit: int = 5,
+    ef_search_values=DEFAULT_EF_SEARCH_VALUES,
+    min_similarity: float = -1.0,
+) -> dict:
+    """Compare HNSW search at each ef_search with exact search.
+
+    Each query excludes its own prediction. The default *min_similarity*
+    of -1 disables the threshold so recall measures pure top-k.
+
+    Returns:
+        ``{"queries", "limit", "exact": {p50_ms, p95_ms},
+        "ann": [{ef_search, recall, p50_ms, p95_ms}, ...]}``
+    """
+
+    def run(embedding, exclude, **kwargs):
+        start = time.perf_counter()
+        matches = service.find_similar_posts(
+            embedding,
+            limit=limit,
+            min_similarity=min_similarity,
+            exclude_prediction_id=exclude,
+            **kwargs,
+        )
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        return {m["prediction_id"] for m in matches}, elapsed_ms
+
+    truth = []
+    exact_ms = []
+    for prediction_id, embedding in queries:
+        ids, elapsed = run(embedding, prediction_id, exact=True)
+        truth.append(ids)
+        exact_ms.append(elapsed)
+
+    ann = []
+    for ef_search in ef_search_values:
+        found = 0
+        ann_ms = []
+        for (prediction_id, embedding), expected in zip(queries, truth):
+            ids, elapsed = run(embedding, prediction_id, ef_search=ef_search)
+            found += len(ids & expected)
+            ann_ms.append(elapsed)
+        relevant = sum(len(expected) for expected in truth)
+        ann.append(
+            {
+                "ef_search": ef_search,
+                "recall": round(found / relevant, 4) if relevant else None,
+                **_latency(ann_ms),
+            }
+        )
+
+    return {
+        "queries": len(queries),
+        "limit": limit,
+        "exact": _latency(exact_ms),
+        "ann": ann,
+    }
+
+
+def _print_benchmark(report: dict) -> None:
+    exact = report["exact"]
+    print(f"{report['queries']} queries, top-{report['limit']}")
+    print(f"{'mode':<16} {'recall':>8} {'p50 ms':>9} {'p95 ms':>9}")
+    print(f"{'exact':<16} {'1.0':>8} {exact['p50_ms']!s:>9} {exact['p95_ms']!s:>9}")
+    for row in report["ann"]:
+        mode = f"hnsw ef={row['ef_search']}"
+        print(f"{mode:<16} {row['recall']!s:>8} {row['p50_ms']!s:>9} {row['p95_ms']!s:>9}")
+
+
+def main() -> None:
+    """CLI entry point."""
+    setup_cli_logging(verbose=True)
+    parser = argparse.ArgumentParser(description="Manage the post_embeddings HNSW index")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    subparsers.add_parser("status", help="Show index existence, validity and size")
+
+    create = subparsers.add_parser("create", help="Build the index concurrently")
+    create.add_argument("--m", type=int, default=HNSW_M, help=f"Graph degree (default: {HNSW_M})")
+    create.add_argument(
+        "--ef-construction",
+        type=int,
+        default=HNSW_EF_CONSTRUCTION,
+        help=f"Build-time candidate list size (default: {HNSW_EF_CONSTRUCTION})",
+    )
+
+    subparsers.add_parser("reindex", help="Rebuild the index concurrently")
+
+    bench = subparsers.add_parser("benchmark", help="Recall and latency vs exact search")
+    bench.add_argument("--queries", type=int, default=50, help="Sampled queries (default: 50)")
+    bench.add_argument("--limit", type=int, default=5, help="Top-k per query (default: 5)")
+    bench.add_argument(
+        "--ef-search",
+        type=int,
+        nargs="+",
+        default=list(DEFAULT_EF_SEARCH_VALUES),
+        help="ef_search values to test (default: 40 100 200)",
+    )
+    bench.add_argument("--json", action="store_true", help="Print the report as JSON")
+
+    args = parser.parse_args()
+    service = EchoService()
+
+    if args.command == "status":
+        print(json.dumps(service.ann_index_status(), indent=2))
+    elif args.command == "create":
+        service.create_ann_index(m=args.m, ef_construction=args.ef_construction)
+    elif args.command == "reindex":
+        service.reindex_ann_index()
+    elif args.command == "benchmark":
+        queries = sample_query_embeddings(args.queries)
+        if not queries:
+            logger.info("No embeddings to benchmark")
+            return
+        report = benchmark_ann(
+            service, queries, limit=args.limit, ef_search_values=args.ef_search
+        )
+        if args.json:
+            print(json.dumps(report, indent=2))
+        else:
+            _print_benchmark(report)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,84 +2,117 @@
 Backfill embeddings for existing analyzed posts.
 
 Usage:
-    python -m shit.echoes.backfill [--batch-size 100]
+    python -m shit.echoes.backfill [--batch-size 100] [--concurrency 4]
 
 Also serves as a retry mechanism: any prediction without an embedding
 (including those that failed on first attempt) will be picked up.
+
+Predictions are streamed through a server-side cursor one batch at a time,
+so memory stays bounded by ``concurrency`` batches however large the
+backlog. Up to ``concurrency`` embedding API calls run in parallel while
+finished batches are written with a single bulk
+``INSERT ... ON CONFLICT (prediction_id) DO NOTHING`` each. Texts that
+were already embedded (same text_hash) reuse the stored vector.
 """
 
 import argparse
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, Sequence
 
 from sqlalchemy import text
 
 from shit.db.sync_session import get_session
-from shit.echoes.echo_service import EchoService
+from shit.echoes.echo_service import EchoService, text_hash_of
 from shit.logging import get_service_logger, setup_cli_logging
 
 logger = get_service_logger("echo_backfill")
 
-
-def backfill_embeddings(batch_size: int = 100) -> int:
+DEFAULT_CONCURRENCY = 4
+
+UNEMBEDDED_PREDICTIONS_QUERY = text("""
+    SELECT p.id, p.shitpost_id, p.signal_id,
+           COALESCE(s.text, ts.text) as post_text
+    FROM predictions p
+    LEFT JOIN signals s ON s.signal_id = p.signal_id
+    LEFT JOIN truth_social_shitposts ts ON ts.shitpost_id = p.shitpost_id
+    LEFT JOIN post_embeddings pe ON pe.prediction_id = p.id
+    WHERE p.analysis_status = 'completed'
+        AND pe.id IS NULL
+        AND COALESCE(s.text, ts.text) IS NOT NULL
+    ORDER BY p.id
+""")
+
+
+def _stream_unembedded(session, batch_size: int) -> Iterator[Sequence]:
+    """Yield batches of (id, shitpost_id, signal_id, post_text) rows."""
+    result = session.execute(
+        UNEMBEDDED_PREDICTIONS_QUERY.execution_options(
+            stream_results=True, yield_per=batch_size
+        )
+    )
+    yield from result.partitions(batch_size)
+
+
+def _embed_batch(service: EchoService, batch: Sequence) -> tuple[list[dict], int]:
+    """Embedding rows for a batch, plus how many reused a stored vector."""
+    texts = [row[3] for row in batch]
+    vectors, reused = service.embed_texts(texts)
+    records = [
+        {
+            "prediction_id": pred_id,
+            "shitpost_id": shitpost_id,
+            "signal_id": signal_id,
+            "text_hash": text_hash_of(post_text),
+            "embedding": vector,
+            "model": service.embedding_client.model,
+        }
+        for (pred_id, shitpost_id, signal_id, post_text), vector in zip(batch, vectors)
+    ]
+    return records, reused
+
+
+def backfill_embeddings(
+    batch_size: int = 100, concurrency: int = DEFAULT_CONCURRENCY
+) -> int:
     """Embed all existing analyzed posts that don't have embeddings yet.
 
     Args:
         batch_size: Number of texts to embed per OpenAI API call.
+        concurrency: Embedding batches in flight at once.
 
     Returns:
-        Total number of embeddings generated.
+        Total number of embeddings stored.
     """
-    with get_session() as session:
-        predictions = session.execute(
-            text("""
-                SELECT p.id, p.shitpost_id, p.signal_id,
-                       COALESCE(s.text, ts.text) as post_text
-                FROM predictions p
-                LEFT JOIN signals s ON s.signal_id = p.signal_id
-                LEFT JOIN truth_social_shitposts ts ON ts.shitpost_id = p.shitpost_id
-                LEFT JOIN post_embeddings pe ON pe.prediction_id = p.id
-                WHERE p.analysis_status = 'completed'
-                    AND pe.id IS NULL
-                    AND COALESCE(s.text, ts.text) IS NOT NULL
-                ORDER BY p.id
-            """)
-        ).fetchall()
-
-    total = len(predictions)
-    if total == 0:
-        logger.info("No predictions need embedding")
-        return 0
-
-    logger.info(f"Backfilling embeddings for {total} predictions")
     service = EchoService()
     embedded = 0
+    reused = 0
+    pending = deque()
+
+    def store(future) -> None:
+        nonlocal embedded, reused
+        records, batch_reused = future.result()
+        embedded += service.store_embeddings(records)
+        reused += batch_reused
+        logger.info(f"Backfilled {embedded} embeddings ({reused} reused)")
+
+    with (
+        ThreadPoolExecutor(max_workers=concurrency) as pool,
+        get_session() as read_session,
+    ):
+        for batch in _stream_unembedded(read_session, batch_size):
+            pending.append(pool.submit(_embed_batch, service, batch))
+            # Write the oldest batch while the others are still embedding
+            if len(pending) >= concurrency:
+                store(pending.popleft())
+        while pending:
+            store(pending.popleft())
+
+    if embedded == 0:
+        logger.info("No predictions need embedding")
+        return 0
 
-    for i in range(0, total, batch_size):
-        batch = predictions[i : i + batch_size]
-        texts = [row[3] for row in batch]
-
-        embeddings = service.embedding_client.embed_batch(texts)
-
-        import hashlib
-
-        from shit.echoes.models import PostEmbedding
-
-        with get_session() as session:
-            for j, (pred_id, shitpost_id, signal_id, post_text) in enumerate(batch):
-                text_hash = hashlib.sha256(post_text.encode()).hexdigest()
-                record = PostEmbedding(
-                    prediction_id=pred_id,
-                    shitpost_id=shitpost_id,
-                    signal_id=signal_id,
-                    text_hash=text_hash,
-                    embedding=embeddings[j],
-                    model=service.embedding_client.model,
-                )
-                session.add(record)
-
-        embedded += len(batch)
-        logger.info(f"Backfilled {min(i + batch_size, total)}/{total} embeddings")
-
-    logger.info(f"Backfill complete: {embedded} embeddings generated")
+    logger.info(f"Backfill complete: {embedded} embeddings stored ({reused} reused)")
     return embedded
 
 
@@ -93,8 +126,14 @@ def main() -> None:
         default=100,
         help="Texts per OpenAI API call (default: 100)",
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        help=f"Embedding batches in flight at once (default: {DEFAULT_CONCURRENCY})",
+    )
     args = parser.parse_args()
-    backfill_embeddings(batch_size=args.batch_size)
+    backfill_embeddings(batch_size=args.batch_size, concurrency=args.concurrency)
 
 
 if __name__ == "__main__":
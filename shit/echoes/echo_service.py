@@ -3,15 +3,23 @@ EchoService — Historical similarity search and outcome aggregation.
 
 Embeds post text, stores embeddings in pgvector, finds similar past posts,
 and aggregates their realized market outcomes.
+
+Similarity search is an ORDER BY ... LIMIT top-k over the pgvector HNSW
+index (created/reindexed by ``create_ann_index``/``reindex_ann_index``, or
+scripts/012), post-filtered on status and threshold. With
+ECHO_VECTOR_INDEX_ENABLED it runs against the in-process vector index
+(shit/echoes/vector_index.py) instead; ``exact=True`` always scans.
 """
 
 import hashlib
-from typing import Optional
+from typing import Iterable, Optional
 
 from sqlalchemy import text as sql_text
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 
-from shit.db.sync_session import get_session
+from shit.config.shitpost_settings import settings
+from shit.db.sync_session import engine, get_session
+from shit.echoes.vector_index import vector_index
 from shit.llm.embeddings import EmbeddingClient
 from shit.logging import get_service_logger
 
@@ -21,6 +29,97 @@ EMBEDDING_MODEL = "text-embedding-3-small"
 DEFAULT_SIMILARITY_THRESHOLD = 0.65
 DEFAULT_MATCH_LIMIT = 5
 
+# Extra vector-index candidates fetched per search, to absorb status filtering
+INDEX_CANDIDATE_SLACK = 10
+
+# pgvector HNSW index over post_embeddings.embedding (cosine distance)
+ANN_INDEX_NAME = "ix_post_embeddings_embedding_hnsw"
+HNSW_M = 16
+HNSW_EF_CONSTRUCTION = 64
+
+# Index-driven top-k: nearest candidates by distance alone (servable by the
+# HNSW index), then the exclusion, status and threshold filters.
+ANN_SIMILARITY_QUERY = sql_text("""
+    WITH candidates AS (
+        SELECT
+            pe.prediction_id,
+            pe.shitpost_id,
+            pe.signal_id,
+            pe.embedding <=> :query_vec AS distance
+        FROM post_embeddings pe
+        ORDER BY pe.embedding <=> :query_vec
+        LIMIT :candidates
+    )
+    SELECT
+        c.prediction_id,
+        c.shitpost_id,
+        c.signal_id,
+        1 - c.distance AS similarity,
+        p.assets,
+        p.market_impact,
+        p.confidence,
+        p.thesis,
+        p.post_timestamp
+    FROM candidates c
+    JOIN predictions p ON p.id = c.prediction_id
+    WHERE c.prediction_id != COALESCE(:exclude_id, -1)
+        AND p.analysis_status = 'completed'
+        AND c.distance <= :max_dist
+    ORDER BY c.distance
+    LIMIT :lim
+""")
+
+# Exact search: every embedding is scored (used for verification/benchmarks)
+EXACT_SIMILARITY_QUERY = sql_text("""
+    SELECT
+        pe.prediction_id,
+        pe.shitpost_id,
+        pe.signal_id,
+        1 - (pe.embedding <=> :query_vec) AS similarity,
+        p.assets,
+        p.market_impact,
+        p.confidence,
+        p.thesis,
+        p.post_timestamp
+    FROM post_embeddings pe
+    JOIN predictions p ON p.id = pe.prediction_id
+    WHERE pe.prediction_id != COALESCE(:exclude_id, -1)
+        AND p.analysis_status = 'completed'
+        AND (pe.embedding <=> :query_vec) <= :max_dist
+    ORDER BY pe.embedding <=> :query_vec
+    LIMIT :lim
+""")
+
+
+def text_hash_of(text: str) -> str:
+    """SHA-256 of the post text, the PostEmbedding.text_hash reuse key."""
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+def _match_dict(
+    prediction_id,
+    shitpost_id,
+    signal_id,
+    similarity,
+    assets,
+    market_impact,
+    confidence,
+    thesis,
+    post_timestamp,
+) -> dict:
+    """Match dict in the column order of the similarity query."""
+    return {
+        "prediction_id": prediction_id,
+        "shitpost_id": shitpost_id,
+        "signal_id": signal_id,
+        "similarity": round(float(similarity), 4),
+        "assets": assets,
+        "market_impact": market_impact,
+        "confidence": confidence,
+        "thesis": thesis,
+        "post_timestamp": post_timestamp,
+    }
+
 
 class EchoService:
     """Manages post embeddings and historical similarity search.
@@ -46,6 +145,9 @@ class EchoService:
     ) -> bool:
         """Generate embedding for a post and store it.
 
+        Text already embedded for another prediction (same text_hash) reuses
+        the stored vector instead of calling the embeddings API.
+
         Returns True if stored, False if error or already exists.
         """
         if not text or not text.strip():
@@ -64,9 +166,13 @@ class EchoService:
                 logger.debug(f"Embedding already exists for prediction {prediction_id}")
                 return False
 
-        embedding = self.embedding_client.embed(text)
+        text_hash = text_hash_of(text)
+        embedding = self.reuse_embeddings([text_hash]).get(text_hash)
+        if embedding is None:
+            embedding = self.embedding_client.embed(text)
+        else:
+            logger.debug(f"Reusing stored embedding for prediction {prediction_id}")
 
-        text_hash = hashlib.sha256(text.encode()).hexdigest()
         # INSERT ... ON CONFLICT (prediction_id) DO NOTHING closes the TOCTOU race
         # between the pre-check above and this insert: two concurrent workers can
         # both pass the existence check, both embed, and race to insert. Column
@@ -89,6 +195,8 @@ class EchoService:
 
         if inserted:
             logger.info(f"Stored embedding for prediction {prediction_id}")
+            if settings.ECHO_VECTOR_INDEX_ENABLED:
+                vector_index.add(prediction_id, embedding)
         else:
             # A concurrent writer stored this prediction's embedding between our
             # pre-check and insert. The desired end-state holds, so the conflict
@@ -99,6 +207,74 @@ class EchoService:
             )
         return True
 
+    def reuse_embeddings(self, text_hashes: Iterable[str]) -> dict[str, list[float]]:
+        """Stored vectors for texts this model has already embedded, by text_hash.
+
+        Identical text (reposts, re-analysed posts) embeds identically, so a
+        hit saves an embeddings API call.
+        """
+        hashes = set(text_hashes)
+        if not hashes:
+            return {}
+
+        from shit.echoes.models import PostEmbedding
+
+        with get_session() as session:
+            rows = (
+                session.query(PostEmbedding.text_hash, PostEmbedding.embedding)
+                .filter(
+                    PostEmbedding.text_hash.in_(hashes),
+                    PostEmbedding.model == self.embedding_client.model,
+                )
+                .all()
+            )
+        return {text_hash: list(embedding) for text_hash, embedding in rows}
+
+    def embed_texts(self, texts: list[str]) -> tuple[list[list[float]], int]:
+        """Embed *texts*, reusing stored vectors and deduplicating repeats.
+
+        Only distinct texts with no stored embedding go to the API, in one
+        batch call.
+
+        Returns:
+            (one vector per input text, number of texts that skipped the API)
+        """
+        hashes = [text_hash_of(t) for t in texts]
+        vectors = self.reuse_embeddings(hashes)
+
+        missing: dict[str, str] = {}
+        for text, text_hash in zip(texts, hashes):
+            if text_hash not in vectors:
+                missing.setdefault(text_hash, text)
+        if missing:
+            fresh = self.embedding_client.embed_batch(list(missing.values()))
+            vectors.update(zip(missing, fresh))
+
+        return [vectors[h] for h in hashes], len(texts) - len(missing)
+
+    def store_embeddings(self, records: list[dict]) -> int:
+        """Bulk-insert embedding rows, skipping predictions that already have one.
+
+        Args:
+            records: PostEmbedding column dicts (prediction_id, shitpost_id,
+                signal_id, text_hash, embedding, model).
+
+        Returns:
+            Number of rows inserted.
+        """
+        if not records:
+            return 0
+
+        from shit.echoes.models import PostEmbedding
+
+        stmt = (
+            pg_insert(PostEmbedding)
+            .values(records)
+            .on_conflict_do_nothing(index_elements=["prediction_id"])
+        )
+        with get_session() as session:
+            return session.execute(stmt).rowcount
+
     def get_embedding(self, prediction_id: int) -> Optional[list[float]]:
         """Retrieve the stored embedding for a prediction."""
         from shit.echoes.models import PostEmbedding
@@ -119,6 +295,8 @@ class EchoService:
         limit: int = DEFAULT_MATCH_LIMIT,
         min_similarity: float = DEFAULT_SIMILARITY_THRESHOLD,
         exclude_prediction_id: int | None = None,
+        exact: bool = False,
+        ef_search: int | None = None,
     ) -> list[dict]:
         """Find the most similar historical posts by embedding cosine similarity.
 
@@ -127,60 +305,172 @@ class EchoService:
             limit: Maximum number of matches to return.
             min_similarity: Minimum cosine similarity threshold (0-1).
             exclude_prediction_id: Exclude this prediction from results.
+            exact: Run an exact sequential scan, bypassing both the vector
+                index and the HNSW index (for verifying their results).
+            ef_search: HNSW candidate list size for this query (default:
+                ECHO_HNSW_EF_SEARCH); higher trades latency for recall.
 
         Returns:
             List of dicts with prediction_id, similarity, text preview, etc.
         """
+        if settings.ECHO_VECTOR_INDEX_ENABLED and not exact:
+            return self._find_similar_indexed(
+                embedding, limit, min_similarity, exclude_prediction_id
+            )
+
         max_distance = 1.0 - min_similarity
+        params = {
+            "query_vec": str(embedding),
+            "exclude_id": exclude_prediction_id,
+            "max_dist": max_distance,
+            "lim": limit,
+        }
 
-        query = sql_text("""
-            SELECT
-                pe.prediction_id,
-                pe.shitpost_id,
-                pe.signal_id,
-                1 - (pe.embedding <=> :query_vec) AS similarity,
-                p.assets,
-                p.market_impact,
-                p.confidence,
-                p.thesis,
-                p.post_timestamp
-            FROM post_embeddings pe
-            JOIN predictions p ON p.id = pe.prediction_id
-            WHERE pe.prediction_id != COALESCE(:exclude_id, -1)
-                AND p.analysis_status = 'completed'
-                AND (pe.embedding <=> :query_vec) <= :max_dist
-            ORDER BY pe.embedding <=> :query_vec
-            LIMIT :lim
-        """)
+        with get_session() as session:
+            if exact:
+                # Force the sequential scan so results are ground truth
+                session.execute(
+                    sql_text("SELECT set_config('enable_indexscan', 'off', true)")
+                )
+                query = EXACT_SIMILARITY_QUERY
+            else:
+                ef_search = ef_search or settings.ECHO_HNSW_EF_SEARCH
+                session.execute(
+                    sql_text("SELECT set_config('hnsw.ef_search', :ef, true)"),
+                    {"ef": str(ef_search)},
+                )
+                query = ANN_SIMILARITY_QUERY
+                params["candidates"] = max(ef_search, limit + INDEX_CANDIDATE_SLACK)
+
+            result = session.execute(query, params)
+            matches = [_match_dict(*row) for row in result.fetchall()]
+
+        return matches
+
+    def _find_similar_indexed(
+        self,
+        embedding: list[float],
+        limit: int,
+        min_similarity: float,
+        exclude_prediction_id: int | None,
+    ) -> list[dict]:
+        """find_similar_posts() against the in-process vector index.
+
+        Over-fetches candidates so that predictions whose status changed
+        since they were indexed can be dropped without coming up short.
+        """
+        from shit.echoes.models import PostEmbedding
+        from shitvault.shitpost_models import Prediction
 
         with get_session() as session:
-            result = session.execute(
-                query,
-                {
-                    "query_vec": str(embedding),
-                    "exclude_id": exclude_prediction_id,
-                    "max_dist": max_distance,
-                    "lim": limit,
-                },
+            candidates = vector_index.search(
+                session,
+                embedding,
+                limit=limit + INDEX_CANDIDATE_SLACK,
+                min_similarity=min_similarity,
+                exclude_prediction_id=exclude_prediction_id,
             )
-
-            matches = []
-            for row in result.fetchall():
-                matches.append(
-                    {
-                        "prediction_id": row[0],
-                        "shitpost_id": row[1],
-                        "signal_id": row[2],
-                        "similarity": round(float(row[3]), 4),
-                        "assets": row[4],
-                        "market_impact": row[5],
-                        "confidence": row[6],
-                        "thesis": row[7],
-                        "post_timestamp": row[8],
-                    }
+            if not candidates:
+                return []
+
+            similarity = dict(candidates)
+            rows = (
+                session.query(
+                    PostEmbedding.prediction_id,
+                    PostEmbedding.shitpost_id,
+                    PostEmbedding.signal_id,
+                    Prediction.assets,
+                    Prediction.market_impact,
+                    Prediction.confidence,
+                    Prediction.thesis,
+                    Prediction.post_timestamp,
+                )
+                .join(Prediction, Prediction.id == PostEmbedding.prediction_id)
+                .filter(
+                    PostEmbedding.prediction_id.in_(similarity),
+                    Prediction.analysis_status == "completed",
                 )
+                .all()
+            )
 
-        return matches
+        rows.sort(key=lambda row: similarity[row[0]], reverse=True)
+        return [
+            _match_dict(*row[:3], similarity[row[0]], *row[3:]) for row in rows[:limit]
+        ]
+
+    def ann_index_status(self) -> dict:
+        """Existence, validity and on-disk size of the HNSW index."""
+        query = sql_text("""
+            SELECT i.indisvalid, pg_relation_size(c.oid), pg_get_indexdef(c.oid)
+            FROM pg_class c
+            JOIN pg_index i ON i.indexrelid = c.oid
+            WHERE c.relname = :name
+        """)
+        with get_session() as session:
+            row = session.execute(query, {"name": ANN_INDEX_NAME}).first()
+
+        if row is None:
+            return {
+                "name": ANN_INDEX_NAME,
+                "exists": False,
+                "valid": False,
+                "size_bytes": 0,
+                "definition": None,
+            }
+        return {
+            "name": ANN_INDEX_NAME,
+            "exists": True,
+            "valid": bool(row[0]),
+            "size_bytes": int(row[1]),
+            "definition": row[2],
+        }
+
+    def create_ann_index(
+        self, m: int = HNSW_M, ef_construction: int = HNSW_EF_CONSTRUCTION
+    ) -> bool:
+        """Build the HNSW index without blocking writes.
+
+        An invalid index left behind by an interrupted concurrent build is
+        dropped first.
+
+        Returns:
+            True if the index was built, False if a valid one already exists.
+        """
+        status = self.ann_index_status()
+        if status["valid"]:
+            logger.info(f"{ANN_INDEX_NAME} already exists")
+            return False
+
+        statements = []
+        if status["exists"]:
+            logger.warning(f"Dropping invalid {ANN_INDEX_NAME} before rebuilding")
+            statements.append(f"DROP INDEX CONCURRENTLY IF EXISTS {ANN_INDEX_NAME}")
+        statements.append(
+            f"CREATE INDEX CONCURRENTLY {ANN_INDEX_NAME} ON post_embeddings "
+            f"USING hnsw (embedding vector_cosine_ops) "
+            f"WITH (m = {int(m)}, ef_construction = {int(ef_construction)})"
+        )
+        self._run_autocommit(statements)
+        logger.info(f"Built {ANN_INDEX_NAME} (m={m}, ef_construction={ef_construction})")
+        return True
+
+    def reindex_ann_index(self) -> None:
+        """Rebuild the HNSW index without blocking writes (creates it if missing).
+
+        Worth running after large backfills, which degrade graph quality.
+        """
+        if not self.ann_index_status()["exists"]:
+            self.create_ann_index()
+            return
+        self._run_autocommit([f"REINDEX INDEX CONCURRENTLY {ANN_INDEX_NAME}"])
+        logger.info(f"Reindexed {ANN_INDEX_NAME}")
+
+    @staticmethod
+    def _run_autocommit(statements: list[str]) -> None:
+        """Run DDL outside a transaction (required by CONCURRENTLY)."""
+        with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+            for statement in statements:
+                conn.execute(sql_text(statement))
 
     def aggregate_echoes(
         self,
@@ -3,7 +3,7 @@ PostEmbedding model for storing text embeddings with pgvector.
 """
 
 from pgvector.sqlalchemy import Vector
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Index
 from sqlalchemy.sql import func
 
 from shit.db.data_models import Base
@@ -13,6 +13,17 @@ class PostEmbedding(Base):
     """Stores text embeddings for semantic similarity search."""
 
     __tablename__ = "post_embeddings"
+    __table_args__ = (
+        # Serves EchoService's ORDER BY embedding <=> :q LIMIT k lookups
+        # (scripts/012_post_embeddings_hnsw_index.sql)
+        Index(
+            "ix_post_embeddings_embedding_hnsw",
+            "embedding",
+            postgresql_using="hnsw",
+            postgresql_with={"m": 16, "ef_construction": 64},
+            postgresql_ops={"embedding": "vector_cosine_ops"},
+        ),
+    )
 
     id = Column(Integer, primary_key=True)
     prediction_id = Column(
@@ -24,7 +35,7 @@ class PostEmbedding(Base):
     )
     shitpost_id = Column(String(255), nullable=True)
     signal_id = Column(String(255), nullable=True)
-    text_hash = Column(String(64), nullable=False)
+    text_hash = Column(String(64), nullable=False, index=True)  # embedding reuse key
     embedding = Column(Vector(1536), nullable=False)
     model = Column(String(50), nullable=False, default="text-embedding-3-small")
     created_at = Column(DateTime, nullable=False, server_default=func.now())
@@ -0,0 +1,225 @@
+"""
+Vector Index
+In-process top-k index over post_embeddings for EchoService.
+
+Without it, every echo lookup (one per alert, per /api/echoes call and per
+briefing item) is a sequential pgvector ``<=>`` scan over every stored
+embedding joined to predictions. The index keeps the embeddings of completed
+predictions as one L2-normalised float32 NumPy matrix, so cosine similarity
+against a query is a single matrix-vector product and top-k is an
+``argpartition`` — exact cosine ranking (to float32 precision) whose cost
+stays flat as the history grows.
+
+The index is:
+
+- loaded lazily, in id-ordered batches, on the first search;
+- refreshed incrementally: at most every ECHO_VECTOR_INDEX_REFRESH_SECONDS a
+  search picks up rows stored since the last load, so embeddings written by
+  other processes become visible; EchoService also adds the embeddings it
+  stores itself right away. Each refresh re-reads the last RESCAN_ROWS ids
+  below the high-water mark: ids are assigned at insert but rows become
+  visible at commit, so a concurrent writer's row can appear below ids
+  already loaded (as can a prediction that completes after its embedding
+  was stored). Rows already indexed are skipped;
+- filtered on ``analysis_status``: only completed predictions are loaded,
+  and EchoService re-checks the status when it fetches the matched rows.
+
+Enabled with ECHO_VECTOR_INDEX_ENABLED (about 6 KB of memory per stored
+post); ``EchoService.find_similar_posts(..., exact=True)`` always runs the
+pgvector query, for verification.
+"""
+
+import threading
+import time
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from shit.config.shitpost_settings import settings
+
+# Rows fetched per query while loading the index
+LOAD_BATCH_SIZE = 5000
+
+# Ids below the high-water mark re-read on every refresh, for late commits
+RESCAN_ROWS = 1000
+
+
+class VectorIndex:
+    """Thread-safe normalised embedding matrix keyed by prediction_id."""
+
+    def __init__(self, refresh_seconds: float):
+        self.refresh_seconds = refresh_seconds
+        self._ids = np.empty(0, dtype=np.int64)
+        self._matrix = np.empty((0, 0), dtype=np.float32)
+        self._size = 0
+        self._positions: dict[int, int] = {}
+        self._high_water = 0
+        self._loaded = False
+        self._refreshed_at = 0.0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def loaded(self) -> bool:
+        return self._loaded
+
+    def search(
+        self,
+        session: Session,
+        query: Sequence[float],
+        limit: int,
+        min_similarity: float = 0.0,
+        exclude_prediction_id: Optional[int] = None,
+    ) -> List[Tuple[int, float]]:
+        """Top *limit* ``(prediction_id, similarity)`` pairs, most similar first.
+
+        Loads or refreshes the index from *session* first when due.
+        """
+        self.refresh(session)
+
+        vector = _normalise(np.asarray(query, dtype=np.float32))
+        with self._lock:
+            if self._size == 0 or vector is None:
+                return []
+            if vector.shape[0] != self._matrix.shape[1]:
+                raise ValueError(
+                    f"Query has {vector.shape[0]} dimensions, "
+                    f"index has {self._matrix.shape[1]}"
+                )
+            ids = self._ids[: self._size]
+            scores = self._matrix[: self._size] @ vector
+
+        if exclude_prediction_id is not None:
+            scores = np.where(ids == exclude_prediction_id, -np.inf, scores)
+
+        k = min(limit, len(scores))
+        if k <= 0:
+            return []
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return [
+            (int(ids[i]), float(scores[i]))
+            for i in top
+            if scores[i] >= min_similarity
+        ]
+
+    def refresh(self, session: Session, force: bool = False) -> int:
+        """Load rows stored since the last refresh; returns how many were added.
+
+        Rows within ``RESCAN_ROWS`` ids below the newest loaded one are read
+        again, so rows committed out of id order are not missed. Does nothing
+        until ``refresh_seconds`` have passed since the last refresh, unless
+        the index has never been loaded or *force* is set.
+        """
+        with self._lock:
+            due = time.monotonic() - self._refreshed_at >= self.refresh_seconds
+            if self._loaded and not (due or force):
+                return 0
+            after = max(0, self._high_water - RESCAN_ROWS)
+
+        added = 0
+        for batch in _iter_completed_embeddings(session, after):
+            with self._lock:
+                added += self._append(batch)
+                self._high_water = max(self._high_water, batch[-1][0])
+
+        with self._lock:
+            self._loaded = True
+            self._refreshed_at = time.monotonic()
+        return added
+
+    def add(self, prediction_id: int, embedding: Sequence[float]) -> None:
+        """Add an embedding this process just stored (no-op until loaded)."""
+        with self._lock:
+            if self._loaded:
+                self._append([(None, prediction_id, embedding)])
+
+    def clear(self) -> None:
+        """Drop everything; the next search reloads from the database."""
+        with self._lock:
+            self._ids = np.empty(0, dtype=np.int64)
+            self._matrix = np.empty((0, 0), dtype=np.float32)
+            self._size = 0
+            self._positions = {}
+            self._high_water = 0
+            self._loaded = False
+            self._refreshed_at = 0.0
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "embeddings": self._size,
+                "bytes": int(self._matrix.nbytes + self._ids.nbytes),
+                "loaded": self._loaded,
+            }
+
+    def _append(self, rows: Iterable[Tuple[Optional[int], int, Sequence[float]]]) -> int:
+        """Append ``(row_id, prediction_id, embedding)`` rows; caller holds the lock."""
+        added = 0
+        for _, prediction_id, embedding in rows:
+            if prediction_id in self._positions:
+                continue
+            vector = _normalise(np.asarray(embedding, dtype=np.float32))
+            if vector is None:
+                continue
+            self._reserve(self._size + 1, vector.shape[0])
+            self._ids[self._size] = prediction_id
+            self._matrix[self._size] = vector
+            self._positions[prediction_id] = self._size
+            self._size += 1
+            added += 1
+        return added
+
+    def _reserve(self, rows: int, dims: int) -> None:
+        """Grow the buffers geometrically so appends stay amortised O(1)."""
+        if self._matrix.shape[1] not in (0, dims):
+            raise ValueError(
+                f"Embedding has {dims} dimensions, index has {self._matrix.shape[1]}"
+            )
+        capacity = self._matrix.shape[0]
+        if rows <= capacity and self._matrix.shape[1] == dims:
+            return
+        capacity = max(rows, capacity * 2, 1024)
+        matrix = np.zeros((capacity, dims), dtype=np.float32)
+        ids = np.zeros(capacity, dtype=np.int64)
+        if self._size:
+            matrix[: self._size] = self._matrix[: self._size]
+            ids[: self._size] = self._ids[: self._size]
+        self._matrix, self._ids = matrix, ids
+
+
+def _normalise(vector: np.ndarray) -> Optional[np.ndarray]:
+    """Unit-length copy of *vector*, or None for a zero vector."""
+    norm = float(np.linalg.norm(vector))
+    if not norm:
+        return None
+    return vector / norm
+
+
+def _iter_completed_embeddings(session: Session, after: int):
+    """Yield batches of ``(id, prediction_id, embedding)`` for completed predictions."""
+    from shit.echoes.models import PostEmbedding
+    from shitvault.shitpost_models import Prediction
+
+    while True:
+        batch = (
+            session.query(
+                PostEmbedding.id, PostEmbedding.prediction_id, PostEmbedding.embedding
+            )
+            .join(Prediction, Prediction.id == PostEmbedding.prediction_id)
+            .filter(PostEmbedding.id > after, Prediction.analysis_status == "completed")
+            .order_by(PostEmbedding.id)
+            .limit(LOAD_BATCH_SIZE)
+            .all()
+        )
+        if not batch:
+            return
+        yield batch
+        after = batch[-1][0]
+
+
+# Process-wide index shared by EchoService instances (alerts, API, briefings)
+vector_index = VectorIndex(refresh_seconds=settings.ECHO_VECTOR_INDEX_REFRESH_SECONDS)
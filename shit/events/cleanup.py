@@ -2,6 +2,10 @@
 Event Cleanup
 
 Prune old completed and dead-letter events from the queue.
+
+On a partitioned PostgreSQL events table (see ``shit.events.partitions``)
+retention drops whole expired partitions; the row-level deletes then only
+reach the expired partitions that had to be kept for their live rows.
 """
 
 from datetime import datetime, timezone, timedelta
@@ -9,8 +13,16 @@ from datetime import datetime, timezone, timedelta
 from sqlalchemy import and_
 
 from shit.db.sync_session import get_session
-from shit.events.models import Event
+from shit.events.models import Event, PipelineSpan
 from shit.events.event_types import EventStatus
+from shit.events.partitions import (
+    PARTITIONS_AHEAD,
+    drop_partition,
+    ensure_partitions,
+    expired_partitions,
+    is_partitioned,
+    partition_start,
+)
 from shit.logging import get_service_logger
 
 logger = get_service_logger("event_cleanup")
@@ -28,15 +40,14 @@ def cleanup_completed_events(older_than_days: int = 7) -> int:
     cutoff = datetime.now(timezone.utc) - timedelta(days=older_than_days)
 
     with get_session() as session:
+        conditions = [Event.status == EventStatus.COMPLETED, Event.completed_at < cutoff]
+        if is_partitioned(session):
+            # Leave partitions not yet wholly past the cutoff to the partition drop
+            conditions.append(Event.created_at < partition_start(cutoff))
         count = (
             session.query(Event)
-            .filter(
-                and_(
-                    Event.status == EventStatus.COMPLETED,
-                    Event.completed_at < cutoff,
-                )
-            )
-            .delete(synchronize_session="fetch")
+            .filter(and_(*conditions))
+            .delete(synchronize_session=False)
         )
 
     logger.info(
@@ -60,15 +71,14 @@ def cleanup_dead_letter_events(older_than_days: int = 30) -> int:
     cutoff = datetime.now(timezone.utc) - timedelta(days=older_than_days)
 
     with get_session() as session:
+        conditions = [Event.status == EventStatus.DEAD_LETTER, Event.updated_at < cutoff]
+        if is_partitioned(session):
+            # Leave partitions not yet wholly past the cutoff to the partition drop
+            conditions.append(Event.created_at < partition_start(cutoff))
         count = (
             session.query(Event)
-            .filter(
-                and_(
-                    Event.status == EventStatus.DEAD_LETTER,
-                    Event.updated_at < cutoff,
-                )
-            )
-            .delete(synchronize_session="fetch")
+            .filter(and_(*conditions))
+            .delete(synchronize_session=False)
         )
 
     logger.info(
@@ -78,6 +88,92 @@ def cleanup_dead_letter_events(older_than_days: int = 30) -> int:
     return count
 
 
+def cleanup_pipeline_spans(older_than_days: int = 14) -> int:
+    """Delete pipeline tracing spans older than the given threshold.
+
+    Args:
+        older_than_days: Delete spans started more than this many days ago.
+
+    Returns:
+        Number of spans deleted.
+    """
+    cutoff = datetime.now(timezone.utc) - timedelta(days=older_than_days)
+
+    with get_session() as session:
+        count = (
+            session.query(PipelineSpan)
+            .filter(PipelineSpan.started_at < cutoff)
+            .delete(synchronize_session=False)
+        )
+
+    logger.info(
+        f"Cleaned up {count} pipeline spans older than {older_than_days} days",
+        extra={"deleted": count, "cutoff_days": older_than_days},
+    )
+    return count
+
+
+def create_future_partitions(weeks_ahead: int = PARTITIONS_AHEAD) -> list[str]:
+    """Create the events partitions for the coming weeks (PostgreSQL only).
+
+    Args:
+        weeks_ahead: Weekly partitions to keep ready beyond the current one.
+
+    Returns:
+        Names of the partitions created (empty if the table isn't partitioned).
+    """
+    with get_session() as session:
+        if not is_partitioned(session):
+            return []
+        return ensure_partitions(session, weeks_ahead=weeks_ahead)
+
+
+def cleanup_expired_partitions(
+    completed_days: int = 7,
+    dead_letter_days: int = 30,
+) -> list[str]:
+    """Drop events partitions whose range is past retention (PostgreSQL only).
+
+    Each drop commits on its own so the lock it takes on the events table is
+    held only briefly. A partition that still holds live rows, or whose lock
+    can't be taken in time, is kept for the next run.
+
+    Args:
+        completed_days: Retention for completed events.
+        dead_letter_days: Retention for dead-letter events.
+
+    Returns:
+        Names of the partitions dropped.
+    """
+    with get_session() as session:
+        if not is_partitioned(session):
+            return []
+        candidates = expired_partitions(session, completed_days=completed_days)
+
+    dropped = []
+    for partition in candidates:
+        try:
+            with get_session() as session:
+                if drop_partition(
+                    session,
+                    partition,
+                    completed_days=completed_days,
+                    dead_letter_days=dead_letter_days,
+                ):
+                    dropped.append(partition.name)
+        except Exception:
+            logger.warning(
+                f"Could not drop event partition {partition.name}, will retry next run",
+                exc_info=True,
+            )
+
+    logger.info(
+        f"Dropped {len(dropped)} expired event partition(s)",
+        extra={"dropped": dropped, "cutoff_days": completed_days},
+    )
+    return dropped
+
+
 def retry_dead_letter_events(
     event_type: str | None = None,
     consumer_group: str | None = None,
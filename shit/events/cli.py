@@ -57,6 +57,87 @@ def cmd_queue_stats(args: argparse.Namespace) -> int:
     return 0
 
 
+def cmd_metrics(args: argparse.Namespace) -> int:
+    """Show per-consumer-group lag, throughput and latency."""
+    import json
+
+    from shit.db.sync_session import get_session
+    from shit.events.metrics import collect_queue_metrics
+
+    with get_session() as session:
+        metrics = collect_queue_metrics(session, window_minutes=args.window_minutes)
+
+    if args.json:
+        print(json.dumps(
+            {
+                "window_minutes": args.window_minutes,
+                "consumer_groups": [m.to_dict() for m in metrics],
+            },
+            indent=2,
+        ))
+        return 0
+
+    def fmt(value, suffix=""):
+        return "-" if value is None else f"{value:.1f}{suffix}"
+
+    print(f"\nQueue metrics (last {args.window_minutes} min)")
+    print(
+        f"{'Consumer Group':<16} {'Pending':>8} {'Oldest':>9} {'Done/min':>9} "
+        f"{'Fail%':>6} {'p50':>8} {'p95':>8} {'p99':>8}"
+    )
+    print("-" * 80)
+    for m in metrics:
+        failure_pct = None if m.failure_rate is None else m.failure_rate * 100
+        print(
+            f"{m.consumer_group:<16} {m.pending:>8} "
+            f"{fmt(m.oldest_pending_age_seconds, 's'):>9} "
+            f"{m.throughput_per_minute:>9.2f} {fmt(failure_pct):>6} "
+            f"{fmt(m.latency.p50, 's'):>8} {fmt(m.latency.p95, 's'):>8} "
+            f"{fmt(m.latency.p99, 's'):>8}"
+        )
+    return 0
+
+
+def cmd_trace_report(args: argparse.Namespace) -> int:
+    """Show post-to-alert latency percentiles broken down by stage."""
+    import json
+
+    from shit.db.sync_session import get_session
+    from shit.events.tracing import build_trace_report, load_spans
+
+    with get_session() as session:
+        report = build_trace_report(load_spans(session, hours=args.hours))
+
+    if args.json:
+        print(json.dumps({"hours": args.hours, **report}, indent=2))
+        return 0
+
+    if not report["traces"]:
+        print(f"No pipeline traces in the last {args.hours} hours.")
+        return 0
+
+    def fmt(summary):
+        return "  ".join(
+            "-" if summary[p] is None else f"{summary[p]:>8.1f}s"
+            for p in ("p50", "p95", "p99")
+        )
+
+    print(f"\nPipeline latency (last {args.hours}h, {report['traces']} traces)")
+    print(f"{'':<28} {'n':>6}  {'p50':>9}  {'p95':>9}  {'p99':>9}")
+    print("-" * 70)
+    for label, key in (("Harvest -> alert", "post_to_alert"),
+                       ("Published -> alert", "published_to_alert")):
+        summary = report[key]
+        print(f"{label:<28} {summary['count']:>6}  {fmt(summary)}")
+    print("-" * 70)
+    for stage, stats in report["stages"].items():
+        for kind in ("wait", "duration"):
+            summary = stats[kind]
+            if summary["count"]:
+                print(f"{stage + ' ' + kind:<28} {summary['count']:>6}  {fmt(summary)}")
+    return 0
+
+
 def cmd_retry_dead_letter(args: argparse.Namespace) -> int:
     """Re-queue dead-letter events for retry."""
     from shit.events.cleanup import retry_dead_letter_events
@@ -76,13 +157,30 @@ def cmd_cleanup(args: argparse.Namespace) -> int:
     from shit.events.cleanup import (
         cleanup_completed_events,
         cleanup_dead_letter_events,
+        cleanup_expired_partitions,
+        cleanup_pipeline_spans,
+        create_future_partitions,
     )
 
+    # Partitioned PostgreSQL table: keep partitions ready, drop expired ones
+    created = create_future_partitions(weeks_ahead=args.weeks_ahead)
+    dropped = cleanup_expired_partitions(
+        completed_days=args.completed_days,
+        dead_letter_days=args.dead_letter_days,
+    )
+    if created:
+        print(f"Created {len(created)} partitions: {', '.join(created)}")
+    if dropped:
+        print(f"Dropped {len(dropped)} expired partitions: {', '.join(dropped)}")
+
     completed_deleted = cleanup_completed_events(older_than_days=args.completed_days)
     dead_deleted = cleanup_dead_letter_events(older_than_days=args.dead_letter_days)
 
     print(f"Deleted {completed_deleted} completed events (>{args.completed_days} days old)")
     print(f"Deleted {dead_deleted} dead-letter events (>{args.dead_letter_days} days old)")
+
+    spans_deleted = cleanup_pipeline_spans(older_than_days=args.span_days)
+    print(f"Deleted {spans_deleted} pipeline spans (>{args.span_days} days old)")
     return 0
 
 
@@ -158,6 +256,34 @@ def main() -> int:
         help="Maximum number of events to retry (default: 100)",
     )
 
+    # metrics
+    metrics_parser = subparsers.add_parser(
+        "metrics",
+        help="Show per-consumer-group lag, throughput and latency",
+    )
+    metrics_parser.add_argument(
+        "--window-minutes", type=int, default=60,
+        help="Window for throughput, failures and latency (default: 60)",
+    )
+    metrics_parser.add_argument(
+        "--json", action="store_true",
+        help="Print metrics as JSON",
+    )
+
+    # trace-report
+    trace_parser = subparsers.add_parser(
+        "trace-report",
+        help="Show post-to-alert latency percentiles by pipeline stage",
+    )
+    trace_parser.add_argument(
+        "--hours", type=int, default=24,
+        help="Report traces started in the last N hours (default: 24)",
+    )
+    trace_parser.add_argument(
+        "--json", action="store_true",
+        help="Print the report as JSON",
+    )
+
     # cleanup
     cleanup_parser = subparsers.add_parser(
         "cleanup",
@@ -171,6 +297,14 @@ def main() -> int:
         "--dead-letter-days", type=int, default=30,
         help="Delete dead-letter events older than N days (default: 30)",
     )
+    cleanup_parser.add_argument(
+        "--weeks-ahead", type=int, default=4,
+        help="Weekly event partitions to create ahead, PostgreSQL only (default: 4)",
+    )
+    cleanup_parser.add_argument(
+        "--span-days", type=int, default=14,
+        help="Delete pipeline tracing spans older than N days (default: 14)",
+    )
 
     # list
     list_parser = subparsers.add_parser(
@@ -202,6 +336,8 @@ def main() -> int:
 
     commands = {
         "queue-stats": cmd_queue_stats,
+        "metrics": cmd_metrics,
+        "trace-report": cmd_trace_report,
         "retry-dead-letter": cmd_retry_dead_letter,
         "cleanup": cmd_cleanup,
         "list": cmd_list_events,
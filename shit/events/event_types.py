@@ -63,6 +63,18 @@ CONSUMER_GROUPS: dict[str, list[str]] = {
 }
 
 
+# Event types announced on the LISTEN/NOTIFY broadcast channel (see
+# shit.events.notify). They change what the API serves, so API replicas
+# invalidate their response caches on them; emitted even with no consumers.
+BROADCAST_EVENT_TYPES: frozenset[str] = frozenset(
+    {
+        EventType.PREDICTION_CREATED,
+        EventType.PRICES_BACKFILLED,
+        EventType.OUTCOMES_MATURED,
+    }
+)
+
+
 # Payload documentation (for reference, not enforced at runtime)
 PAYLOAD_SCHEMAS: dict[str, dict] = {
     EventType.POSTS_HARVESTED: {
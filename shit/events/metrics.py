@@ -0,0 +1,218 @@
+"""
+Event Queue Metrics
+
+Per-consumer-group lag and throughput, for sizing worker pools:
+
+- **Depth**: pending and claimed event counts, and the age of the oldest
+  pending event (how far behind the group is).
+- **Throughput**: events completed per minute over a recent window.
+- **Failures**: events whose latest attempt failed within the window
+  (retrying or dead-lettered), and their share of the window's outcomes.
+- **Latency**: a histogram and percentiles of claim-to-complete time, from
+  the ``claimed_at``/``completed_at`` timestamps ``EventWorker`` records on
+  every event, so all worker processes report through the table itself.
+
+Every figure comes from a handful of aggregate queries served by the
+events indexes (``status``, ``completed_at``, ``ix_events_claimable``);
+latency percentiles use the most recent ``sample_limit`` completions.
+"""
+
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from shit.events.event_types import CONSUMER_GROUPS, EventStatus
+from shit.events.models import Event
+
+# Histogram bucket upper bounds for claim-to-complete latency, in seconds
+LATENCY_BUCKETS = (0.5, 1, 2, 5, 10, 30, 60, 120, 300, 600, 1800, 3600)
+
+# Completions sampled per consumer group for latency percentiles
+DEFAULT_SAMPLE_LIMIT = 5000
+
+
+@dataclass
+class LatencyHistogram:
+    """Claim-to-complete latency distribution, in seconds."""
+
+    count: int = 0
+    p50: Optional[float] = None
+    p95: Optional[float] = None
+    p99: Optional[float] = None
+    max: Optional[float] = None
+    # Cumulative counts per bucket upper bound ("+Inf" last)
+    buckets: dict[str, int] = field(default_factory=dict)
+
+    @classmethod
+    def from_samples(cls, samples: list[float]) -> "LatencyHistogram":
+        """Build a histogram from latency samples."""
+        samples = sorted(samples)
+        buckets = {}
+        for bound in LATENCY_BUCKETS:
+            buckets[str(bound)] = sum(1 for s in samples if s <= bound)
+        buckets["+Inf"] = len(samples)
+
+        if not samples:
+            return cls(buckets=buckets)
+        return cls(
+            count=len(samples),
+            p50=percentile(samples, 50),
+            p95=percentile(samples, 95),
+            p99=percentile(samples, 99),
+            max=round(samples[-1], 3),
+            buckets=buckets,
+        )
+
+
+@dataclass
+class ConsumerGroupMetrics:
+    """Lag and throughput for one consumer group."""
+
+    consumer_group: str
+    pending: int = 0
+    claimed: int = 0
+    oldest_pending_age_seconds: Optional[float] = None
+    completed: int = 0
+    failed: int = 0
+    dead_lettered: int = 0
+    throughput_per_minute: float = 0.0
+    failure_rate: Optional[float] = None
+    latency: LatencyHistogram = field(
+        default_factory=lambda: LatencyHistogram.from_samples([])
+    )
+
+    def to_dict(self) -> dict:
+        """Plain-dict form for JSON output."""
+        return asdict(self)
+
+
+def percentile(sorted_samples: list[float], pct: float) -> float:
+    """Nearest-rank percentile of pre-sorted samples."""
+    rank = max(1, -(-len(sorted_samples) * pct // 100))  # ceil
+    return round(sorted_samples[int(rank) - 1], 3)
+
+
+def _utc_naive(moment: datetime) -> datetime:
+    """Event timestamps are naive UTC columns; normalise for arithmetic."""
+    if moment.tzinfo is not None:
+        moment = moment.astimezone(timezone.utc).replace(tzinfo=None)
+    return moment
+
+
+def collect_queue_metrics(
+    session: Session,
+    window_minutes: int = 60,
+    sample_limit: int = DEFAULT_SAMPLE_LIMIT,
+    now: Optional[datetime] = None,
+) -> list[ConsumerGroupMetrics]:
+    """Compute per-consumer-group queue metrics.
+
+    Args:
+        session: Database session.
+        window_minutes: Window for throughput, failures and latency.
+        sample_limit: Max recent completions per group used for latency.
+        now: Reference time (default: current UTC time).
+
+    Returns:
+        Metrics for every registered consumer group (and any other group
+        with open events), sorted by consumer group.
+    """
+    now = _utc_naive(now or datetime.now(timezone.utc))
+    since = now - timedelta(minutes=window_minutes)
+
+    groups: dict[str, ConsumerGroupMetrics] = {
+        name: ConsumerGroupMetrics(consumer_group=name)
+        for consumers in CONSUMER_GROUPS.values()
+        for name in consumers
+    }
+
+    def group(name: str) -> ConsumerGroupMetrics:
+        if name not in groups:
+            groups[name] = ConsumerGroupMetrics(consumer_group=name)
+        return groups[name]
+
+    # Depth and oldest pending event
+    open_rows = (
+        session.query(
+            Event.consumer_group,
+            Event.status,
+            func.count(Event.id),
+            func.min(Event.created_at),
+        )
+        .filter(Event.status.in_([EventStatus.PENDING, EventStatus.CLAIMED]))
+        .group_by(Event.consumer_group, Event.status)
+        .all()
+    )
+    for name, status, count, oldest in open_rows:
+        metrics = group(name)
+        if status == EventStatus.PENDING:
+            metrics.pending = count
+            if oldest is not None:
+                age = (now - _utc_naive(oldest)).total_seconds()
+                metrics.oldest_pending_age_seconds = round(max(age, 0.0), 3)
+        else:
+            metrics.claimed = count
+
+    # Completions in the window
+    completed_rows = (
+        session.query(Event.consumer_group, func.count(Event.id))
+        .filter(Event.status == EventStatus.COMPLETED, Event.completed_at >= since)
+        .group_by(Event.consumer_group)
+        .all()
+    )
+    for name, count in completed_rows:
+        group(name).completed = count
+
+    # Latest attempt failed in the window: retrying or dead-lettered
+    failed_rows = (
+        session.query(Event.consumer_group, Event.status, func.count(Event.id))
+        .filter(
+            Event.status.in_([EventStatus.PENDING, EventStatus.DEAD_LETTER]),
+            Event.error.isnot(None),
+            Event.updated_at >= since,
+        )
+        .group_by(Event.consumer_group, Event.status)
+        .all()
+    )
+    for name, status, count in failed_rows:
+        metrics = group(name)
+        metrics.failed += count
+        if status == EventStatus.DEAD_LETTER:
+            metrics.dead_lettered = count
+
+    for metrics in groups.values():
+        metrics.throughput_per_minute = round(metrics.completed / window_minutes, 3)
+        outcomes = metrics.completed + metrics.failed
+        if outcomes:
+            metrics.failure_rate = round(metrics.failed / outcomes, 4)
+        if metrics.completed:
+            metrics.latency = LatencyHistogram.from_samples(
+                _latency_samples(session, metrics.consumer_group, since, sample_limit)
+            )
+
+    return [groups[name] for name in sorted(groups)]
+
+
+def _latency_samples(
+    session: Session, consumer_group: str, since: datetime, limit: int
+) -> list[float]:
+    """Claim-to-complete seconds for a group's most recent completions."""
+    rows = (
+        session.query(Event.claimed_at, Event.completed_at)
+        .filter(
+            Event.consumer_group == consumer_group,
+            Event.status == EventStatus.COMPLETED,
+            Event.completed_at >= since,
+            Event.claimed_at.isnot(None),
+        )
+        .order_by(Event.completed_at.desc())
+        .limit(limit)
+        .all()
+    )
+    return [
+        max((_utc_naive(done) - _utc_naive(claimed)).total_seconds(), 0.0)
+        for claimed, done in rows
+    ]
@@ -8,7 +8,7 @@ exponential backoff retry, and dead-letter handling.
 
 from datetime import datetime, timezone
 
-from sqlalchemy import Column, String, Text, DateTime, Integer, JSON, Index
+from sqlalchemy import Column, String, Text, DateTime, Float, Integer, JSON, Index
 
 from shit.db.data_models import Base, IDMixin, TimestampMixin
 from shit.events.event_types import EventStatus
@@ -25,6 +25,9 @@ class Event(Base, IDMixin, TimestampMixin):
         pending -> claimed -> completed
                            -> failed -> (retry as pending)
                                      -> dead_letter (after max_attempts)
+
+    On PostgreSQL the table is range-partitioned by ``created_at`` (see
+    ``shit.events.partitions``); its primary key there is ``(id, created_at)``.
     """
 
     __tablename__ = "events"
@@ -98,3 +101,32 @@ class Event(Base, IDMixin, TimestampMixin):
                 datetime.now(timezone.utc).timestamp() + backoff_seconds,
                 tz=timezone.utc,
             )
+
+
+class PipelineSpan(Base, IDMixin, TimestampMixin):
+    """One timed pipeline stage for a correlation_id (see ``shit.events.tracing``).
+
+    A harvest run's ``correlation_id`` follows its events through every
+    consumer, so the spans sharing it trace posts from harvest to alert.
+    """
+
+    __tablename__ = "pipeline_spans"
+
+    correlation_id = Column(String(255), nullable=False, index=True)
+    stage = Column(String(50), nullable=False)
+    status = Column(String(20), nullable=False, default="ok")
+    started_at = Column(DateTime, nullable=False)
+    ended_at = Column(DateTime, nullable=False)
+    duration_ms = Column(Float, nullable=False)
+    attributes = Column(JSON, default=dict, nullable=False)
+
+    __table_args__ = (
+        # Reports and retention scan spans by start time
+        Index("ix_pipeline_spans_started_at", "started_at"),
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<PipelineSpan(stage='{self.stage}', correlation_id='{self.correlation_id}', "
+            f"duration_ms={self.duration_ms})>"
+        )
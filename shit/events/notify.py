@@ -0,0 +1,170 @@
+"""
+Event Queue Wake-ups (PostgreSQL LISTEN/NOTIFY)
+
+``emit_event()`` calls ``notify_consumers()`` in the same transaction as the
+event rows, so PostgreSQL delivers one notification per consumer group
+channel when (and only if) the rows commit. Persistent workers block on an
+``EventListener`` instead of sleeping between polls, so an emitted event is
+picked up immediately and an idle worker stops querying the events table.
+
+Notifications are a wake-up hint only: the payload is empty and the worker
+still claims through ``FOR UPDATE SKIP LOCKED``. Workers keep a slow safety
+poll for missed notifications and for retries whose ``next_retry_at`` has
+passed (those are never notified).
+
+Event types in ``BROADCAST_EVENT_TYPES`` are also announced on
+``BROADCAST_CHANNEL`` with a small JSON payload (``event_type`` and
+``prediction_id``), whether or not they have consumer groups. Every process
+LISTENing there (each API replica) sees every announcement, which is what
+in-process caches need for invalidation; consumer-group rows are only ever
+claimed by one worker.
+
+Other backends (SQLite in development and tests) have no LISTEN/NOTIFY:
+``notify_consumers()`` and ``notify_broadcast()`` are no-ops and
+``EventListener.open()`` returns None, leaving workers on fixed-interval
+polling.
+"""
+
+import json
+import select
+from typing import Iterable, Optional
+
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from shit.events.event_types import BROADCAST_EVENT_TYPES
+from shit.logging import get_service_logger
+
+logger = get_service_logger("event_notify")
+
+CHANNEL_PREFIX = "events_"
+
+# Channel announcing BROADCAST_EVENT_TYPES to every listening process
+BROADCAST_CHANNEL = "events_broadcast"
+
+
+def channel_for(consumer_group: str) -> str:
+    """Notification channel name for a consumer group."""
+    return f"{CHANNEL_PREFIX}{consumer_group}"
+
+
+def supports_notify(bind) -> bool:
+    """Whether the engine/connection is PostgreSQL (has LISTEN/NOTIFY)."""
+    return getattr(getattr(bind, "dialect", None), "name", None) == "postgresql"
+
+
+def notify_consumers(session: Session, consumer_groups: Iterable[str]) -> None:
+    """Queue a wake-up for each consumer group, delivered on commit.
+
+    Args:
+        session: Session holding the uncommitted event rows.
+        consumer_groups: Groups that received a row.
+    """
+    if not supports_notify(session.get_bind()):
+        return
+    for consumer_group in sorted(set(consumer_groups)):
+        session.execute(
+            text("SELECT pg_notify(:channel, '')"),
+            {"channel": channel_for(consumer_group)},
+        )
+
+
+def notify_broadcast(session: Session, events: Iterable[tuple[str, dict]]) -> None:
+    """Queue a broadcast for each ``(event_type, payload)`` in BROADCAST_EVENT_TYPES.
+
+    Delivered on commit, like ``notify_consumers()``. Only the event type
+    and the payload's ``prediction_id`` are sent (NOTIFY payloads are
+    capped at 8000 bytes).
+    """
+    if not supports_notify(session.get_bind()):
+        return
+    for event_type, payload in events:
+        if event_type not in BROADCAST_EVENT_TYPES:
+            continue
+        message = {"event_type": event_type, "prediction_id": payload.get("prediction_id")}
+        session.execute(
+            text("SELECT pg_notify(:channel, :payload)"),
+            {"channel": BROADCAST_CHANNEL, "payload": json.dumps(message)},
+        )
+
+
+class EventListener:
+    """A dedicated connection LISTENing on one notification channel."""
+
+    def __init__(self, connection, channel: str):
+        self._connection = connection
+        self.channel = channel
+
+    @classmethod
+    def open(cls, engine: Engine, consumer_group: str) -> Optional["EventListener"]:
+        """LISTEN for a consumer group's wake-ups.
+
+        The connection is detached from the pool so the LISTEN never leaks
+        into a pooled connection.
+
+        Returns:
+            A listener, or None if the backend has no LISTEN/NOTIFY.
+        """
+        return cls.open_channel(engine, channel_for(consumer_group))
+
+    @classmethod
+    def open_channel(cls, engine: Engine, channel: str) -> Optional["EventListener"]:
+        """LISTEN on an arbitrary channel (e.g. BROADCAST_CHANNEL).
+
+        Returns:
+            A listener, or None if the backend has no LISTEN/NOTIFY.
+        """
+        if not supports_notify(engine):
+            return None
+
+        pooled = engine.raw_connection()
+        pooled.detach()
+        connection = pooled.dbapi_connection
+        connection.autocommit = True
+        with connection.cursor() as cursor:
+            cursor.execute(f'LISTEN "{channel}"')
+        return cls(connection, channel)
+
+    def wait(self, timeout: float) -> bool:
+        """Block until a notification arrives or ``timeout`` seconds pass.
+
+        Returns:
+            True if at least one notification was received.
+        """
+        if not self._drain():
+            ready, _, _ = select.select([self._connection], [], [], timeout)
+            if not ready:
+                return False
+            self._connection.poll()
+            return self._drain()
+        return True
+
+    def receive(self, timeout: float) -> list[str]:
+        """Block until notifications arrive or ``timeout`` seconds pass.
+
+        Returns:
+            The payloads received (empty on timeout), oldest first.
+        """
+        if not self._connection.notifies:
+            ready, _, _ = select.select([self._connection], [], [], timeout)
+            if ready:
+                self._connection.poll()
+        payloads = [notify.payload for notify in self._connection.notifies]
+        self._connection.notifies.clear()
+        return payloads
+
+    def _drain(self) -> bool:
+        """Discard queued notifications; True if there were any."""
+        notifies = self._connection.notifies
+        if not notifies:
+            return False
+        notifies.clear()
+        return True
+
+    def close(self) -> None:
+        """Close the listening connection (ends the LISTEN)."""
+        try:
+            self._connection.close()
+        except Exception:
+            logger.debug(f"Error closing listener on {self.channel}", exc_info=True)
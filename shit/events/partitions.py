@@ -0,0 +1,276 @@
+"""
+Event Table Partitioning (PostgreSQL)
+
+On PostgreSQL the events table is range-partitioned by ``created_at`` into
+weekly partitions (see ``scripts/010_partition_events.sql``):
+
+- ``ensure_partitions()`` creates the partitions for the coming weeks ahead
+  of time. Workers run it at startup and event cleanup runs it daily. Rows
+  outside every range land in the ``events_default`` partition instead of
+  failing; the next ``ensure_partitions()`` fills the missing ranges and
+  moves those rows into them.
+- Retention drops whole partitions: once a partition's range ends before the
+  completed-event cutoff and it holds nothing worth keeping (pending or
+  claimed events, recent completions or dead letters still inside their
+  retention), ``drop_partition()`` detaches and drops it instead of deleting
+  its rows one by one.
+- ``claim_floor()`` gives workers a ``created_at`` lower bound for the claim
+  query, so it is pruned to the hot partitions that can hold pending events.
+
+SQLite (development and tests) keeps the plain table: ``is_partitioned()``
+is False there and callers keep row-level deletes and an unbounded claim.
+"""
+
+import re
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from sqlalchemy import func, select, text
+from sqlalchemy.orm import Session
+
+from shit.events.event_types import EventStatus
+from shit.events.models import Event
+from shit.logging import get_service_logger
+
+logger = get_service_logger("event_partitions")
+
+PARTITION_PREFIX = "events_p"
+
+# Catch-all partition for rows outside every range
+DEFAULT_PARTITION = "events_default"
+
+# Width of one partition
+PARTITION_INTERVAL = timedelta(days=7)
+
+# Weekly partitions kept created beyond the current one
+PARTITIONS_AHEAD = 4
+
+# Slack below the oldest pending event for producers' clock skew
+CLAIM_FLOOR_MARGIN = timedelta(hours=1)
+
+# Give up on a partition drop rather than queue behind long transactions
+DROP_LOCK_TIMEOUT = "5s"
+
+_UPPER_BOUND = re.compile(r"TO \('([^']+)'\)")
+
+
+@dataclass(frozen=True)
+class EventPartition:
+    """One partition of the events table."""
+
+    name: str
+    upper: Optional[datetime]  # Exclusive upper bound (None = MAXVALUE/DEFAULT)
+
+
+def is_partitioned(session: Session) -> bool:
+    """Whether the events table is a partitioned PostgreSQL table."""
+    if session.get_bind().dialect.name != "postgresql":
+        return False
+    relkind = session.execute(
+        text("SELECT relkind FROM pg_class WHERE oid = to_regclass('events')")
+    ).scalar()
+    return relkind == "p"
+
+
+def _utc_naive(moment: datetime) -> datetime:
+    """``created_at`` is a naive UTC column; normalise for comparisons."""
+    if moment.tzinfo is not None:
+        moment = moment.astimezone(timezone.utc).replace(tzinfo=None)
+    return moment
+
+
+def partition_start(moment: datetime) -> datetime:
+    """Start of the weekly partition range containing *moment* (Monday 00:00 UTC)."""
+    day = _utc_naive(moment).replace(hour=0, minute=0, second=0, microsecond=0)
+    return day - timedelta(days=day.weekday())
+
+
+def partition_name(start: datetime) -> str:
+    """Name of the partition whose range starts at *start*."""
+    return f"{PARTITION_PREFIX}{start:%Y%m%d}"
+
+
+def list_partitions(session: Session) -> list[EventPartition]:
+    """Partitions of the events table, oldest upper bound first."""
+    rows = session.execute(
+        text(
+            "SELECT c.relname, pg_get_expr(c.relpartbound, c.oid) "
+            "FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid "
+            "WHERE i.inhparent = 'events'::regclass"
+        )
+    ).all()
+
+    partitions = []
+    for name, bound in rows:
+        match = _UPPER_BOUND.search(bound or "")
+        upper = datetime.fromisoformat(match.group(1)) if match else None
+        partitions.append(EventPartition(name=name, upper=upper))
+    return sorted(partitions, key=lambda p: (p.upper is None, p.upper or datetime.max))
+
+
+def ensure_partitions(
+    session: Session,
+    weeks_ahead: int = PARTITIONS_AHEAD,
+    now: Optional[datetime] = None,
+) -> list[str]:
+    """Create partitions up to ``weeks_ahead`` weeks past the current one.
+
+    New ranges start where the newest existing partition ends, so a partial
+    first week (e.g. after the migration's legacy partition) is filled in
+    rather than overlapping it, and weeks missed while nothing ran are
+    created too (their rows are moved out of the default partition).
+
+    Returns:
+        Names of the partitions created.
+    """
+    current = partition_start(now or datetime.now(timezone.utc))
+    horizon = current + PARTITION_INTERVAL * (weeks_ahead + 1)
+
+    partitions = list_partitions(session)
+    bounded = [p.upper for p in partitions if p.upper is not None]
+    start = max(bounded) if bounded else current
+    has_default = any(p.name == DEFAULT_PARTITION for p in partitions)
+
+    created = []
+    while start < horizon:
+        end = partition_start(start) + PARTITION_INTERVAL
+        name = partition_name(start)
+        _create_partition(session, name, start, end, has_default)
+        created.append(name)
+        start = end
+
+    if created:
+        logger.info(
+            f"Created {len(created)} event partition(s): {', '.join(created)}",
+            extra={"partitions": created},
+        )
+    return created
+
+
+def _create_partition(
+    session: Session, name: str, start: datetime, end: datetime, has_default: bool
+) -> None:
+    """Create one range partition, moving its rows out of the default partition.
+
+    PostgreSQL refuses to create a range while the default partition holds
+    rows inside it, so those are moved with the default detached. The
+    detach holds a lock on the events table until the transaction ends.
+    """
+    bounds = {"start": start, "end": end}
+    create = text(
+        f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF events "
+        f"FOR VALUES FROM ('{start:%Y-%m-%d %H:%M:%S}') "
+        f"TO ('{end:%Y-%m-%d %H:%M:%S}')"
+    )
+    in_range = "created_at >= :start AND created_at < :end"
+    spilled = has_default and session.execute(
+        text(f"SELECT 1 FROM {DEFAULT_PARTITION} WHERE {in_range} LIMIT 1"), bounds
+    ).first()
+    if not spilled:
+        session.execute(create)
+        return
+
+    session.execute(text(f"ALTER TABLE events DETACH PARTITION {DEFAULT_PARTITION}"))
+    session.execute(create)
+    moved = session.execute(
+        text(f"INSERT INTO {name} SELECT * FROM {DEFAULT_PARTITION} WHERE {in_range}"),
+        bounds,
+    ).rowcount
+    session.execute(text(f"DELETE FROM {DEFAULT_PARTITION} WHERE {in_range}"), bounds)
+    session.execute(
+        text(f"ALTER TABLE events ATTACH PARTITION {DEFAULT_PARTITION} DEFAULT")
+    )
+    logger.warning(
+        f"Moved {moved} events from {DEFAULT_PARTITION} into {name}",
+        extra={"partition": name, "moved": moved},
+    )
+
+
+def expired_partitions(
+    session: Session,
+    completed_days: int = 7,
+    now: Optional[datetime] = None,
+) -> list[EventPartition]:
+    """Partitions whose whole range is older than the completed-event cutoff."""
+    cutoff = _utc_naive(now or datetime.now(timezone.utc)) - timedelta(days=completed_days)
+    return [
+        p for p in list_partitions(session)
+        if p.upper is not None and p.upper <= cutoff
+    ]
+
+
+def drop_partition(
+    session: Session,
+    partition: EventPartition,
+    completed_days: int = 7,
+    dead_letter_days: int = 30,
+    now: Optional[datetime] = None,
+) -> bool:
+    """Detach and drop an expired partition unless it still holds live rows.
+
+    The partition is locked before the check so a concurrent retry can't
+    revive a row between the check and the drop. Commit promptly: the
+    detach holds a lock on the events table until the transaction ends.
+
+    Returns:
+        True if the partition was dropped, False if it was kept.
+    """
+    now = _utc_naive(now or datetime.now(timezone.utc))
+    session.execute(text(f"SET LOCAL lock_timeout = '{DROP_LOCK_TIMEOUT}'"))
+    session.execute(text(f"LOCK TABLE {partition.name} IN ACCESS EXCLUSIVE MODE"))
+
+    live = session.execute(
+        text(
+            f"SELECT 1 FROM {partition.name} "
+            "WHERE status NOT IN (:completed, :dead_letter) "
+            "OR (status = :completed AND completed_at >= :completed_cutoff) "
+            "OR (status = :dead_letter AND updated_at >= :dead_letter_cutoff) "
+            "LIMIT 1"
+        ),
+        {
+            "completed": EventStatus.COMPLETED,
+            "dead_letter": EventStatus.DEAD_LETTER,
+            "completed_cutoff": now - timedelta(days=completed_days),
+            "dead_letter_cutoff": now - timedelta(days=dead_letter_days),
+        },
+    ).first()
+    if live:
+        logger.info(
+            f"Keeping expired partition {partition.name}: it still holds live events",
+            extra={"partition": partition.name},
+        )
+        return False
+
+    session.execute(text(f"ALTER TABLE events DETACH PARTITION {partition.name}"))
+    session.execute(text(f"DROP TABLE {partition.name}"))
+    logger.info(
+        f"Dropped expired event partition {partition.name}",
+        extra={"partition": partition.name},
+    )
+    return True
+
+
+def claim_floor(
+    session: Session,
+    consumer_group: str,
+    now: Optional[datetime] = None,
+) -> datetime:
+    """Lowest ``created_at`` a consumer group's claim query needs to scan.
+
+    Pending and claimed (possibly about to be retried) events are never
+    older than this, so bounding the claim by it prunes the cold partitions.
+
+    Returns:
+        The oldest open event's ``created_at`` (or now, if there are none),
+        less ``CLAIM_FLOOR_MARGIN``.
+    """
+    now = _utc_naive(now or datetime.now(timezone.utc))
+    oldest = session.execute(
+        select(func.min(Event.created_at)).where(
+            Event.consumer_group == consumer_group,
+            Event.status.in_([EventStatus.PENDING, EventStatus.CLAIMED]),
+        )
+    ).scalar()
+    floor = now if oldest is None else min(_utc_naive(oldest), now)
+    return floor - CLAIM_FLOOR_MARGIN
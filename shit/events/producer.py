@@ -2,19 +2,34 @@
 Event Producer
 
 Emits events to the PostgreSQL-backed queue with write-time fan-out.
-Each call creates one row per consumer group defined in CONSUMER_GROUPS.
+Each event creates one row per consumer group defined in CONSUMER_GROUPS.
+
+``emit_events()`` fans out any number of events in a single multi-row
+``INSERT ... RETURNING id``; ``emit_event()`` is the one-event shorthand.
+Event types in BROADCAST_EVENT_TYPES are also announced to every listening
+process (see ``shit.events.notify``), even when they have no consumers.
+Both can write inside the caller's session (transactional outbox): the
+events then commit or roll back together with the caller's own changes.
 """
 
 import uuid
 from typing import Optional
 
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
 from shit.db.sync_session import get_session
 from shit.events.models import Event
-from shit.events.event_types import CONSUMER_GROUPS, EventStatus
+from shit.events.event_types import BROADCAST_EVENT_TYPES, CONSUMER_GROUPS, EventStatus
+from shit.events.notify import notify_broadcast, notify_consumers
+from shit.events.tracing import current_correlation_id
 from shit.logging import get_service_logger
 
 logger = get_service_logger("event_producer")
 
+# Event rows per INSERT statement (10 bind parameters each)
+ROWS_PER_STATEMENT = 1000
+
 
 def emit_event(
     event_type: str,
@@ -22,6 +37,7 @@ def emit_event(
     source_service: str,
     correlation_id: Optional[str] = None,
     max_attempts: int = 3,
+    session: Optional[Session] = None,
 ) -> list[int]:
     """Emit an event to all registered consumer groups.
 
@@ -33,8 +49,11 @@ def emit_event(
         payload: Event-specific data dict.
         source_service: Name of the service emitting the event.
         correlation_id: Optional ID to link related events across the chain.
-            If None, a new UUID is generated.
+            If None, the id of the event being processed is used (see
+            ``shit.events.tracing``), else a new UUID is generated.
         max_attempts: Max retry attempts before dead-lettering (default 3).
+        session: Optional caller session to write in; the caller commits.
+            If None, the event is committed in its own transaction.
 
     Returns:
         List of created event IDs.
@@ -42,52 +61,118 @@ def emit_event(
     Raises:
         ValueError: If event_type has no registered consumer groups.
     """
-    consumers = CONSUMER_GROUPS.get(event_type)
-    if consumers is None:
-        raise ValueError(
-            f"Unknown event type: {event_type}. "
-            f"Registered types: {list(CONSUMER_GROUPS.keys())}"
-        )
+    return emit_events(
+        [
+            {
+                "event_type": event_type,
+                "payload": payload,
+                "source_service": source_service,
+                "correlation_id": correlation_id,
+                "max_attempts": max_attempts,
+            }
+        ],
+        session=session,
+    )
 
-    if not consumers:
-        logger.debug(
-            f"Event {event_type} has no consumers, skipping emission",
-            extra={"event_type": event_type, "source": source_service},
-        )
-        return []
 
-    if correlation_id is None:
-        correlation_id = str(uuid.uuid4())
+def emit_events(events: list[dict], session: Optional[Session] = None) -> list[int]:
+    """Emit several events, fanned out with one multi-row INSERT.
 
-    event_ids: list[int] = []
+    Args:
+        events: Dicts with the ``emit_event()`` arguments: ``event_type``,
+            ``payload`` and ``source_service`` (required), ``correlation_id``
+            and ``max_attempts`` (optional).
+        session: Optional caller session to write in; the caller commits
+            (and the wake-up NOTIFY is delivered with that commit). If None,
+            the events are committed in their own transaction.
+
+    Returns:
+        Created event IDs: for each event in order, one per consumer group
+        in CONSUMER_GROUPS order.
+
+    Raises:
+        ValueError: If any event_type is unknown (nothing is written).
+    """
+    rows = []
+    emitted = []
+    broadcasts = []
+    for spec in events:
+        event_type = spec["event_type"]
+        consumers = CONSUMER_GROUPS.get(event_type)
+        if consumers is None:
+            raise ValueError(
+                f"Unknown event type: {event_type}. "
+                f"Registered types: {list(CONSUMER_GROUPS.keys())}"
+            )
 
-    with get_session() as session:
+        if event_type in BROADCAST_EVENT_TYPES:
+            broadcasts.append((event_type, spec["payload"]))
+
+        if not consumers:
+            logger.debug(
+                f"Event {event_type} has no consumers, skipping emission",
+                extra={"event_type": event_type, "source": spec["source_service"]},
+            )
+            continue
+
+        correlation_id = (
+            spec.get("correlation_id") or current_correlation_id() or str(uuid.uuid4())
+        )
         for consumer_group in consumers:
-            event = Event(
-                event_type=event_type,
-                consumer_group=consumer_group,
-                payload=payload,
-                status=EventStatus.PENDING,
-                source_service=source_service,
-                correlation_id=correlation_id,
-                max_attempts=max_attempts,
+            rows.append(
+                {
+                    "event_type": event_type,
+                    "consumer_group": consumer_group,
+                    "payload": spec["payload"],
+                    "status": EventStatus.PENDING,
+                    "source_service": spec["source_service"],
+                    "correlation_id": correlation_id,
+                    "max_attempts": spec.get("max_attempts", 3),
+                }
             )
-            session.add(event)
-            session.flush()  # Assign ID before commit
-            event_ids.append(event.id)
-
-        # Session commits on context manager exit
-
-    logger.info(
-        f"Emitted {event_type} to {len(consumers)} consumer(s): "
-        f"{', '.join(consumers)}",
-        extra={
-            "event_type": event_type,
-            "consumers": consumers,
-            "correlation_id": correlation_id,
-            "source": source_service,
-            "event_ids": event_ids,
-        },
-    )
+        emitted.append((spec, consumers, correlation_id, len(rows)))
+
+    if not rows and not broadcasts:
+        return []
 
+    if session is not None:
+        event_ids = _insert_events(session, rows, broadcasts)
+    else:
+        with get_session() as own_session:
+            event_ids = _insert_events(own_session, rows, broadcasts)
+            # Session commits on context manager exit
+
+    start = 0
+    for spec, consumers, correlation_id, end in emitted:
+        logger.info(
+            f"Emitted {spec['event_type']} to {len(consumers)} consumer(s): "
+            f"{', '.join(consumers)}",
+            extra={
+                "event_type": spec["event_type"],
+                "consumers": consumers,
+                "correlation_id": correlation_id,
+                "source": spec["source_service"],
+                "event_ids": event_ids[start:end],
+            },
+        )
+        start = end
+
+    return event_ids
+
+
+def _insert_events(
+    session: Session, rows: list[dict], broadcasts: list[tuple[str, dict]]
+) -> list[int]:
+    """Insert event rows with multi-row INSERTs and queue wake-ups and broadcasts."""
+    event_ids: list[int] = []
+    for start in range(0, len(rows), ROWS_PER_STATEMENT):
+        chunk = rows[start:start + ROWS_PER_STATEMENT]
+        result = session.execute(insert(Event).values(chunk).returning(Event.id))
+        # One statement draws its ids in VALUES order; RETURNING order isn't
+        # guaranteed, so sort to line them up with the rows
+        event_ids.extend(sorted(result.scalars()))
+
+    # Wake LISTENing workers; PostgreSQL delivers this only on commit
+    notify_consumers(session, {row["consumer_group"] for row in rows})
+    notify_broadcast(session, broadcasts)
     return event_ids
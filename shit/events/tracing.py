@@ -0,0 +1,221 @@
+"""
+Pipeline Latency Tracing
+
+Measures how long a post takes from harvest to Telegram alert, per stage.
+
+A harvest run mints a ``correlation_id`` and stamps it on its
+``posts_harvested`` event. ``EventWorker`` processes every event inside
+``correlation_scope(event.correlation_id)``, and ``emit_event()`` defaults to
+the current scope's id, so the id follows the chain through the S3
+processor, the analyzer, market data and notifications without any
+consumer passing it along.
+
+Each instrumented stage records one ``PipelineSpan`` row via
+``trace_span()``: ``harvest``, ``s3_processor``, ``analysis``,
+``backfill`` and ``alert``. Recording is best-effort (a failed write is
+logged and dropped) and is skipped outside a correlation scope or when
+``PIPELINE_TRACING_ENABLED`` is off.
+
+``build_trace_report()`` turns the spans into p50/p95/p99 post-to-alert
+latency plus per-stage duration and queue wait
+(``python -m shit.events trace-report``).
+"""
+
+import contextvars
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from typing import Iterator, Optional
+
+from shit.config.shitpost_settings import settings
+from shit.db.sync_session import get_session
+from shit.events.metrics import percentile
+from shit.events.models import PipelineSpan
+from shit.logging import get_service_logger
+
+logger = get_service_logger("pipeline_tracing")
+
+# Stages in pipeline order
+STAGES = ("harvest", "s3_processor", "analysis", "backfill", "alert")
+
+# The stage whose output each stage waits on
+UPSTREAM = {
+    "s3_processor": "harvest",
+    "analysis": "s3_processor",
+    "backfill": "analysis",
+    "alert": "analysis",
+}
+
+_correlation_id: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar(
+    "correlation_id", default=None
+)
+
+
+def current_correlation_id() -> Optional[str]:
+    """The correlation_id of the event being processed, if any."""
+    return _correlation_id.get()
+
+
+@contextmanager
+def correlation_scope(correlation_id: Optional[str]) -> Iterator[None]:
+    """Make *correlation_id* current for spans and emitted events."""
+    token = _correlation_id.set(correlation_id)
+    try:
+        yield
+    finally:
+        _correlation_id.reset(token)
+
+
+def record_span(
+    stage: str,
+    correlation_id: Optional[str],
+    started_at: datetime,
+    ended_at: datetime,
+    status: str = "ok",
+    attributes: Optional[dict] = None,
+) -> None:
+    """Persist one span (best-effort; never raises)."""
+    if not settings.PIPELINE_TRACING_ENABLED or not correlation_id:
+        return
+    try:
+        with get_session() as session:
+            session.add(
+                PipelineSpan(
+                    correlation_id=correlation_id,
+                    stage=stage,
+                    status=status,
+                    started_at=started_at,
+                    ended_at=ended_at,
+                    duration_ms=round((ended_at - started_at).total_seconds() * 1000, 3),
+                    attributes=attributes or {},
+                )
+            )
+    except Exception:
+        logger.debug(f"Failed to record {stage} span", exc_info=True)
+
+
+@contextmanager
+def trace_span(
+    stage: str, correlation_id: Optional[str] = None, **attributes
+) -> Iterator[dict]:
+    """Time the enclosed block as one *stage* span.
+
+    Yields the span's attributes dict so the block can add results
+    (e.g. counts) before the span is recorded. An exception marks the span
+    ``error`` and propagates.
+
+    Args:
+        stage: Stage name (one of STAGES).
+        correlation_id: Trace to record under (default: the current scope's).
+        **attributes: Initial span attributes (JSON-serialisable).
+    """
+    correlation_id = correlation_id or current_correlation_id()
+    started_at = datetime.now(timezone.utc)
+    start = time.perf_counter()
+    status = "ok"
+    try:
+        yield attributes
+    except BaseException:
+        status = "error"
+        raise
+    finally:
+        ended_at = started_at + timedelta(seconds=time.perf_counter() - start)
+        record_span(stage, correlation_id, started_at, ended_at, status, attributes)
+
+
+def load_spans(session, hours: int = 24) -> list[PipelineSpan]:
+    """Spans of every trace with a span started in the last *hours* hours."""
+    since = datetime.now(timezone.utc) - timedelta(hours=hours)
+    recent = (
+        session.query(PipelineSpan.correlation_id)
+        .filter(PipelineSpan.started_at >= since)
+        .distinct()
+    )
+    return (
+        session.query(PipelineSpan)
+        .filter(PipelineSpan.correlation_id.in_(recent))
+        .order_by(PipelineSpan.started_at)
+        .all()
+    )
+
+
+def _summary(samples: list[float]) -> dict:
+    """Count and p50/p95/p99 (seconds) of *samples*."""
+    samples = sorted(samples)
+    if not samples:
+        return {"count": 0, "p50": None, "p95": None, "p99": None}
+    return {
+        "count": len(samples),
+        "p50": percentile(samples, 50),
+        "p95": percentile(samples, 95),
+        "p99": percentile(samples, 99),
+    }
+
+
+def _as_utc(moment: datetime) -> datetime:
+    """Span timestamps are naive UTC in the database."""
+    if moment.tzinfo is None:
+        return moment.replace(tzinfo=timezone.utc)
+    return moment
+
+
+def build_trace_report(spans: list[PipelineSpan]) -> dict:
+    """Latency percentiles from spans (see module docstring).
+
+    - ``post_to_alert``: per alert actually sent, seconds from the start of
+      its trace (the harvest) to the end of the alert.
+    - ``published_to_alert``: the same, measured from the post's publish
+      time (includes the wait for the next harvest).
+    - ``stages``: per trace, each stage's wall-clock extent (first start to
+      last end) and its queue wait after the first upstream span finished.
+    """
+    traces: dict[str, list[PipelineSpan]] = {}
+    for span in spans:
+        traces.setdefault(span.correlation_id, []).append(span)
+
+    post_to_alert: list[float] = []
+    published_to_alert: list[float] = []
+    durations: dict[str, list[float]] = {stage: [] for stage in STAGES}
+    waits: dict[str, list[float]] = {stage: [] for stage in STAGES}
+
+    for trace in traces.values():
+        trace_start = min(_as_utc(s.started_at) for s in trace)
+        by_stage: dict[str, list[PipelineSpan]] = {}
+        for span in trace:
+            by_stage.setdefault(span.stage, []).append(span)
+
+        for stage, stage_spans in by_stage.items():
+            first_start = min(_as_utc(s.started_at) for s in stage_spans)
+            last_end = max(_as_utc(s.ended_at) for s in stage_spans)
+            durations.setdefault(stage, []).append((last_end - first_start).total_seconds())
+
+            upstream = by_stage.get(UPSTREAM.get(stage, ""))
+            if upstream:
+                ready = min(_as_utc(s.ended_at) for s in upstream)
+                waits.setdefault(stage, []).append(
+                    max((first_start - ready).total_seconds(), 0.0)
+                )
+
+        for alert in by_stage.get("alert", []):
+            attributes = alert.attributes or {}
+            if not attributes.get("alerts_sent"):
+                continue
+            alert_end = _as_utc(alert.ended_at)
+            post_to_alert.append((alert_end - trace_start).total_seconds())
+            published = attributes.get("post_published_at")
+            if published:
+                try:
+                    published_at = _as_utc(datetime.fromisoformat(published))
+                except (TypeError, ValueError):
+                    continue
+                published_to_alert.append((alert_end - published_at).total_seconds())
+
+    return {
+        "traces": len(traces),
+        "post_to_alert": _summary(post_to_alert),
+        "published_to_alert": _summary(published_to_alert),
+        "stages": {
+            stage: {"duration": _summary(durations[stage]), "wait": _summary(waits[stage])}
+            for stage in durations
+        },
+    }
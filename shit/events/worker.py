@@ -5,25 +5,59 @@ Provides a polling loop that claims and processes events from the queue.
 Consumers subclass this and implement ``process_event()``.
 
 Supports two modes:
-- ``run()``: Persistent polling loop with graceful shutdown (SIGTERM/SIGINT).
-- ``run_once()``: Drain all pending events and exit (for Railway cron).
+- ``run()``: Persistent loop with graceful shutdown (SIGTERM/SIGINT). On
+  PostgreSQL an idle worker blocks on LISTEN for its consumer group and only
+  polls every ``listen_timeout`` seconds as a safety net; elsewhere it polls
+  every ``poll_interval`` seconds.
+- ``run_once()``: Drain all pending events and exit (for Railway cron). A
+  SIGTERM/SIGINT stops the drain after the events in flight.
+
+Workers that set ``batch_mode = True`` handle each claimed batch with
+``process_events()`` and write the claim and the completed/failed transitions
+with one bulk UPDATE each, instead of a transaction per event. Their claim
+size doubles while batches come back full (up to ``max_batch_size``) and
+drops back to ``batch_size`` once the queue is drained.
+
+With ``concurrency`` > 1 the claimed events are processed on a thread pool,
+each in its own session. On SIGTERM/SIGINT events already running finish
+and record their outcome; claimed events not yet started are released back
+to pending for the next worker.
+
+On a partitioned PostgreSQL events table the claim query is bounded below by
+the oldest open event's ``created_at`` (refreshed every few minutes and after
+an empty poll), so it only touches the hot partitions.
+
+Events are processed inside their ``correlation_id``'s scope, so events
+emitted and spans traced by a consumer join the same trace (see
+``shit.events.tracing``).
 """
 
 import abc
 import argparse
 import signal
+import threading
 import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from typing import Optional
 
-from sqlalchemy import and_, or_
+from sqlalchemy import and_, bindparam, case, cast, null, or_, update
 
 from shit.db.sync_session import get_session, SessionLocal  # noqa: F401 (get_session patched in tests)
 from shit.events.models import Event
 from shit.events.event_types import EventStatus
+from shit.events.notify import EventListener
+from shit.events.partitions import claim_floor, ensure_partitions, is_partitioned
+from shit.events.tracing import correlation_scope
 from shit.logging import get_service_logger
 
+#: process_events() outcome for an event skipped because the worker is stopping
+NOT_STARTED = object()
+
+# Seconds before a worker re-derives its partition-pruning claim floor
+CLAIM_FLOOR_REFRESH = 300.0
+
 
 class EventWorker(abc.ABC):
     """Base class for event consumers.
@@ -32,6 +66,9 @@ class EventWorker(abc.ABC):
         - ``consumer_group``: property returning the consumer group name.
         - ``process_event(event_type, payload)``: process a single event.
 
+    Subclasses may set ``batch_mode = True`` (and optionally override
+    ``process_events(events)``) to process and record whole batches at once.
+
     Usage::
 
         class MyWorker(EventWorker):
@@ -50,26 +87,49 @@ class EventWorker(abc.ABC):
     #: Consumer group name — set in subclass
     consumer_group: str = ""
 
+    #: Process claimed events with process_events() and bulk state writes
+    batch_mode: bool = False
+
+    #: Default number of events processed at once (override per consumer)
+    concurrency: int = 1
+
     def __init__(
         self,
         poll_interval: float = 2.0,
         batch_size: int = 10,
         worker_id: Optional[str] = None,
+        listen_timeout: float = 30.0,
+        max_batch_size: int = 500,
+        concurrency: Optional[int] = None,
     ):
         """Initialize the worker.
 
         Args:
-            poll_interval: Seconds between poll cycles in persistent mode.
+            poll_interval: Seconds between poll cycles in persistent mode
+                when LISTEN/NOTIFY is unavailable.
             batch_size: Max events to claim per poll cycle.
             worker_id: Unique worker identifier. Auto-generated if None.
+            listen_timeout: Max seconds to block on LISTEN before polling
+                anyway (catches retries coming due and missed notifications).
+            max_batch_size: Upper bound for the adaptive claim size in batch
+                mode.
+            concurrency: Events processed at once on a thread pool
+                (default: the class's ``concurrency``).
         """
         if not self.consumer_group:
             raise ValueError("consumer_group must be set in subclass")
 
         self.poll_interval = poll_interval
+        self.listen_timeout = listen_timeout
         self.batch_size = batch_size
+        self.max_batch_size = max(batch_size, max_batch_size)
+        self._claim_limit = batch_size
+        self.concurrency = max(1, concurrency or self.concurrency)
         self.worker_id = worker_id or f"{self.consumer_group}-{uuid.uuid4().hex[:8]}"
         self._shutdown = False
+        self._partitioned: Optional[bool] = None
+        self._claim_floor: Optional[datetime] = None
+        self._claim_floor_at = 0.0
         self.logger = get_service_logger(f"worker.{self.consumer_group}")
 
     @abc.abstractmethod
@@ -88,25 +148,123 @@ class EventWorker(abc.ABC):
         """
         ...
 
+    def process_events(self, events: list[Event]) -> list:
+        """Process a claimed batch (batch mode only).
+
+        The default calls ``process_event()`` for each event (``concurrency``
+        at a time); override to share setup or I/O across the batch.
+
+        Args:
+            events: Claimed events (detached; read-only).
+
+        Returns:
+            One outcome per event, in order: the result dict on success, the
+            exception that failed it, or ``NOT_STARTED`` if the worker began
+            shutting down before reaching it.
+        """
+
+        def process_one(event: Event):
+            if self._shutdown:
+                return NOT_STARTED
+            try:
+                with correlation_scope(event.correlation_id):
+                    return self.process_event(event.event_type, event.payload)
+            except Exception as exc:
+                return exc
+
+        return self._map(process_one, events)
+
     def run(self) -> None:
         """Run the persistent polling loop. Handles SIGTERM/SIGINT."""
         self._setup_signal_handlers()
+        self._ensure_partitions()
+        listener = self._open_listener()
         self.logger.info(
             f"Worker {self.worker_id} starting persistent loop "
-            f"(group={self.consumer_group}, interval={self.poll_interval}s)"
+            f"(group={self.consumer_group}, "
+            + (
+                f"LISTEN {listener.channel}, safety poll {self.listen_timeout}s)"
+                if listener
+                else f"interval={self.poll_interval}s)"
+            )
         )
 
-        while not self._shutdown:
-            try:
-                processed = self._poll_and_process()
-                if processed == 0:
+        try:
+            while not self._shutdown:
+                try:
+                    processed = self._poll_and_process()
+                    if processed == 0:
+                        listener = self._wait_for_events(listener)
+                except Exception:
+                    self.logger.error("Unexpected error in poll loop", exc_info=True)
                     time.sleep(self.poll_interval)
-            except Exception:
-                self.logger.error("Unexpected error in poll loop", exc_info=True)
-                time.sleep(self.poll_interval)
+        finally:
+            if listener:
+                listener.close()
 
         self.logger.info(f"Worker {self.worker_id} shut down gracefully")
 
+    def _ensure_partitions(self) -> None:
+        """Create any missing events partitions (PostgreSQL only, best effort).
+
+        Workers start far more often than the daily cleanup cron runs, so a
+        missed cron never leaves new events without a weekly partition.
+        """
+        session = SessionLocal()
+        try:
+            if is_partitioned(session):
+                created = ensure_partitions(session)
+                session.commit()
+                if created:
+                    self.logger.info(f"Created events partitions: {', '.join(created)}")
+        except Exception:
+            session.rollback()
+            self.logger.warning("Could not ensure events partitions", exc_info=True)
+        finally:
+            session.close()
+
+    def _open_listener(self) -> Optional[EventListener]:
+        """LISTEN for this consumer group's wake-ups, or None to poll."""
+        try:
+            return EventListener.open(SessionLocal.kw.get("bind"), self.consumer_group)
+        except Exception:
+            self.logger.warning(
+                "Could not LISTEN for events, falling back to polling", exc_info=True
+            )
+            return None
+
+    def _wait_for_events(self, listener: Optional[EventListener]) -> Optional[EventListener]:
+        """Idle until new events may be claimable.
+
+        Blocks on the listener (in one-second slices so a shutdown signal is
+        honoured promptly) for up to ``listen_timeout`` seconds. Without a
+        listener, sleeps ``poll_interval``. A broken listener is closed and
+        re-opened after one ``poll_interval`` sleep.
+
+        Returns:
+            The listener to use for the next idle cycle.
+        """
+        if listener is None:
+            time.sleep(self.poll_interval)
+            return None
+
+        waited = 0.0
+        try:
+            while not self._shutdown and waited < self.listen_timeout:
+                timeout = min(1.0, self.listen_timeout - waited)
+                if listener.wait(timeout):
+                    return listener
+                waited += timeout
+            return listener
+        except Exception:
+            self.logger.warning(
+                f"LISTEN connection on {listener.channel} failed, reconnecting",
+                exc_info=True,
+            )
+            listener.close()
+            time.sleep(self.poll_interval)
+            return self._open_listener()
+
     def run_once(self) -> int:
         """Drain all pending events and exit.
 
@@ -117,13 +275,21 @@ class EventWorker(abc.ABC):
             f"Worker {self.worker_id} draining queue (group={self.consumer_group})"
         )
 
+        previous_handlers = self._setup_signal_handlers()
+        self._ensure_partitions()
         total = 0
-        while True:
-            processed = self._poll_and_process()
-            total += processed
-            if processed == 0:
-                break
+        try:
+            while not self._shutdown:
+                processed = self._poll_and_process()
+                total += processed
+                if processed == 0:
+                    break
+        finally:
+            for signum, handler in previous_handlers.items():
+                signal.signal(signum, handler)
 
+        if self._shutdown:
+            self.logger.info(f"Worker {self.worker_id} stopped draining on shutdown")
         self.logger.info(
             f"Worker {self.worker_id} drained {total} events",
             extra={"total_processed": total},
@@ -137,35 +303,47 @@ class EventWorker(abc.ABC):
             Number of events processed in this batch.
         """
         now = datetime.now(timezone.utc)
-        processed = 0
 
         session = SessionLocal()
         try:
+            conditions = [
+                Event.consumer_group == self.consumer_group,
+                Event.status == EventStatus.PENDING,
+                or_(
+                    Event.next_retry_at.is_(None),
+                    Event.next_retry_at <= now,
+                ),
+            ]
+            floor = self._get_claim_floor(session, now)
+            if floor is not None:
+                conditions.append(Event.created_at >= floor)
+
             # Claim events with SELECT ... FOR UPDATE SKIP LOCKED
             claimable = (
                 session.query(Event)
-                .filter(
-                    and_(
-                        Event.consumer_group == self.consumer_group,
-                        Event.status == EventStatus.PENDING,
-                        or_(
-                            Event.next_retry_at.is_(None),
-                            Event.next_retry_at <= now,
-                        ),
-                    )
-                )
+                .filter(and_(*conditions))
                 .with_for_update(skip_locked=True)
-                .limit(self.batch_size)
+                .limit(
+                    self._claim_limit
+                    if self.batch_mode
+                    else max(self.batch_size, self.concurrency)
+                )
                 .all()
             )
 
             if not claimable:
                 session.commit()
+                self._claim_limit = self.batch_size
+                # Re-derive the floor next poll: catches events re-queued below it
+                self._claim_floor = None
                 return 0
 
             # Mark claimed
-            for event in claimable:
-                event.mark_claimed(self.worker_id)
+            if self.batch_mode:
+                self._bulk_claim(session, claimable)
+            else:
+                for event in claimable:
+                    event.mark_claimed(self.worker_id)
             session.commit()
 
         except Exception:
@@ -175,25 +353,212 @@ class EventWorker(abc.ABC):
         finally:
             session.close()
 
+        if self.batch_mode:
+            # Grow the next claim while the queue keeps up with it
+            if len(claimable) >= self._claim_limit:
+                self._claim_limit = min(self._claim_limit * 2, self.max_batch_size)
+            else:
+                self._claim_limit = self.batch_size
+            return self._process_batch(claimable)
+
         # Process each event in its own transaction
-        for event in claimable:
-            self._process_single(event)
-            processed += 1
+        started = self._map(self._process_single, claimable)
+        self._release([e for e, ran in zip(claimable, started) if not ran])
+        return sum(started)
+
+    def _get_claim_floor(self, session, now: datetime) -> Optional[datetime]:
+        """Lower ``created_at`` bound for the claim query, or None if unpartitioned."""
+        if self._partitioned is None:
+            self._partitioned = is_partitioned(session)
+        if not self._partitioned:
+            return None
+
+        if (
+            self._claim_floor is None
+            or time.monotonic() - self._claim_floor_at >= CLAIM_FLOOR_REFRESH
+        ):
+            self._claim_floor = claim_floor(session, self.consumer_group, now)
+            self._claim_floor_at = time.monotonic()
+        return self._claim_floor
+
+    def _map(self, fn, items: list) -> list:
+        """Apply *fn* to *items* (``concurrency`` at a time), results in order."""
+        if self.concurrency <= 1 or len(items) <= 1:
+            return [fn(item) for item in items]
+        with ThreadPoolExecutor(
+            max_workers=min(self.concurrency, len(items)),
+            thread_name_prefix=self.worker_id,
+        ) as pool:
+            return list(pool.map(fn, items))
+
+    def _release(self, events: list[Event]) -> None:
+        """Return claimed-but-unstarted events to pending (shutdown drain)."""
+        if not events:
+            return
+        session = SessionLocal()
+        try:
+            session.execute(
+                update(Event)
+                .where(
+                    Event.id.in_([event.id for event in events]),
+                    Event.status == EventStatus.CLAIMED,
+                    Event.claimed_by == self.worker_id,
+                )
+                .values(
+                    status=EventStatus.PENDING,
+                    claimed_by=None,
+                    claimed_at=None,
+                    attempt=Event.attempt - 1,
+                )
+                .execution_options(synchronize_session=False)
+            )
+            session.commit()
+            self.logger.info(f"Released {len(events)} unstarted events on shutdown")
+        except Exception:
+            session.rollback()
+            self.logger.error(f"Failed to release {len(events)} events", exc_info=True)
+        finally:
+            session.close()
+
+    def _bulk_claim(self, session, events: list[Event]) -> None:
+        """Claim locked events with one UPDATE and mirror it in memory."""
+        now = datetime.now(timezone.utc)
+        session.execute(
+            update(Event)
+            .where(Event.id.in_([event.id for event in events]))
+            .values(
+                status=EventStatus.CLAIMED,
+                claimed_by=self.worker_id,
+                claimed_at=now,
+                attempt=Event.attempt + 1,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        # Detach so the in-memory copies are not flushed a second time
+        session.expunge_all()
+        for event in events:
+            event.mark_claimed(self.worker_id)
+            event.claimed_at = now
+
+    def _process_batch(self, events: list[Event]) -> int:
+        """Process claimed events together and record every outcome at once.
+
+        Returns:
+            Number of events processed (excluding ones released on shutdown).
+        """
+        try:
+            outcomes = self.process_events(events)
+            if len(outcomes) != len(events):
+                raise ValueError(
+                    f"process_events returned {len(outcomes)} outcomes "
+                    f"for {len(events)} events"
+                )
+        except Exception as exc:
+            self.logger.error(f"Batch of {len(events)} events failed", exc_info=True)
+            outcomes = [exc] * len(events)
+
+        unstarted = [e for e, o in zip(events, outcomes) if o is NOT_STARTED]
+        self._release(unstarted)
+        finished = [(e, o) for e, o in zip(events, outcomes) if o is not NOT_STARTED]
+        events = [e for e, _ in finished]
+        if not events:
+            return 0
+
+        for event, outcome in finished:
+            if isinstance(outcome, Exception):
+                event.mark_failed(str(outcome))
+                self.logger.warning(
+                    f"Event {event.id} failed (attempt {event.attempt}/"
+                    f"{event.max_attempts}): {outcome}",
+                    extra={
+                        "event_id": event.id,
+                        "event_type": event.event_type,
+                        "attempt": event.attempt,
+                        "error": str(outcome),
+                    },
+                )
+            else:
+                event.mark_completed(outcome)
+                self.logger.debug(
+                    f"Completed event {event.id} ({event.event_type})",
+                    extra={
+                        "event_id": event.id,
+                        "event_type": event.event_type,
+                        "attempt": event.attempt,
+                    },
+                )
+
+        session = SessionLocal()
+        try:
+            dialect = session.get_bind().dialect.name
+            session.execute(self._transitions_statement(events, dialect))
+            session.commit()
+        except Exception:
+            session.rollback()
+            self.logger.error(
+                f"Transaction failed for batch of {len(events)} events", exc_info=True
+            )
+        finally:
+            session.close()
+        return len(events)
+
+    @staticmethod
+    def _transitions_statement(events: list[Event], dialect: str = ""):
+        """One UPDATE writing each event's in-memory outcome columns.
+
+        Per-row values are selected with ``CASE id WHEN ... END``; rows no
+        longer claimed (e.g. reset by an operator) are left alone. PostgreSQL
+        needs the CASE cast to the column type (its branches are untyped
+        parameters); SQLite must not get one (CAST AS JSON/DATETIME would
+        coerce to a number).
+        """
+        values = {}
+        for name in ("status", "completed_at", "result", "error", "next_retry_at"):
+            column_type = Event.__table__.c[name].type
+            expression = case(
+                {
+                    event.id: (
+                        null()
+                        if getattr(event, name) is None
+                        else bindparam(None, getattr(event, name), type_=column_type)
+                    )
+                    for event in events
+                },
+                value=Event.id,
+            )
+            values[name] = (
+                cast(expression, column_type) if dialect == "postgresql" else expression
+            )
+        return (
+            update(Event)
+            .where(
+                Event.id.in_([event.id for event in events]),
+                Event.status == EventStatus.CLAIMED,
+            )
+            .values(**values)
+            .execution_options(synchronize_session=False)
+        )
 
-        return processed
+    def _process_single(self, event: Event) -> bool:
+        """Process a single claimed event in its own transaction.
 
-    def _process_single(self, event: Event) -> None:
-        """Process a single claimed event in its own transaction."""
+        Returns:
+            False if the event was not started because the worker is
+            shutting down, True otherwise.
+        """
+        if self._shutdown:
+            return False
         session = SessionLocal()
         try:
             # Re-attach event to this session
             db_event = session.get(Event, event.id)
             if db_event is None or db_event.status != EventStatus.CLAIMED:
                 session.commit()
-                return
+                return True
 
             try:
-                result = self.process_event(db_event.event_type, db_event.payload)
+                with correlation_scope(db_event.correlation_id):
+                    result = self.process_event(db_event.event_type, db_event.payload)
                 db_event.mark_completed(result)
                 self.logger.debug(
                     f"Completed event {db_event.id} ({db_event.event_type})",
@@ -223,16 +588,29 @@ class EventWorker(abc.ABC):
             self.logger.error(f"Transaction failed for event {event.id}", exc_info=True)
         finally:
             session.close()
+        return True
 
-    def _setup_signal_handlers(self) -> None:
-        """Register SIGTERM/SIGINT handlers for graceful shutdown."""
+    def _setup_signal_handlers(self) -> dict:
+        """Register SIGTERM/SIGINT handlers for graceful shutdown.
+
+        Python only allows this on the main thread; elsewhere nothing is
+        registered.
+
+        Returns:
+            The handlers replaced, by signal number.
+        """
+        if threading.current_thread() is not threading.main_thread():
+            return {}
 
         def _handle_signal(signum, frame):
             self.logger.info(f"Received signal {signum}, shutting down...")
             self._shutdown = True
 
-        signal.signal(signal.SIGTERM, _handle_signal)
-        signal.signal(signal.SIGINT, _handle_signal)
+        previous = {}
+        for signum in (signal.SIGTERM, signal.SIGINT):
+            previous[signum] = signal.getsignal(signum)
+            signal.signal(signum, _handle_signal)
+        return previous
 
 
 def run_worker_main(
@@ -243,8 +621,9 @@ def run_worker_main(
 ) -> int:
     """Shared CLI entry point for event consumer workers.
 
-    Provides the standard --once and --poll-interval arguments, instantiates
-    the worker, and dispatches to run_once() or run().
+    Provides the standard --once, --poll-interval, --concurrency and
+    --listen-timeout arguments, instantiates the worker, and dispatches to
+    run_once() or run().
 
     Args:
         worker_class: The EventWorker subclass to instantiate.
@@ -273,11 +652,27 @@ def run_worker_main(
         "--poll-interval",
         type=float,
         default=2.0,
-        help="Seconds between polls in persistent mode (default: 2.0)",
+        help="Seconds between polls in persistent mode without LISTEN/NOTIFY (default: 2.0)",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=None,
+        help=f"Events processed at once (default: {worker_class.concurrency})",
+    )
+    parser.add_argument(
+        "--listen-timeout",
+        type=float,
+        default=30.0,
+        help="Max seconds to wait for a NOTIFY before polling anyway (default: 30.0)",
     )
     args = parser.parse_args()
 
-    worker = worker_class(poll_interval=args.poll_interval)
+    worker = worker_class(
+        poll_interval=args.poll_interval,
+        listen_timeout=args.listen_timeout,
+        concurrency=args.concurrency,
+    )
 
     if args.once:
         total = worker.run_once()
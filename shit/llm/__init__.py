@@ -4,6 +4,7 @@ Base LLM client and prompt utilities for the Shitpost-Alpha project.
 """
 
 from .llm_client import LLMClient
+from .batch_client import LLMBatchClient
 from .compare_providers import (
     ConsensusBuilder,
     ConsensusResult,
@@ -22,6 +23,7 @@ from .provider_config import PROVIDERS, get_provider, get_recommended_model
 
 __all__ = [
     "LLMClient",
+    "LLMBatchClient",
     "ConsensusBuilder",
     "ConsensusResult",
     "EnsembleResult",
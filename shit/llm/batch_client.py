@@ -0,0 +1,261 @@
+"""
+LLM Batch Client
+Submits many prompts at once through a provider's asynchronous batch endpoint.
+
+OpenAI (``/v1/batches``) and Anthropic (Message Batches) accept thousands of
+requests in one submission, run them within 24 hours under limits far above
+the real-time ones, and bill them at a discount. That suits backfill and
+range analysis, which don't need answers in real time.
+
+Requests are built exactly like ``LLMClient._call_llm`` builds them (same
+model, system message, completion cap and temperature), so the results are
+interchangeable with real-time ones: they are read from and written to the
+same response cache, and parsed through ``LLMClient.build_analysis``.
+
+The OpenAI path goes through the client's ``base_url``, so a local stand-in
+server implementing the files and batches endpoints (LLM_BASE_URL) can
+replace the real API in tests.
+"""
+
+import asyncio
+import json
+import time
+from typing import Dict, Optional
+
+from shit.config.shitpost_settings import settings
+from shit.llm.llm_client import (
+    DEFAULT_SYSTEM_MESSAGE,
+    MAX_OUTPUT_TOKENS,
+    LLMClient,
+)
+from shit.llm.response_cache import make_cache_key
+from shit.logging.service_loggers import LLMLogger
+
+llm_logger = LLMLogger("llm_batch_client")
+logger = llm_logger.logger
+
+# Providers with a batch endpoint (grok's OpenAI-compatible API has none)
+BATCH_PROVIDERS = {"openai", "anthropic"}
+
+_OPENAI_ENDPOINT = "/v1/chat/completions"
+_OPENAI_DONE = {"completed", "failed", "expired", "cancelled"}
+
+
+class LLMBatchClient:
+    """Runs prompts through the batch endpoint of an ``LLMClient``'s provider."""
+
+    def __init__(
+        self,
+        llm_client: LLMClient,
+        poll_interval: Optional[float] = None,
+        timeout: Optional[float] = None,
+    ):
+        """Initialize the batch client.
+
+        Args:
+            llm_client: Client whose provider, model and SDK client are used
+            poll_interval: Seconds between status checks (default:
+                LLM_BATCH_POLL_SECONDS setting)
+            timeout: Seconds to wait for a batch before giving up (default:
+                LLM_BATCH_TIMEOUT_HOURS setting)
+
+        Raises:
+            ValueError: If the provider has no batch endpoint
+        """
+        if llm_client.provider not in BATCH_PROVIDERS:
+            raise ValueError(
+                f"Batch API not supported for provider: {llm_client.provider}"
+            )
+        self.llm_client = llm_client
+        self.poll_interval = (
+            poll_interval
+            if poll_interval is not None
+            else settings.LLM_BATCH_POLL_SECONDS
+        )
+        self.timeout = (
+            timeout if timeout is not None else settings.LLM_BATCH_TIMEOUT_HOURS * 3600
+        )
+
+    async def run(
+        self, prompts: Dict[str, str], system_message: str = None
+    ) -> Dict[str, Optional[str]]:
+        """Answer every prompt, submitting only the ones not already cached.
+
+        Args:
+            prompts: Prompt text by custom ID (letters, digits, ``-`` and
+                ``_``, at most 64 characters)
+            system_message: System message for every request (optional)
+
+        Returns:
+            Response text by custom ID; None for requests that failed
+
+        Raises:
+            RuntimeError: If the provider reports the whole batch as failed
+            TimeoutError: If the batch does not finish within ``timeout``
+        """
+        system_message = system_message or DEFAULT_SYSTEM_MESSAGE
+        cache = self.llm_client.response_cache
+        results: Dict[str, Optional[str]] = {}
+        keys = {}
+        if cache is not None:
+            for custom_id, prompt in prompts.items():
+                key = make_cache_key(
+                    self.llm_client.provider, self.llm_client.model, prompt, system_message
+                )
+                cached = await asyncio.to_thread(cache.get, key)
+                if cached is not None and self.llm_client.is_complete_analysis(
+                    cached.response
+                ):
+                    results[custom_id] = cached.response
+                else:
+                    keys[custom_id] = key
+
+        to_submit = {cid: p for cid, p in prompts.items() if cid not in results}
+        if not to_submit:
+            return results
+
+        started = time.monotonic()
+        batch_id = await self.submit(to_submit, system_message)
+        await self.wait(batch_id)
+        fetched = await self.fetch_results(batch_id)
+        elapsed = time.monotonic() - started
+
+        # A batch call "takes" its share of the wall time, for saved-latency stats
+        per_request = elapsed / len(to_submit)
+        for custom_id in to_submit:
+            response_text = fetched.get(custom_id)
+            results[custom_id] = response_text
+            if custom_id in keys and self.llm_client.is_complete_analysis(response_text):
+                await asyncio.to_thread(
+                    cache.put, keys[custom_id], response_text, per_request
+                )
+
+        succeeded = sum(1 for cid in to_submit if results[cid])
+        logger.info(
+            f"Batch {batch_id}: {succeeded}/{len(to_submit)} requests succeeded "
+            f"in {elapsed:.0f}s ({len(prompts) - len(to_submit)} served from cache)"
+        )
+        return results
+
+    async def submit(self, prompts: Dict[str, str], system_message: str) -> str:
+        """Create a batch for *prompts* and return its provider batch ID."""
+        client = self.llm_client.client
+        model = self.llm_client.model
+
+        if self.llm_client.provider == "anthropic":
+            batch = await client.messages.batches.create(
+                requests=[
+                    {
+                        "custom_id": custom_id,
+                        "params": {
+                            "model": model,
+                            "max_tokens": MAX_OUTPUT_TOKENS,
+                            "temperature": 0.3,
+                            "system": system_message,
+                            "messages": [{"role": "user", "content": prompt}],
+                        },
+                    }
+                    for custom_id, prompt in prompts.items()
+                ]
+            )
+        else:
+            lines = [
+                json.dumps(
+                    {
+                        "custom_id": custom_id,
+                        "method": "POST",
+                        "url": _OPENAI_ENDPOINT,
+                        "body": {
+                            "model": model,
+                            "messages": [
+                                {"role": "system", "content": system_message},
+                                {"role": "user", "content": prompt},
+                            ],
+                            "max_completion_tokens": MAX_OUTPUT_TOKENS,
+                            "temperature": 0.3,
+                        },
+                    }
+                )
+                for custom_id, prompt in prompts.items()
+            ]
+            input_file = await client.files.create(
+                file=("batch_input.jsonl", "\n".join(lines).encode("utf-8")),
+                purpose="batch",
+            )
+            batch = await client.batches.create(
+                input_file_id=input_file.id,
+                endpoint=_OPENAI_ENDPOINT,
+                completion_window="24h",
+            )
+
+        logger.info(
+            f"Submitted batch {batch.id} with {len(prompts)} requests to "
+            f"{self.llm_client.provider}/{model}"
+        )
+        return batch.id
+
+    async def wait(self, batch_id: str) -> None:
+        """Poll until the batch stops processing.
+
+        Raises:
+            RuntimeError: If the batch failed, or was cancelled with no output
+            TimeoutError: If the batch does not finish within ``timeout``
+        """
+        deadline = time.monotonic() + self.timeout
+        while not await self._finished(batch_id):
+            if time.monotonic() >= deadline:
+                raise TimeoutError(
+                    f"Batch {batch_id} did not finish within {self.timeout:.0f}s"
+                )
+            await asyncio.sleep(self.poll_interval)
+
+    async def _finished(self, batch_id: str) -> bool:
+        """Whether the batch has stopped processing and has results to fetch."""
+        client = self.llm_client.client
+        if self.llm_client.provider == "anthropic":
+            batch = await client.messages.batches.retrieve(batch_id)
+            return batch.processing_status == "ended"
+
+        batch = await client.batches.retrieve(batch_id)
+        if batch.status not in _OPENAI_DONE:
+            return False
+        # Expired and cancelled batches still return what they finished
+        if batch.status == "failed" or not batch.output_file_id:
+            raise RuntimeError(f"Batch {batch_id} {batch.status} without output")
+        return True
+
+    async def fetch_results(self, batch_id: str) -> Dict[str, Optional[str]]:
+        """Download a finished batch's responses, keyed by custom ID."""
+        client = self.llm_client.client
+        results: Dict[str, Optional[str]] = {}
+
+        if self.llm_client.provider == "anthropic":
+            async for entry in await client.messages.batches.results(batch_id):
+                if entry.result.type == "succeeded":
+                    results[entry.custom_id] = entry.result.message.content[0].text
+                else:
+                    logger.warning(
+                        f"Batch {batch_id} request {entry.custom_id}: {entry.result.type}"
+                    )
+                    results[entry.custom_id] = None
+            return results
+
+        batch = await client.batches.retrieve(batch_id)
+        if not batch.output_file_id:
+            return results
+        content = await client.files.content(batch.output_file_id)
+        for line in content.text.splitlines():
+            if not line.strip():
+                continue
+            entry = json.loads(line)
+            response = entry.get("response") or {}
+            if response.get("status_code") == 200:
+                body = response["body"]
+                results[entry["custom_id"]] = body["choices"][0]["message"]["content"]
+            else:
+                logger.warning(
+                    f"Batch {batch_id} request {entry['custom_id']}: "
+                    f"{entry.get('error') or response.get('status_code')}"
+                )
+                results[entry["custom_id"]] = None
+        return results
@@ -7,10 +7,13 @@ import json
 import logging
 from typing import Dict, Optional, List, Any
 import asyncio
+import time
 from datetime import datetime
 
 from shit.config.shitpost_settings import settings
 from shit.utils.error_handling import handle_exceptions
+from shit.llm.rate_budget import get_provider_budget
+from shit.llm.response_cache import get_response_cache, make_cache_key
 
 # Use centralized LLMLogger for beautiful logging
 from shit.logging.service_loggers import LLMLogger
@@ -19,6 +22,12 @@ from shit.logging.service_loggers import LLMLogger
 llm_logger = LLMLogger("llm_client")
 logger = llm_logger.logger
 
+# Completion cap for every call; also reserved against the token budget
+MAX_OUTPUT_TOKENS = 1000
+DEFAULT_SYSTEM_MESSAGE = "You are a helpful AI assistant."
+# Fields a parsed analysis must have; anything less is not cached
+REQUIRED_ANALYSIS_FIELDS = ('assets', 'market_impact', 'confidence', 'thesis')
+
 
 class LLMClient:
     """Generic LLM API client for OpenAI, Anthropic, and Grok services."""
@@ -37,6 +46,8 @@ class LLMClient:
         self.api_key = api_key or settings.get_llm_api_key()
         self.base_url = base_url or settings.get_llm_base_url()
         self.confidence_threshold = settings.CONFIDENCE_THRESHOLD
+        self.budget = get_provider_budget(self.provider)
+        self.response_cache = get_response_cache()
 
         # Determine SDK type: grok uses OpenAI-compatible API
         self._sdk_type = self._get_sdk_type()
@@ -89,7 +100,7 @@ class LLMClient:
         test_prompt = "Respond with 'OK' if you can read this."
         
         try:
-            response = await self._call_llm(test_prompt)
+            response = await self._call_llm(test_prompt, use_cache=False)
             if response and "OK" in response:
                 logger.info("LLM connection test successful")
             else:
@@ -124,93 +135,180 @@ class LLMClient:
             
             # Call LLM
             response = await self._call_llm(prompt)
-            
-            if not response:
-                logger.warning("No response from LLM")
-                return None
-            
-            # Parse response
-            analysis = await self._parse_analysis_response(response)
-            
-            if not analysis:
-                logger.warning("Failed to parse LLM response")
-                return None
-            
-            # Add metadata
-            confidence = analysis.get('confidence', 0.0)
-            analysis['meets_threshold'] = confidence >= self.confidence_threshold
-            analysis['analysis_quality'] = self._get_quality_label(confidence)
-            analysis['original_content'] = content
-            analysis['llm_provider'] = self.provider
-            analysis['llm_model'] = self.model
-            analysis['analysis_timestamp'] = self._get_timestamp()
-            
-            logger.info(f"Analysis completed with confidence {confidence} (quality: {analysis['analysis_quality']})")
-            return analysis
+            return await self.build_analysis(response, content)
             
         except Exception as e:
             logger.error(f"Error analyzing content: {e}")
             await handle_exceptions(e)
             return None
+
+    async def build_analysis(self, response: Optional[str], content: str) -> Optional[Dict]:
+        """Turn a raw LLM response into an analysis dictionary.
+
+        Shared by ``analyze`` and the batch API path, which obtains its
+        responses without calling ``_call_llm``.
+
+        Args:
+            response: Raw LLM response text (None if the call failed)
+            content: Content that was analyzed
+
+        Returns:
+            Analysis result dictionary, or None if there is nothing to parse
+        """
+        if not response:
+            logger.warning("No response from LLM")
+            return None
+
+        # Parse response
+        analysis = await self._parse_analysis_response(response)
+
+        if not analysis:
+            logger.warning("Failed to parse LLM response")
+            return None
+
+        # Add metadata
+        confidence = analysis.get('confidence', 0.0)
+        analysis['meets_threshold'] = confidence >= self.confidence_threshold
+        analysis['analysis_quality'] = self._get_quality_label(confidence)
+        analysis['original_content'] = content
+        analysis['llm_provider'] = self.provider
+        analysis['llm_model'] = self.model
+        analysis['analysis_timestamp'] = self._get_timestamp()
+
+        logger.info(f"Analysis completed with confidence {confidence} (quality: {analysis['analysis_quality']})")
+        return analysis
     
-    async def _call_llm(self, prompt: str, system_message: str = None) -> Optional[str]:
+    async def _call_llm(
+        self, prompt: str, system_message: str = None, use_cache: bool = True
+    ) -> Optional[str]:
         """Call the LLM with the given prompt.
-        
+
+        Identical calls (same provider, model, prompt version and prompt text)
+        are answered from the response cache when it is enabled. Only
+        responses that parse as a complete JSON analysis are cached, so a
+        truncated or malformed completion is requested again next time.
+
         Args:
             prompt: User prompt
             system_message: System message (optional)
-            
+            use_cache: Consult and populate the response cache
+
         Returns:
             LLM response text
         """
+        system_message = system_message or DEFAULT_SYSTEM_MESSAGE
+        cache = self.response_cache if use_cache else None
+        cache_key = None
+        if cache is not None:
+            cache_key = make_cache_key(self.provider, self.model, prompt, system_message)
+            try:
+                cached = await asyncio.to_thread(cache.get, cache_key)
+            except Exception as e:
+                logger.warning(f"LLM response cache lookup failed: {e}")
+                cached = None
+            if cached is not None and self.is_complete_analysis(cached.response):
+                logger.debug(
+                    f"LLM cache hit for {self.provider}/{self.model} "
+                    f"(saved {cached.latency_seconds:.1f}s)"
+                )
+                return cached.response
+
+        started = time.monotonic()
+        response_text = await self._request_completion(prompt, system_message)
+        elapsed = time.monotonic() - started
+
+        if cache_key is not None and self.is_complete_analysis(response_text):
+            try:
+                await asyncio.to_thread(cache.put, cache_key, response_text, elapsed)
+            except Exception as e:
+                logger.warning(f"LLM response cache store failed: {e}")
+        return response_text
+
+    async def _request_completion(self, prompt: str, system_message: str) -> Optional[str]:
+        """Send one completion request, within the provider's rate budget.
+
+        Args:
+            prompt: User prompt
+            system_message: System message
+
+        Returns:
+            LLM response text, or None on error
+        """
+        # Rough prompt size (~4 chars/token) plus the full completion allowance
+        estimated_tokens = (len(prompt) + len(system_message)) // 4 + MAX_OUTPUT_TOKENS
+        await self.budget.acquire(estimated_tokens)
+
         try:
             if self._sdk_type == "openai":
                 response = await asyncio.wait_for(
                     self.client.chat.completions.create(
                         model=self.model,
                         messages=[
-                            {"role": "system", "content": system_message or "You are a helpful AI assistant."},
+                            {"role": "system", "content": system_message},
                             {"role": "user", "content": prompt}
                         ],
-                        max_completion_tokens=1000,
+                        max_completion_tokens=MAX_OUTPUT_TOKENS,
                         temperature=0.3
                     ),
                     timeout=30.0  # 30 second timeout
                 )
+                usage = getattr(response, "usage", None)
+                self.budget.record_usage(
+                    estimated_tokens, _as_int(getattr(usage, "total_tokens", None))
+                )
                 return response.choices[0].message.content
 
             elif self._sdk_type == "anthropic":
                 response = await asyncio.wait_for(
                     self.client.messages.create(
                         model=self.model,
-                        max_tokens=1000,
+                        max_tokens=MAX_OUTPUT_TOKENS,
                         temperature=0.3,
-                        system=system_message or "You are a helpful AI assistant.",
+                        system=system_message,
                         messages=[
                             {"role": "user", "content": prompt}
                         ]
                     ),
                     timeout=30.0  # 30 second timeout
                 )
+                usage = getattr(response, "usage", None)
+                input_tokens = _as_int(getattr(usage, "input_tokens", None))
+                output_tokens = _as_int(getattr(usage, "output_tokens", None))
+                self.budget.record_usage(
+                    estimated_tokens,
+                    input_tokens + output_tokens
+                    if input_tokens is not None and output_tokens is not None
+                    else None,
+                )
                 return response.content[0].text
             
         except Exception as e:
             logger.error(f"Error calling LLM: {e}")
             return None
     
+    def is_complete_analysis(self, response: Optional[str]) -> bool:
+        """Whether *response* holds a JSON analysis with every required field."""
+        return isinstance(response, str) and self._parse_json_analysis(response) is not None
+
+    def _parse_json_analysis(self, response: str) -> Optional[Dict]:
+        """The JSON analysis in *response*, or None if absent or incomplete."""
+        json_match = self._extract_json(response)
+        if not json_match:
+            return None
+        analysis = json.loads(json_match)
+        if isinstance(analysis, dict) and all(
+            field in analysis for field in REQUIRED_ANALYSIS_FIELDS
+        ):
+            return analysis
+        return None
+
     async def _parse_analysis_response(self, response: str) -> Optional[Dict]:
         """Parse the LLM response into structured analysis."""
         try:
-            # Try to extract JSON from response
-            json_match = self._extract_json(response)
-            if json_match:
-                analysis = json.loads(json_match)
-                
-                # Validate required fields
-                required_fields = ['assets', 'market_impact', 'confidence', 'thesis']
-                if all(field in analysis for field in required_fields):
-                    return analysis
-            
+            analysis = self._parse_json_analysis(response)
+            if analysis is not None:
+                return analysis
+
             # Fallback: try to parse manually
             return await self._parse_manual_response(response)
             
@@ -293,6 +391,11 @@ class LLMClient:
             return "low"
 
 
+def _as_int(value: Any) -> Optional[int]:
+    """Usage counts as int, or None when the SDK response omits them."""
+    return value if isinstance(value, int) else None
+
+
 # For testing purposes
 async def test_llm_client():
     """Test function to verify LLM client."""
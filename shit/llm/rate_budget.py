@@ -0,0 +1,97 @@
+"""
+LLM Rate Budgets
+Per-provider request and token budgets shared by every LLMClient in the process.
+
+Each provider gets two token buckets refilled continuously over a minute:
+one for requests (ProviderConfig.rate_limit_rpm, or LLM_REQUESTS_PER_MINUTE)
+and one for tokens (LLM_TOKENS_PER_MINUTE, 0 = unlimited). A call reserves
+one request plus an estimate of its tokens up front and sleeps off any
+deficit; the estimate is corrected from the provider's reported usage once
+the response arrives.
+
+Reservations are made without awaiting, so they are atomic on the event
+loop and need no asyncio lock; buckets can therefore be shared across
+loops (tests, ``asyncio.run`` per CLI invocation).
+"""
+
+import asyncio
+import time
+from typing import Dict, Optional
+
+from shit.config.shitpost_settings import settings
+from shit.llm.provider_config import PROVIDERS
+
+
+class _Bucket:
+    """Token bucket that may go into debt; debt is repaid by waiting."""
+
+    def __init__(self, per_minute: float):
+        self.rate = per_minute / 60.0
+        self.capacity = float(per_minute)
+        self.tokens = float(per_minute)
+        self.updated = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def reserve(self, amount: float) -> float:
+        """Take *amount* now and return the seconds to wait before using it."""
+        self._refill()
+        self.tokens -= amount
+        return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+    def adjust(self, delta: float) -> None:
+        """Charge (positive) or refund (negative) *delta* after the fact."""
+        self._refill()
+        self.tokens = min(self.capacity, self.tokens - delta)
+
+
+class ProviderBudget:
+    """Request-rate and token-rate budget for one LLM provider."""
+
+    def __init__(self, requests_per_minute: float, tokens_per_minute: float = 0):
+        self._requests = _Bucket(requests_per_minute) if requests_per_minute > 0 else None
+        self._tokens = _Bucket(tokens_per_minute) if tokens_per_minute > 0 else None
+
+    async def acquire(self, estimated_tokens: int) -> float:
+        """Wait until one request of *estimated_tokens* fits the budget.
+
+        Returns:
+            Seconds spent waiting.
+        """
+        wait = 0.0
+        if self._requests:
+            wait = self._requests.reserve(1)
+        if self._tokens:
+            wait = max(wait, self._tokens.reserve(estimated_tokens))
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    def record_usage(self, estimated_tokens: int, actual_tokens: Optional[int]) -> None:
+        """Replace a call's token estimate with the usage the provider reported."""
+        if self._tokens and actual_tokens is not None:
+            self._tokens.adjust(actual_tokens - estimated_tokens)
+
+
+_budgets: Dict[str, ProviderBudget] = {}
+
+
+def get_provider_budget(provider: str) -> ProviderBudget:
+    """Return the process-wide budget for *provider*, creating it on first use."""
+    budget = _budgets.get(provider)
+    if budget is None:
+        rpm = settings.LLM_REQUESTS_PER_MINUTE
+        if rpm is None:
+            config = PROVIDERS.get(provider)
+            rpm = config.rate_limit_rpm if config else 60
+        budget = ProviderBudget(rpm, settings.LLM_TOKENS_PER_MINUTE)
+        _budgets[provider] = budget
+    return budget
+
+
+def reset_provider_budgets() -> None:
+    """Forget all budgets (settings changes, tests)."""
+    _budgets.clear()
@@ -0,0 +1,193 @@
+"""
+LLM Response Cache
+Persistent cache of raw LLM completions keyed by what produced them.
+
+An entry is keyed by (provider, model, PROMPT_VERSION, sha256 of the system
+message and final prompt), so a prompt tweak, a model switch or a version
+bump never reuses an old answer, while re-running a backfill, a
+``compare_cli`` session or an ensemble over already-seen text (reposts
+included) skips the API call entirely.
+
+Entries live in a local SQLite file (LLM_CACHE_PATH), expire after
+LLM_CACHE_TTL_HOURS and are trimmed least-recently-used beyond
+LLM_CACHE_MAX_ENTRIES. Each entry remembers how long the original call took,
+which is what a hit reports as saved latency.
+"""
+
+import hashlib
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Optional
+
+from shit.config.shitpost_settings import settings
+from shit.llm.prompts import PROMPT_VERSION
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS llm_responses (
+    provider TEXT NOT NULL,
+    model TEXT NOT NULL,
+    prompt_version TEXT NOT NULL,
+    prompt_sha256 TEXT NOT NULL,
+    response TEXT NOT NULL,
+    latency_seconds REAL NOT NULL,
+    created_at REAL NOT NULL,
+    last_used_at REAL NOT NULL,
+    PRIMARY KEY (provider, model, prompt_version, prompt_sha256)
+)
+"""
+_LRU_INDEX = (
+    "CREATE INDEX IF NOT EXISTS ix_llm_responses_last_used "
+    "ON llm_responses (last_used_at)"
+)
+
+
+@dataclass(frozen=True)
+class CacheKey:
+    provider: str
+    model: str
+    prompt_version: str
+    prompt_sha256: str
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    response: str
+    latency_seconds: float
+
+
+def make_cache_key(
+    provider: str, model: str, prompt: str, system_message: str = ""
+) -> CacheKey:
+    """Build the cache key for one call."""
+    digest = hashlib.sha256(
+        f"{system_message}\x00{prompt}".encode("utf-8")
+    ).hexdigest()
+    return CacheKey(provider, model, PROMPT_VERSION, digest)
+
+
+class LLMResponseCache:
+    """SQLite-backed response cache with TTL and LRU size eviction."""
+
+    def __init__(self, path: str, ttl_seconds: float, max_entries: int):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.saved_seconds = 0.0
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(_SCHEMA)
+            conn.execute(_LRU_INDEX)
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def get(self, key: CacheKey) -> Optional[CachedResponse]:
+        """Return the live entry for *key*, counting the hit or miss."""
+        now = time.time()
+        with self._lock:
+            conn = self._connection()
+            row = conn.execute(
+                "SELECT response, latency_seconds, created_at FROM llm_responses "
+                "WHERE provider = ? AND model = ? AND prompt_version = ? "
+                "AND prompt_sha256 = ?",
+                _params(key),
+            ).fetchone()
+
+            if row is not None and now - row[2] >= self.ttl_seconds:
+                conn.execute(
+                    "DELETE FROM llm_responses WHERE provider = ? AND model = ? "
+                    "AND prompt_version = ? AND prompt_sha256 = ?",
+                    _params(key),
+                )
+                conn.commit()
+                row = None
+
+            if row is None:
+                self.misses += 1
+                return None
+
+            conn.execute(
+                "UPDATE llm_responses SET last_used_at = ? WHERE provider = ? "
+                "AND model = ? AND prompt_version = ? AND prompt_sha256 = ?",
+                (now, *_params(key)),
+            )
+            conn.commit()
+            self.hits += 1
+            self.saved_seconds += row[1]
+            return CachedResponse(response=row[0], latency_seconds=row[1])
+
+    def put(self, key: CacheKey, response: str, latency_seconds: float) -> None:
+        """Store *response*, then evict expired and least-recently-used rows."""
+        now = time.time()
+        with self._lock:
+            conn = self._connection()
+            conn.execute(
+                "INSERT OR REPLACE INTO llm_responses VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (*_params(key), response, latency_seconds, now, now),
+            )
+            conn.execute(
+                "DELETE FROM llm_responses WHERE created_at <= ?",
+                (now - self.ttl_seconds,),
+            )
+            (count,) = conn.execute("SELECT COUNT(*) FROM llm_responses").fetchone()
+            if count > self.max_entries:
+                conn.execute(
+                    "DELETE FROM llm_responses WHERE rowid IN ("
+                    "SELECT rowid FROM llm_responses ORDER BY last_used_at LIMIT ?)",
+                    (count - self.max_entries,),
+                )
+            conn.commit()
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "saved_seconds": self.saved_seconds,
+            }
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+def _params(key: CacheKey) -> tuple:
+    return (key.provider, key.model, key.prompt_version, key.prompt_sha256)
+
+
+_cache: Optional[LLMResponseCache] = None
+
+
+def get_response_cache() -> Optional[LLMResponseCache]:
+    """Return the process-wide cache, or None when LLM_CACHE_ENABLED is off."""
+    global _cache
+    if not settings.LLM_CACHE_ENABLED:
+        return None
+    if _cache is None:
+        _cache = LLMResponseCache(
+            path=settings.LLM_CACHE_PATH,
+            ttl_seconds=settings.LLM_CACHE_TTL_HOURS * 3600,
+            max_entries=settings.LLM_CACHE_MAX_ENTRIES,
+        )
+    return _cache
+
+
+def set_response_cache(cache: Optional[LLMResponseCache]) -> None:
+    """Replace the process-wide cache (tests, alternate cache files)."""
+    global _cache
+    _cache = cache
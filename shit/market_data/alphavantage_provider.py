@@ -32,6 +32,11 @@ class AlphaVantageProvider(PriceProvider):
     def name(self) -> str:
         return "alphavantage"
 
+    @property
+    def rate_limit_per_minute(self) -> Optional[float]:
+        rate = settings.MARKET_DATA_ALPHAVANTAGE_RATE_LIMIT
+        return rate if rate > 0 else None
+
     def is_available(self) -> bool:
         """Available only if an API key is configured."""
         return self._api_key is not None and len(self._api_key) > 0
@@ -7,15 +7,17 @@ is always available for outcome calculation.
 """
 
 from datetime import date, timedelta
-from typing import List, Set, Tuple
+from typing import Dict, List, Set, Tuple
 import logging
 from sqlalchemy import and_
 
 from shit.market_data.client import MarketDataClient
 from shit.market_data.outcome_calculator import OutcomeCalculator
 from shit.market_data.models import MarketPrice
+from shit.market_data.price_cache import load_symbol_rows, price_cache
 from shit.market_data.ticker_registry import TickerRegistryService
 from shit.db.sync_session import get_session
+from shit.events.tracing import trace_span
 from shitvault.shitpost_models import Prediction
 from shitvault.signal_models import Signal  # noqa: F401 - registers Signal with SQLAlchemy mapper
 from shit.logging import get_service_logger, print_success, print_error, print_info
@@ -86,14 +88,9 @@ class AutoBackfillService:
         cutoff_date = date.today() - timedelta(days=days_back)
 
         with get_session() as session:
-            recent_price = session.query(MarketPrice).filter(
-                and_(
-                    MarketPrice.symbol == symbol,
-                    MarketPrice.date >= cutoff_date
-                )
-            ).first()
+            series = price_cache.get(symbol, lambda s: load_symbol_rows(session, s))
 
-            return recent_price is None
+        return not series.has_data_since(cutoff_date)
 
     def backfill_ticker(self, symbol: str, force: bool = False) -> bool:
         """
@@ -106,14 +103,7 @@ class AutoBackfillService:
         Returns:
             True if successful, False otherwise
         """
-        # Skip invalid symbols
-        if not symbol or len(symbol) > 10 or ' ' in symbol:
-            self.logger.warning(f"Invalid symbol format: {symbol}")
-            return False
-
-        # Skip Korean exchange symbols (yfinance doesn't support)
-        if symbol.startswith('KRX:'):
-            self.logger.debug(f"Skipping Korean exchange symbol: {symbol}")
+        if not self._is_backfillable(symbol):
             return False
 
         try:
@@ -165,6 +155,97 @@ class AutoBackfillService:
             )
             return False
 
+    def backfill_tickers(self, symbols: List[str], force: bool = False) -> Dict[str, bool]:
+        """
+        Backfill price history for many tickers in one pass.
+
+        Fetches go through MarketDataClient.update_prices_for_symbols, which
+        uses multi-ticker downloads and bounded-concurrency per-symbol
+        fetches, and stores everything in one transaction. Only symbols the
+        providers returned no data for are marked invalid in the registry;
+        fetch and store errors leave it untouched.
+
+        Args:
+            symbols: Ticker symbols
+            force: Force refresh even if data exists
+
+        Returns:
+            Dict mapping each symbol to True if prices were backfilled
+        """
+        outcome = {symbol: False for symbol in symbols}
+        valid = [s for s in dict.fromkeys(symbols) if self._is_backfillable(s)]
+        if not valid:
+            return outcome
+
+        try:
+            start_date = date.today() - timedelta(days=self.backfill_days)
+            end_date = date.today()
+
+            with MarketDataClient() as client:
+                counts = client.update_prices_for_symbols(
+                    valid,
+                    start_date=start_date,
+                    end_date=end_date,
+                    force_refresh=force,
+                )
+        except Exception as e:
+            self.logger.error(
+                f"Failed to backfill {len(valid)} tickers: {e}",
+                extra={"symbols": valid, "error": str(e)},
+                exc_info=True
+            )
+            return outcome
+
+        for symbol in valid:
+            count = counts.get(symbol)
+            if count is None:
+                # Fetch or store error, not missing data: leave the registry alone
+                self.logger.warning(
+                    f"Could not backfill {symbol}; will retry later",
+                    extra={"symbol": symbol}
+                )
+            elif count > 0:
+                outcome[symbol] = True
+                try:
+                    self.registry.update_price_metadata(symbol)
+                except Exception as reg_err:
+                    self.logger.warning(
+                        f"Failed to update registry metadata for {symbol}: {reg_err}",
+                        extra={"symbol": symbol}
+                    )
+            else:
+                self.logger.warning(
+                    f"No price data available for {symbol}",
+                    extra={"symbol": symbol}
+                )
+                try:
+                    self.registry.mark_ticker_invalid(symbol, "yfinance returned no price data")
+                except Exception as reg_err:
+                    self.logger.warning(
+                        f"Failed to mark {symbol} invalid in registry: {reg_err}",
+                        extra={"symbol": symbol}
+                    )
+
+        self.logger.info(
+            f"Backfilled {sum(outcome.values())}/{len(valid)} tickers",
+            extra={"count": len(valid)}
+        )
+        return outcome
+
+    def _is_backfillable(self, symbol: str) -> bool:
+        """Return False for symbols no provider can serve."""
+        # Skip invalid symbols
+        if not symbol or len(symbol) > 10 or ' ' in symbol:
+            self.logger.warning(f"Invalid symbol format: {symbol}")
+            return False
+
+        # Skip Korean exchange symbols (yfinance doesn't support)
+        if symbol.startswith('KRX:'):
+            self.logger.debug(f"Skipping Korean exchange symbol: {symbol}")
+            return False
+
+        return True
+
     def process_single_prediction(
         self,
         prediction_id: int,
@@ -173,6 +254,8 @@ class AutoBackfillService:
         """
         Process a single prediction: backfill assets and calculate outcome.
 
+        Traced as a ``backfill`` span when run for an event.
+
         Args:
             prediction_id: ID of prediction to process
             calculate_outcome: Whether to calculate outcome after backfill
@@ -180,6 +263,17 @@ class AutoBackfillService:
         Returns:
             Tuple of (assets_backfilled, outcomes_calculated)
         """
+        with trace_span("backfill", prediction_id=prediction_id) as span:
+            backfilled, outcomes = self._backfill_prediction(
+                prediction_id, calculate_outcome
+            )
+            span.update(assets_backfilled=backfilled, outcomes_calculated=outcomes)
+        return backfilled, outcomes
+
+    def _backfill_prediction(
+        self, prediction_id: int, calculate_outcome: bool
+    ) -> Tuple[int, int]:
+        """Backfill a prediction's assets and calculate its outcome."""
         with get_session() as session:
             prediction = session.query(Prediction).filter(
                 Prediction.id == prediction_id
@@ -359,11 +453,9 @@ class AutoBackfillService:
                 "failed": 0
             }
 
-            for ticker in missing:
-                if self.backfill_ticker(ticker):
-                    stats["backfilled"] += 1
-                else:
-                    stats["failed"] += 1
+            backfilled = self.backfill_tickers(missing)
+            stats["backfilled"] = sum(backfilled.values())
+            stats["failed"] = len(backfilled) - stats["backfilled"]
 
             self.logger.info("Backfill complete", extra=stats)
             return stats
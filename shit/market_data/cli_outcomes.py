@@ -127,18 +127,40 @@ def fix_sentiments(dry_run: bool):
 @click.option(
     "--emit-event", is_flag=True, help="Emit outcomes_matured event when done"
 )
-def mature_outcomes(limit: Optional[int], emit_event: bool):
+@click.option(
+    "--batch",
+    is_flag=True,
+    help="Vectorized mode: bulk price loads and one UPDATE per chunk",
+)
+@click.option(
+    "--chunk-size",
+    type=int,
+    default=500,
+    show_default=True,
+    help="Outcomes per chunk in --batch mode",
+)
+def mature_outcomes(
+    limit: Optional[int], emit_event: bool, batch: bool, chunk_size: int
+):
     """Re-evaluate incomplete prediction outcomes to fill matured timeframes.
 
     Finds all prediction_outcomes where is_complete=False and re-runs
     outcome calculation for any timeframes that have now matured.
     This fills in T+7 and T+30 values that were NULL at initial creation.
+
+    Use --batch when re-maturing a large backlog: prices are loaded in bulk
+    and daily timeframes are computed as array operations.
     """
     print_info("Maturing incomplete prediction outcomes...")
 
     try:
         with OutcomeCalculator() as calculator:
-            stats = calculator.mature_outcomes(limit=limit, emit_event=emit_event)
+            if batch:
+                stats = calculator.mature_outcomes_batch(
+                    limit=limit, emit_event=emit_event, chunk_size=chunk_size
+                )
+            else:
+                stats = calculator.mature_outcomes(limit=limit, emit_event=emit_event)
 
             # Print statistics
             rprint("\n[bold]Outcome Maturation Results:[/bold]")
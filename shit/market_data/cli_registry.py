@@ -13,6 +13,7 @@ from sqlalchemy import text
 
 from shit.logging import print_success, print_error, print_info
 from shit.db.sync_session import get_session
+from shitvault.feed_index import sync_feed_index
 
 console = Console()
 
@@ -170,6 +171,9 @@ def remap_tickers_cmd(dry_run: bool):
                 total_remapped += count
 
             if not dry_run:
+                if total_remapped:
+                    # Rewritten assets may have emptied (or renamed) feed posts
+                    sync_feed_index(session)
                 session.commit()
 
         if total_remapped == 0:
@@ -248,6 +252,9 @@ def clean_concept_tickers_cmd(dry_run: bool):
                 total_cleaned += count
 
             if not dry_run:
+                if total_cleaned:
+                    # Rewritten assets may have emptied (or renamed) feed posts
+                    sync_feed_index(session)
                 session.commit()
 
         if total_cleaned == 0:
@@ -4,8 +4,9 @@ Fetches stock/asset prices using pluggable providers and stores in database.
 """
 
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, date, timedelta, timezone
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Set, Tuple
 
 from sqlalchemy.orm import Session
 from sqlalchemy import and_
@@ -17,6 +18,8 @@ from shit.market_data.price_provider import (
     RawPriceRecord,
     ProviderError,
 )
+from shit.market_data.price_cache import PricePoint, load_symbol_rows, price_cache
+from shit.market_data.price_store import upsert_prices
 from shit.market_data.yfinance_provider import YFinanceProvider
 from shit.market_data.alphavantage_provider import AlphaVantageProvider
 from shit.db.sync_session import get_session
@@ -91,6 +94,7 @@ class MarketDataClient:
         self.session = session
         self._own_session = session is None
         self._provider_chain = provider_chain or _build_default_provider_chain()
+        self._price_cache = price_cache
 
     def __enter__(self):
         if self._own_session:
@@ -162,6 +166,7 @@ class MarketDataClient:
         try:
             prices = self._store_raw_records(raw_records, force_refresh)
             self.session.commit()
+            self._price_cache.invalidate([symbol])
 
             logger.info(
                 f"Successfully stored {len(prices)} prices for {symbol}",
@@ -176,6 +181,7 @@ class MarketDataClient:
                 exc_info=True,
             )
             self.session.rollback()
+            self._price_cache.invalidate([symbol])
             raise
 
     def _fetch_with_retry(
@@ -236,86 +242,65 @@ class MarketDataClient:
         records: List[RawPriceRecord],
         force_refresh: bool = False,
     ) -> List[MarketPrice]:
-        """Convert RawPriceRecord objects to MarketPrice ORM objects and store.
+        """Upsert RawPriceRecord objects and return the stored MarketPrice rows.
 
-        Uses batch duplicate detection instead of per-record queries to avoid
-        N+1 pattern (was 1 SELECT per record, now 1 SELECT total).
+        Writes go through one multi-row ``INSERT ... ON CONFLICT (symbol, date)``
+        (see price_store). Existing rows are left untouched unless
+        force_refresh is set. The stored rows are then read back with a
+        single range query over the records' symbols and dates, and the
+        symbols' price_cache entries are invalidated.
         """
         if not records:
             return []
 
-        prices = []
-
-        # Batch-fetch all existing prices in one query
-        record_keys = [(r.symbol, r.date) for r in records]
-        symbols = list({k[0] for k in record_keys})
-        dates = list({k[1] for k in record_keys})
+        symbols = list({r.symbol for r in records})
+        upsert_prices(
+            self.session,
+            records,
+            overwrite=force_refresh,
+            copy_threshold=settings.MARKET_DATA_COPY_THRESHOLD,
+        )
+        self._price_cache.invalidate(symbols)
 
-        existing_rows = (
+        stored = (
             self.session.query(MarketPrice)
             .filter(
                 and_(
                     MarketPrice.symbol.in_(symbols),
-                    MarketPrice.date.in_(dates),
+                    MarketPrice.date >= min(r.date for r in records),
+                    MarketPrice.date <= max(r.date for r in records),
                 )
             )
+            .populate_existing()
             .all()
         )
-        existing_map = {(p.symbol, p.date): p for p in existing_rows}
+        stored_map = {(p.symbol, p.date): p for p in stored}
 
+        prices = []
+        seen = set()
         for record in records:
-            existing_price = existing_map.get((record.symbol, record.date))
-
-            if existing_price and not force_refresh:
-                prices.append(existing_price)
-                continue
-
-            # Create or update price record
-            if existing_price:
-                price_obj = existing_price
-            else:
-                price_obj = MarketPrice(symbol=record.symbol, date=record.date)
-
-            price_obj.open = record.open
-            price_obj.high = record.high
-            price_obj.low = record.low
-            price_obj.close = record.close
-            price_obj.volume = record.volume
-            price_obj.adjusted_close = record.adjusted_close
-            price_obj.source = record.source
-            price_obj.last_updated = datetime.now(timezone.utc)
-            price_obj.is_market_open = True
-
-            if not existing_price:
-                self.session.add(price_obj)
-
-            prices.append(price_obj)
-
+            key = (record.symbol, record.date)
+            if key in stored_map and key not in seen:
+                seen.add(key)
+                prices.append(stored_map[key])
         return prices
 
     def get_price_on_date(
         self, symbol: str, target_date: date, lookback_days: int = 7
-    ) -> Optional[MarketPrice]:
-        """Get price for a specific date, with fallback for non-trading days.
-
-        Uses a single bounded query to find the most recent price on or before
-        the target date within the lookback window. If target_date is a weekend
-        or holiday, this returns the most recent trading day's close.
+    ) -> Optional[PricePoint]:
+        """Get the close for a specific date, with fallback for non-trading days.
+
+        Resolved against the in-process price cache: the symbol's history is
+        loaded once, then the most recent close on or before the target date
+        within the lookback window is found by binary search. If target_date
+        is a weekend or holiday, this returns the most recent trading day's
+        close.
         """
-        # Single query: find most recent price on or before target within lookback window
-        lookback_date = target_date - timedelta(days=lookback_days * 2)  # Calendar days > trading days
-        price = (
-            self.session.query(MarketPrice)
-            .filter(
-                and_(
-                    MarketPrice.symbol == symbol,
-                    MarketPrice.date <= target_date,
-                    MarketPrice.date >= lookback_date,
-                )
-            )
-            .order_by(MarketPrice.date.desc())
-            .first()
+        series = self._price_cache.get(
+            symbol, lambda s: load_symbol_rows(self.session, s)
         )
+        # Calendar days > trading days
+        price = series.close_on_or_before(target_date, lookback_days * 2)
 
         if price:
             if price.date != target_date:
@@ -349,27 +334,149 @@ class MarketDataClient:
         symbols: List[str],
         start_date: Optional[date] = None,
         end_date: Optional[date] = None,
+        force_refresh: bool = False,
     ) -> Dict[str, int]:
-        """Update prices for multiple symbols."""
+        """Update prices for multiple symbols.
+
+        Symbols with fresh data in the database are skipped. The rest are
+        fetched with multi-ticker provider calls where available, then
+        concurrently per symbol (bounded by MARKET_DATA_MAX_CONCURRENCY)
+        for anything the bulk path missed. All fetched records are stored
+        with one bulk upsert and one commit.
+
+        Returns:
+            Dict mapping symbol to the number of prices available for it
+            (0 if the providers had none). Symbols whose freshness check,
+            fetch or store failed are left out, so callers can tell an
+            error from a symbol without data.
+        """
         if start_date is None:
             start_date = date.today() - timedelta(days=30)
         if end_date is None:
             end_date = date.today()
 
-        results = {}
-        for symbol in symbols:
+        results: Dict[str, int] = {}
+        to_fetch: List[str] = []
+        staleness_days = settings.MARKET_DATA_STALENESS_THRESHOLD_HOURS // 24
+
+        for symbol in dict.fromkeys(symbols):
+            if force_refresh:
+                to_fetch.append(symbol)
+                continue
             try:
-                prices = self.fetch_price_history(symbol, start_date, end_date)
-                results[symbol] = len(prices)
+                existing = self._get_existing_prices(symbol, start_date, end_date)
+                is_fresh = bool(existing) and existing[-1].date >= (
+                    date.today() - timedelta(days=staleness_days)
+                )
             except Exception as e:
                 logger.error(
-                    f"Failed to update prices for {symbol}: {e}",
+                    f"Failed to check existing prices for {symbol}: {e}",
                     extra={"symbol": symbol, "error": str(e)},
                 )
+                continue
+            if is_fresh:
+                results[symbol] = len(existing)
+            else:
+                to_fetch.append(symbol)
+
+        if not to_fetch:
+            return results
+
+        fetched, failed = self._fetch_many(to_fetch, start_date, end_date)
+        for symbol in to_fetch:
+            if symbol not in failed:
                 results[symbol] = 0
+        records = [r for symbol in to_fetch for r in fetched.get(symbol, [])]
+        if not records:
+            return results
 
+        try:
+            written = upsert_prices(
+                self.session,
+                records,
+                overwrite=force_refresh,
+                copy_threshold=settings.MARKET_DATA_COPY_THRESHOLD,
+            )
+            self.session.commit()
+        except Exception as e:
+            logger.error(
+                f"Error storing prices for {len(fetched)} symbols: {e}",
+                extra={"symbols": list(fetched), "error": str(e)},
+                exc_info=True,
+            )
+            self.session.rollback()
+            return {s: n for s, n in results.items() if s not in fetched}
+        finally:
+            self._price_cache.invalidate(fetched)
+
+        for symbol, symbol_records in fetched.items():
+            results[symbol] = len({r.date for r in symbol_records})
+
+        logger.info(
+            f"Stored {written} prices for {len(fetched)}/{len(to_fetch)} symbols",
+            extra={"count": written, "symbols_fetched": len(fetched)},
+        )
         return results
 
+    def _fetch_many(
+        self,
+        symbols: List[str],
+        start_date: date,
+        end_date: date,
+    ) -> Tuple[Dict[str, List[RawPriceRecord]], Set[str]]:
+        """Fetch raw records for many symbols without touching the session.
+
+        Tries the chain's multi-ticker path first, then runs
+        ``_fetch_with_retry`` in a thread pool for the remaining symbols.
+        Provider rate limits are enforced inside the chain, so workers
+        sharing a provider wait on the same budget.
+
+        Returns:
+            ``(records by symbol, symbols whose fetch raised unexpectedly)``.
+            Symbols the providers had no data for are in neither.
+        """
+        fetched: Dict[str, List[RawPriceRecord]] = {}
+
+        try:
+            fetched.update(
+                self._provider_chain.fetch_bulk_with_fallback(
+                    symbols,
+                    start_date,
+                    end_date,
+                    chunk_size=settings.MARKET_DATA_BULK_CHUNK_SIZE,
+                )
+            )
+        except Exception as e:
+            logger.warning(
+                f"Bulk fetch failed, falling back to per-symbol fetch: {e}",
+                extra={"error": str(e)},
+            )
+
+        remaining = [s for s in symbols if s not in fetched]
+        failed: Set[str] = set()
+        if not remaining:
+            return fetched, failed
+
+        def _fetch_one(symbol: str) -> Optional[List[RawPriceRecord]]:
+            try:
+                return self._fetch_with_retry(symbol, start_date, end_date)
+            except Exception as e:
+                logger.error(
+                    f"Failed to update prices for {symbol}: {e}",
+                    extra={"symbol": symbol, "error": str(e)},
+                )
+                return None
+
+        max_workers = max(1, min(settings.MARKET_DATA_MAX_CONCURRENCY, len(remaining)))
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            for symbol, records in zip(remaining, pool.map(_fetch_one, remaining)):
+                if records is None:
+                    failed.add(symbol)
+                elif records:
+                    fetched[symbol] = records
+
+        return fetched, failed
+
     def _get_existing_prices(
         self, symbol: str, start_date: date, end_date: date
     ) -> List[MarketPrice]:
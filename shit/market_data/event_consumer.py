@@ -19,6 +19,7 @@ class MarketDataWorker(EventWorker):
     """Processes prediction_created events by backfilling market data."""
 
     consumer_group = ConsumerGroup.MARKET_DATA
+    concurrency = 4  # yfinance fetches are I/O bound
 
     def process_event(self, event_type: str, payload: dict) -> dict:
         """Process a prediction_created event.
@@ -10,29 +10,98 @@ Usage:
     cal.next_trading_day(date(2025, 7, 4))  # date(2025, 7, 7) (skip Fri holiday + weekend)
     cal.trading_days_between(date(2025, 1, 6), date(2025, 1, 10))  # 5
     cal.trading_day_offset(date(2025, 6, 13), 1)  # date(2025, 6, 16) -- Friday +1 = Monday
+
+Day-level queries (is_trading_day, next/previous/nearest, offsets, counts)
+are answered from a per-process ordinal session index built once from the
+exchange calendar. exchange_calendars is only consulted for dates outside
+the indexed range and for intraday (open/close time) queries.
 """
 
 from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache
 from typing import Optional
 
 import exchange_calendars as xcals
+import numpy as np
 import pandas as pd
 
 from shit.logging import get_service_logger
 
 logger = get_service_logger("market_calendar")
 
+# date(1970, 1, 1).toordinal() -- converts numpy epoch days to date ordinals
+_EPOCH_ORDINAL = 719163
+
+
+class _SessionIndex:
+    """Compact ordinal index over every session in an exchange calendar.
+
+    ``sessions`` is a sorted int32 array of session-day ordinals
+    (``date.toordinal()``). ``position[i]`` is the index into ``sessions``
+    of the first session on or after day ``first + i``, and
+    ``is_session[i]`` marks whether that day is itself a session. Together
+    they turn snapping, offsets and between-counts into array lookups.
+    """
+
+    def __init__(self, sessions: pd.DatetimeIndex) -> None:
+        epoch_days = sessions.values.astype("datetime64[D]").astype(np.int64)
+        self.sessions = (epoch_days + _EPOCH_ORDINAL).astype(np.int32)
+        self.first = int(self.sessions[0])
+        self.last = int(self.sessions[-1])
+
+        days = np.arange(self.first, self.last + 1, dtype=np.int32)
+        self.position = np.searchsorted(self.sessions, days, side="left").astype(
+            np.int32
+        )
+        self.is_session = np.zeros(len(days), dtype=bool)
+        self.is_session[self.sessions - self.first] = True
+
+    def in_range(self, ordinals: np.ndarray) -> np.ndarray:
+        return (ordinals >= self.first) & (ordinals <= self.last)
+
+    def offset(self, ordinals: np.ndarray, offset: int) -> np.ndarray:
+        """Vectorized trading-day offset; -1 where the result is out of range."""
+        result = np.full(len(ordinals), -1, dtype=np.int64)
+        inside = self.in_range(ordinals)
+        rel = ordinals[inside] - self.first
+
+        anchor = self.position[rel].astype(np.int64)
+        if offset < 0:
+            # Non-session days snap back to the previous session
+            anchor = anchor - (~self.is_session[rel])
+        target = anchor + offset
+
+        valid = (anchor >= 0) & (target >= 0) & (target < len(self.sessions))
+        values = np.full(len(rel), -1, dtype=np.int64)
+        values[valid] = self.sessions[target[valid]]
+        result[inside] = values
+        return result
+
+
+@lru_cache(maxsize=None)
+def _session_index(exchange_key: str) -> _SessionIndex:
+    """Build (once per process) the session index for an exchange."""
+    cal = xcals.get_calendar(exchange_key)
+    index = _SessionIndex(cal.sessions)
+    logger.debug(
+        f"Built {exchange_key} session index: {len(index.sessions)} sessions "
+        f"({date.fromordinal(index.first)} to {date.fromordinal(index.last)})"
+    )
+    return index
+
 
 class MarketCalendar:
     """NYSE/NASDAQ market calendar for trading-day arithmetic.
 
     This class is stateless and cheap to instantiate. It wraps a singleton
     exchange_calendars.ExchangeCalendar under the hood (the library caches
-    calendar instances internally).
+    calendar instances internally) plus a per-process ``_SessionIndex``
+    that answers day-level queries without touching pandas.
 
     All methods accept plain ``datetime.date`` objects and return plain
     ``datetime.date`` or ``datetime.datetime`` objects -- no pandas types
-    leak into the public API.
+    leak into the public API. The ``*_ordinals`` variants take and return
+    NumPy arrays of day ordinals for bulk callers.
     """
 
     # NYSE calendar covers both NYSE and NASDAQ holidays (same schedule)
@@ -40,11 +109,17 @@ class MarketCalendar:
 
     def __init__(self) -> None:
         self._cal = xcals.get_calendar(self._EXCHANGE_KEY)
+        self._index = _session_index(self._EXCHANGE_KEY)
 
     # -- Trading-day queries --------------------------------------------------
 
     def is_trading_day(self, d: date) -> bool:
         """Return True if *d* is a regular NYSE trading session."""
+        n = d.toordinal()
+        idx = self._index
+        if idx.first <= n <= idx.last:
+            return bool(idx.is_session[n - idx.first])
+
         ts = pd.Timestamp(d)
         try:
             return self._cal.is_session(ts)
@@ -58,6 +133,13 @@ class MarketCalendar:
         If *d* is a trading day, this returns the *following* trading day.
         If *d* is a weekend or holiday, this returns the next open session.
         """
+        n = d.toordinal()
+        idx = self._index
+        if idx.first <= n <= idx.last:
+            pos = idx.position[n - idx.first] + idx.is_session[n - idx.first]
+            if pos < len(idx.sessions):
+                return date.fromordinal(int(idx.sessions[pos]))
+
         ts = pd.Timestamp(d)
         try:
             return self._cal.next_session(ts).date()
@@ -67,6 +149,13 @@ class MarketCalendar:
 
     def previous_trading_day(self, d: date) -> date:
         """Return the most recent trading day strictly before *d*."""
+        n = d.toordinal()
+        idx = self._index
+        if idx.first <= n <= idx.last:
+            pos = idx.position[n - idx.first] - 1
+            if pos >= 0:
+                return date.fromordinal(int(idx.sessions[pos]))
+
         ts = pd.Timestamp(d)
         try:
             return self._cal.previous_session(ts).date()
@@ -99,7 +188,11 @@ class MarketCalendar:
         if offset == 0:
             return self.nearest_trading_day(d)
 
-        # Snap to nearest session first
+        result = self._index.offset(np.array([d.toordinal()]), offset)[0]
+        if result >= 0:
+            return date.fromordinal(int(result))
+
+        # Outside the precomputed range: snap to nearest session first
         ts = pd.Timestamp(d)
         try:
             if self._cal.is_session(ts):
@@ -119,6 +212,12 @@ class MarketCalendar:
 
         Both endpoints are included if they are trading days.
         """
+        lo, hi = start.toordinal(), end.toordinal()
+        idx = self._index
+        if idx.first <= lo <= idx.last and idx.first <= hi <= idx.last:
+            after_end = idx.position[hi - idx.first] + idx.is_session[hi - idx.first]
+            return max(int(after_end - idx.position[lo - idx.first]), 0)
+
         ts_start = pd.Timestamp(start)
         ts_end = pd.Timestamp(end)
         try:
@@ -127,6 +226,41 @@ class MarketCalendar:
         except ValueError:
             return 0
 
+    # -- Bulk (array) queries -------------------------------------------------
+
+    def trading_day_mask_ordinals(self, ordinals: np.ndarray) -> np.ndarray:
+        """Vectorized ``is_trading_day`` over an array of day ordinals."""
+        ordinals = np.asarray(ordinals, dtype=np.int64)
+        idx = self._index
+        inside = idx.in_range(ordinals)
+
+        result = np.zeros(len(ordinals), dtype=bool)
+        result[inside] = idx.is_session[ordinals[inside] - idx.first]
+        for i in np.flatnonzero(~inside):
+            result[i] = self.is_trading_day(date.fromordinal(int(ordinals[i])))
+        return result
+
+    def trading_day_offset_ordinals(
+        self, ordinals: np.ndarray, offset: int
+    ) -> np.ndarray:
+        """Vectorized ``trading_day_offset`` over an array of day ordinals.
+
+        Args:
+            ordinals: Anchor days as ``date.toordinal()`` values.
+            offset: Trading days to advance (positive) or go back (negative).
+
+        Returns:
+            int64 array of target-day ordinals. ``offset=0`` snaps to the
+            nearest trading day. Entries outside the precomputed session
+            range fall back to ``trading_day_offset``.
+        """
+        ordinals = np.asarray(ordinals, dtype=np.int64)
+        result = self._index.offset(ordinals, offset)
+        for i in np.flatnonzero(result < 0):
+            d = date.fromordinal(int(ordinals[i]))
+            result[i] = self.trading_day_offset(d, offset).toordinal()
+        return result
+
     # -- Market-hours queries -------------------------------------------------
 
     def next_market_open(self, dt: datetime) -> datetime:
@@ -62,8 +62,12 @@ class MarketPrice(Base, IDMixin, TimestampMixin):
     def __repr__(self):
         return f"<MarketPrice(symbol='{self.symbol}', date={self.date}, close=${self.close})>"
 
-    # Unique constraint on symbol + date (one price record per symbol per day)
-    __table_args__ = ({"sqlite_autoincrement": True},)
+    # Unique constraint on symbol + date (one price record per symbol per day).
+    # Also the ON CONFLICT target for the bulk upsert in price_store.
+    __table_args__ = (
+        UniqueConstraint("symbol", "date", name="uq_market_prices_symbol_date"),
+        {"sqlite_autoincrement": True},
+    )
 
 
 class PredictionOutcome(Base, IDMixin, TimestampMixin):
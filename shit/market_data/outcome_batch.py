@@ -0,0 +1,172 @@
+"""
+Batch Outcome Engine
+Vectorized maturation of prediction outcomes.
+
+The per-row path (``OutcomeCalculator.mature_outcomes``) resolves every
+(symbol, date) pair with its own ``get_price_on_date`` query. This module
+loads every close needed by a chunk of outcomes in one query, lays them out
+as a forward-filled date x symbol matrix, and computes T+N prices, returns,
+correctness flags and P&L as NumPy array operations.
+
+Semantics mirror the per-row path:
+- "Close on date D" means the most recent close on or before D within a
+  14-calendar-day lookback (same window as ``get_price_on_date``).
+- Correctness uses the same 0.5% threshold as ``PredictionOutcome.is_correct``.
+- P&L assumes a $1000 position.
+"""
+
+from datetime import date
+from typing import Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import and_
+from sqlalchemy.orm import Session
+
+from shit.market_data.models import MarketPrice
+
+# Trading-day timeframes and the PredictionOutcome columns they populate
+TIMEFRAMES = (
+    (1, "price_t1", "return_t1", "correct_t1", "pnl_t1"),
+    (3, "price_t3", "return_t3", "correct_t3", "pnl_t3"),
+    (7, "price_t7", "return_t7", "correct_t7", "pnl_t7"),
+    (30, "price_t30", "return_t30", "correct_t30", "pnl_t30"),
+)
+
+# Mirrors MarketDataClient.get_price_on_date (lookback_days=7, doubled to calendar days)
+LOOKBACK_CALENDAR_DAYS = 14
+
+CORRECTNESS_THRESHOLD = 0.5
+POSITION_SIZE = 1000.0
+
+
+class PriceMatrix:
+    """Forward-filled closing prices indexed by (date ordinal, symbol).
+
+    Rows are consecutive calendar-day ordinals starting at ``origin``;
+    columns are symbols. Each cell holds the most recent close on or
+    before that day, limited to ``LOOKBACK_CALENDAR_DAYS`` of fill.
+    """
+
+    def __init__(self, values: np.ndarray, origin: int, symbols: Sequence[str]):
+        self.values = values
+        self.origin = origin
+        self.symbols = list(symbols)
+        self._columns = {s: i for i, s in enumerate(self.symbols)}
+
+    @classmethod
+    def from_rows(
+        cls,
+        rows: Iterable[tuple],
+        start: date,
+        end: date,
+        lookback_days: int = LOOKBACK_CALENDAR_DAYS,
+    ) -> "PriceMatrix":
+        """Build a matrix from ``(symbol, date, close)`` rows.
+
+        Args:
+            rows: Iterable of (symbol, date, close) tuples.
+            start: Earliest date that will be looked up.
+            end: Latest date that will be looked up.
+            lookback_days: Maximum calendar days a close is carried forward.
+        """
+        origin = start.toordinal() - lookback_days
+        index = pd.RangeIndex(origin, end.toordinal() + 1)
+
+        frame = pd.DataFrame(list(rows), columns=["symbol", "date", "close"])
+        if frame.empty:
+            return cls(np.empty((len(index), 0)), origin, [])
+
+        frame["ordinal"] = [d.toordinal() for d in frame["date"]]
+        wide = frame.pivot_table(
+            index="ordinal", columns="symbol", values="close", aggfunc="last"
+        )
+        wide = wide.reindex(index).ffill(limit=lookback_days)
+        return cls(wide.to_numpy(dtype=float), origin, list(wide.columns))
+
+    @classmethod
+    def load(
+        cls,
+        session: Session,
+        symbols: Sequence[str],
+        start: date,
+        end: date,
+        lookback_days: int = LOOKBACK_CALENDAR_DAYS,
+    ) -> "PriceMatrix":
+        """Load all closes for *symbols* covering [start - lookback, end] in one query."""
+        rows = (
+            session.query(MarketPrice.symbol, MarketPrice.date, MarketPrice.close)
+            .filter(
+                and_(
+                    MarketPrice.symbol.in_(list(symbols)),
+                    MarketPrice.date >= date.fromordinal(start.toordinal() - lookback_days),
+                    MarketPrice.date <= end,
+                )
+            )
+            .all()
+        )
+        return cls.from_rows(rows, start, end, lookback_days)
+
+    def lookup(self, symbols: Sequence[str], ordinals: np.ndarray) -> np.ndarray:
+        """Return the close on or before each (symbol, ordinal) pair, NaN if unknown."""
+        ordinals = np.asarray(ordinals, dtype=np.int64)
+        result = np.full(len(ordinals), np.nan)
+
+        cols = np.array([self._columns.get(s, -1) for s in symbols], dtype=np.int64)
+        rows = ordinals - self.origin
+        valid = (cols >= 0) & (rows >= 0) & (rows < self.values.shape[0])
+        result[valid] = self.values[rows[valid], cols[valid]]
+        return result
+
+
+def compute_returns(base: np.ndarray, prices: np.ndarray) -> np.ndarray:
+    """Percentage return from *base* to *prices*; NaN where undefined."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        returns = (prices - base) / base * 100
+    returns[~np.isfinite(returns)] = np.nan
+    return returns
+
+
+def compute_correct(
+    sentiments: Sequence[Optional[str]],
+    returns: np.ndarray,
+    threshold: float = CORRECTNESS_THRESHOLD,
+) -> np.ndarray:
+    """Vectorized ``PredictionOutcome.is_correct``.
+
+    Returns a float array of 1.0 (correct), 0.0 (incorrect) or NaN
+    (no sentiment, unknown sentiment, or no return).
+    """
+    labels = np.array([(s or "").lower() for s in sentiments], dtype=object)
+    bullish = labels == "bullish"
+    bearish = labels == "bearish"
+    neutral = labels == "neutral"
+
+    correct = np.full(len(returns), np.nan)
+    correct[bullish] = returns[bullish] > threshold
+    correct[bearish] = returns[bearish] < -threshold
+    correct[neutral] = np.abs(returns[neutral]) <= threshold
+    correct[np.isnan(returns)] = np.nan
+    return correct
+
+
+def compute_pnl(returns: np.ndarray, position_size: float = POSITION_SIZE) -> np.ndarray:
+    """P&L for a position of *position_size* given percentage *returns*."""
+    return returns / 100 * position_size
+
+
+def to_optional_float(value: float) -> Optional[float]:
+    """Convert a NumPy scalar to ``float`` or ``None`` for NaN."""
+    return None if np.isnan(value) else float(value)
+
+
+def to_optional_bool(value: float) -> Optional[bool]:
+    """Convert a 1.0/0.0/NaN flag to ``True``/``False``/``None``."""
+    return None if np.isnan(value) else bool(value)
+
+
+def column_array(rows: List[Dict], key: str) -> np.ndarray:
+    """Extract a nullable float column from row dicts as a NaN-padded array."""
+    return np.array(
+        [np.nan if r[key] is None else r[key] for r in rows], dtype=float
+    )
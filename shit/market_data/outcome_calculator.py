@@ -12,10 +12,13 @@ Timeframe semantics (v2 -- trading-day based):
 """
 
 from datetime import date, datetime, timedelta, timezone
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
+
+import numpy as np
 from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from sqlalchemy import and_, update
 
+from shit.market_data import outcome_batch
 from shit.market_data.models import PredictionOutcome
 from shit.market_data.client import MarketDataClient
 from shit.market_data.market_calendar import MarketCalendar
@@ -640,26 +643,244 @@ class OutcomeCalculator:
 
         # Optionally emit event for downstream consumers
         if emit_event and stats["matured"] > 0:
+            self._emit_outcomes_matured(stats)
+
+        return stats
+
+    def mature_outcomes_batch(
+        self,
+        limit: Optional[int] = None,
+        emit_event: bool = False,
+        chunk_size: int = 500,
+        fetch_missing: bool = True,
+    ) -> Dict[str, Any]:
+        """
+        Vectorized variant of ``mature_outcomes()`` for large backlogs.
+
+        Works from the denormalized columns on ``prediction_outcomes`` rows
+        rather than re-loading each prediction. Per chunk it issues one
+        bulk SELECT against ``market_prices``, computes T+1/T+3/T+7/T+30
+        prices, returns, correctness and P&L as array operations, and
+        writes the results back with one bulk UPDATE.
+
+        Intraday fields (same-day, 1h) are left untouched -- they come from
+        per-post intraday snapshots and do not affect ``is_complete``.
+        ``mature_outcomes()`` remains the reference implementation.
+
+        Args:
+            limit: Maximum number of incomplete outcomes to process.
+            emit_event: If True, emit an outcomes_matured event when done.
+            chunk_size: Outcomes per SELECT/UPDATE round trip.
+            fetch_missing: If True, fetch missing price history from the
+                provider chain (one call per symbol per chunk) before
+                giving up on a timeframe.
+
+        Returns:
+            Dict with the same maturation statistics as ``mature_outcomes()``.
+        """
+        columns = [
+            PredictionOutcome.id,
+            PredictionOutcome.symbol,
+            PredictionOutcome.prediction_date,
+            PredictionOutcome.prediction_sentiment,
+            PredictionOutcome.price_at_prediction,
+        ]
+        for _, *attrs in outcome_batch.TIMEFRAMES:
+            columns.extend(getattr(PredictionOutcome, attr) for attr in attrs)
+
+        query = (
+            self.session.query(*columns)
+            .filter(PredictionOutcome.is_complete == False)  # noqa: E712
+            .order_by(PredictionOutcome.id)
+        )
+
+        if limit:
+            query = query.limit(limit)
+
+        rows = [dict(row._mapping) for row in query.all()]
+
+        logger.info(
+            f"Found {len(rows)} incomplete outcomes to mature (batch mode)",
+            extra={"count": len(rows), "limit": limit, "chunk_size": chunk_size},
+        )
+
+        stats = {
+            "total_incomplete": len(rows),
+            "matured": 0,
+            "newly_complete": 0,
+            "still_incomplete": 0,
+            "errors": 0,
+            "skipped": 0,
+        }
+
+        for start in range(0, len(rows), chunk_size):
+            chunk = rows[start : start + chunk_size]
             try:
-                from shit.events.producer import emit_event as _emit_event
-                from shit.events.event_types import EventType
-
-                _emit_event(
-                    event_type=EventType.OUTCOMES_MATURED,
-                    payload={
-                        "total_incomplete": stats["total_incomplete"],
-                        "matured": stats["matured"],
-                        "newly_complete": stats["newly_complete"],
-                        "still_incomplete": stats["still_incomplete"],
-                        "errors": stats["errors"],
-                    },
-                    source_service="outcome_maturation",
-                )
+                updates, skipped = self._mature_chunk(chunk, fetch_missing)
+                if updates:
+                    self.session.execute(update(PredictionOutcome), updates)
+                self.session.commit()
+
+                stats["matured"] += len(updates)
+                stats["skipped"] += skipped
+                for row in updates:
+                    if row["is_complete"]:
+                        stats["newly_complete"] += 1
+                    else:
+                        stats["still_incomplete"] += 1
             except Exception as e:
-                logger.warning(f"Failed to emit outcomes_matured event: {e}")
+                self.session.rollback()
+                logger.error(
+                    f"Error maturing outcome chunk at offset {start}: {e}",
+                    extra={"offset": start, "size": len(chunk), "error": str(e)},
+                    exc_info=True,
+                )
+                stats["errors"] += len(chunk)
+
+        logger.info("Outcome maturation complete (batch mode)", extra=stats)
+
+        if emit_event and stats["matured"] > 0:
+            self._emit_outcomes_matured(stats)
 
         return stats
 
+    def _mature_chunk(
+        self, rows: List[Dict[str, Any]], fetch_missing: bool
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """Compute matured timeframe values for a chunk of outcome rows.
+
+        Returns:
+            (update_rows, skipped_count). Each update row carries every
+            timeframe column so the chunk is written as a single executemany.
+        """
+        today_ord = date.today().toordinal()
+        symbols = [r["symbol"] for r in rows]
+        sentiments = [r["prediction_sentiment"] for r in rows]
+        pred_ords = np.array(
+            [r["prediction_date"].toordinal() for r in rows], dtype=np.int64
+        )
+
+        # Target trading days for every row and timeframe (array lookups)
+        targets = np.column_stack(
+            [
+                self._calendar.trading_day_offset_ordinals(pred_ords, n)
+                for n, *_ in outcome_batch.TIMEFRAMES
+            ]
+        )
+        due = targets <= today_ord
+
+        existing = np.column_stack(
+            [
+                outcome_batch.column_array(rows, price_attr)
+                for _, price_attr, *_ in outcome_batch.TIMEFRAMES
+            ]
+        )
+        stored_base = outcome_batch.column_array(rows, "price_at_prediction")
+        needed = due & np.isnan(existing)
+
+        range_start = date.fromordinal(int(pred_ords.min()))
+        range_end = date.fromordinal(
+            int(max(pred_ords.max(), np.where(due, targets, 0).max()))
+        )
+
+        def resolve(matrix):
+            base = np.where(
+                np.isnan(stored_base), matrix.lookup(symbols, pred_ords), stored_base
+            )
+            looked_up = np.column_stack(
+                [matrix.lookup(symbols, targets[:, i]) for i in range(targets.shape[1])]
+            )
+            return base, np.where(needed, looked_up, np.nan)
+
+        unique_symbols = sorted(set(symbols))
+        matrix = outcome_batch.PriceMatrix.load(
+            self.session, unique_symbols, range_start, range_end
+        )
+        base, fetched = resolve(matrix)
+
+        if fetch_missing:
+            missing = np.isnan(base) | (needed & np.isnan(fetched)).any(axis=1)
+            retry = sorted(
+                {symbols[i] for i in np.flatnonzero(missing)} - self._failed_symbols
+            )
+            for symbol in retry:
+                try:
+                    self.market_client.fetch_price_history(
+                        symbol,
+                        start_date=range_start - timedelta(days=7),
+                        end_date=range_end,
+                    )
+                except Exception as e:
+                    logger.debug(
+                        f"Could not fetch price history for {symbol}: {e}",
+                        extra={"symbol": symbol, "error": str(e)},
+                    )
+            if retry:
+                matrix = outcome_batch.PriceMatrix.load(
+                    self.session, unique_symbols, range_start, range_end
+                )
+                base, fetched = resolve(matrix)
+
+        resolvable = ~np.isnan(base)
+        for i in np.flatnonzero(~resolvable):
+            self._failed_symbols.add(symbols[i])
+
+        filled = needed & ~np.isnan(fetched)
+        prices = np.where(filled, fetched, existing)
+        complete = (due & ~np.isnan(prices)).all(axis=1)
+
+        now = datetime.now(timezone.utc)
+        updates: List[Dict[str, Any]] = [
+            {
+                "id": rows[i]["id"],
+                "price_at_prediction": float(base[i]),
+                "is_complete": bool(complete[i]),
+                "last_price_update": now,
+            }
+            for i in np.flatnonzero(resolvable)
+        ]
+        indices = np.flatnonzero(resolvable)
+
+        for col, (_, price_attr, return_attr, correct_attr, pnl_attr) in enumerate(
+            outcome_batch.TIMEFRAMES
+        ):
+            returns = outcome_batch.compute_returns(base, fetched[:, col])
+            correct = outcome_batch.compute_correct(sentiments, returns)
+            pnl = outcome_batch.compute_pnl(returns)
+
+            for row, i in zip(updates, indices):
+                if filled[i, col]:
+                    row[price_attr] = float(fetched[i, col])
+                    row[return_attr] = outcome_batch.to_optional_float(returns[i])
+                    row[correct_attr] = outcome_batch.to_optional_bool(correct[i])
+                    row[pnl_attr] = outcome_batch.to_optional_float(pnl[i])
+                else:
+                    # Carry existing values so every row has the same keys
+                    for attr in (price_attr, return_attr, correct_attr, pnl_attr):
+                        row[attr] = rows[i][attr]
+
+        return updates, int((~resolvable).sum())
+
+    def _emit_outcomes_matured(self, stats: Dict[str, Any]) -> None:
+        """Emit an outcomes_matured event for downstream consumers."""
+        try:
+            from shit.events.producer import emit_event as _emit_event
+            from shit.events.event_types import EventType
+
+            _emit_event(
+                event_type=EventType.OUTCOMES_MATURED,
+                payload={
+                    "total_incomplete": stats["total_incomplete"],
+                    "matured": stats["matured"],
+                    "newly_complete": stats["newly_complete"],
+                    "still_incomplete": stats["still_incomplete"],
+                    "errors": stats["errors"],
+                },
+                source_service="outcome_maturation",
+            )
+        except Exception as e:
+            logger.warning(f"Failed to emit outcomes_matured event: {e}")
+
     def get_accuracy_stats(
         self, timeframe: str = "t7", min_confidence: Optional[float] = None
     ) -> Dict[str, Any]:
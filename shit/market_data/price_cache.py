@@ -0,0 +1,249 @@
+"""
+Price Cache
+In-process columnar cache of market_prices rows, one entry per symbol.
+
+Each entry keeps the symbol's full history as date ordinals plus OHLCV
+columns in NumPy arrays sorted by date, so "close on or before date D" is a
+binary search instead of a SQL round trip. Entries are:
+
+- loaded whole, with one query per symbol, on first use;
+- evicted least-recently-used once the arrays exceed the memory budget
+  (MARKET_DATA_PRICE_CACHE_MB);
+- dropped after MARKET_DATA_PRICE_CACHE_TTL_SECONDS so writes made by other
+  processes become visible;
+- invalidated explicitly when this process writes prices
+  (MarketDataClient calls ``invalidate`` after every price store).
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import date
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from shit.config.shitpost_settings import settings
+from shit.market_data.models import MarketPrice
+
+# Row layout expected from loaders: (date, open, high, low, close, volume)
+PriceRow = Tuple[Any, Optional[float], Optional[float], Optional[float], float, Optional[int]]
+
+
+@dataclass(frozen=True)
+class PricePoint:
+    """A single cached close, returned by ``MarketDataClient.get_price_on_date``."""
+
+    symbol: str
+    date: date
+    close: float
+
+
+class PriceSeries:
+    """Date-sorted OHLCV columns for one symbol."""
+
+    __slots__ = ("symbol", "ordinals", "open", "high", "low", "close", "volume", "loaded_at")
+
+    def __init__(
+        self,
+        symbol: str,
+        ordinals: np.ndarray,
+        columns: Dict[str, np.ndarray],
+        loaded_at: float,
+    ):
+        self.symbol = symbol
+        self.ordinals = ordinals
+        self.open = columns["open"]
+        self.high = columns["high"]
+        self.low = columns["low"]
+        self.close = columns["close"]
+        self.volume = columns["volume"]
+        self.loaded_at = loaded_at
+
+    @classmethod
+    def from_rows(cls, symbol: str, rows: Iterable[Sequence]) -> "PriceSeries":
+        """Build a series from ``(date, open, high, low, close, volume)`` rows."""
+        parsed = []
+        for row in rows:
+            d = row[0]
+            if isinstance(d, str):  # raw SQL on SQLite returns ISO strings
+                d = date.fromisoformat(d[:10])
+            parsed.append((d.toordinal(), *row[1:6]))
+        parsed.sort(key=lambda r: r[0])
+
+        ordinals = np.array([r[0] for r in parsed], dtype=np.int32)
+        columns = {
+            name: np.array(
+                [np.nan if r[i] is None else r[i] for r in parsed], dtype=np.float64
+            )
+            for i, name in enumerate(("open", "high", "low", "close", "volume"), start=1)
+        }
+        return cls(symbol, ordinals, columns, time.monotonic())
+
+    def __len__(self) -> int:
+        return len(self.ordinals)
+
+    @property
+    def nbytes(self) -> int:
+        return self.ordinals.nbytes + 5 * self.close.nbytes
+
+    def close_on_or_before(
+        self, target_date: date, lookback_days: int
+    ) -> Optional[PricePoint]:
+        """Most recent close on or before *target_date*, at most *lookback_days* earlier."""
+        target = target_date.toordinal()
+        i = int(np.searchsorted(self.ordinals, target, side="right")) - 1
+        if i < 0 or self.ordinals[i] < target - lookback_days:
+            return None
+        return PricePoint(
+            symbol=self.symbol,
+            date=date.fromordinal(int(self.ordinals[i])),
+            close=float(self.close[i]),
+        )
+
+    def has_data_since(self, start_date: date) -> bool:
+        """True if any row falls on or after *start_date*."""
+        return len(self) > 0 and int(self.ordinals[-1]) >= start_date.toordinal()
+
+    def rows_since(self, start_date: date) -> List[PriceRow]:
+        """Rows on or after *start_date* as ``(date, open, high, low, close, volume)``."""
+        i = int(np.searchsorted(self.ordinals, start_date.toordinal(), side="left"))
+        return [
+            (
+                date.fromordinal(int(self.ordinals[j])),
+                _optional(self.open[j]),
+                _optional(self.high[j]),
+                _optional(self.low[j]),
+                float(self.close[j]),
+                None if np.isnan(self.volume[j]) else int(self.volume[j]),
+            )
+            for j in range(i, len(self))
+        ]
+
+
+class PriceCache:
+    """Thread-safe LRU of PriceSeries bounded by total array bytes."""
+
+    def __init__(self, max_bytes: int, ttl_seconds: float):
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, PriceSeries]" = OrderedDict()
+        self._bytes = 0
+        self._generation = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(
+        self, symbol: str, loader: Callable[[str], Iterable[Sequence]]
+    ) -> PriceSeries:
+        """Return the cached series for *symbol*, calling *loader* on a miss."""
+        entry, generation = self._lookup(symbol)
+        if entry is not None:
+            return entry
+        return self._fill(symbol, loader(symbol), generation)
+
+    async def aget(
+        self, symbol: str, loader: Callable[[str], Awaitable[Iterable[Sequence]]]
+    ) -> PriceSeries:
+        """``get`` with an async *loader*, for callers on an event loop."""
+        entry, generation = self._lookup(symbol)
+        if entry is not None:
+            return entry
+        return self._fill(symbol, await loader(symbol), generation)
+
+    def _lookup(self, symbol: str) -> Tuple[Optional[PriceSeries], int]:
+        """The fresh entry for *symbol* (or None) and the current generation."""
+        with self._lock:
+            entry = self._entries.get(symbol)
+            if entry is not None and time.monotonic() - entry.loaded_at < self.ttl_seconds:
+                self._entries.move_to_end(symbol)
+                self.hits += 1
+                return entry, self._generation
+            self.misses += 1
+            return None, self._generation
+
+    def _fill(
+        self, symbol: str, rows: Iterable[Sequence], generation: int
+    ) -> PriceSeries:
+        series = PriceSeries.from_rows(symbol, rows)
+        with self._lock:
+            # An invalidation during the load means the rows may predate a write
+            if generation == self._generation:
+                self._put(symbol, series)
+        return series
+
+    def invalidate(self, symbols: Iterable[str]) -> None:
+        """Drop cached series for *symbols* (call after writing their prices)."""
+        with self._lock:
+            self._generation += 1
+            for symbol in symbols:
+                entry = self._entries.pop(symbol, None)
+                if entry is not None:
+                    self._bytes -= entry.nbytes
+
+    def clear(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+            self._bytes = 0
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "symbols": len(self._entries),
+                "bytes": self._bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+    def _put(self, symbol: str, series: PriceSeries) -> None:
+        old = self._entries.pop(symbol, None)
+        if old is not None:
+            self._bytes -= old.nbytes
+        self._entries[symbol] = series
+        self._bytes += series.nbytes
+        while self._bytes > self.max_bytes and len(self._entries) > 1:
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= evicted.nbytes
+
+
+def load_symbol_rows(session: Session, symbol: str) -> List[Sequence]:
+    """Load every market_prices row for *symbol* in PriceRow layout."""
+    return (
+        session.query(
+            MarketPrice.date,
+            MarketPrice.open,
+            MarketPrice.high,
+            MarketPrice.low,
+            MarketPrice.close,
+            MarketPrice.volume,
+        )
+        .filter(MarketPrice.symbol == symbol)
+        .all()
+    )
+
+
+def _optional(value: float) -> Optional[float]:
+    return None if np.isnan(value) else float(value)
+
+
+# Process-wide cache shared by MarketDataClient, AutoBackfillService and the prices API
+price_cache = PriceCache(
+    max_bytes=settings.MARKET_DATA_PRICE_CACHE_MB * 1024 * 1024,
+    ttl_seconds=settings.MARKET_DATA_PRICE_CACHE_TTL_SECONDS,
+)
@@ -3,10 +3,12 @@ Price Provider Abstraction
 Defines the interface for market data sources (yfinance, Alpha Vantage, etc.).
 """
 
+import threading
+import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from datetime import date, datetime
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from shit.logging import get_service_logger
 
@@ -32,9 +34,61 @@ class RawPriceRecord:
     bar_datetime: Optional[datetime] = None  # Full datetime for intraday bars
 
 
+class RateLimiter:
+    """Thread-safe token bucket limiting calls to *per_minute* requests.
+
+    ``acquire()`` blocks until a token is available. The bucket starts full,
+    so short bursts up to ``burst`` requests go through immediately.
+    """
+
+    def __init__(self, per_minute: float, burst: Optional[int] = None):
+        self.rate = per_minute / 60.0
+        self.capacity = float(burst if burst is not None else max(1, int(per_minute // 10)))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a request may proceed."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+_rate_limiters: Dict[str, RateLimiter] = {}
+_rate_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(provider_name: str, per_minute: float) -> RateLimiter:
+    """Return the process-wide rate limiter for a provider (created on first use)."""
+    with _rate_limiters_lock:
+        limiter = _rate_limiters.get(provider_name)
+        if limiter is None:
+            limiter = RateLimiter(per_minute)
+            _rate_limiters[provider_name] = limiter
+        return limiter
+
+
 class PriceProvider(ABC):
     """Abstract base class for price data providers."""
 
+    # Providers that override fetch_prices_bulk with a native multi-symbol call
+    supports_bulk_fetch: bool = False
+
+    @property
+    def rate_limit_per_minute(self) -> Optional[float]:
+        """Maximum requests per minute for this provider (None = unlimited)."""
+        return None
+
     @property
     @abstractmethod
     def name(self) -> str:
@@ -72,6 +126,36 @@ class PriceProvider(ABC):
         """
         ...
 
+    def fetch_prices_bulk(
+        self,
+        symbols: List[str],
+        start_date: date,
+        end_date: date,
+    ) -> Dict[str, List[RawPriceRecord]]:
+        """Fetch historical prices for many symbols.
+
+        The default implementation calls ``fetch_prices`` per symbol.
+        Providers with a native multi-symbol endpoint override this and set
+        ``supports_bulk_fetch = True``.
+
+        Returns:
+            Dict mapping symbol to its records. Symbols that failed or
+            returned no data are omitted.
+        """
+        results: Dict[str, List[RawPriceRecord]] = {}
+        for symbol in symbols:
+            try:
+                records = self.fetch_prices(symbol, start_date, end_date)
+            except ProviderError as e:
+                logger.warning(
+                    f"{self.name} failed for {symbol} in bulk fetch: {e}",
+                    extra={"provider": self.name, "symbol": symbol},
+                )
+                continue
+            if records:
+                results[symbol] = records
+        return results
+
 
 class ProviderError(Exception):
     """Raised when a price provider fails to fetch data."""
@@ -100,6 +184,19 @@ class ProviderChain:
         if not self.providers:
             logger.warning("No price providers are available/configured")
 
+        # Process-wide limiters, shared by every chain (and thread) using a provider
+        self._limiters: Dict[str, RateLimiter] = {}
+        for p in self.providers:
+            rate = getattr(p, "rate_limit_per_minute", None)
+            if isinstance(rate, (int, float)) and rate > 0:
+                self._limiters[p.name] = get_rate_limiter(p.name, rate)
+
+    def throttle(self, provider: PriceProvider) -> None:
+        """Block until *provider* is within its request-rate budget."""
+        limiter = self._limiters.get(provider.name)
+        if limiter is not None:
+            limiter.acquire()
+
     def fetch_with_fallback(
         self,
         symbol: str,
@@ -127,6 +224,7 @@ class ProviderChain:
                     f"Attempting {provider.name} for {symbol}",
                     extra={"provider": provider.name, "symbol": symbol},
                 )
+                self.throttle(provider)
                 records = provider.fetch_prices(symbol, start_date, end_date)
                 if records:
                     logger.info(
@@ -159,3 +257,57 @@ class ProviderChain:
         raise ProviderError(
             "all_providers", f"All providers failed for {symbol}: {error_summary}"
         )
+
+    def fetch_bulk_with_fallback(
+        self,
+        symbols: List[str],
+        start_date: date,
+        end_date: date,
+        chunk_size: int = 50,
+    ) -> Dict[str, List[RawPriceRecord]]:
+        """Fetch many symbols through providers with a native multi-symbol call.
+
+        Symbols are sent in chunks of ``chunk_size``; each chunk counts as one
+        request against the provider's rate limit. A chunk that fails is
+        logged and skipped. Symbols that no bulk provider returned are left
+        out of the result so the caller can fall back to ``fetch_with_fallback``.
+
+        Returns:
+            Dict mapping symbol to its records.
+        """
+        results: Dict[str, List[RawPriceRecord]] = {}
+        remaining = list(dict.fromkeys(symbols))
+
+        for provider in self.providers:
+            if getattr(provider, "supports_bulk_fetch", False) is not True:
+                continue
+            if not remaining:
+                break
+
+            for i in range(0, len(remaining), chunk_size):
+                chunk = remaining[i : i + chunk_size]
+                try:
+                    self.throttle(provider)
+                    fetched = provider.fetch_prices_bulk(chunk, start_date, end_date)
+                except Exception as e:
+                    logger.warning(
+                        f"{provider.name} bulk fetch failed for {len(chunk)} symbols: {e}",
+                        extra={
+                            "provider": provider.name,
+                            "symbols": chunk,
+                            "error": str(e),
+                        },
+                    )
+                    continue
+                for symbol, records in fetched.items():
+                    if records:
+                        results[symbol] = records
+
+            logger.info(
+                f"{provider.name} bulk fetch returned data for "
+                f"{sum(1 for s in remaining if s in results)}/{len(remaining)} symbols",
+                extra={"provider": provider.name, "count": len(remaining)},
+            )
+            remaining = [s for s in remaining if s not in results]
+
+        return results
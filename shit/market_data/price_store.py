@@ -0,0 +1,204 @@
+"""
+Bulk Price Store
+Native upserts for the market_prices table.
+
+Rows are written with multi-row ``INSERT ... ON CONFLICT (symbol, date)``
+statements (PostgreSQL and SQLite share the same syntax through their
+SQLAlchemy dialects). Very large PostgreSQL batches take a COPY fast path:
+rows are streamed into a temporary staging table and merged into
+market_prices with a single ``INSERT ... SELECT ... ON CONFLICT``.
+
+Both paths rely on the ``uq_market_prices_symbol_date`` unique index
+(scripts/009_market_prices_symbol_date_unique.sql).
+"""
+
+import csv
+import io
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional
+
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from shit.market_data.models import MarketPrice
+from shit.market_data.price_provider import RawPriceRecord
+from shit.logging import get_service_logger
+
+logger = get_service_logger("price_store")
+
+CONFLICT_COLUMNS = ("symbol", "date")
+
+# Every column written on insert (created_at/updated_at have no server default)
+INSERT_COLUMNS = (
+    "symbol",
+    "date",
+    "open",
+    "high",
+    "low",
+    "close",
+    "volume",
+    "adjusted_close",
+    "source",
+    "last_updated",
+    "is_market_open",
+    "has_split",
+    "has_dividend",
+    "created_at",
+    "updated_at",
+)
+
+# Columns refreshed when an existing (symbol, date) row is overwritten
+UPDATE_COLUMNS = (
+    "open",
+    "high",
+    "low",
+    "close",
+    "volume",
+    "adjusted_close",
+    "source",
+    "last_updated",
+    "is_market_open",
+    "updated_at",
+)
+
+# 15 bind parameters per row keeps a statement well under SQLite's 32766 limit
+ROWS_PER_STATEMENT = 1000
+
+_STAGE_TABLE = "_market_prices_stage"
+
+
+def records_to_rows(records: Iterable[RawPriceRecord]) -> List[Dict[str, Any]]:
+    """Convert records to insert rows, keeping the last record per (symbol, date).
+
+    PostgreSQL rejects an ON CONFLICT DO UPDATE statement that touches the
+    same key twice, so duplicates are collapsed here.
+    """
+    now = datetime.now(timezone.utc)
+    rows: Dict[tuple, Dict[str, Any]] = {}
+    for r in records:
+        rows[(r.symbol, r.date)] = {
+            "symbol": r.symbol,
+            "date": r.date,
+            "open": r.open,
+            "high": r.high,
+            "low": r.low,
+            "close": r.close,
+            "volume": r.volume,
+            "adjusted_close": r.adjusted_close,
+            "source": r.source,
+            "last_updated": now,
+            "is_market_open": True,
+            "has_split": False,
+            "has_dividend": False,
+            "created_at": now,
+            "updated_at": now,
+        }
+    return list(rows.values())
+
+
+def upsert_prices(
+    session: Session,
+    records: Iterable[RawPriceRecord],
+    overwrite: bool = False,
+    copy_threshold: Optional[int] = None,
+) -> int:
+    """Insert price records, skipping or overwriting existing (symbol, date) rows.
+
+    Args:
+        session: Session whose transaction the writes join (caller commits)
+        records: Records to store
+        overwrite: Update existing rows instead of leaving them untouched
+        copy_threshold: On PostgreSQL, use COPY when at least this many rows
+
+    Returns:
+        Number of rows inserted or updated.
+    """
+    rows = records_to_rows(records)
+    if not rows:
+        return 0
+
+    dialect = session.get_bind().dialect.name
+    if dialect == "postgresql":
+        if copy_threshold and len(rows) >= copy_threshold:
+            return _copy_upsert(session, rows, overwrite)
+        insert_fn = pg_insert
+    elif dialect == "sqlite":
+        insert_fn = sqlite_insert
+    else:
+        raise ValueError(f"Bulk price upsert is not supported on {dialect!r}")
+
+    table = MarketPrice.__table__
+    written = 0
+    for i in range(0, len(rows), ROWS_PER_STATEMENT):
+        stmt = insert_fn(table).values(rows[i : i + ROWS_PER_STATEMENT])
+        if overwrite:
+            stmt = stmt.on_conflict_do_update(
+                index_elements=list(CONFLICT_COLUMNS),
+                set_={col: stmt.excluded[col] for col in UPDATE_COLUMNS},
+            )
+        else:
+            stmt = stmt.on_conflict_do_nothing(index_elements=list(CONFLICT_COLUMNS))
+        written += session.execute(stmt).rowcount
+
+    logger.debug(
+        f"Upserted {written}/{len(rows)} market_prices rows",
+        extra={"rows": len(rows), "written": written, "dialect": dialect},
+    )
+    return written
+
+
+def _copy_upsert(session: Session, rows: List[Dict[str, Any]], overwrite: bool) -> int:
+    """PostgreSQL fast path: COPY into a temp table, then merge with one statement."""
+    columns = ", ".join(INSERT_COLUMNS)
+    conn = session.connection()
+
+    conn.exec_driver_sql(f"DROP TABLE IF EXISTS {_STAGE_TABLE}")
+    conn.exec_driver_sql(
+        f"CREATE TEMP TABLE {_STAGE_TABLE} ON COMMIT DROP AS "
+        f"SELECT {columns} FROM market_prices WITH NO DATA"
+    )
+
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    for row in rows:
+        writer.writerow(
+            ["" if row[col] is None else _csv_value(row[col]) for col in INSERT_COLUMNS]
+        )
+    buf.seek(0)
+
+    cursor = conn.connection.cursor()
+    try:
+        cursor.copy_expert(
+            f"COPY {_STAGE_TABLE} ({columns}) FROM STDIN WITH (FORMAT csv)", buf
+        )
+    finally:
+        cursor.close()
+
+    if overwrite:
+        assignments = ", ".join(f"{col} = EXCLUDED.{col}" for col in UPDATE_COLUMNS)
+        conflict = f"DO UPDATE SET {assignments}"
+    else:
+        conflict = "DO NOTHING"
+
+    result = conn.exec_driver_sql(
+        f"INSERT INTO market_prices ({columns}) "
+        f"SELECT {columns} FROM {_STAGE_TABLE} "
+        f"ON CONFLICT ({', '.join(CONFLICT_COLUMNS)}) {conflict}"
+    )
+    written = result.rowcount
+
+    logger.info(
+        f"COPY upserted {written}/{len(rows)} market_prices rows",
+        extra={"rows": len(rows), "written": written},
+    )
+    return written
+
+
+def _csv_value(value: Any) -> Any:
+    """Render a value for PostgreSQL's CSV COPY format."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    return value
@@ -5,11 +5,13 @@ Wraps the yfinance library behind the PriceProvider interface.
 
 from dataclasses import dataclass, field
 from datetime import date, datetime, timedelta, timezone
-from typing import List, Optional
+from typing import Dict, List, Optional
 
+import pandas as pd
 import yfinance as yf
 
 from shit.market_data.price_provider import PriceProvider, RawPriceRecord, ProviderError
+from shit.config.shitpost_settings import settings
 from shit.logging import get_service_logger
 
 logger = get_service_logger("yfinance_provider")
@@ -18,10 +20,17 @@ logger = get_service_logger("yfinance_provider")
 class YFinanceProvider(PriceProvider):
     """Price provider backed by the yfinance library."""
 
+    supports_bulk_fetch = True
+
     @property
     def name(self) -> str:
         return "yfinance"
 
+    @property
+    def rate_limit_per_minute(self) -> Optional[float]:
+        rate = settings.MARKET_DATA_YFINANCE_RATE_LIMIT
+        return rate if rate > 0 else None
+
     def is_available(self) -> bool:
         """yfinance is always available (no API key needed)."""
         return True
@@ -47,38 +56,48 @@ class YFinanceProvider(PriceProvider):
                 )
                 return []
 
-            records = []
-            for idx, row in hist.iterrows():
-                price_date = idx.date() if hasattr(idx, "date") else idx
+            return _history_to_records(symbol, hist)
 
-                record = RawPriceRecord(
-                    symbol=symbol,
-                    date=price_date,
-                    open=float(row["Open"])
-                    if "Open" in row and row["Open"] is not None
-                    else None,
-                    high=float(row["High"])
-                    if "High" in row and row["High"] is not None
-                    else None,
-                    low=float(row["Low"])
-                    if "Low" in row and row["Low"] is not None
-                    else None,
-                    close=float(row["Close"]) if "Close" in row else 0.0,
-                    volume=int(row["Volume"])
-                    if "Volume" in row and row["Volume"] is not None
-                    else None,
-                    adjusted_close=float(row["Close"]) if "Close" in row else None,
-                    source="yfinance",
-                )
-                records.append(record)
+        except Exception as e:
+            raise ProviderError(
+                "yfinance", f"Failed to fetch {symbol}: {e}", original_error=e
+            )
 
-            return records
+    def fetch_prices_bulk(
+        self,
+        symbols: List[str],
+        start_date: date,
+        end_date: date,
+    ) -> Dict[str, List[RawPriceRecord]]:
+        """Fetch daily prices for many symbols with one ``yf.download`` call.
+
+        Symbols yfinance has no data for come back as all-NaN columns and
+        are omitted from the result.
+        """
+        if not symbols:
+            return {}
 
+        try:
+            data = yf.download(
+                list(symbols),
+                start=start_date,
+                end=end_date + timedelta(days=1),
+                group_by="ticker",
+                auto_adjust=True,
+                progress=False,
+            )
         except Exception as e:
             raise ProviderError(
-                "yfinance", f"Failed to fetch {symbol}: {e}", original_error=e
+                "yfinance",
+                f"Bulk download failed for {len(symbols)} symbols: {e}",
+                original_error=e,
             )
 
+        return {
+            symbol: _history_to_records(symbol, hist)
+            for symbol, hist in _split_download(data, symbols).items()
+        }
+
     def fetch_intraday_prices(
         self,
         symbol: str,
@@ -156,6 +175,68 @@ class YFinanceProvider(PriceProvider):
             return []
 
 
+def _split_download(
+    data: Optional[pd.DataFrame], symbols: List[str]
+) -> Dict[str, pd.DataFrame]:
+    """Split a ``group_by="ticker"`` download into per-symbol frames.
+
+    Rows without a close are dropped, and symbols left with no rows
+    (unknown or delisted tickers come back as all-NaN columns) are omitted.
+    """
+    if data is None or data.empty:
+        return {}
+
+    frames: Dict[str, pd.DataFrame] = {}
+    is_multi = isinstance(data.columns, pd.MultiIndex)
+    tickers = set(data.columns.get_level_values(0)) if is_multi else set()
+
+    for symbol in symbols:
+        if is_multi:
+            if symbol not in tickers:
+                continue
+            hist = data[symbol]
+        elif len(symbols) == 1:
+            hist = data
+        else:
+            continue
+
+        hist = hist.dropna(subset=["Close"])
+        if not hist.empty:
+            frames[symbol] = hist
+
+    return frames
+
+
+def _history_to_records(symbol: str, hist: pd.DataFrame) -> List[RawPriceRecord]:
+    """Convert a yfinance daily OHLCV frame into RawPriceRecord objects."""
+    records = []
+    for idx, row in hist.iterrows():
+        price_date = idx.date() if hasattr(idx, "date") else idx
+
+        record = RawPriceRecord(
+            symbol=symbol,
+            date=price_date,
+            open=float(row["Open"])
+            if "Open" in row and row["Open"] is not None
+            else None,
+            high=float(row["High"])
+            if "High" in row and row["High"] is not None
+            else None,
+            low=float(row["Low"])
+            if "Low" in row and row["Low"] is not None
+            else None,
+            close=float(row["Close"]) if "Close" in row else 0.0,
+            volume=int(row["Volume"])
+            if "Volume" in row and row["Volume"] is not None
+            else None,
+            adjusted_close=float(row["Close"]) if "Close" in row else None,
+            source="yfinance",
+        )
+        records.append(record)
+
+    return records
+
+
 @dataclass
 class LiveQuote:
     """Point-in-time price quote from yfinance fast_info."""
@@ -211,6 +292,58 @@ def fetch_live_quote(symbol: str) -> Optional[LiveQuote]:
         return None
 
 
+def fetch_live_quotes(symbols: List[str]) -> Dict[str, LiveQuote]:
+    """Fetch current prices for many symbols with one ``yf.download`` call.
+
+    Reads the last few daily bars: the latest bar (today's, while the
+    market is open) gives the price, day range and volume, and the bar
+    before it the previous close. Symbols without data are omitted.
+    Returns an empty dict on any failure — never raises.
+
+    Args:
+        symbols: Ticker symbols (e.g., ["AAPL", "TSLA"]).
+
+    Returns:
+        Dict mapping symbol to its LiveQuote.
+    """
+    if not symbols:
+        return {}
+
+    try:
+        data = yf.download(
+            list(symbols),
+            period="5d",
+            interval="1d",
+            group_by="ticker",
+            auto_adjust=False,
+            progress=False,
+        )
+    except Exception as e:
+        logger.warning(
+            f"Failed to fetch live quotes for {len(symbols)} symbols: {e}",
+            extra={"symbols": list(symbols), "error": str(e)},
+        )
+        return {}
+
+    quotes: Dict[str, LiveQuote] = {}
+    for symbol, hist in _split_download(data, symbols).items():
+        last = hist.iloc[-1]
+        price = _safe_float(last["Close"])
+        if price is None:
+            continue
+        previous_close = hist["Close"].iloc[-2] if len(hist) > 1 else None
+        quotes[symbol] = LiveQuote(
+            symbol=symbol,
+            price=price,
+            previous_close=_safe_float(previous_close),
+            day_high=_safe_float(last["High"]),
+            day_low=_safe_float(last["Low"]),
+            volume=_safe_int(last["Volume"]),
+            source="yfinance_download",
+        )
+    return quotes
+
+
 def _safe_float(value) -> Optional[float]:
     """Safely convert to float, returning None on failure."""
     try:
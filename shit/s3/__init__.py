@@ -5,12 +5,15 @@ Provides shared S3 operations for the Shitpost-Alpha project.
 
 from .s3_client import S3Client
 from .s3_data_lake import S3DataLake
-from .s3_models import S3StorageData, S3Stats
+from .s3_manifest import S3Manifest
+from .s3_models import S3StorageData, S3Stats, S3ManifestEntry
 from .s3_config import S3Config
 
 __all__ = [
     'S3Client',
     'S3DataLake', 
+    'S3Manifest',
+    'S3ManifestEntry',
     'S3StorageData',
     'S3Stats',
     'S3Config'
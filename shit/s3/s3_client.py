@@ -6,6 +6,7 @@ S3 connection management and configuration.
 import logging
 from typing import Optional
 import boto3
+from botocore.config import Config as BotoConfig
 from botocore.exceptions import ClientError
 
 from shit.config.shitpost_settings import settings
@@ -48,12 +49,15 @@ class S3Client:
         try:
             logger.debug(f"Initializing S3 client for bucket: {self.config.bucket_name}")
             
-            # Create S3 client
+            # Create S3 client (pool sized for concurrent GETs; botocore default is 10)
             self._client = boto3.client(
                 's3',
                 aws_access_key_id=self.config.access_key_id,
                 aws_secret_access_key=self.config.secret_access_key,
-                region_name=self.config.region
+                region_name=self.config.region,
+                config=BotoConfig(
+                    max_pool_connections=max(10, self.config.max_concurrent_gets)
+                )
             )
             
             # Create S3 resource (for higher-level operations)
@@ -24,10 +24,17 @@ class S3Config:
     timeout_seconds: int = 30
     max_retries: int = 3
     chunk_size: int = 8192
+    max_concurrent_gets: int = 16  # GetObject calls in flight when streaming
+    
+    # Manifest (index of raw objects, read instead of listing raw/)
+    use_manifest: bool = True
+    manifest_flush_size: int = 25  # Buffered entries per manifest part
+    manifest_reconcile_days: int = 2  # Closed days compaction checks against raw/
     
     # Data Organization
     raw_data_prefix: str = "raw"
     processed_data_prefix: str = "processed"
+    manifest_data_prefix: str = "manifest"
     
     def __post_init__(self):
         """Validate configuration after initialization."""
@@ -46,3 +53,8 @@ class S3Config:
     def processed_prefix(self) -> str:
         """Get the full prefix for processed data."""
         return f"{self.prefix}/{self.processed_data_prefix}"
+    
+    @property
+    def manifest_prefix(self) -> str:
+        """Get the full prefix for the raw data manifest."""
+        return f"{self.prefix}/{self.manifest_data_prefix}"
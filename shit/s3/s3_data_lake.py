@@ -6,13 +6,15 @@ Handles storage and retrieval of raw API data in S3.
 import asyncio
 import json
 import logging
+from collections import deque
 from datetime import datetime
-from typing import Dict, List, Optional, AsyncGenerator
+from typing import Dict, Iterable, List, Optional, AsyncGenerator
 from botocore.exceptions import ClientError
 
 from .s3_client import S3Client
 from .s3_config import S3Config
-from .s3_models import S3StorageData, S3Stats, S3KeyInfo
+from .s3_manifest import S3Manifest
+from .s3_models import S3StorageData, S3Stats, S3KeyInfo, S3ManifestEntry
 
 # Use centralized S3Logger for beautiful logging
 from shit.logging.service_loggers import S3Logger
@@ -36,6 +38,7 @@ class S3DataLake:
             prefix="truth-social"
         )
         self.s3_client = S3Client(self.config)
+        self.manifest = S3Manifest(self.s3_client, self.config)
         
     async def initialize(self):
         """Initialize S3 client and verify bucket access."""
@@ -105,13 +108,14 @@ class S3DataLake:
             
             # Upload to S3 with timeout
             logger.info(f"Uploading data to S3: {s3_key}")
+            body = json.dumps(storage_data.__dict__, indent=2)
             try:
                 await asyncio.wait_for(
                     asyncio.to_thread(
                         lambda: self.s3_client.client.put_object(
                             Bucket=self.config.bucket_name,
                             Key=s3_key,
-                            Body=json.dumps(storage_data.__dict__, indent=2),
+                            Body=body,
                             ContentType='application/json',
                             Metadata={
                                 'shitpost_id': shitpost_id,
@@ -131,6 +135,17 @@ class S3DataLake:
                 raise
             
             logger.info(f"Stored raw data for shitpost {shitpost_id} in S3: {s3_key}")
+            
+            # Index the object; parts are written in batches (and on cleanup)
+            self.manifest.add(S3ManifestEntry(
+                post_id=str(shitpost_id),
+                key=s3_key,
+                size=len(body.encode('utf-8')),
+                timestamp=post_timestamp.isoformat()
+            ))
+            if self.manifest.pending_count >= self.config.manifest_flush_size:
+                await self.manifest.flush()
+            
             return s3_key
             
         except Exception as e:
@@ -196,17 +211,34 @@ class S3DataLake:
     
     async def list_raw_data(self, start_date: Optional[datetime] = None, 
                           end_date: Optional[datetime] = None,
-                          limit: Optional[int] = None) -> List[str]:
+                          limit: Optional[int] = None,
+                          until_post_id: Optional[str] = None) -> List[str]:
         """List S3 keys for raw data within date range.
         
+        Reads the manifest tail when the manifest has been built, and only
+        falls back to listing the whole raw/ prefix when it has not.
+        
         Args:
             start_date: Start date for filtering (optional)
             end_date: End date for filtering (optional)
             limit: Maximum number of keys to return (optional)
+            until_post_id: Stop after this post's key, e.g. the last post
+                already loaded (optional)
             
         Returns:
             List of S3 keys sorted by date path (newest first)
         """
+        if self.config.use_manifest:
+            try:
+                entries = await self.manifest.entries(start_date, limit, until_post_id)
+                if entries is not None:
+                    s3_keys = [entry.key for entry in entries]
+                    logger.info(f"Found {len(s3_keys)} raw data files in S3 manifest (newest first)")
+                    return s3_keys
+                logger.debug("S3 manifest not built yet, listing raw data prefix")
+            except Exception as e:
+                logger.warning(f"Error reading S3 manifest, listing raw data prefix: {e}")
+        
         try:
             # Build prefix for date range
             if start_date:
@@ -238,6 +270,12 @@ class S3DataLake:
             
             s3_keys.sort(key=extract_post_id, reverse=True)  # Sort by post ID, newest first
             
+            if until_post_id:
+                for i, key in enumerate(s3_keys):
+                    if key.split('/')[-1].replace('.json', '') == until_post_id:
+                        s3_keys = s3_keys[:i + 1]
+                        break
+            
             # Apply limit after sorting
             if limit:
                 s3_keys = s3_keys[:limit]
@@ -265,14 +303,42 @@ class S3DataLake:
         try:
             s3_keys = await self.list_raw_data(start_date, end_date, limit)
             
-            for s3_key in s3_keys:
-                raw_data = await self.get_raw_data(s3_key)
+            async for raw_data in self.iter_raw_data(s3_keys):
                 if raw_data:
                     yield raw_data
                     
         except Exception as e:
             logger.error(f"Error streaming raw data from S3: {e}")
             raise
+
+    async def iter_raw_data(self, s3_keys: Iterable[str],
+                            concurrency: Optional[int] = None) -> AsyncGenerator[Optional[Dict], None]:
+        """Fetch S3 objects with several GETs in flight, yielding in key order.
+
+        Up to ``concurrency`` (default: config.max_concurrent_gets) objects are
+        requested ahead of the consumer, so throughput is bounded by the
+        network rather than by per-object latency.
+
+        Args:
+            s3_keys: S3 keys to fetch
+            concurrency: Maximum GetObject calls in flight (optional)
+
+        Yields:
+            Raw data dictionary per key (None if the object is missing)
+        """
+        concurrency = max(1, concurrency or self.config.max_concurrent_gets)
+        in_flight = deque()
+        try:
+            for s3_key in s3_keys:
+                in_flight.append(asyncio.create_task(self.get_raw_data(s3_key)))
+                if len(in_flight) >= concurrency:
+                    yield await in_flight.popleft()
+            while in_flight:
+                yield await in_flight.popleft()
+        finally:
+            # Consumer stopped early or a GET failed: drop the read-ahead
+            for task in in_flight:
+                task.cancel()
     
     async def get_data_stats(self) -> S3Stats:
         """Get statistics about stored raw data.
@@ -280,6 +346,20 @@ class S3DataLake:
         Returns:
             S3Stats object with storage statistics
         """
+        if self.config.use_manifest:
+            try:
+                counted = await self.manifest.stats()
+                if counted is not None:
+                    return S3Stats(
+                        total_files=counted[0],
+                        total_size_bytes=counted[1],
+                        total_size_mb=0.0,  # Will be calculated in __post_init__
+                        bucket=self.config.bucket_name,
+                        prefix=self.config.prefix
+                    )
+            except Exception as e:
+                logger.warning(f"Error reading S3 manifest stats, listing raw data prefix: {e}")
+        
         try:
             # Count total objects
             paginator = self.s3_client.client.get_paginator('list_objects_v2')
@@ -310,7 +390,20 @@ class S3DataLake:
                 prefix=self.config.prefix
             )
     
+    async def flush_manifest(self) -> int:
+        """Write any buffered manifest entries.
+        
+        Returns:
+            Number of entries written
+        """
+        return await self.manifest.flush()
+    
     async def cleanup(self):
         """Cleanup S3 resources."""
+        if self.manifest.pending_count:
+            try:
+                await self.manifest.flush()
+            except Exception as e:
+                logger.warning(f"Failed to flush S3 manifest: {e}")
         await self.s3_client.cleanup()
         logger.debug("S3 Data Lake cleanup completed")
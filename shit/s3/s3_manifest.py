@@ -0,0 +1,381 @@
+"""
+S3 Manifest
+Append-only index of the raw objects in the data lake.
+
+Every stored object gets a manifest entry (post_id, timestamp, key, size).
+Entries are buffered and written as small JSON-lines parts, partitioned by
+post day so the layout mirrors raw/:
+
+    truth-social/manifest/YYYY/MM/DD/part-<utc>-<id>.jsonl
+    truth-social/manifest/YYYY/MM/DD/compacted-<files>-<bytes>.jsonl
+    truth-social/manifest/_complete.json
+
+Compaction merges a day's parts into a single ``compacted-*`` object whose
+name carries the day's file count and byte total, so storage stats come from
+one listing of the (small) manifest prefix without reading closed days.
+Readers walk days newest first and stop as soon as they have what they need.
+
+Entries are buffered in the writing process, so a harvester that crashes
+before flushing leaves raw objects the manifest does not list. Compaction
+therefore reconciles each day it touches, and the last
+``manifest_reconcile_days`` closed days, against that day's raw/ listing.
+
+The manifest is only trusted once ``rebuild()`` has indexed the existing
+bucket and written the ``_complete.json`` marker; until then callers fall
+back to listing raw/.
+"""
+
+import asyncio
+import json
+import uuid
+from collections import defaultdict
+from dataclasses import asdict
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
+
+from .s3_client import S3Client
+from .s3_config import S3Config
+from .s3_models import S3ManifestEntry
+
+# Use centralized S3Logger for beautiful logging
+from shit.logging.service_loggers import S3Logger
+
+# Create S3Logger instance
+s3_logger = S3Logger("s3_manifest")
+logger = s3_logger.logger
+
+MANIFEST_MARKER = "_complete.json"
+COMPACTED_PREFIX = "compacted-"
+PART_PREFIX = "part-"
+
+# S3 DeleteObjects accepts at most this many keys per call
+_DELETE_BATCH = 1000
+
+
+class S3Manifest:
+    """Reads and maintains the day-partitioned manifest of raw objects."""
+
+    def __init__(self, s3_client: S3Client, config: S3Config):
+        """Initialize the manifest.
+
+        Args:
+            s3_client: Initialized (or soon to be initialized) S3 client
+            config: S3 configuration
+        """
+        self.s3_client = s3_client
+        self.config = config
+        self._pending: List[S3ManifestEntry] = []
+
+    # ── Writing ──────────────────────────────────────────────────────────
+
+    def add(self, entry: S3ManifestEntry) -> None:
+        """Buffer an entry until the next flush."""
+        self._pending.append(entry)
+
+    @property
+    def pending_count(self) -> int:
+        """Number of buffered entries not yet written."""
+        return len(self._pending)
+
+    async def flush(self) -> int:
+        """Write buffered entries as one new part per day.
+
+        Entries whose part could not be written stay buffered for the next
+        flush.
+
+        Returns:
+            Number of entries written
+        """
+        if not self._pending:
+            return 0
+
+        by_day: Dict[str, List[S3ManifestEntry]] = defaultdict(list)
+        for entry in self._pending:
+            by_day[self._day_of(entry.key)].append(entry)
+
+        written = 0
+        remaining: List[S3ManifestEntry] = []
+        stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S")
+        for day, entries in by_day.items():
+            part_key = f"{self.config.manifest_prefix}/{day}/{PART_PREFIX}{stamp}-{uuid.uuid4().hex[:8]}.jsonl"
+            try:
+                await self._put_entries(part_key, entries)
+                written += len(entries)
+            except Exception as e:
+                logger.warning(f"Failed to write manifest part {part_key}: {e}")
+                remaining.extend(entries)
+
+        self._pending = remaining
+        logger.debug(f"Flushed {written} manifest entries ({len(remaining)} still pending)")
+        return written
+
+    async def compact(self, before: Optional[date] = None) -> int:
+        """Merge each day's parts into a single compacted object.
+
+        Each day with parts, and each of the ``manifest_reconcile_days``
+        days before *before*, is first reconciled against its raw/ listing
+        so objects whose entries were never flushed get indexed.
+
+        The merged object is written before the parts are deleted, so a
+        concurrent reader sees every entry at least once (duplicates are
+        resolved by post_id).
+
+        Args:
+            before: Only compact days strictly before this date (default:
+                today, UTC, so the day still being written is left alone)
+
+        Returns:
+            Number of day partitions compacted
+        """
+        before = before or datetime.now(timezone.utc).date()
+        listing = await self._list()
+        if listing is None:
+            logger.info("Manifest not built yet - nothing to compact")
+            return 0
+
+        recent = {
+            (before - timedelta(days=offset)).strftime("%Y/%m/%d")
+            for offset in range(1, self.config.manifest_reconcile_days + 1)
+        }
+        compacted = 0
+        for day in sorted(set(listing) | recent):
+            if datetime.strptime(day, "%Y/%m/%d").date() >= before:
+                continue
+            objects = listing.get(day, [])
+            is_compacted = (
+                len(objects) == 1 and self._compacted_stats(objects[0][0]) is not None
+            )
+            if is_compacted and day not in recent:
+                continue  # Already a single compacted object
+
+            entries = await self._read_day(objects)
+            indexed = {entry.post_id for entry in entries}
+            unindexed = [
+                entry for entry in await self._list_raw(f"{day}/")
+                if entry.post_id not in indexed
+            ]
+            if unindexed:
+                logger.warning(
+                    f"Indexing {len(unindexed)} raw objects missing from manifest day {day}"
+                )
+                entries.extend(unindexed)
+            if not entries or (is_compacted and not unindexed):
+                continue
+
+            new_key = self._compacted_key(day, entries)
+            await self._put_entries(new_key, entries)
+            await self._delete([key for key, _ in objects if key != new_key])
+            compacted += 1
+
+        logger.info(f"Compacted {compacted} manifest day partitions")
+        return compacted
+
+    async def rebuild(self) -> int:
+        """Index every object under raw/ and mark the manifest complete.
+
+        One full listing of the bucket, meant to run once when the manifest
+        is introduced (or to repair it). Existing parts are kept and merged
+        on read; existing compacted objects are replaced.
+
+        Returns:
+            Number of objects indexed
+        """
+        raw_entries = await self._list_raw()
+        existing = await self._list(require_marker=False) or {}
+
+        by_day: Dict[str, List[S3ManifestEntry]] = defaultdict(list)
+        for entry in raw_entries:
+            by_day[self._day_of(entry.key)].append(entry)
+
+        for day, entries in by_day.items():
+            new_key = self._compacted_key(day, entries)
+            await self._put_entries(new_key, entries)
+            await self._delete([
+                key for key, _ in existing.get(day, [])
+                if key != new_key and self._compacted_stats(key) is not None
+            ])
+
+        marker = {'rebuilt_at': datetime.now(timezone.utc).isoformat(), 'entries': len(raw_entries)}
+        await asyncio.to_thread(
+            lambda: self.s3_client.client.put_object(
+                Bucket=self.config.bucket_name,
+                Key=f"{self.config.manifest_prefix}/{MANIFEST_MARKER}",
+                Body=json.dumps(marker),
+                ContentType='application/json'
+            )
+        )
+        logger.info(f"Rebuilt manifest: {len(raw_entries)} objects in {len(by_day)} day partitions")
+        return len(raw_entries)
+
+    # ── Reading ──────────────────────────────────────────────────────────
+
+    async def entries(self, start_date: Optional[datetime] = None,
+                      limit: Optional[int] = None,
+                      until_post_id: Optional[str] = None) -> Optional[List[S3ManifestEntry]]:
+        """Read entries newest first, stopping as early as possible.
+
+        Args:
+            start_date: Only this day's partition, matching the raw/ date
+                prefix used by ``S3DataLake.list_raw_data`` (optional)
+            limit: Stop once this many entries are collected (optional)
+            until_post_id: Stop after the entry for this post (optional)
+
+        Returns:
+            Entries sorted by post ID, newest first; None if the manifest has
+            not been built
+        """
+        listing = await self._list()
+        if listing is None:
+            return None
+
+        days = sorted(listing, reverse=True)
+        if start_date:
+            days = [day for day in days if day == start_date.strftime("%Y/%m/%d")]
+
+        result: List[S3ManifestEntry] = []
+        for day in days:
+            day_entries = sorted(await self._read_day(listing[day]), key=lambda e: e.sort_key, reverse=True)
+            if until_post_id:
+                ids = [entry.post_id for entry in day_entries]
+                if until_post_id in ids:
+                    result.extend(day_entries[:ids.index(until_post_id) + 1])
+                    break
+            result.extend(day_entries)
+            if limit and len(result) >= limit:
+                break
+
+        result.sort(key=lambda e: e.sort_key, reverse=True)
+        return result[:limit] if limit else result
+
+    async def stats(self) -> Optional[Tuple[int, int]]:
+        """Count indexed objects and bytes.
+
+        Compacted days are counted from their object names; only days with
+        uncompacted parts are read.
+
+        Returns:
+            (total_files, total_size_bytes), or None if the manifest has not
+            been built
+        """
+        listing = await self._list()
+        if listing is None:
+            return None
+
+        total_files = 0
+        total_size = 0
+        for objects in listing.values():
+            counted = self._compacted_stats(objects[0][0]) if len(objects) == 1 else None
+            if counted is None:
+                entries = await self._read_day(objects)
+                counted = (len(entries), sum(entry.size for entry in entries))
+            total_files += counted[0]
+            total_size += counted[1]
+        return total_files, total_size
+
+    # ── Helpers ──────────────────────────────────────────────────────────
+
+    def _day_of(self, raw_key: str) -> str:
+        """Extract the YYYY/MM/DD partition from a raw/ key."""
+        return "/".join(raw_key.split("/")[-4:-1])
+
+    def _compacted_key(self, day: str, entries: List[S3ManifestEntry]) -> str:
+        total_size = sum(entry.size for entry in entries)
+        return f"{self.config.manifest_prefix}/{day}/{COMPACTED_PREFIX}{len(entries)}-{total_size}.jsonl"
+
+    @staticmethod
+    def _compacted_stats(key: str) -> Optional[Tuple[int, int]]:
+        """Parse (files, bytes) from a compacted object's name, else None."""
+        filename = key.split("/")[-1]
+        if not filename.startswith(COMPACTED_PREFIX):
+            return None
+        try:
+            files, size = filename[len(COMPACTED_PREFIX):].replace(".jsonl", "").split("-")
+            return int(files), int(size)
+        except ValueError:
+            return None
+
+    async def _list_raw(self, day_prefix: str = "") -> List[S3ManifestEntry]:
+        """Entries for the raw objects under raw/ (or one raw/YYYY/MM/DD/ day)."""
+        prefix = f"{self.config.raw_prefix}/{day_prefix}"
+
+        def list_raw() -> List[S3ManifestEntry]:
+            paginator = self.s3_client.client.get_paginator('list_objects_v2')
+            entries = []
+            for page in paginator.paginate(Bucket=self.config.bucket_name, Prefix=prefix):
+                for obj in page.get('Contents', []):
+                    key = obj['Key']
+                    post_id = key.split('/')[-1].replace('.json', '')
+                    entries.append(S3ManifestEntry(post_id=post_id, key=key, size=obj['Size']))
+            return entries
+
+        return await asyncio.to_thread(list_raw)
+
+    async def _list(self, require_marker: bool = True) -> Optional[Dict[str, List[Tuple[str, int]]]]:
+        """List manifest objects grouped by day partition.
+
+        Returns:
+            {YYYY/MM/DD: [(key, size), ...]} with keys in name order
+            (compacted before parts, parts oldest first), or None if
+            ``require_marker`` and the manifest has not been built
+        """
+        prefix = f"{self.config.manifest_prefix}/"
+
+        def list_manifest():
+            paginator = self.s3_client.client.get_paginator('list_objects_v2')
+            objects = []
+            for page in paginator.paginate(Bucket=self.config.bucket_name, Prefix=prefix):
+                objects.extend((obj['Key'], obj['Size']) for obj in page.get('Contents', []))
+            return objects
+
+        objects = await asyncio.to_thread(list_manifest)
+        complete = False
+        by_day: Dict[str, List[Tuple[str, int]]] = defaultdict(list)
+        for key, size in sorted(objects):
+            relative = key[len(prefix):]
+            if relative == MANIFEST_MARKER:
+                complete = True
+                continue
+            parts = relative.split("/")
+            if len(parts) == 4:
+                by_day["/".join(parts[:3])].append((key, size))
+
+        if require_marker and not complete:
+            return None
+        return dict(by_day)
+
+    async def _read_day(self, objects: List[Tuple[str, int]]) -> List[S3ManifestEntry]:
+        """Read a day's manifest objects, later objects winning per post_id."""
+        contents = await asyncio.gather(*(self._get_entries(key) for key, _ in objects))
+        merged: Dict[str, S3ManifestEntry] = {}
+        for entries in contents:
+            for entry in entries:
+                merged[entry.post_id] = entry
+        return list(merged.values())
+
+    async def _get_entries(self, key: str) -> List[S3ManifestEntry]:
+        response = await asyncio.to_thread(
+            lambda: self.s3_client.client.get_object(Bucket=self.config.bucket_name, Key=key)
+        )
+        body = response['Body'].read().decode('utf-8')
+        return [S3ManifestEntry(**json.loads(line)) for line in body.splitlines() if line.strip()]
+
+    async def _put_entries(self, key: str, entries: List[S3ManifestEntry]) -> None:
+        body = "\n".join(json.dumps(asdict(entry)) for entry in entries)
+        await asyncio.to_thread(
+            lambda: self.s3_client.client.put_object(
+                Bucket=self.config.bucket_name,
+                Key=key,
+                Body=body,
+                ContentType='application/x-ndjson'
+            )
+        )
+
+    async def _delete(self, keys: List[str]) -> None:
+        for i in range(0, len(keys), _DELETE_BATCH):
+            chunk = keys[i:i + _DELETE_BATCH]
+            await asyncio.to_thread(
+                lambda: self.s3_client.client.delete_objects(
+                    Bucket=self.config.bucket_name,
+                    Delete={'Objects': [{'Key': key} for key in chunk], 'Quiet': True}
+                )
+            )
@@ -107,3 +107,21 @@ class S3ProcessingResult:
         
         if not self.post_id:
             raise ValueError("post_id is required")
+
+
+@dataclass
+class S3ManifestEntry:
+    """Model for one raw object recorded in the S3 manifest."""
+    
+    post_id: str
+    key: str
+    size: int
+    timestamp: Optional[str] = None  # Post timestamp (None when rebuilt from a listing)
+    
+    @property
+    def sort_key(self) -> int:
+        """Numeric post ID for newest-first ordering (0 for non-numeric IDs)."""
+        try:
+            return int(self.post_id)
+        except (TypeError, ValueError):
+            return 0
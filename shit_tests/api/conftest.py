@@ -6,7 +6,7 @@ Provides TestClient, mock execute_query, and row factory functions.
 import os
 import sys
 from datetime import date, datetime
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -69,7 +69,6 @@ def make_post_row(**overrides) -> tuple[list[tuple], list[str]]:
         "viral_score": 0.8,
         "sentiment_score": -0.3,
         "urgency_score": 0.9,
-        "total_count": 42,
     }
     defaults.update(overrides)
     columns = list(defaults.keys())
@@ -161,24 +160,50 @@ def make_outcome_rows(*rows_overrides: dict) -> tuple[list[tuple], list[str]]:
 # ---------------------------------------------------------------------------
 
 
+@pytest.fixture(autouse=True)
+def shared_cache_path(tmp_path):
+    """Give each test its own cross-worker price cache file."""
+    from api.queries import price_queries
+
+    path = str(tmp_path / "shared_cache.sqlite3")
+    with (
+        patch.object(price_queries._candle_store, "path", path),
+        patch.object(price_queries._live_store, "path", path),
+        patch.object(price_queries._batch_live_store, "path", path),
+    ):
+        yield path
+
+
 @pytest.fixture
 def mock_execute_query():
     """Mock execute_query at all usage sites to return controlled data.
 
-    feed_queries and price_queries both do `from api.dependencies import execute_query`
-    at module level, creating separate name bindings. We share a single MagicMock
-    across both patch sites so side_effect/return_value set once works everywhere.
+    feed_queries and price_queries import ``execute_query_async`` at module level,
+    creating separate name bindings. Both patch sites record into a single
+    MagicMock so side_effect/return_value set once works everywhere.
 
     Usage in tests:
         def test_something(client, mock_execute_query):
             mock_execute_query.return_value = (rows, columns)
             response = client.get("/api/feed/at?offset=0")
     """
+    from api.services.feed_cache import feed_response_cache
+
+    # Responses cached by one test must not leak into the next
+    feed_response_cache.clear()
     mock_eq = MagicMock()
     mock_eq.return_value = ([], [])
-    with patch("api.queries.feed_queries.execute_query", mock_eq):
-        with patch("api.queries.price_queries.execute_query", mock_eq):
-            yield mock_eq
+    # The queries are async; route them through the same recording mock
+    async_eq = AsyncMock(side_effect=lambda *args, **kwargs: mock_eq(*args, **kwargs))
+    with patch("api.queries.feed_queries.execute_query_async", async_eq):
+        with patch("api.queries.price_queries.execute_query_async", async_eq):
+            # The feed total is counted (and cached) separately from the post row
+            with patch(
+                "api.queries.feed_queries.get_feed_total",
+                new_callable=AsyncMock,
+                return_value=42,
+            ):
+                yield mock_eq
 
 
 @pytest.fixture
@@ -0,0 +1,53 @@
+"""Tests for the async query layer in api/dependencies.py."""
+
+from unittest.mock import patch
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import text
+
+import api.dependencies as deps
+
+
+@pytest_asyncio.fixture
+async def sqlite_db(tmp_path):
+    """Point the API's async engine at a throwaway SQLite file."""
+    url = f"sqlite:///{tmp_path / 'api.db'}"
+    await deps.close_async_db()
+    with patch.object(deps.settings, "DATABASE_URL", url):
+        db = await deps.init_async_db()
+        yield db
+    await deps.close_async_db()
+
+
+@pytest.mark.asyncio
+async def test_execute_query_async_returns_rows_and_columns(sqlite_db):
+    async with sqlite_db.engine.begin() as conn:
+        await conn.execute(text("CREATE TABLE t (id INTEGER, name TEXT)"))
+        await conn.execute(text("INSERT INTO t VALUES (1, 'a')"))
+
+    rows, columns = await deps.execute_query_async(
+        "SELECT id, name FROM t WHERE id = :id", {"id": 1}
+    )
+
+    assert columns == ["id", "name"]
+    assert [tuple(row) for row in rows] == [(1, "a")]
+
+
+@pytest.mark.asyncio
+async def test_init_is_idempotent(sqlite_db):
+    assert await deps.init_async_db() is sqlite_db
+
+
+@pytest.mark.asyncio
+async def test_engine_does_not_create_tables(sqlite_db):
+    rows, _ = await deps.execute_query_async(
+        "SELECT name FROM sqlite_master WHERE type = 'table'"
+    )
+    assert rows == []
+
+
+@pytest.mark.asyncio
+async def test_query_errors_propagate(sqlite_db):
+    with pytest.raises(Exception):
+        await deps.execute_query_async("SELECT * FROM missing_table")
@@ -0,0 +1,57 @@
+"""Tests for the event queue metrics API endpoint."""
+
+from contextlib import contextmanager
+from unittest.mock import MagicMock, patch
+
+from fastapi.testclient import TestClient
+
+from api.main import app
+from shit.events.metrics import ConsumerGroupMetrics, LatencyHistogram
+
+client = TestClient(app)
+
+
+@contextmanager
+def _mock_get_session():
+    yield MagicMock()
+
+
+class TestQueueMetricsEndpoint:
+    """Tests for GET /api/events/metrics."""
+
+    def test_returns_metrics_per_consumer_group(self):
+        metrics = [
+            ConsumerGroupMetrics(
+                consumer_group="analyzer",
+                pending=3,
+                oldest_pending_age_seconds=42.0,
+                completed=10,
+                failed=1,
+                throughput_per_minute=0.5,
+                failure_rate=0.0909,
+                latency=LatencyHistogram.from_samples([1.0, 2.0, 3.0]),
+            ),
+            ConsumerGroupMetrics(consumer_group="notifications"),
+        ]
+
+        with (
+            patch("shit.db.sync_session.get_session", _mock_get_session),
+            patch(
+                "shit.events.metrics.collect_queue_metrics", return_value=metrics
+            ) as mock_collect,
+        ):
+            resp = client.get("/api/events/metrics?window_minutes=20")
+
+        assert resp.status_code == 200
+        body = resp.json()
+        assert body["window_minutes"] == 20
+        analyzer, notifications = body["consumer_groups"]
+        assert analyzer["pending"] == 3
+        assert analyzer["latency"]["p50"] == 2.0
+        assert analyzer["latency"]["buckets"]["+Inf"] == 3
+        assert notifications["failure_rate"] is None
+        assert mock_collect.call_args.kwargs["window_minutes"] == 20
+
+    def test_rejects_out_of_range_window(self):
+        resp = client.get("/api/events/metrics?window_minutes=0")
+        assert resp.status_code == 422
@@ -0,0 +1,162 @@
+"""Tests for the feed response cache (api/services/feed_cache.py)."""
+
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from api.services.feed_cache import CachedResponse, FeedCacheListener, FeedResponseCache
+
+
+def _response(prediction_id=101, thesis="thesis"):
+    response = MagicMock()
+    response.prediction.prediction_id = prediction_id
+    response.model_dump_json.return_value = json.dumps({"thesis": thesis})
+    return response
+
+
+def _built(prediction_id=101):
+    """An async build callable returning a response for *prediction_id*."""
+    return AsyncMock(return_value=_response(prediction_id))
+
+
+@pytest.fixture
+def cache():
+    return FeedResponseCache(max_entries=10, ttl_seconds=300)
+
+
+class TestCachedResponse:
+    def test_etag_is_content_hash(self):
+        a = CachedResponse.from_response(_response(thesis="a"))
+        b = CachedResponse.from_response(_response(thesis="a"))
+        c = CachedResponse.from_response(_response(thesis="c"))
+
+        assert a.etag == b.etag != c.etag
+        assert a.etag.startswith('"') and a.etag.endswith('"')
+
+    def test_matches_if_none_match(self):
+        cached = CachedResponse.from_response(_response())
+
+        assert cached.matches(cached.etag)
+        assert cached.matches(f'"other", W/{cached.etag}')
+        assert cached.matches("*")
+        assert not cached.matches('"other"')
+        assert not cached.matches(None)
+
+
+class TestFeedResponseCache:
+    @pytest.mark.asyncio
+    async def test_hit_skips_build(self, cache):
+        build = AsyncMock(return_value=_response())
+
+        first = await cache.get(("offset", 0), build)
+        second = await cache.get(("offset", 0), build)
+
+        assert first is second
+        build.assert_called_once()
+        assert cache.stats() == {"entries": 1, "hits": 1, "misses": 1}
+
+    @pytest.mark.asyncio
+    async def test_missing_post_not_cached(self, cache):
+        build = AsyncMock(return_value=None)
+
+        assert await cache.get(("offset", 99), build) is None
+        assert await cache.get(("offset", 99), build) is None
+        assert build.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_expired_entry_rebuilt(self):
+        cache = FeedResponseCache(max_entries=10, ttl_seconds=0)
+        build = AsyncMock(return_value=_response())
+
+        await cache.get(("offset", 0), build)
+        await cache.get(("offset", 0), build)
+
+        assert build.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_least_recently_used_evicted(self):
+        cache = FeedResponseCache(max_entries=2, ttl_seconds=300)
+        await cache.get(("offset", 0), _built(1))
+        await cache.get(("offset", 1), _built(2))
+        await cache.get(("offset", 0), _built(1))
+        await cache.get(("offset", 2), _built(3))
+
+        build = AsyncMock(return_value=_response(2))
+        await cache.get(("offset", 1), build)
+        build.assert_called_once()
+        assert cache.stats()["entries"] == 2
+
+    @pytest.mark.asyncio
+    async def test_invalidate_drops_entries_for_prediction(self, cache):
+        await cache.get(("offset", 0), _built(1))
+        await cache.get(("cursor", "c", "older"), _built(1))
+        await cache.get(("offset", 1), _built(2))
+
+        cache.invalidate([1])
+
+        assert cache.stats()["entries"] == 1
+
+    @pytest.mark.asyncio
+    async def test_build_racing_invalidation_not_stored(self, cache):
+        async def build():
+            cache.invalidate_all()
+            return _response()
+
+        with patch("api.services.feed_cache.clear_feed_total_cache"):
+            assert await cache.get(("offset", 0), build) is not None
+        assert cache.stats()["entries"] == 0
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("event_type", ["prediction_created", "outcomes_matured"])
+    async def test_feed_changing_events_drop_everything(self, cache, event_type):
+        await cache.get(("offset", 0), _built(1))
+
+        with patch("api.services.feed_cache.clear_feed_total_cache") as mock_clear_total:
+            cache.apply_event(event_type, 7)
+
+        assert cache.stats()["entries"] == 0
+        mock_clear_total.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_prices_backfilled_drops_one_prediction(self, cache):
+        await cache.get(("offset", 0), _built(1))
+        await cache.get(("offset", 1), _built(2))
+
+        cache.apply_event("prices_backfilled", 2)
+
+        assert cache.stats()["entries"] == 1
+
+    @pytest.mark.asyncio
+    async def test_unrelated_events_ignored(self, cache):
+        await cache.get(("offset", 0), _built(1))
+
+        cache.apply_event("signals_stored")
+
+        assert cache.stats()["entries"] == 1
+
+
+class TestFeedCacheListener:
+    def test_handle_applies_broadcast(self):
+        cache = MagicMock()
+        listener = FeedCacheListener(cache)
+
+        listener.handle('{"event_type": "prices_backfilled", "prediction_id": 5}')
+
+        cache.apply_event.assert_called_once_with("prices_backfilled", 5)
+
+    def test_handle_ignores_malformed_payload(self):
+        cache = MagicMock()
+        listener = FeedCacheListener(cache)
+
+        listener.handle("not json")
+        listener.handle("{}")
+
+        cache.apply_event.assert_not_called()
+
+    def test_start_without_listen_notify(self):
+        listener = FeedCacheListener(MagicMock())
+
+        with patch("shit.events.notify.supports_notify", return_value=False):
+            assert listener.start() is False
+        listener.stop()
@@ -1,20 +1,37 @@
 """Tests for feed query functions (api/queries/feed_queries.py).
 
-Unit tests for the query layer, mocking execute_query at the
+Unit tests for the query layer, mocking execute_query_async at the
 api.dependencies level.
 """
 
-from unittest.mock import patch
+from datetime import datetime
+from unittest.mock import AsyncMock, patch
 
+import pytest
+
+from api.queries import feed_queries
 from conftest import make_outcome_row, make_post_row
 
+# Unpatched, for the total-count cache tests
+_get_feed_total = feed_queries.get_feed_total
+
+
+@pytest.fixture(autouse=True)
+def feed_total():
+    """The cached feed total is a separate query; pin it for row tests."""
+    with patch(
+        "api.queries.feed_queries.get_feed_total", new_callable=AsyncMock, return_value=10
+    ) as mock_total:
+        yield mock_total
+
 
 # ---------------------------------------------------------------------------
 # get_analyzed_post_at_offset — returns dict on success
 # ---------------------------------------------------------------------------
 
 
-def test_get_analyzed_post_at_offset_returns_dict():
+@pytest.mark.asyncio
+async def test_get_analyzed_post_at_offset_returns_dict():
     """get_analyzed_post_at_offset returns (dict, total) tuple."""
     rows, columns = make_post_row(
         signal_id="post_1",
@@ -38,13 +55,12 @@ def test_get_analyzed_post_at_offset_returns_dict():
         viral_score=0.6,
         sentiment_score=0.7,
         urgency_score=0.8,
-        total_count=10,
     )
 
-    with patch("api.queries.feed_queries.execute_query", return_value=(rows, columns)):
+    with patch("api.queries.feed_queries.execute_query_async", new_callable=AsyncMock, return_value=(rows, columns)):
         from api.queries.feed_queries import get_analyzed_post_at_offset
 
-        result = get_analyzed_post_at_offset(0)
+        result = await get_analyzed_post_at_offset(0)
 
     assert result is not None
     row, total = result
@@ -59,12 +75,13 @@ def test_get_analyzed_post_at_offset_returns_dict():
 # ---------------------------------------------------------------------------
 
 
-def test_get_analyzed_post_at_offset_returns_none_when_empty():
+@pytest.mark.asyncio
+async def test_get_analyzed_post_at_offset_returns_none_when_empty():
     """get_analyzed_post_at_offset returns None when no rows match."""
-    with patch("api.queries.feed_queries.execute_query", return_value=([], [])):
+    with patch("api.queries.feed_queries.execute_query_async", new_callable=AsyncMock, return_value=([], [])):
         from api.queries.feed_queries import get_analyzed_post_at_offset
 
-        result = get_analyzed_post_at_offset(9999)
+        result = await get_analyzed_post_at_offset(9999)
 
     assert result is None
 
@@ -74,7 +91,8 @@ def test_get_analyzed_post_at_offset_returns_none_when_empty():
 # ---------------------------------------------------------------------------
 
 
-def test_get_analyzed_post_at_offset_parses_json_string_assets():
+@pytest.mark.asyncio
+async def test_get_analyzed_post_at_offset_parses_json_string_assets():
     """When assets is a JSON string, it gets parsed to a list."""
     rows, columns = make_post_row(
         signal_id="post_json",
@@ -82,10 +100,10 @@ def test_get_analyzed_post_at_offset_parses_json_string_assets():
         market_impact='{"TSLA": "bullish"}',
     )
 
-    with patch("api.queries.feed_queries.execute_query", return_value=(rows, columns)):
+    with patch("api.queries.feed_queries.execute_query_async", new_callable=AsyncMock, return_value=(rows, columns)):
         from api.queries.feed_queries import get_analyzed_post_at_offset
 
-        result = get_analyzed_post_at_offset(0)
+        result = await get_analyzed_post_at_offset(0)
 
     row, _ = result
     assert row["assets"] == ["TSLA", "NVDA"]
@@ -99,7 +117,8 @@ def test_get_analyzed_post_at_offset_parses_json_string_assets():
 # ---------------------------------------------------------------------------
 
 
-def test_get_analyzed_post_at_offset_leaves_native_types():
+@pytest.mark.asyncio
+async def test_get_analyzed_post_at_offset_leaves_native_types():
     """When assets is already a list and market_impact a dict, they are not re-parsed."""
     rows, columns = make_post_row(
         signal_id="post_native",
@@ -107,29 +126,116 @@ def test_get_analyzed_post_at_offset_leaves_native_types():
         market_impact={"AAPL": "bearish"},
     )
 
-    with patch("api.queries.feed_queries.execute_query", return_value=(rows, columns)):
+    with patch("api.queries.feed_queries.execute_query_async", new_callable=AsyncMock, return_value=(rows, columns)):
         from api.queries.feed_queries import get_analyzed_post_at_offset
 
-        result = get_analyzed_post_at_offset(0)
+        result = await get_analyzed_post_at_offset(0)
 
     row, _ = result
     assert row["assets"] == ["AAPL"]
     assert row["market_impact"] == {"AAPL": "bearish"}
 
 
+# ---------------------------------------------------------------------------
+# Feed index navigation
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_offset_lookup_walks_feed_index_then_joins_one_post():
+    """The OFFSET runs over feed_index; the big join is for the target row only."""
+    rows, columns = make_post_row()
+
+    with patch(
+        "api.queries.feed_queries.execute_query_async", new_callable=AsyncMock, return_value=(rows, columns)
+    ) as mock_eq:
+        await feed_queries.get_analyzed_post_at_offset(5)
+
+    sql, params = mock_eq.call_args[0]
+    assert "FROM feed_index" in sql
+    assert "OFFSET :offset" in sql
+    assert "COUNT(*) OVER()" not in sql
+    assert "assets::text" not in sql
+    assert params == {"offset": 5}
+
+
+@pytest.mark.asyncio
+async def test_cursor_lookup_older_uses_keyset():
+    rows, columns = make_post_row()
+    published_at = datetime(2026, 3, 25, 14, 30)
+
+    with patch(
+        "api.queries.feed_queries.execute_query_async", new_callable=AsyncMock, return_value=(rows, columns)
+    ) as mock_eq:
+        row, total = await feed_queries.get_analyzed_post_from(published_at, 101, "older")
+
+    sql, params = mock_eq.call_args[0]
+    assert "(published_at, prediction_id) < (:published_at, :prediction_id)" in sql
+    assert "OFFSET" not in sql
+    assert params == {"published_at": published_at, "prediction_id": 101}
+    assert row["prediction_id"] == 101
+    assert total == 10
+
+
+@pytest.mark.asyncio
+async def test_cursor_lookup_newer_uses_ascending_keyset():
+    with patch(
+        "api.queries.feed_queries.execute_query_async", new_callable=AsyncMock, return_value=([], [])
+    ) as mock_eq:
+        result = await feed_queries.get_analyzed_post_from(datetime(2026, 3, 25), 101, "newer")
+
+    sql = mock_eq.call_args[0][0]
+    assert "(published_at, prediction_id) > (:published_at, :prediction_id)" in sql
+    assert "ORDER BY published_at ASC, prediction_id ASC" in sql
+    assert result is None
+
+
+@pytest.mark.asyncio
+async def test_feed_total_is_cached():
+    feed_queries.clear_feed_total_cache()
+    with patch(
+        "api.queries.feed_queries.execute_query_async", new_callable=AsyncMock, return_value=([(7,)], ["count"])
+    ) as mock_eq:
+        assert await _get_feed_total() == 7
+        assert await _get_feed_total() == 7
+
+    assert mock_eq.call_count == 1
+    assert "FROM feed_index WHERE has_assets" in mock_eq.call_args[0][0]
+    feed_queries.clear_feed_total_cache()
+
+
+@pytest.mark.asyncio
+async def test_feed_total_recounted_after_ttl():
+    feed_queries.clear_feed_total_cache()
+    with (
+        patch(
+            "api.queries.feed_queries.execute_query_async",
+            new_callable=AsyncMock,
+            return_value=([(7,)], ["count"]),
+        ) as mock_eq,
+        patch("api.queries.feed_queries.TOTAL_COUNT_TTL_SECONDS", -1),
+    ):
+        await _get_feed_total()
+        await _get_feed_total()
+
+    assert mock_eq.call_count == 2
+    feed_queries.clear_feed_total_cache()
+
+
 # ---------------------------------------------------------------------------
 # get_outcomes_for_prediction — returns list of dicts
 # ---------------------------------------------------------------------------
 
 
-def test_get_outcomes_for_prediction_returns_list():
+@pytest.mark.asyncio
+async def test_get_outcomes_for_prediction_returns_list():
     """get_outcomes_for_prediction returns a list of outcome dicts."""
     rows, columns = make_outcome_row()
 
-    with patch("api.queries.feed_queries.execute_query", return_value=(rows, columns)):
+    with patch("api.queries.feed_queries.execute_query_async", new_callable=AsyncMock, return_value=(rows, columns)):
         from api.queries.feed_queries import get_outcomes_for_prediction
 
-        result = get_outcomes_for_prediction(101)
+        result = await get_outcomes_for_prediction(101)
 
     assert len(result) == 1
     assert result[0]["symbol"] == "AAPL"
@@ -142,11 +248,12 @@ def test_get_outcomes_for_prediction_returns_list():
 # ---------------------------------------------------------------------------
 
 
-def test_get_outcomes_for_prediction_empty():
+@pytest.mark.asyncio
+async def test_get_outcomes_for_prediction_empty():
     """get_outcomes_for_prediction returns empty list when no outcomes exist."""
-    with patch("api.queries.feed_queries.execute_query", return_value=([], [])):
+    with patch("api.queries.feed_queries.execute_query_async", new_callable=AsyncMock, return_value=([], [])):
         from api.queries.feed_queries import get_outcomes_for_prediction
 
-        result = get_outcomes_for_prediction(9999)
+        result = await get_outcomes_for_prediction(9999)
 
     assert result == []
@@ -3,12 +3,16 @@
 Covers:
 - GET /api/feed/at?offset=0
 - GET /api/feed/at?offset=N
+- GET /api/feed/at?cursor=...&direction=...
 - Navigation bounds
 - JSON field parsing
 - Error/edge cases
 - GET /api/health
 """
 
+from datetime import datetime
+
+from api.services.feed_service import encode_cursor
 from conftest import make_outcome_rows, make_post_row
 
 
@@ -167,6 +171,105 @@ def test_get_post_at_offset_five(client, mock_execute_query):
     assert first_call_params[0][1] == {"offset": 5}
 
 
+# ---------------------------------------------------------------------------
+# GET /api/feed/at?cursor=... — keyset navigation
+# ---------------------------------------------------------------------------
+
+
+def test_response_carries_cursor_for_current_post(client, mock_execute_query):
+    post_rows, post_cols = make_post_row()
+    mock_execute_query.side_effect = [(post_rows, post_cols), ([], []), ([], [])]
+
+    response = client.get("/api/feed/at?offset=3")
+
+    assert response.json()["navigation"]["cursor"] == encode_cursor(
+        datetime(2026, 3, 25, 14, 30), 101, 3
+    )
+
+
+def test_cursor_older_returns_next_post(client, mock_execute_query):
+    post_rows, post_cols = make_post_row(prediction_id=100)
+    mock_execute_query.side_effect = [(post_rows, post_cols), ([], []), ([], [])]
+    cursor = encode_cursor(datetime(2026, 3, 25, 14, 30), 101, 3)
+
+    response = client.get(f"/api/feed/at?cursor={cursor}&direction=older")
+
+    assert response.status_code == 200
+    assert response.json()["navigation"]["current_offset"] == 4
+    sql, params = mock_execute_query.call_args_list[0][0]
+    assert "OFFSET" not in sql
+    assert params == {"published_at": datetime(2026, 3, 25, 14, 30), "prediction_id": 101}
+
+
+def test_cursor_newer_returns_previous_post(client, mock_execute_query):
+    post_rows, post_cols = make_post_row()
+    mock_execute_query.side_effect = [(post_rows, post_cols), ([], []), ([], [])]
+    cursor = encode_cursor(datetime(2026, 3, 25, 14, 30), 101, 3)
+
+    response = client.get(f"/api/feed/at?cursor={cursor}&direction=newer")
+
+    assert response.status_code == 200
+    assert response.json()["navigation"]["current_offset"] == 2
+
+
+def test_cursor_past_the_end_returns_404(client, mock_execute_query):
+    mock_execute_query.side_effect = [([], [])]
+    cursor = encode_cursor(datetime(2026, 3, 25, 14, 30), 101, 41)
+
+    response = client.get(f"/api/feed/at?cursor={cursor}")
+
+    assert response.status_code == 404
+    assert response.json()["detail"] == "No older post"
+
+
+def test_invalid_cursor_returns_400(client, mock_execute_query):
+    response = client.get("/api/feed/at?cursor=not-a-cursor")
+
+    assert response.status_code == 400
+    mock_execute_query.assert_not_called()
+
+
+# ---------------------------------------------------------------------------
+# Response cache and ETag revalidation
+# ---------------------------------------------------------------------------
+
+
+def test_repeat_request_served_from_cache(client, mock_execute_query):
+    post_rows, post_cols = make_post_row()
+    mock_execute_query.side_effect = [(post_rows, post_cols), ([], []), ([], [])]
+
+    first = client.get("/api/feed/at?offset=0")
+    queries = mock_execute_query.call_count
+    second = client.get("/api/feed/at?offset=0")
+
+    assert second.status_code == 200
+    assert second.content == first.content
+    assert second.headers["etag"] == first.headers["etag"]
+    assert mock_execute_query.call_count == queries
+
+
+def test_matching_if_none_match_returns_304(client, mock_execute_query):
+    post_rows, post_cols = make_post_row()
+    mock_execute_query.side_effect = [(post_rows, post_cols), ([], []), ([], [])]
+
+    etag = client.get("/api/feed/at?offset=0").headers["etag"]
+    response = client.get("/api/feed/at?offset=0", headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+
+
+def test_stale_if_none_match_returns_body(client, mock_execute_query):
+    post_rows, post_cols = make_post_row()
+    mock_execute_query.side_effect = [(post_rows, post_cols), ([], []), ([], [])]
+
+    response = client.get("/api/feed/at?offset=0", headers={"If-None-Match": '"stale"'})
+
+    assert response.status_code == 200
+    assert response.json()["prediction"]["prediction_id"] == 101
+
+
 # ---------------------------------------------------------------------------
 # GET /api/feed/at?offset=9999 — out of range returns 404
 # ---------------------------------------------------------------------------
@@ -234,7 +337,7 @@ def test_navigation_has_older_false_at_last_post(client, mock_execute_query):
         ([], []),  # snapshots
     ]
 
-    # total_count is 42 in make_post_row defaults, so offset=41 is the last post
+    # The feed total is pinned to 42 in conftest, so offset=41 is the last post
     response = client.get("/api/feed/at?offset=41")
     assert response.status_code == 200
 
@@ -5,9 +5,31 @@ and orchestration tests for get_feed_response.
 """
 
 from datetime import date, datetime
-from unittest.mock import patch
+from unittest.mock import AsyncMock, patch
 
-from api.services.feed_service import FeedService
+import pytest
+
+from api.services.feed_service import FeedService, decode_cursor, encode_cursor
+
+
+# ---------------------------------------------------------------------------
+# feed cursors
+# ---------------------------------------------------------------------------
+
+
+class TestFeedCursor:
+    def test_roundtrip(self):
+        cursor = encode_cursor(datetime(2026, 3, 25, 14, 30), 101, 7)
+        assert decode_cursor(cursor) == (datetime(2026, 3, 25, 14, 30), 101, 7)
+
+    def test_url_safe(self):
+        cursor = encode_cursor(datetime(2026, 3, 25, 14, 30), 101, 7)
+        assert "=" not in cursor and "+" not in cursor and "/" not in cursor
+
+    @pytest.mark.parametrize("cursor", ["", "not-a-cursor", "W10", "WyJ4IiwgMSwgMl0"])
+    def test_malformed_raises_value_error(self, cursor):
+        with pytest.raises(ValueError):
+            decode_cursor(cursor)
 
 
 # ---------------------------------------------------------------------------
@@ -315,15 +337,19 @@ class TestBuildOutcome:
 
 
 class TestGetFeedResponse:
-    def test_returns_none_when_no_post(self):
+    @pytest.mark.asyncio
+    async def test_returns_none_when_no_post(self):
         with patch(
-            "api.services.feed_service.get_analyzed_post_at_offset", return_value=None
+            "api.services.feed_service.get_analyzed_post_at_offset",
+                new_callable=AsyncMock,
+                return_value=None
         ):
             service = FeedService()
-            result = service.get_feed_response(0)
+            result = await service.get_feed_response(0)
         assert result is None
 
-    def test_happy_path(self):
+    @pytest.mark.asyncio
+    async def test_happy_path(self):
         row = {
             "signal_id": "post_1",
             "text": "Test",
@@ -357,14 +383,17 @@ class TestGetFeedResponse:
         with (
             patch(
                 "api.services.feed_service.get_analyzed_post_at_offset",
+                new_callable=AsyncMock,
                 return_value=(row, 10),
             ),
             patch(
-                "api.services.feed_service.get_outcomes_for_prediction", return_value=[]
+                "api.services.feed_service.get_outcomes_for_prediction",
+                new_callable=AsyncMock,
+                return_value=[]
             ),
         ):
             service = FeedService()
-            result = service.get_feed_response(0)
+            result = await service.get_feed_response(0)
 
         assert result is not None
         assert result.post.signal_id == "post_1"
@@ -372,7 +401,8 @@ class TestGetFeedResponse:
         assert result.outcomes == []
         assert result.navigation.total_posts == 10
 
-    def test_filters_invalid_tickers_from_assets(self):
+    @pytest.mark.asyncio
+    async def test_filters_invalid_tickers_from_assets(self):
         """Assets in prediction that have no outcome (filtered by SQL) should be removed."""
         row = {
             "signal_id": "post_2",
@@ -454,15 +484,17 @@ class TestGetFeedResponse:
         with (
             patch(
                 "api.services.feed_service.get_analyzed_post_at_offset",
+                new_callable=AsyncMock,
                 return_value=(row, 5),
             ),
             patch(
                 "api.services.feed_service.get_outcomes_for_prediction",
+                new_callable=AsyncMock,
                 return_value=outcomes_raw,
             ),
         ):
             service = FeedService()
-            result = service.get_feed_response(0)
+            result = await service.get_feed_response(0)
 
         assert result is not None
         # Only RTX should remain in assets (RTN and DEFENSE filtered)
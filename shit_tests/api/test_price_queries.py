@@ -1,12 +1,24 @@
 """Tests for price query functions (api/queries/price_queries.py).
 
-Unit tests for the query/cache layer, mocking yfinance and execute_query.
+Unit tests for the query/cache layer, mocking yfinance and execute_query_async.
 """
 
 import time
 from collections import OrderedDict
 from datetime import date
-from unittest.mock import patch, MagicMock
+from unittest.mock import AsyncMock, patch, MagicMock
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def empty_price_cache():
+    """Database fallbacks go through the process-wide price cache."""
+    from shit.market_data.price_cache import price_cache
+
+    price_cache.clear()
+    yield
+    price_cache.clear()
 
 
 # ---------------------------------------------------------------------------
@@ -100,17 +112,22 @@ def test_fetch_from_yfinance_none_values_default():
 # ---------------------------------------------------------------------------
 
 
-def test_fetch_from_database_happy_path():
+@pytest.mark.asyncio
+async def test_fetch_from_database_happy_path():
     """_fetch_from_database returns formatted candle dicts from DB rows."""
     columns = ["date", "open", "high", "low", "close", "volume"]
     rows = [
         (date(2026, 3, 25), 180.0, 182.0, 179.0, 181.5, 50000000),
     ]
 
-    with patch("api.queries.price_queries.execute_query", return_value=(rows, columns)):
+    with patch(
+        "api.queries.price_queries.execute_query_async",
+        new_callable=AsyncMock,
+        return_value=(rows, columns),
+    ):
         from api.queries.price_queries import _fetch_from_database
 
-        result = _fetch_from_database("AAPL", date(2026, 3, 20))
+        result = await _fetch_from_database("AAPL", date(2026, 3, 20))
 
     assert len(result) == 1
     assert result[0]["date"] == "2026-03-25"
@@ -122,12 +139,17 @@ def test_fetch_from_database_happy_path():
 # ---------------------------------------------------------------------------
 
 
-def test_fetch_from_database_empty():
+@pytest.mark.asyncio
+async def test_fetch_from_database_empty():
     """_fetch_from_database returns empty list when no rows found."""
-    with patch("api.queries.price_queries.execute_query", return_value=([], [])):
+    with patch(
+        "api.queries.price_queries.execute_query_async",
+        new_callable=AsyncMock,
+        return_value=([], []),
+    ):
         from api.queries.price_queries import _fetch_from_database
 
-        result = _fetch_from_database("FAKE", date(2026, 3, 20))
+        result = await _fetch_from_database("FAKE", date(2026, 3, 20))
 
     assert result == []
 
@@ -137,7 +159,8 @@ def test_fetch_from_database_empty():
 # ---------------------------------------------------------------------------
 
 
-def test_get_candles_cache_miss():
+@pytest.mark.asyncio
+async def test_get_candles_cache_miss():
     """_get_candles fetches from yfinance on cache miss."""
     candles = [
         {
@@ -156,7 +179,7 @@ def test_get_candles_cache_miss():
         ):
             from api.queries.price_queries import _get_candles
 
-            result = _get_candles("AAPL", 30)
+            result = await _get_candles("AAPL", 30)
 
     assert result == candles
 
@@ -166,7 +189,8 @@ def test_get_candles_cache_miss():
 # ---------------------------------------------------------------------------
 
 
-def test_get_candles_cache_hit():
+@pytest.mark.asyncio
+async def test_get_candles_cache_hit():
     """_get_candles returns cached data without re-fetching when TTL is fresh."""
     cached_candles = [
         {
@@ -184,7 +208,7 @@ def test_get_candles_cache_hit():
         with patch("api.queries.price_queries._fetch_from_yfinance") as mock_yf:
             from api.queries.price_queries import _get_candles
 
-            result = _get_candles("AAPL", 30)
+            result = await _get_candles("AAPL", 30)
 
     mock_yf.assert_not_called()
     assert result == cached_candles
@@ -195,7 +219,8 @@ def test_get_candles_cache_hit():
 # ---------------------------------------------------------------------------
 
 
-def test_get_candles_cache_eviction():
+@pytest.mark.asyncio
+async def test_get_candles_cache_eviction():
     """_get_candles evicts least-recently-used entries past _CACHE_MAX."""
     cache = OrderedDict()
     candles = [
@@ -211,7 +236,7 @@ def test_get_candles_cache_eviction():
 
                 # Insert 5 distinct (symbol, days) keys into a cap-3 cache.
                 for i in range(5):
-                    _get_candles(f"SYM{i}", 30)
+                    await _get_candles(f"SYM{i}", 30)
 
     # Size never exceeds the cap; the two oldest keys were evicted.
     assert len(cache) == 3
@@ -220,7 +245,8 @@ def test_get_candles_cache_eviction():
     assert ("SYM4", 30) in cache
 
 
-def test_get_candles_cache_hit_marks_recently_used():
+@pytest.mark.asyncio
+async def test_get_candles_cache_hit_marks_recently_used():
     """A fresh cache hit moves its key to most-recently-used (LRU ordering)."""
     now = time.time()
     candles = [
@@ -238,7 +264,7 @@ def test_get_candles_cache_hit_marks_recently_used():
             from api.queries.price_queries import _get_candles
 
             # Hit the oldest key ("A"); it should move to the end.
-            result = _get_candles("A", 30)
+            result = await _get_candles("A", 30)
 
     mock_yf.assert_not_called()
     assert result == candles
@@ -250,7 +276,8 @@ def test_get_candles_cache_hit_marks_recently_used():
 # ---------------------------------------------------------------------------
 
 
-def test_get_price_data_response_structure():
+@pytest.mark.asyncio
+async def test_get_price_data_response_structure():
     """get_price_data returns dict with symbol, post_timestamp, candles, post_date_index."""
     candles = [
         {
@@ -269,9 +296,157 @@ def test_get_price_data_response_structure():
         ):
             from api.queries.price_queries import get_price_data
 
-            result = get_price_data("aapl", 30, None)
+            result = await get_price_data("aapl", 30, None)
 
     assert result["symbol"] == "AAPL"
     assert result["post_timestamp"] is None
     assert result["candles"] == candles
     assert result["post_date_index"] is None
+
+
+# ---------------------------------------------------------------------------
+# Batch candles — one download, one DB query, columnar output
+# ---------------------------------------------------------------------------
+
+
+def _candle(day: str, close: float) -> dict:
+    return {
+        "date": day,
+        "open": close,
+        "high": close,
+        "low": close,
+        "close": close,
+        "volume": 100,
+    }
+
+
+@pytest.mark.asyncio
+async def test_fetch_bulk_from_database_one_query():
+    """_fetch_bulk_from_database reads every symbol with a single IN query."""
+    rows = [
+        ("AAPL", date(2026, 3, 24), 180.0, 182.0, 179.0, 181.5, 100),
+        ("AAPL", date(2026, 3, 25), 181.0, 183.0, 180.0, 182.5, 200),
+        ("TSLA", date(2026, 3, 25), 250.0, 255.0, 249.0, 252.0, None),
+    ]
+
+    with patch(
+        "api.queries.price_queries.execute_query_async",
+        new_callable=AsyncMock,
+        return_value=(rows, []),
+    ) as mock_eq:
+        from api.queries.price_queries import _fetch_bulk_from_database
+
+        result = await _fetch_bulk_from_database(["AAPL", "TSLA", "FAKE"], date(2026, 3, 20))
+
+    mock_eq.assert_called_once()
+    query, params = mock_eq.call_args[0]
+    assert "IN (:symbol_0, :symbol_1, :symbol_2)" in query
+    assert params["symbol_2"] == "FAKE"
+    assert [c["close"] for c in result["AAPL"]] == [181.5, 182.5]
+    assert result["TSLA"][0]["volume"] == 0
+    assert result["FAKE"] == []
+
+
+@pytest.mark.asyncio
+async def test_get_candles_batch_db_fallback_only_for_missing():
+    """Symbols yfinance returned are not re-read from the database."""
+    with (
+        patch("api.queries.price_queries._price_cache", OrderedDict()),
+        patch(
+            "api.queries.price_queries._fetch_bulk_from_yfinance",
+            return_value={"AAPL": [_candle("2026-03-25", 1.0)]},
+        ),
+        patch(
+            "api.queries.price_queries._fetch_bulk_from_database",
+            new_callable=AsyncMock,
+            return_value={"TSLA": [_candle("2026-03-25", 2.0)]},
+        ) as mock_db,
+    ):
+        from api.queries.price_queries import _get_candles_batch
+
+        result = await _get_candles_batch(["AAPL", "TSLA"], 30)
+
+    assert mock_db.call_args[0][0] == ["TSLA"]
+    assert result["TSLA"][0]["close"] == 2.0
+    assert set(result) == {"AAPL", "TSLA"}
+
+
+@pytest.mark.asyncio
+async def test_get_candles_falls_back_to_database():
+    """An empty yfinance result is filled from market_prices on the async engine."""
+    rows = [(date.today(), 180.0, 182.0, 179.0, 181.5, 100)]
+
+    with (
+        patch("api.queries.price_queries._price_cache", OrderedDict()) as cache,
+        patch("api.queries.price_queries._fetch_from_yfinance", return_value=[]),
+        patch(
+            "api.queries.price_queries.execute_query_async",
+            new_callable=AsyncMock,
+            return_value=(rows, []),
+        ) as mock_eq,
+    ):
+        from api.queries.price_queries import _get_candles
+
+        result = await _get_candles("AAPL", 30)
+
+    mock_eq.assert_awaited_once()
+    assert result[0]["close"] == 181.5
+    assert cache[("AAPL", 30)][0] == result
+
+
+@pytest.mark.asyncio
+async def test_get_batch_price_data_columnar():
+    """get_batch_price_data returns parallel arrays and lists symbols without data."""
+    fetched = {
+        "AAPL": [_candle("2026-03-24", 1.0), _candle("2026-03-25", 2.0)],
+        "FAKE": [],
+    }
+
+    with (
+        patch("api.queries.price_queries._price_cache", OrderedDict()),
+        patch(
+            "api.queries.price_queries._fetch_candles_bulk", return_value=fetched
+        ) as mock_fetch,
+        patch(
+            "api.queries.price_queries._fetch_bulk_from_database",
+            new_callable=AsyncMock,
+            return_value={"FAKE": []},
+        ),
+    ):
+        from api.queries.price_queries import get_batch_price_data
+
+        result = await get_batch_price_data(["AAPL", "FAKE"], 30)
+
+    mock_fetch.assert_called_once_with(["AAPL", "FAKE"], 30)
+    assert result["missing"] == ["FAKE"]
+    assert result["series"]["AAPL"] == {
+        "dates": ["2026-03-24", "2026-03-25"],
+        "open": [1.0, 2.0],
+        "high": [1.0, 2.0],
+        "low": [1.0, 2.0],
+        "close": [1.0, 2.0],
+        "volume": [100, 100],
+    }
+
+
+@pytest.mark.asyncio
+async def test_get_batch_price_data_fetches_only_uncached():
+    """Cached symbols are served from cache; only the rest are fetched."""
+    cache = OrderedDict({("AAPL", 30): ([_candle("2026-03-25", 1.0)], time.time())})
+
+    with (
+        patch("api.queries.price_queries._price_cache", cache),
+        patch(
+            "api.queries.price_queries._fetch_candles_bulk",
+            return_value={"TSLA": [_candle("2026-03-25", 2.0)]},
+        ) as mock_fetch,
+    ):
+        from api.queries.price_queries import get_batch_price_data, _get_candles
+
+        result = await get_batch_price_data(["AAPL", "TSLA"], 30)
+        # The batch result is shared with the single-symbol path
+        single = await _get_candles("TSLA", 30)
+
+    mock_fetch.assert_called_once_with(["TSLA"], 30)
+    assert set(result["series"]) == {"AAPL", "TSLA"}
+    assert single[0]["close"] == 2.0
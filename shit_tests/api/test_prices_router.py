@@ -6,10 +6,12 @@ Covers:
 - post_timestamp handling
 - yfinance fallback to DB
 - TTL cache behavior
+- GET /api/prices/batch and /api/prices/live/batch
 - Edge cases
 """
 
 from collections import OrderedDict
+from datetime import date, timedelta
 from unittest.mock import patch
 
 
@@ -246,6 +248,9 @@ def test_get_prices_yfinance_fails_db_fallback(
 ):
     """When yfinance returns empty, falls back to database and returns those candles."""
     db_rows, db_cols = sample_candle_rows
+    # The fallback now slices the cached history by date, so keep rows inside the window
+    shift = date.today() - timedelta(days=10) - db_rows[0][0]
+    db_rows = [(row[0] + shift, *row[1:]) for row in db_rows]
     mock_execute_query.return_value = (db_rows, db_cols)
 
     with patch("api.queries.price_queries._price_cache", OrderedDict()):
@@ -256,7 +261,7 @@ def test_get_prices_yfinance_fails_db_fallback(
     assert response.status_code == 200
     data = response.json()
     assert len(data["candles"]) == 4
-    assert data["candles"][0]["date"] == "2026-03-20"
+    assert data["candles"][0]["date"] == str(db_rows[0][0])
 
 
 # ---------------------------------------------------------------------------
@@ -352,3 +357,164 @@ def test_get_live_quote_not_found(client, mock_execute_query):
 
     assert response.status_code == 404
     assert "No quote available" in response.json()["detail"]
+
+
+def test_get_live_quote_cached_across_requests(client, mock_execute_query):
+    """Repeat live-quote requests within the TTL share one yfinance call."""
+    from datetime import datetime, timezone
+
+    from shit.market_data.yfinance_provider import LiveQuote
+
+    quote = LiveQuote(
+        symbol="AAPL",
+        price=182.5,
+        captured_at=datetime(2026, 4, 5, 14, 30, tzinfo=timezone.utc),
+    )
+
+    with patch(
+        "shit.market_data.yfinance_provider.fetch_live_quote", return_value=quote
+    ) as mock_fq:
+        first = client.get("/api/prices/AAPL/live")
+        second = client.get("/api/prices/aapl/live")
+
+    assert first.json() == second.json()
+    assert second.json()["captured_at"] == "2026-04-05T14:30:00+00:00"
+    mock_fq.assert_called_once_with("AAPL")
+
+
+# ---------------------------------------------------------------------------
+# GET /api/prices/batch — many symbols, columnar candles
+# ---------------------------------------------------------------------------
+
+
+def test_get_prices_batch_single_provider_call(client, mock_execute_query):
+    """GET /api/prices/batch resolves all symbols with one yfinance download."""
+    from shit.market_data.price_provider import RawPriceRecord
+
+    def records(symbol, close):
+        return [
+            RawPriceRecord(
+                symbol=symbol,
+                date=date(2026, 3, 25),
+                open=close,
+                high=close,
+                low=close,
+                close=close,
+                volume=100,
+                adjusted_close=None,
+                source="yfinance",
+            )
+        ]
+
+    with (
+        patch("api.queries.price_queries._price_cache", OrderedDict()),
+        patch(
+            "shit.market_data.yfinance_provider.YFinanceProvider.fetch_prices_bulk",
+            return_value={"AAPL": records("AAPL", 1.0), "TSLA": records("TSLA", 2.0)},
+        ) as mock_bulk,
+    ):
+        mock_execute_query.return_value = ([], [])
+        response = client.get("/api/prices/batch?symbols=aapl, TSLA,FAKE,AAPL&days=7")
+
+    assert response.status_code == 200
+    data = response.json()
+    mock_bulk.assert_called_once()
+    assert mock_bulk.call_args[0][0] == ["AAPL", "TSLA", "FAKE"]
+    assert data["days"] == 7
+    assert data["series"]["TSLA"]["dates"] == ["2026-03-25"]
+    assert data["series"]["TSLA"]["close"] == [2.0]
+    assert data["missing"] == ["FAKE"]
+    # One market_prices query for the symbols yfinance didn't have
+    mock_execute_query.assert_called_once()
+    assert mock_execute_query.call_args[0][1]["symbol_0"] == "FAKE"
+
+
+def test_get_prices_batch_requires_symbols(client, mock_execute_query):
+    """GET /api/prices/batch with no usable symbols returns 400."""
+    response = client.get("/api/prices/batch?symbols= , ")
+
+    assert response.status_code == 400
+
+
+def test_get_prices_batch_too_many_symbols(client, mock_execute_query):
+    """GET /api/prices/batch rejects more than BATCH_MAX_SYMBOLS symbols."""
+    from api.queries.price_queries import BATCH_MAX_SYMBOLS
+
+    symbols = ",".join(f"S{i}" for i in range(BATCH_MAX_SYMBOLS + 1))
+    response = client.get(f"/api/prices/batch?symbols={symbols}")
+
+    assert response.status_code == 400
+    assert str(BATCH_MAX_SYMBOLS) in response.json()["detail"]
+
+
+# ---------------------------------------------------------------------------
+# GET /api/prices/live/batch — many live quotes
+# ---------------------------------------------------------------------------
+
+
+def test_get_live_quotes_batch(client, mock_execute_query):
+    """GET /api/prices/live/batch returns parallel arrays from one yfinance call."""
+    from datetime import datetime, timezone
+
+    from shit.market_data.yfinance_provider import LiveQuote
+
+    captured = datetime(2026, 4, 5, 14, 30, tzinfo=timezone.utc)
+    quotes = {
+        "AAPL": LiveQuote(
+            symbol="AAPL", price=182.5, previous_close=180.0, captured_at=captured
+        ),
+        "TSLA": LiveQuote(symbol="TSLA", price=250.0, volume=1000, captured_at=captured),
+    }
+
+    with patch(
+        "shit.market_data.yfinance_provider.fetch_live_quotes", return_value=quotes
+    ) as mock_fq:
+        response = client.get("/api/prices/live/batch?symbols=AAPL,FAKE,TSLA")
+
+    assert response.status_code == 200
+    data = response.json()
+    mock_fq.assert_called_once_with(["AAPL", "FAKE", "TSLA"])
+    assert data["symbols"] == ["AAPL", "TSLA"]
+    assert data["price"] == [182.5, 250.0]
+    assert data["previous_close"] == [180.0, None]
+    assert data["volume"] == [None, 1000]
+    assert data["captured_at"] == ["2026-04-05T14:30:00+00:00"] * 2
+    assert data["missing"] == ["FAKE"]
+
+
+def test_batch_and_single_live_quotes_cached_apart(client, mock_execute_query):
+    """Daily-bar batch quotes never answer the fast_info single-symbol endpoint."""
+    from shit.market_data.yfinance_provider import LiveQuote
+
+    with (
+        patch(
+            "shit.market_data.yfinance_provider.fetch_live_quotes",
+            return_value={"TSLA": LiveQuote(symbol="TSLA", price=250.0)},
+        ),
+        patch(
+            "shit.market_data.yfinance_provider.fetch_live_quote",
+            return_value=LiveQuote(symbol="TSLA", price=251.0),
+        ) as mock_one,
+    ):
+        client.get("/api/prices/live/batch?symbols=TSLA")
+        single = client.get("/api/prices/TSLA/live")
+
+    mock_one.assert_called_once_with("TSLA")
+    assert single.json()["price"] == 251.0
+
+
+def test_get_live_quotes_batch_fetches_only_uncached(client, mock_execute_query):
+    """Symbols already quoted within the TTL are not fetched again."""
+    from shit.market_data.yfinance_provider import LiveQuote
+
+    def fake_fetch(symbols):
+        return {s: LiveQuote(symbol=s, price=1.0) for s in symbols}
+
+    with patch(
+        "shit.market_data.yfinance_provider.fetch_live_quotes", side_effect=fake_fetch
+    ) as mock_fq:
+        client.get("/api/prices/live/batch?symbols=AAPL")
+        response = client.get("/api/prices/live/batch?symbols=AAPL,TSLA")
+
+    assert mock_fq.call_args_list[1][0][0] == ["TSLA"]
+    assert response.json()["symbols"] == ["AAPL", "TSLA"]
@@ -0,0 +1,172 @@
+"""Tests for the cross-worker response cache (api/shared_cache.py)."""
+
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from api.shared_cache import SharedCache
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "cache.sqlite3")
+
+
+def _cache(path, ttl=60, stale=60):
+    return SharedCache("test", ttl_seconds=ttl, stale_seconds=stale, path=path)
+
+
+def test_miss_fetches_then_hits(path):
+    cache = _cache(path)
+    fetch = MagicMock(return_value={"price": 1.5})
+
+    assert cache.get("AAPL", fetch) == {"price": 1.5}
+    assert cache.get("AAPL", fetch) == {"price": 1.5}
+    fetch.assert_called_once()
+
+
+def test_entries_shared_between_workers(path):
+    _cache(path).get("AAPL", lambda: [1, 2, 3])
+    other_worker = _cache(path)
+    fetch = MagicMock()
+
+    assert other_worker.get("AAPL", fetch) == [1, 2, 3]
+    fetch.assert_not_called()
+
+
+def test_namespaces_are_separate(path):
+    SharedCache("a", 60, 60, path=path).get("K", lambda: "a")
+
+    assert SharedCache("b", 60, 60, path=path).get("K", lambda: "b") == "b"
+
+
+def test_concurrent_misses_share_one_fetch(path):
+    cache = _cache(path)
+    calls = []
+
+    def slow_fetch():
+        calls.append(1)
+        time.sleep(0.2)
+        return "quote"
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(cache.get("AAPL", slow_fetch)))
+        for _ in range(10)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert results == ["quote"] * 10
+    assert len(calls) == 1
+
+
+def test_waits_for_lease_holder_in_other_worker(path):
+    leader, follower = _cache(path), _cache(path)
+    assert leader._acquire_lease("AAPL")
+    fetch = MagicMock(return_value="mine")
+    result = []
+
+    thread = threading.Thread(target=lambda: result.append(follower.get("AAPL", fetch)))
+    thread.start()
+    time.sleep(0.1)
+    leader._store("AAPL", "leader's", time.time())
+    leader._release_lease("AAPL")
+    thread.join(timeout=5)
+
+    assert result == ["leader's"]
+    fetch.assert_not_called()
+
+
+def test_stale_entry_served_while_revalidating(path):
+    cache = _cache(path, ttl=10, stale=60)
+    cache._store("AAPL", "old", time.time() - 20)
+    refreshed = threading.Event()
+
+    def fetch():
+        refreshed.set()
+        return "new"
+
+    assert cache.get("AAPL", fetch) == "old"
+    assert refreshed.wait(5)
+    for _ in range(100):
+        if cache.peek("AAPL")[0] == "new":
+            break
+        time.sleep(0.01)
+    assert cache.get("AAPL", fetch) == "new"
+
+
+def test_entry_past_stale_window_refetched(path):
+    cache = _cache(path, ttl=10, stale=10)
+    cache._store("AAPL", "old", time.time() - 60)
+
+    assert cache.get("AAPL", lambda: "new") == "new"
+
+
+def test_fetch_error_propagates_and_is_not_cached(path):
+    cache = _cache(path)
+
+    with pytest.raises(RuntimeError):
+        cache.get("AAPL", MagicMock(side_effect=RuntimeError("yfinance down")))
+
+    assert cache.peek("AAPL") is None
+    assert cache.get("AAPL", lambda: "ok") == "ok"
+
+
+def test_unusable_store_falls_back_to_fetching(tmp_path):
+    cache = _cache(str(tmp_path / "missing" / "cache.sqlite3"))
+    fetch = MagicMock(return_value="quote")
+
+    with patch("api.shared_cache.logger"):
+        assert cache.get("AAPL", fetch) == "quote"
+    fetch.assert_called_once()
+
+
+def test_clear_drops_namespace(path):
+    cache = _cache(path)
+    cache.get("AAPL", lambda: "quote")
+
+    cache.clear()
+
+    assert cache.peek("AAPL") is None
+
+
+def test_get_many_fetches_misses_in_one_call(path):
+    cache = _cache(path)
+    cache.get("AAPL", lambda: "cached")
+    fetch_many = MagicMock(return_value={"TSLA": "t", "NVDA": "n"})
+
+    entries = cache.get_many(["AAPL", "TSLA", "NVDA", "FAKE"], fetch_many)
+
+    fetch_many.assert_called_once_with(["TSLA", "NVDA", "FAKE"])
+    assert {k: v for k, (v, _) in entries.items()} == {
+        "AAPL": "cached",
+        "TSLA": "t",
+        "NVDA": "n",
+    }
+    # Batch results are shared with single-key lookups; omitted keys aren't cached
+    assert cache.peek("TSLA")[0] == "t"
+    assert cache.peek("FAKE") is None
+
+
+def test_get_many_revalidates_stale_keys_together(path):
+    cache = _cache(path, ttl=10, stale=60)
+    cache._store("AAPL", "old", time.time() - 20)
+    cache._store("TSLA", "old", time.time() - 20)
+    refreshed = threading.Event()
+    seen = []
+
+    def fetch_many(keys):
+        seen.append(keys)
+        refreshed.set()
+        return {k: "new" for k in keys}
+
+    entries = cache.get_many(["AAPL", "TSLA"], fetch_many)
+
+    assert {v for v, _ in entries.values()} == {"old"}
+    assert refreshed.wait(5)
+    assert seen == [["AAPL", "TSLA"]]
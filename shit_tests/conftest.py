@@ -560,6 +560,40 @@ def setup_test_environment():
             del os.environ[key]
 
 
+@pytest.fixture(autouse=True)
+def clear_price_cache():
+    """Keep the process-wide market price cache from leaking between tests."""
+    from shit.market_data.price_cache import price_cache
+
+    price_cache.clear()
+    yield
+    price_cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def reset_llm_budgets():
+    """Start every test with full per-provider LLM rate budgets."""
+    from shit.llm.rate_budget import reset_provider_budgets
+
+    reset_provider_budgets()
+    yield
+    reset_provider_budgets()
+
+
+@pytest.fixture(autouse=True)
+def llm_response_cache(tmp_path):
+    """Give every test its own empty LLM response cache file."""
+    from shit.llm.response_cache import LLMResponseCache, set_response_cache
+
+    cache = LLMResponseCache(
+        path=str(tmp_path / "llm_responses.db"), ttl_seconds=3600, max_entries=1000
+    )
+    set_response_cache(cache)
+    yield cache
+    cache.close()
+    set_response_cache(None)
+
+
 # Pytest configuration
 def pytest_configure(config):
     """Configure pytest with custom markers."""
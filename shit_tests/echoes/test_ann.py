@@ -0,0 +1,128 @@
+"""
+Tests for HNSW index management (EchoService) and the ANN benchmark
+(shit/echoes/ann.py).
+"""
+
+import os
+
+os.environ.setdefault("DATABASE_URL", "sqlite:///:memory:")
+
+from unittest.mock import MagicMock, patch
+
+from shit.echoes.ann import benchmark_ann
+from shit.echoes.echo_service import ANN_INDEX_NAME, EchoService
+
+_SESSION_PATCH = "shit.echoes.echo_service.get_session"
+_ENGINE_PATCH = "shit.echoes.echo_service.engine"
+
+
+def _service():
+    return EchoService(embedding_client=MagicMock())
+
+
+def _session_ctx(status_row):
+    mock_session = MagicMock()
+    mock_session.execute.return_value.first.return_value = status_row
+    mock_ctx = MagicMock()
+    mock_ctx.__enter__ = MagicMock(return_value=mock_session)
+    mock_ctx.__exit__ = MagicMock(return_value=False)
+    return mock_ctx
+
+
+def _executed(mock_engine):
+    conn = mock_engine.connect.return_value.execution_options.return_value
+    conn = conn.__enter__.return_value
+    return [str(c[0][0]) for c in conn.execute.call_args_list]
+
+
+class TestAnnIndexManagement:
+    def test_status_missing(self):
+        with patch(_SESSION_PATCH, return_value=_session_ctx(None)):
+            status = _service().ann_index_status()
+
+        assert status["exists"] is False
+        assert status["valid"] is False
+
+    def test_status_existing(self):
+        row = (True, 8192, "CREATE INDEX ...")
+        with patch(_SESSION_PATCH, return_value=_session_ctx(row)):
+            status = _service().ann_index_status()
+
+        assert status == {
+            "name": ANN_INDEX_NAME,
+            "exists": True,
+            "valid": True,
+            "size_bytes": 8192,
+            "definition": "CREATE INDEX ...",
+        }
+
+    def test_create_builds_concurrently_in_autocommit(self):
+        with (
+            patch(_SESSION_PATCH, return_value=_session_ctx(None)),
+            patch(_ENGINE_PATCH) as mock_engine,
+        ):
+            assert _service().create_ann_index(m=24, ef_construction=128) is True
+
+        mock_engine.connect.return_value.execution_options.assert_called_once_with(
+            isolation_level="AUTOCOMMIT"
+        )
+        (statement,) = _executed(mock_engine)
+        assert statement.startswith(f"CREATE INDEX CONCURRENTLY {ANN_INDEX_NAME}")
+        assert "hnsw (embedding vector_cosine_ops)" in statement
+        assert "m = 24, ef_construction = 128" in statement
+
+    def test_create_skips_valid_index(self):
+        row = (True, 8192, "")
+        with (
+            patch(_SESSION_PATCH, return_value=_session_ctx(row)),
+            patch(_ENGINE_PATCH) as mock_engine,
+        ):
+            assert _service().create_ann_index() is False
+
+        mock_engine.connect.assert_not_called()
+
+    def test_create_replaces_invalid_index(self):
+        row = (False, 0, "")
+        with (
+            patch(_SESSION_PATCH, return_value=_session_ctx(row)),
+            patch(_ENGINE_PATCH) as mock_engine,
+        ):
+            _service().create_ann_index()
+
+        drop, create = _executed(mock_engine)
+        assert drop == f"DROP INDEX CONCURRENTLY IF EXISTS {ANN_INDEX_NAME}"
+        assert create.startswith("CREATE INDEX CONCURRENTLY")
+
+    def test_reindex(self):
+        row = (True, 8192, "")
+        with (
+            patch(_SESSION_PATCH, return_value=_session_ctx(row)),
+            patch(_ENGINE_PATCH) as mock_engine,
+        ):
+            _service().reindex_ann_index()
+
+        assert _executed(mock_engine) == [f"REINDEX INDEX CONCURRENTLY {ANN_INDEX_NAME}"]
+
+
+class TestBenchmark:
+    def test_recall_against_exact(self):
+        service = MagicMock()
+
+        def find(embedding, exact=False, ef_search=None, **kwargs):
+            if exact:
+                return [{"prediction_id": i} for i in (1, 2, 3, 4)]
+            if ef_search == 10:
+                return [{"prediction_id": i} for i in (1, 2, 9)]
+            return [{"prediction_id": i} for i in (1, 2, 3, 4)]
+
+        service.find_similar_posts.side_effect = find
+        queries = [(100, [0.1]), (101, [0.2])]
+
+        report = benchmark_ann(service, queries, limit=4, ef_search_values=(10, 100))
+
+        assert report["queries"] == 2
+        assert report["exact"]["p50_ms"] is not None
+        assert [row["recall"] for row in report["ann"]] == [0.5, 1.0]
+        # Each query excludes its own prediction
+        calls = service.find_similar_posts.call_args_list
+        assert {c.kwargs["exclude_prediction_id"] for c in calls} == {100, 101}
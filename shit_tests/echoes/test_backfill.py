@@ -0,0 +1,65 @@
+"""
+Tests for shit/echoes/backfill.py — streaming, pipelined embedding backfill.
+"""
+
+import os
+
+os.environ.setdefault("DATABASE_URL", "sqlite:///:memory:")
+
+from unittest.mock import MagicMock, patch
+
+from shit.echoes.backfill import backfill_embeddings
+from shit.echoes.echo_service import text_hash_of
+
+
+def _rows(start, count):
+    return [(i, None, f"sig-{i}", f"post {i}") for i in range(start, start + count)]
+
+
+def _run(batches, concurrency=2):
+    service = MagicMock()
+    service.embedding_client.model = "text-embedding-3-small"
+    service.embed_texts.side_effect = lambda texts: ([[0.1]] * len(texts), 1)
+    service.store_embeddings.side_effect = lambda records: len(records)
+
+    with (
+        patch("shit.echoes.backfill.EchoService", return_value=service),
+        patch("shit.echoes.backfill.get_session"),
+        patch("shit.echoes.backfill._stream_unembedded", return_value=iter(batches)),
+    ):
+        total = backfill_embeddings(batch_size=3, concurrency=concurrency)
+    return total, service
+
+
+class TestBackfillEmbeddings:
+    def test_every_batch_embedded_and_bulk_stored_in_order(self):
+        batches = [_rows(1, 3), _rows(4, 3), _rows(7, 1)]
+
+        total, service = _run(batches)
+
+        assert total == 7
+        assert service.embed_texts.call_count == 3
+        stored = [
+            [r["prediction_id"] for r in call.args[0]]
+            for call in service.store_embeddings.call_args_list
+        ]
+        assert stored == [[1, 2, 3], [4, 5, 6], [7]]
+
+    def test_records_carry_text_hash_and_model(self):
+        _, service = _run([_rows(1, 1)])
+
+        (record,) = service.store_embeddings.call_args[0][0]
+        assert record == {
+            "prediction_id": 1,
+            "shitpost_id": None,
+            "signal_id": "sig-1",
+            "text_hash": text_hash_of("post 1"),
+            "embedding": [0.1],
+            "model": "text-embedding-3-small",
+        }
+
+    def test_nothing_to_do(self):
+        total, service = _run([])
+
+        assert total == 0
+        service.store_embeddings.assert_not_called()
@@ -1,7 +1,8 @@
 """
 Tests for shit/echoes/echo_service.py — EchoService core operations.
 
-Covers: embed_and_store, get_embedding, duplicate detection, empty text handling.
+Covers: embed_and_store, get_embedding, duplicate detection, empty text handling,
+text_hash embedding reuse and bulk writes.
 """
 
 import os
@@ -10,7 +11,9 @@ os.environ.setdefault("DATABASE_URL", "sqlite:///:memory:")
 
 from unittest.mock import patch, MagicMock
 
-from shit.echoes.echo_service import EchoService
+from sqlalchemy.dialects import postgresql
+
+from shit.echoes.echo_service import EchoService, text_hash_of
 
 _SESSION_PATCH = "shit.echoes.echo_service.get_session"
 
@@ -119,3 +122,67 @@ class TestGetEmbedding:
             result = service.get_embedding(prediction_id=999)
 
         assert result is None
+
+
+class TestEmbeddingReuse:
+    def test_embed_and_store_reuses_vector_for_same_text(self):
+        mock_client = _mock_embedding_client()
+        mock_ctx, mock_session = _mock_session_ctx(query_results=None)
+        text_hash = text_hash_of("Drill baby drill!")
+        mock_session.query.return_value.filter.return_value.all.return_value = [
+            (text_hash, [0.3] * 1536)
+        ]
+
+        service = EchoService(embedding_client=mock_client)
+        with patch(_SESSION_PATCH, return_value=mock_ctx):
+            assert service.embed_and_store(prediction_id=2, text="Drill baby drill!")
+
+        mock_client.embed.assert_not_called()
+        insert_params = mock_session.execute.call_args[0][0].compile().params
+        assert insert_params["embedding"] == [0.3] * 1536
+
+    def test_embed_texts_dedupes_and_reuses(self):
+        mock_client = _mock_embedding_client()
+        mock_client.embed_batch.side_effect = lambda texts: [
+            [float(len(t))] * 3 for t in texts
+        ]
+        service = EchoService(embedding_client=mock_client)
+        stored = {text_hash_of("old"): [9.0] * 3}
+
+        with patch.object(service, "reuse_embeddings", return_value=dict(stored)):
+            vectors, reused = service.embed_texts(["old", "new!", "new!", "xy"])
+
+        mock_client.embed_batch.assert_called_once_with(["new!", "xy"])
+        assert vectors == [[9.0] * 3, [4.0] * 3, [4.0] * 3, [2.0] * 3]
+        assert reused == 2
+
+    def test_embed_texts_all_reused_skips_api(self):
+        mock_client = _mock_embedding_client()
+        service = EchoService(embedding_client=mock_client)
+
+        with patch.object(
+            service, "reuse_embeddings", return_value={text_hash_of("a"): [1.0]}
+        ):
+            assert service.embed_texts(["a", "a"]) == ([[1.0], [1.0]], 2)
+
+        mock_client.embed_batch.assert_not_called()
+
+    def test_store_embeddings_bulk_insert_on_conflict(self):
+        mock_ctx, mock_session = _mock_session_ctx(rowcount=2)
+        service = EchoService(embedding_client=_mock_embedding_client())
+        records = [
+            {"prediction_id": i, "shitpost_id": None, "signal_id": f"s{i}",
+             "text_hash": "h", "embedding": [0.1] * 3, "model": "m"}
+            for i in (1, 2)
+        ]
+
+        with patch(_SESSION_PATCH, return_value=mock_ctx):
+            assert service.store_embeddings(records) == 2
+
+        mock_session.execute.assert_called_once()
+        sql = str(mock_session.execute.call_args[0][0].compile(dialect=postgresql.dialect()))
+        assert "ON CONFLICT (prediction_id) DO NOTHING" in sql
+
+    def test_store_embeddings_empty(self):
+        service = EchoService(embedding_client=_mock_embedding_client())
+        assert service.store_embeddings([]) == 0
@@ -118,3 +118,39 @@ class TestFindSimilarPosts:
         call_args = mock_session.execute.call_args
         params = call_args[0][1]
         assert abs(params["max_dist"] - 0.20) < 0.001
+
+
+class TestQueryModes:
+    def _run(self, **kwargs):
+        mock_session = MagicMock()
+        mock_session.execute.return_value.fetchall.return_value = []
+        mock_ctx = MagicMock()
+        mock_ctx.__enter__ = MagicMock(return_value=mock_session)
+        mock_ctx.__exit__ = MagicMock(return_value=False)
+
+        service = EchoService(embedding_client=_mock_embedding_client())
+        with patch(_SESSION_PATCH, return_value=mock_ctx):
+            service.find_similar_posts(embedding=[0.1] * 1536, **kwargs)
+        return mock_session.execute.call_args_list
+
+    def test_default_is_index_driven_top_k(self):
+        setup, search = self._run(limit=5, ef_search=200)
+
+        assert "hnsw.ef_search" in str(setup[0][0])
+        assert setup[0][1] == {"ef": "200"}
+        sql = str(search[0][0])
+        # Distance threshold is applied after the LIMITed candidate scan
+        assert sql.index("LIMIT :candidates") < sql.index("c.distance <= :max_dist")
+        assert search[0][1]["candidates"] == 200
+
+    def test_candidates_cover_limit_plus_filter_slack(self):
+        _, search = self._run(limit=50, ef_search=20)
+
+        assert search[0][1]["candidates"] == 60
+
+    def test_exact_mode_disables_index_scans(self):
+        setup, search = self._run(exact=True)
+
+        assert "enable_indexscan" in str(setup[0][0])
+        assert "(pe.embedding <=> :query_vec) <= :max_dist" in str(search[0][0])
+        assert "candidates" not in search[0][1]
@@ -0,0 +1,250 @@
+"""
+Tests for the in-process vector index (shit/echoes/vector_index.py) and
+EchoService's indexed search path.
+"""
+
+import os
+
+os.environ.setdefault("DATABASE_URL", "sqlite:///:memory:")
+
+from contextlib import contextmanager
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from shit.db.data_models import Base
+from shit.echoes.echo_service import EchoService
+from shit.echoes.models import PostEmbedding
+from shit.echoes.vector_index import VectorIndex
+from shitvault.shitpost_models import Prediction
+from shitvault.signal_models import Signal
+
+DIMS = 8
+
+
+def _vec(*components):
+    """A DIMS-dimensional vector with the given leading components."""
+    vector = [0.0] * DIMS
+    vector[: len(components)] = components
+    return vector
+
+
+@pytest.fixture
+def session_factory():
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(
+        engine,
+        tables=[Signal.__table__, Prediction.__table__, PostEmbedding.__table__],
+    )
+    yield sessionmaker(engine, expire_on_commit=False)
+    engine.dispose()
+
+
+@pytest.fixture
+def add_post(session_factory):
+    def _add(
+        prediction_id, embedding, status="completed", thesis="", embedding_id=None
+    ):
+        session = session_factory()
+        session.add(
+            Prediction(
+                id=prediction_id,
+                signal_id=f"sig-{prediction_id}",
+                analysis_status=status,
+                assets=["XLE"],
+                thesis=thesis,
+            )
+        )
+        session.add(
+            PostEmbedding(
+                id=embedding_id,
+                prediction_id=prediction_id,
+                signal_id=f"sig-{prediction_id}",
+                text_hash="h",
+                embedding=embedding,
+            )
+        )
+        session.commit()
+        session.close()
+
+    return _add
+
+
+class TestVectorIndex:
+    def test_ranks_by_cosine_similarity(self, session_factory, add_post):
+        add_post(1, _vec(1, 0))
+        add_post(2, _vec(1, 1))
+        add_post(3, _vec(0, 1))
+        index = VectorIndex(refresh_seconds=60)
+
+        session = session_factory()
+        results = index.search(session, _vec(2, 0), limit=2)
+        session.close()
+
+        assert [pid for pid, _ in results] == [1, 2]
+        assert results[0][1] == pytest.approx(1.0)
+        assert results[1][1] == pytest.approx(np.sqrt(0.5))
+
+    def test_threshold_and_exclusion(self, session_factory, add_post):
+        add_post(1, _vec(1, 0))
+        add_post(2, _vec(1, 1))
+        add_post(3, _vec(0, 1))
+        index = VectorIndex(refresh_seconds=60)
+
+        session = session_factory()
+        results = index.search(
+            session, _vec(1, 0), limit=5, min_similarity=0.5, exclude_prediction_id=1
+        )
+        session.close()
+
+        assert [pid for pid, _ in results] == [2]
+
+    def test_only_completed_predictions_loaded(self, session_factory, add_post):
+        add_post(1, _vec(1, 0))
+        add_post(2, _vec(1, 0), status="bypassed")
+        index = VectorIndex(refresh_seconds=60)
+
+        session = session_factory()
+        results = index.search(session, _vec(1, 0), limit=5)
+        session.close()
+
+        assert [pid for pid, _ in results] == [1]
+
+    def test_incremental_refresh(self, session_factory, add_post):
+        add_post(1, _vec(1, 0))
+        index = VectorIndex(refresh_seconds=0)
+        session = session_factory()
+        index.search(session, _vec(1, 0), limit=5)
+
+        add_post(2, _vec(0, 1))
+
+        assert index.refresh(session) == 1
+        assert len(index) == 2
+        assert index.refresh(session) == 0
+        session.close()
+
+    def test_refresh_picks_up_rows_committed_below_high_water(
+        self, session_factory, add_post
+    ):
+        add_post(1, _vec(1, 0), embedding_id=10)
+        index = VectorIndex(refresh_seconds=0)
+        session = session_factory()
+        index.refresh(session)
+
+        # A concurrent writer took id 9 first but committed after id 10 was loaded
+        add_post(2, _vec(0, 1), embedding_id=9)
+
+        assert index.refresh(session) == 1
+        assert len(index) == 2
+        session.close()
+
+    def test_refresh_throttled(self, session_factory, add_post):
+        add_post(1, _vec(1, 0))
+        index = VectorIndex(refresh_seconds=3600)
+        session = session_factory()
+        index.search(session, _vec(1, 0), limit=5)
+
+        add_post(2, _vec(0, 1))
+
+        assert index.refresh(session) == 0
+        assert index.refresh(session, force=True) == 1
+        session.close()
+
+    def test_add_is_deduplicated_against_refresh(self, session_factory, add_post):
+        add_post(1, _vec(1, 0))
+        index = VectorIndex(refresh_seconds=0)
+        session = session_factory()
+        index.refresh(session)
+
+        add_post(2, _vec(0, 1))
+        index.add(2, _vec(0, 1))
+        index.refresh(session)
+        session.close()
+
+        assert len(index) == 2
+
+    def test_add_before_load_is_ignored(self):
+        index = VectorIndex(refresh_seconds=60)
+        index.add(1, _vec(1, 0))
+        assert len(index) == 0
+
+    def test_grows_past_initial_capacity(self, session_factory):
+        index = VectorIndex(refresh_seconds=60)
+        session = session_factory()
+        index.refresh(session)
+        session.close()
+
+        for pid in range(1, 1500):
+            index.add(pid, _vec(1, pid))
+
+        assert len(index) == 1499
+        assert index.stats()["embeddings"] == 1499
+
+
+class TestEchoServiceIndexedSearch:
+    @pytest.fixture
+    def service(self, session_factory):
+        @contextmanager
+        def mock_get_session():
+            session = session_factory()
+            try:
+                yield session
+                session.commit()
+            finally:
+                session.close()
+
+        index = VectorIndex(refresh_seconds=60)
+        with (
+            patch("shit.echoes.echo_service.get_session", mock_get_session),
+            patch("shit.echoes.echo_service.vector_index", index),
+            patch("shit.echoes.echo_service.settings.ECHO_VECTOR_INDEX_ENABLED", True),
+        ):
+            yield EchoService(embedding_client=MagicMock())
+
+    def test_matches_come_from_index(self, service, add_post):
+        add_post(1, _vec(1, 0), thesis="Energy thesis")
+        add_post(2, _vec(1, 1))
+        add_post(3, _vec(0, 1))
+
+        matches = service.find_similar_posts(_vec(1, 0), limit=2, min_similarity=0.5)
+
+        assert [m["prediction_id"] for m in matches] == [1, 2]
+        assert matches[0]["similarity"] == 1.0
+        assert matches[0]["thesis"] == "Energy thesis"
+        assert matches[0]["assets"] == ["XLE"]
+
+    def test_status_rechecked_after_indexing(self, service, add_post, session_factory):
+        add_post(1, _vec(1, 0))
+        add_post(2, _vec(1, 0.1))
+        service.find_similar_posts(_vec(1, 0))
+
+        session = session_factory()
+        session.get(Prediction, 1).analysis_status = "error"
+        session.commit()
+        session.close()
+
+        matches = service.find_similar_posts(_vec(1, 0))
+
+        assert [m["prediction_id"] for m in matches] == [2]
+
+    def test_exact_mode_runs_pgvector_query(self):
+        mock_session = MagicMock()
+        mock_session.execute.return_value.fetchall.return_value = []
+        mock_ctx = MagicMock()
+        mock_ctx.__enter__ = MagicMock(return_value=mock_session)
+        mock_ctx.__exit__ = MagicMock(return_value=False)
+        mock_index = MagicMock()
+
+        with (
+            patch("shit.echoes.echo_service.get_session", return_value=mock_ctx),
+            patch("shit.echoes.echo_service.vector_index", mock_index),
+            patch("shit.echoes.echo_service.settings.ECHO_VECTOR_INDEX_ENABLED", True),
+        ):
+            service = EchoService(embedding_client=MagicMock())
+            assert service.find_similar_posts(_vec(1, 0), exact=True) == []
+
+        mock_index.search.assert_not_called()
+        assert "<=>" in str(mock_session.execute.call_args[0][0])
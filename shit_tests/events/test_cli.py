@@ -13,6 +13,8 @@ from shit.events.cli import (
     cmd_retry_dead_letter,
     cmd_cleanup,
     cmd_list_events,
+    cmd_metrics,
+    cmd_trace_report,
     main,
 )
 
@@ -104,6 +106,139 @@ class TestCmdQueueStats:
         assert "pending=2" in captured.out
 
 
+class TestCmdMetrics:
+    """Tests for the metrics CLI command."""
+
+    @pytest.fixture(autouse=True)
+    def _patch_session(self, event_engine):
+        """Patch get_session to use the test database."""
+        TestSession = sessionmaker(event_engine, expire_on_commit=False)
+        self._TestSession = TestSession
+
+        @contextmanager
+        def mock_get_session():
+            session = TestSession()
+            try:
+                yield session
+                session.commit()
+            finally:
+                session.close()
+
+        with patch("shit.db.sync_session.get_session", mock_get_session):
+            yield
+
+    def _seed_pending(self, consumer_group="analyzer"):
+        session = self._TestSession()
+        session.add(Event(
+            event_type="signals_stored",
+            consumer_group=consumer_group,
+            payload={},
+            created_at=datetime.now(timezone.utc) - timedelta(minutes=5),
+        ))
+        session.commit()
+        session.close()
+
+    def test_table_output(self, capsys):
+        """Shows one row per consumer group."""
+        self._seed_pending()
+
+        result = cmd_metrics(Namespace(window_minutes=60, json=False))
+
+        assert result == 0
+        out = capsys.readouterr().out
+        assert "last 60 min" in out
+        analyzer_row = next(line for line in out.splitlines() if line.startswith("analyzer"))
+        assert analyzer_row.split()[1] == "1"
+
+    def test_json_output(self, capsys):
+        """--json prints machine-readable metrics."""
+        import json
+
+        self._seed_pending()
+
+        cmd_metrics(Namespace(window_minutes=15, json=True))
+
+        data = json.loads(capsys.readouterr().out)
+        assert data["window_minutes"] == 15
+        groups = {g["consumer_group"]: g for g in data["consumer_groups"]}
+        assert groups["analyzer"]["pending"] == 1
+        assert groups["analyzer"]["oldest_pending_age_seconds"] >= 300
+
+
+class TestCmdTraceReport:
+    """Tests for the trace-report CLI command."""
+
+    @pytest.fixture(autouse=True)
+    def _patch_session(self, event_engine):
+        """Patch get_session to use the test database."""
+        TestSession = sessionmaker(event_engine, expire_on_commit=False)
+        self._TestSession = TestSession
+
+        @contextmanager
+        def mock_get_session():
+            session = TestSession()
+            try:
+                yield session
+                session.commit()
+            finally:
+                session.close()
+
+        with patch("shit.db.sync_session.get_session", mock_get_session):
+            yield
+
+    def _seed_trace(self):
+        from shit.events.models import PipelineSpan
+
+        start = datetime.now(timezone.utc) - timedelta(minutes=10)
+        session = self._TestSession()
+        for stage, begin, end, attributes in (
+            ("harvest", 0, 5, {}),
+            ("s3_processor", 10, 12, {}),
+            ("analysis", 20, 40, {}),
+            ("alert", 45, 46, {"alerts_sent": 1}),
+        ):
+            session.add(PipelineSpan(
+                correlation_id="corr-1",
+                stage=stage,
+                started_at=start + timedelta(seconds=begin),
+                ended_at=start + timedelta(seconds=end),
+                duration_ms=(end - begin) * 1000,
+                attributes=attributes,
+            ))
+        session.commit()
+        session.close()
+
+    def test_empty(self, capsys):
+        """No spans prints a notice."""
+        assert cmd_trace_report(Namespace(hours=24, json=False)) == 0
+        assert "No pipeline traces" in capsys.readouterr().out
+
+    def test_table_output(self, capsys):
+        """Prints post-to-alert and per-stage rows."""
+        self._seed_trace()
+
+        cmd_trace_report(Namespace(hours=24, json=False))
+
+        out = capsys.readouterr().out
+        assert "1 traces" in out
+        assert "Harvest -> alert" in out
+        assert "46.0s" in out
+        assert "analysis wait" in out
+
+    def test_json_output(self, capsys):
+        """--json prints the report."""
+        import json
+
+        self._seed_trace()
+
+        cmd_trace_report(Namespace(hours=24, json=True))
+
+        report = json.loads(capsys.readouterr().out)
+        assert report["traces"] == 1
+        assert report["post_to_alert"]["p50"] == 46.0
+        assert report["stages"]["analysis"]["duration"]["p50"] == 20.0
+
+
 class TestCmdRetryDeadLetter:
     """Tests for the retry-dead-letter CLI command."""
 
@@ -243,7 +378,7 @@ class TestCmdCleanup:
         session.commit()
         session.close()
 
-        result = cmd_cleanup(Namespace(completed_days=7, dead_letter_days=30))
+        result = cmd_cleanup(Namespace(completed_days=7, dead_letter_days=30, weeks_ahead=4, span_days=14))
 
         assert result == 0
         captured = capsys.readouterr()
@@ -277,7 +412,7 @@ class TestCmdCleanup:
         session.commit()
         session.close()
 
-        result = cmd_cleanup(Namespace(completed_days=7, dead_letter_days=30))
+        result = cmd_cleanup(Namespace(completed_days=7, dead_letter_days=30, weeks_ahead=4, span_days=14))
 
         assert result == 0
         captured = capsys.readouterr()
@@ -313,7 +448,7 @@ class TestCmdCleanup:
         session.commit()
         session.close()
 
-        cmd_cleanup(Namespace(completed_days=1, dead_letter_days=90))
+        cmd_cleanup(Namespace(completed_days=1, dead_letter_days=90, weeks_ahead=4, span_days=14))
 
         session = self._TestSession()
         assert session.query(Event).filter(Event.status == "completed").count() == 0
@@ -0,0 +1,131 @@
+"""Tests for event queue metrics (shit/events/metrics.py)."""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from shit.events.event_types import CONSUMER_GROUPS
+from shit.events.metrics import LatencyHistogram, collect_queue_metrics
+from shit.events.models import Event
+
+NOW = datetime(2026, 10, 16, 12, 0, 0)
+
+
+class TestLatencyHistogram:
+    def test_empty(self):
+        histogram = LatencyHistogram.from_samples([])
+
+        assert histogram.count == 0
+        assert histogram.p50 is None
+        assert histogram.buckets["+Inf"] == 0
+
+    def test_percentiles_and_cumulative_buckets(self):
+        histogram = LatencyHistogram.from_samples([float(s) for s in range(1, 101)])
+
+        assert histogram.count == 100
+        assert (histogram.p50, histogram.p95, histogram.p99) == (50.0, 95.0, 99.0)
+        assert histogram.max == 100.0
+        assert histogram.buckets["1"] == 1
+        assert histogram.buckets["10"] == 10
+        assert histogram.buckets["60"] == 60
+        assert histogram.buckets["120"] == 100
+        assert histogram.buckets["+Inf"] == 100
+
+
+class TestCollectQueueMetrics:
+    @pytest.fixture
+    def add(self, event_session):
+        def _add(consumer_group="analyzer", status="pending", created_ago=0, **fields):
+            event = Event(
+                event_type="signals_stored",
+                consumer_group=consumer_group,
+                payload={},
+                status=status,
+                created_at=NOW - timedelta(seconds=created_ago),
+                **fields,
+            )
+            event_session.add(event)
+            event_session.flush()
+            return event
+
+        return _add
+
+    def _metrics(self, session, **kwargs):
+        return {
+            m.consumer_group: m
+            for m in collect_queue_metrics(session, now=NOW, **kwargs)
+        }
+
+    def test_every_registered_group_reported(self, event_session):
+        metrics = self._metrics(event_session)
+
+        expected = {g for groups in CONSUMER_GROUPS.values() for g in groups}
+        assert set(metrics) == expected
+        assert all(m.pending == 0 for m in metrics.values())
+        assert all(m.failure_rate is None for m in metrics.values())
+
+    def test_depth_and_oldest_pending_age(self, event_session, add):
+        add(created_ago=600)
+        add(created_ago=30)
+        add(status="claimed", created_ago=900)
+        add(consumer_group="market_data", created_ago=5)
+
+        metrics = self._metrics(event_session)
+
+        assert metrics["analyzer"].pending == 2
+        assert metrics["analyzer"].claimed == 1
+        assert metrics["analyzer"].oldest_pending_age_seconds == 600.0
+        assert metrics["market_data"].oldest_pending_age_seconds == 5.0
+        assert metrics["notifications"].oldest_pending_age_seconds is None
+
+    def test_throughput_failures_and_latency(self, event_session, add):
+        for seconds in (2, 4, 6):
+            add(
+                status="completed",
+                claimed_at=NOW - timedelta(minutes=10, seconds=seconds),
+                completed_at=NOW - timedelta(minutes=10),
+            )
+        # Completed outside the window: ignored
+        add(
+            status="completed",
+            claimed_at=NOW - timedelta(hours=3),
+            completed_at=NOW - timedelta(hours=2),
+        )
+        add(status="pending", error="boom", updated_at=NOW - timedelta(minutes=5))
+        add(status="dead_letter", error="boom", updated_at=NOW - timedelta(minutes=1))
+        # Failed before the window: ignored
+        add(status="dead_letter", error="old", updated_at=NOW - timedelta(hours=5))
+
+        analyzer = self._metrics(event_session, window_minutes=60)["analyzer"]
+
+        assert analyzer.completed == 3
+        assert analyzer.throughput_per_minute == 0.05
+        assert analyzer.failed == 2
+        assert analyzer.dead_lettered == 1
+        assert analyzer.failure_rate == 0.4
+        assert analyzer.latency.count == 3
+        assert analyzer.latency.p50 == 4.0
+        assert analyzer.latency.max == 6.0
+
+    def test_latency_sample_limit(self, event_session, add):
+        for minute in range(5):
+            add(
+                status="completed",
+                claimed_at=NOW - timedelta(minutes=minute, seconds=minute + 1),
+                completed_at=NOW - timedelta(minutes=minute),
+            )
+
+        analyzer = self._metrics(event_session, sample_limit=2)["analyzer"]
+
+        assert analyzer.completed == 5
+        # Only the two most recent completions are sampled
+        assert analyzer.latency.count == 2
+        assert analyzer.latency.max == 2.0
+
+    def test_to_dict_is_json_ready(self, event_session, add):
+        add()
+
+        data = self._metrics(event_session)["analyzer"].to_dict()
+
+        assert data["pending"] == 1
+        assert data["latency"]["buckets"]["+Inf"] == 0
@@ -0,0 +1,181 @@
+"""Tests for LISTEN/NOTIFY wake-ups (shit/events/notify.py)."""
+
+import json
+import socket
+from unittest.mock import MagicMock, patch
+
+from sqlalchemy.orm import sessionmaker
+
+from shit.events.notify import (
+    BROADCAST_CHANNEL,
+    EventListener,
+    channel_for,
+    notify_broadcast,
+    notify_consumers,
+    supports_notify,
+)
+
+
+def _pg_bind():
+    bind = MagicMock()
+    bind.dialect.name = "postgresql"
+    return bind
+
+
+class FakePgConnection:
+    """psycopg2-like connection backed by a socketpair for select()."""
+
+    def __init__(self):
+        self._reader, self._writer = socket.socketpair()
+        self.notifies = []
+        self.executed = []
+        self.autocommit = False
+        self.closed = False
+
+    def fileno(self):
+        return self._reader.fileno()
+
+    def send_notify(self, channel):
+        self._writer.send(b"x")
+        self._pending = channel
+
+    def poll(self):
+        self._reader.recv(1024)
+        self.notifies.append(MagicMock(channel=self._pending, payload=""))
+
+    def cursor(self):
+        conn = self
+
+        class Cursor:
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *args):
+                return False
+
+            def execute(self, sql):
+                conn.executed.append(sql)
+
+        return Cursor()
+
+    def close(self):
+        self.closed = True
+        self._reader.close()
+        self._writer.close()
+
+
+class TestNotifyConsumers:
+    def test_channel_per_consumer_group(self):
+        assert channel_for("analyzer") == "events_analyzer"
+
+    def test_noop_on_sqlite(self, event_engine):
+        session = sessionmaker(event_engine)()
+        session.execute = MagicMock()
+
+        notify_consumers(session, ["analyzer"])
+
+        session.execute.assert_not_called()
+        assert supports_notify(event_engine) is False
+
+    def test_one_pg_notify_per_group(self):
+        session = MagicMock()
+        session.get_bind.return_value = _pg_bind()
+
+        notify_consumers(session, ["notifications", "market_data", "market_data"])
+
+        channels = [c.args[1]["channel"] for c in session.execute.call_args_list]
+        assert channels == ["events_market_data", "events_notifications"]
+
+
+class TestNotifyBroadcast:
+    def test_noop_on_sqlite(self, event_engine):
+        session = sessionmaker(event_engine)()
+        session.execute = MagicMock()
+
+        notify_broadcast(session, [("prediction_created", {"prediction_id": 1})])
+
+        session.execute.assert_not_called()
+
+    def test_only_broadcast_event_types_sent(self):
+        session = MagicMock()
+        session.get_bind.return_value = _pg_bind()
+
+        notify_broadcast(
+            session,
+            [
+                ("signals_stored", {"signal_ids": ["a"]}),
+                ("prediction_created", {"prediction_id": 7, "assets": ["XLE"]}),
+                ("outcomes_matured", {"matured": 3}),
+            ],
+        )
+
+        params = [c.args[1] for c in session.execute.call_args_list]
+        assert [p["channel"] for p in params] == [BROADCAST_CHANNEL] * 2
+        assert [json.loads(p["payload"]) for p in params] == [
+            {"event_type": "prediction_created", "prediction_id": 7},
+            {"event_type": "outcomes_matured", "prediction_id": None},
+        ]
+
+
+class TestEventListener:
+    def test_open_returns_none_on_sqlite(self, event_engine):
+        assert EventListener.open(event_engine, "analyzer") is None
+
+    def test_open_listens_on_detached_connection(self):
+        engine = _pg_bind()
+        connection = FakePgConnection()
+        engine.raw_connection.return_value.dbapi_connection = connection
+
+        listener = EventListener.open(engine, "analyzer")
+
+        engine.raw_connection.return_value.detach.assert_called_once()
+        assert connection.autocommit is True
+        assert connection.executed == ['LISTEN "events_analyzer"']
+        assert listener.channel == "events_analyzer"
+        listener.close()
+        assert connection.closed
+
+    def test_wait_times_out_without_notify(self):
+        listener = EventListener(FakePgConnection(), "events_analyzer")
+
+        assert listener.wait(0.01) is False
+        listener.close()
+
+    def test_wait_wakes_on_notify(self):
+        connection = FakePgConnection()
+        listener = EventListener(connection, "events_analyzer")
+        connection.send_notify("events_analyzer")
+
+        assert listener.wait(5) is True
+        assert connection.notifies == []  # Drained
+        listener.close()
+
+    def test_wait_returns_immediately_for_queued_notifies(self):
+        connection = FakePgConnection()
+        connection.notifies.append(MagicMock())
+        listener = EventListener(connection, "events_analyzer")
+
+        with patch("shit.events.notify.select.select") as mock_select:
+            assert listener.wait(5) is True
+        mock_select.assert_not_called()
+        listener.close()
+
+    def test_open_channel_listens_on_given_channel(self):
+        engine = _pg_bind()
+        connection = FakePgConnection()
+        engine.raw_connection.return_value.dbapi_connection = connection
+
+        listener = EventListener.open_channel(engine, BROADCAST_CHANNEL)
+
+        assert connection.executed == [f'LISTEN "{BROADCAST_CHANNEL}"']
+        listener.close()
+
+    def test_receive_returns_payloads(self):
+        connection = FakePgConnection()
+        connection.notifies.extend([MagicMock(payload="a"), MagicMock(payload="b")])
+        listener = EventListener(connection, BROADCAST_CHANNEL)
+
+        assert listener.receive(5) == ["a", "b"]
+        assert connection.notifies == []
+        assert listener.receive(0.01) == []
+        listener.close()
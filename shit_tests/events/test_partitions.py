@@ -0,0 +1,272 @@
+"""Tests for events table partitioning (shit/events/partitions.py)."""
+
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock, patch
+
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from shit.events.cleanup import cleanup_expired_partitions, create_future_partitions
+from shit.events.models import Event
+from shit.events.worker import EventWorker
+from shit.events.partitions import (
+    CLAIM_FLOOR_MARGIN,
+    DEFAULT_PARTITION,
+    EventPartition,
+    claim_floor,
+    drop_partition,
+    ensure_partitions,
+    expired_partitions,
+    is_partitioned,
+    list_partitions,
+    partition_name,
+    partition_start,
+)
+
+NOW = datetime(2026, 10, 16, 12, 30)  # A Friday
+
+
+def _pg_session(partition_rows=(), live=None):
+    """MagicMock session on PostgreSQL answering the partition catalog query."""
+    session = MagicMock()
+    session.get_bind.return_value.dialect.name = "postgresql"
+    statements = []
+
+    def execute(statement, params=None):
+        sql = str(statement)
+        statements.append(sql)
+        result = MagicMock()
+        if "pg_inherits" in sql:
+            result.all.return_value = list(partition_rows)
+        elif sql.startswith("SELECT 1 FROM"):
+            result.first.return_value = live
+        return result
+
+    session.execute.side_effect = execute
+    return session, statements
+
+
+def _bound(start, end):
+    lower = "MINVALUE" if start is None else f"'{start}'"
+    return f"FOR VALUES FROM ({lower}) TO ('{end}')"
+
+
+class TestPartitionRanges:
+    def test_partition_start_is_monday_midnight(self):
+        assert partition_start(NOW) == datetime(2026, 10, 12)
+        assert partition_start(datetime(2026, 10, 12)) == datetime(2026, 10, 12)
+
+    def test_partition_start_normalises_to_utc(self):
+        aware = datetime(2026, 10, 12, 1, 0, tzinfo=timezone(timedelta(hours=5)))
+        assert partition_start(aware) == datetime(2026, 10, 5)
+
+    def test_partition_name(self):
+        assert partition_name(datetime(2026, 10, 12)) == "events_p20261012"
+
+    def test_list_partitions_parses_upper_bounds(self):
+        session, _ = _pg_session([
+            ("events_p20261019", _bound("2026-10-19 00:00:00", "2026-10-26 00:00:00")),
+            ("events_legacy", _bound(None, "2026-10-17 00:00:00")),
+            ("events_default", "DEFAULT"),
+        ])
+
+        partitions = list_partitions(session)
+
+        assert partitions == [
+            EventPartition("events_legacy", datetime(2026, 10, 17)),
+            EventPartition("events_p20261019", datetime(2026, 10, 26)),
+            EventPartition("events_default", None),
+        ]
+
+
+class TestEnsurePartitions:
+    def test_creates_current_and_ahead(self):
+        session, statements = _pg_session()
+
+        created = ensure_partitions(session, weeks_ahead=2, now=NOW)
+
+        assert created == ["events_p20261012", "events_p20261019", "events_p20261026"]
+        ddl = [s for s in statements if s.startswith("CREATE TABLE")]
+        assert ddl[0] == (
+            "CREATE TABLE IF NOT EXISTS events_p20261012 PARTITION OF events "
+            "FOR VALUES FROM ('2026-10-12 00:00:00') TO ('2026-10-19 00:00:00')"
+        )
+
+    def test_continues_after_newest_partition(self):
+        session, statements = _pg_session([
+            ("events_legacy", _bound(None, "2026-10-17 00:00:00")),
+        ])
+
+        created = ensure_partitions(session, weeks_ahead=1, now=NOW)
+
+        # Partial week after the legacy partition, then whole weeks
+        assert created == ["events_p20261017", "events_p20261019"]
+        assert "FROM ('2026-10-17 00:00:00') TO ('2026-10-19 00:00:00')" in statements[1]
+
+    def test_nothing_to_do_when_horizon_covered(self):
+        session, _ = _pg_session([
+            ("events_p20261019", _bound("2026-10-19 00:00:00", "2026-10-26 00:00:00")),
+        ])
+
+        assert ensure_partitions(session, weeks_ahead=1, now=NOW) == []
+
+    def test_fills_weeks_missed_since_newest_partition(self):
+        session, _ = _pg_session([
+            ("events_p20260928", _bound("2026-09-28 00:00:00", "2026-10-05 00:00:00")),
+        ])
+
+        created = ensure_partitions(session, weeks_ahead=0, now=NOW)
+
+        assert created == ["events_p20261005", "events_p20261012"]
+
+    def test_moves_rows_out_of_default_partition(self):
+        session, statements = _pg_session(
+            [
+                ("events_p20261005", _bound("2026-10-05 00:00:00", "2026-10-12 00:00:00")),
+                (DEFAULT_PARTITION, "DEFAULT"),
+            ],
+            live=(1,),
+        )
+
+        assert ensure_partitions(session, weeks_ahead=0, now=NOW) == ["events_p20261012"]
+
+        assert statements[1].startswith(f"SELECT 1 FROM {DEFAULT_PARTITION}")
+        assert statements[2] == f"ALTER TABLE events DETACH PARTITION {DEFAULT_PARTITION}"
+        assert statements[3].startswith("CREATE TABLE IF NOT EXISTS events_p20261012")
+        assert statements[4].startswith(
+            f"INSERT INTO events_p20261012 SELECT * FROM {DEFAULT_PARTITION}"
+        )
+        assert statements[5].startswith(f"DELETE FROM {DEFAULT_PARTITION}")
+        assert statements[6] == (
+            f"ALTER TABLE events ATTACH PARTITION {DEFAULT_PARTITION} DEFAULT"
+        )
+
+    def test_default_partition_without_rows_is_left_attached(self):
+        session, statements = _pg_session(
+            [(DEFAULT_PARTITION, "DEFAULT")], live=None
+        )
+
+        ensure_partitions(session, weeks_ahead=0, now=NOW)
+
+        assert not any("DETACH" in s for s in statements)
+
+
+class _Worker(EventWorker):
+    consumer_group = "test_consumer"
+
+    def process_event(self, event_type, payload):
+        return {}
+
+
+class TestWorkerStartup:
+    def test_run_once_ensures_partitions(self):
+        session = MagicMock()
+
+        with patch("shit.events.worker.SessionLocal", return_value=session), patch(
+            "shit.events.worker.is_partitioned", return_value=True
+        ), patch(
+            "shit.events.worker.ensure_partitions", return_value=["events_p20261012"]
+        ) as mock_ensure, patch.object(_Worker, "_poll_and_process", return_value=0):
+            _Worker().run_once()
+
+        mock_ensure.assert_called_once_with(session)
+        session.commit.assert_called_once()
+
+    def test_partition_failure_does_not_stop_worker(self):
+        session = MagicMock()
+
+        with patch("shit.events.worker.SessionLocal", return_value=session), patch(
+            "shit.events.worker.is_partitioned", return_value=True
+        ), patch(
+            "shit.events.worker.ensure_partitions", side_effect=RuntimeError("locked")
+        ), patch.object(_Worker, "_poll_and_process", return_value=0):
+            assert _Worker().run_once() == 0
+
+        session.rollback.assert_called_once()
+
+
+class TestRetention:
+    def test_expired_partitions_end_before_cutoff(self):
+        session, _ = _pg_session([
+            ("events_p20260928", _bound("2026-09-28 00:00:00", "2026-10-05 00:00:00")),
+            ("events_p20261005", _bound("2026-10-05 00:00:00", "2026-10-12 00:00:00")),
+            ("events_p20261012", _bound("2026-10-12 00:00:00", "2026-10-19 00:00:00")),
+        ])
+
+        expired = expired_partitions(session, completed_days=7, now=NOW)
+
+        assert [p.name for p in expired] == ["events_p20260928"]
+
+    def test_drop_detaches_and_drops_when_no_live_rows(self):
+        session, statements = _pg_session(live=None)
+        partition = EventPartition("events_p20260928", datetime(2026, 10, 5))
+
+        assert drop_partition(session, partition, now=NOW) is True
+
+        assert "LOCK TABLE events_p20260928 IN ACCESS EXCLUSIVE MODE" in statements
+        assert statements[-2:] == [
+            "ALTER TABLE events DETACH PARTITION events_p20260928",
+            "DROP TABLE events_p20260928",
+        ]
+
+    def test_drop_keeps_partition_with_live_rows(self):
+        session, statements = _pg_session(live=(1,))
+        partition = EventPartition("events_p20260928", datetime(2026, 10, 5))
+
+        assert drop_partition(session, partition, now=NOW) is False
+        assert not any("DROP TABLE" in s for s in statements)
+
+
+class TestSqlite:
+    def test_not_partitioned(self, event_engine):
+        session = sessionmaker(event_engine)()
+        assert is_partitioned(session) is False
+        session.close()
+
+    def test_cleanup_helpers_are_noops(self, event_engine):
+        TestSession = sessionmaker(event_engine)
+
+        @contextmanager
+        def mock_get_session():
+            session = TestSession()
+            try:
+                yield session
+                session.commit()
+            finally:
+                session.close()
+
+        with patch("shit.events.cleanup.get_session", mock_get_session):
+            assert create_future_partitions() == []
+            assert cleanup_expired_partitions() == []
+
+
+class TestClaimFloor:
+    @pytest.fixture
+    def session(self, event_engine):
+        session = sessionmaker(event_engine, expire_on_commit=False)()
+        yield session
+        session.close()
+
+    def _add(self, session, status, created_at, consumer_group="analyzer"):
+        session.add(Event(
+            event_type="signals_stored",
+            consumer_group=consumer_group,
+            payload={},
+            status=status,
+            created_at=created_at,
+        ))
+        session.commit()
+
+    def test_floor_is_oldest_open_event(self, session):
+        self._add(session, "completed", NOW - timedelta(days=9))
+        self._add(session, "pending", NOW - timedelta(days=3))
+        self._add(session, "claimed", NOW - timedelta(days=2))
+        self._add(session, "pending", NOW - timedelta(days=8), consumer_group="market_data")
+
+        floor = claim_floor(session, "analyzer", now=NOW)
+
+        assert floor == NOW - timedelta(days=3) - CLAIM_FLOOR_MARGIN
+
+    def test_floor_without_open_events_is_now(self, session):
+        assert claim_floor(session, "analyzer", now=NOW) == NOW - CLAIM_FLOOR_MARGIN
@@ -6,7 +6,9 @@ from contextlib import contextmanager
 
 from shit.events.models import Event
 from shit.events.event_types import EventType, ConsumerGroup, CONSUMER_GROUPS
-from shit.events.producer import emit_event
+from sqlalchemy import event as sa_event
+
+from shit.events.producer import emit_event, emit_events
 
 
 class TestEmitEvent:
@@ -120,6 +122,21 @@ class TestEmitEvent:
 
         assert event_ids == []
 
+    def test_broadcast_sent_for_event_without_consumers(self):
+        """Broadcast event types are announced even with no consumer rows."""
+        with patch("shit.events.producer.notify_broadcast") as mock_broadcast:
+            event_ids = emit_event(
+                event_type=EventType.OUTCOMES_MATURED,
+                payload={"matured": 3},
+                source_service="outcome_maturation",
+            )
+
+        assert event_ids == []
+        mock_broadcast.assert_called_once()
+        assert mock_broadcast.call_args[0][1] == [
+            (EventType.OUTCOMES_MATURED, {"matured": 3})
+        ]
+
     def test_emit_unknown_event_type_raises(self):
         """Test that an unknown event type raises ValueError."""
         with pytest.raises(ValueError, match="Unknown event type"):
@@ -179,3 +196,151 @@ class TestEmitEvent:
         # Different correlation IDs
         assert e1.correlation_id != e2.correlation_id
         session.close()
+
+    def test_emit_notifies_consumer_groups(self):
+        """Test that emit_event queues a wake-up for each consumer group."""
+        with patch("shit.events.producer.notify_consumers") as mock_notify:
+            emit_event(
+                event_type=EventType.PREDICTION_CREATED,
+                payload={"prediction_id": 1},
+                source_service="analyzer",
+            )
+
+        mock_notify.assert_called_once()
+        assert mock_notify.call_args.args[1] == set(
+            CONSUMER_GROUPS[EventType.PREDICTION_CREATED]
+        )
+
+
+class TestEmitEvents:
+    """Tests for the bulk emit_events function."""
+
+    @pytest.fixture(autouse=True)
+    def _patch_session(self, event_engine):
+        from sqlalchemy.orm import sessionmaker
+
+        TestSession = sessionmaker(event_engine, expire_on_commit=False)
+
+        @contextmanager
+        def mock_get_session():
+            session = TestSession()
+            try:
+                yield session
+                session.commit()
+            except Exception:
+                session.rollback()
+                raise
+            finally:
+                session.close()
+
+        self._engine = event_engine
+        self._TestSession = TestSession
+        with patch("shit.events.producer.get_session", mock_get_session):
+            yield
+
+    def _count_inserts(self):
+        statements = []
+
+        def before_execute(conn, cursor, statement, parameters, context, executemany):
+            if statement.lstrip().upper().startswith("INSERT"):
+                statements.append(statement)
+
+        sa_event.listen(self._engine, "before_cursor_execute", before_execute)
+        return statements
+
+    def test_fans_out_all_events_in_one_insert(self):
+        """All rows for all events and consumer groups go in one INSERT."""
+        inserts = self._count_inserts()
+
+        event_ids = emit_events(
+            [
+                {
+                    "event_type": EventType.PREDICTION_CREATED,
+                    "payload": {"prediction_id": 1},
+                    "source_service": "analyzer",
+                    "correlation_id": "corr-1",
+                },
+                {
+                    "event_type": EventType.PRICES_BACKFILLED,
+                    "payload": {},
+                    "source_service": "market_data",
+                },
+                {
+                    "event_type": EventType.SIGNALS_STORED,
+                    "payload": {"signal_ids": ["s1"]},
+                    "source_service": "s3_processor",
+                    "max_attempts": 5,
+                },
+            ]
+        )
+
+        assert len(inserts) == 1
+        assert len(event_ids) == 3
+
+        session = self._TestSession()
+        rows = [session.get(Event, event_id) for event_id in event_ids]
+        assert [r.consumer_group for r in rows] == [
+            ConsumerGroup.MARKET_DATA,
+            ConsumerGroup.NOTIFICATIONS,
+            ConsumerGroup.ANALYZER,
+        ]
+        assert {r.correlation_id for r in rows[:2]} == {"corr-1"}
+        assert rows[2].max_attempts == 5
+        assert all(r.status == "pending" and r.attempt == 0 for r in rows)
+        session.close()
+
+    def test_unknown_type_writes_nothing(self):
+        """An unknown event type rejects the whole batch."""
+        with pytest.raises(ValueError, match="Unknown event type"):
+            emit_events(
+                [
+                    {"event_type": EventType.SIGNALS_STORED, "payload": {}, "source_service": "t"},
+                    {"event_type": "bogus", "payload": {}, "source_service": "t"},
+                ]
+            )
+
+        session = self._TestSession()
+        assert session.query(Event).count() == 0
+        session.close()
+
+    def test_emits_inside_caller_transaction(self):
+        """With a caller session, events commit or roll back with the caller."""
+        session = self._TestSession()
+        event_ids = emit_event(
+            event_type=EventType.SIGNALS_STORED,
+            payload={"signal_ids": ["s1"]},
+            source_service="s3_processor",
+            session=session,
+        )
+        assert len(event_ids) == 1
+        session.rollback()
+        session.close()
+
+        check = self._TestSession()
+        assert check.query(Event).count() == 0
+        check.close()
+
+    def test_empty_list(self):
+        assert emit_events([]) == []
+
+    def test_inherits_correlation_id_from_scope(self):
+        """Events emitted while processing an event join its trace."""
+        from shit.events.tracing import correlation_scope
+
+        with correlation_scope("corr-parent"):
+            inherited = emit_event(
+                event_type=EventType.SIGNALS_STORED,
+                payload={"signal_ids": ["s1"]},
+                source_service="s3_processor",
+            )
+            explicit = emit_event(
+                event_type=EventType.SIGNALS_STORED,
+                payload={"signal_ids": ["s2"]},
+                source_service="s3_processor",
+                correlation_id="corr-explicit",
+            )
+
+        session = self._TestSession()
+        assert session.get(Event, inherited[0]).correlation_id == "corr-parent"
+        assert session.get(Event, explicit[0]).correlation_id == "corr-explicit"
+        session.close()
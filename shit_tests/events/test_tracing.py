@@ -0,0 +1,184 @@
+"""Tests for pipeline latency tracing (shit/events/tracing.py)."""
+
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from shit.events.models import PipelineSpan
+from shit.events.tracing import (
+    build_trace_report,
+    correlation_scope,
+    current_correlation_id,
+    load_spans,
+    trace_span,
+)
+
+T0 = datetime(2026, 10, 16, 12, 0, 0)
+
+
+def _span(correlation_id, stage, start, end, **attributes):
+    """Unsaved span with offsets in seconds from T0."""
+    return PipelineSpan(
+        correlation_id=correlation_id,
+        stage=stage,
+        status="ok",
+        started_at=T0 + timedelta(seconds=start),
+        ended_at=T0 + timedelta(seconds=end),
+        duration_ms=(end - start) * 1000,
+        attributes=attributes,
+    )
+
+
+@pytest.fixture
+def span_session(event_engine):
+    """Route span writes to the test database; yields a session factory."""
+    TestSession = sessionmaker(event_engine, expire_on_commit=False)
+
+    @contextmanager
+    def mock_get_session():
+        session = TestSession()
+        try:
+            yield session
+            session.commit()
+        finally:
+            session.close()
+
+    with (
+        patch("shit.events.tracing.get_session", mock_get_session),
+        patch("shit.events.tracing.settings.PIPELINE_TRACING_ENABLED", True),
+    ):
+        yield TestSession
+
+
+class TestCorrelationScope:
+    def test_scope_sets_and_restores(self):
+        assert current_correlation_id() is None
+        with correlation_scope("corr-1"):
+            assert current_correlation_id() == "corr-1"
+            with correlation_scope("corr-2"):
+                assert current_correlation_id() == "corr-2"
+            assert current_correlation_id() == "corr-1"
+        assert current_correlation_id() is None
+
+
+class TestTraceSpan:
+    def test_records_span_in_scope(self, span_session):
+        with correlation_scope("corr-1"):
+            with trace_span("analysis", posts=3) as span:
+                span["analyzed"] = 2
+
+        session = span_session()
+        (row,) = session.query(PipelineSpan).all()
+        assert row.correlation_id == "corr-1"
+        assert row.stage == "analysis"
+        assert row.status == "ok"
+        assert row.attributes == {"posts": 3, "analyzed": 2}
+        assert row.ended_at >= row.started_at
+        assert row.duration_ms >= 0
+        session.close()
+
+    def test_error_marks_span_and_propagates(self, span_session):
+        with pytest.raises(RuntimeError):
+            with trace_span("alert", correlation_id="corr-1"):
+                raise RuntimeError("telegram down")
+
+        session = span_session()
+        assert session.query(PipelineSpan.status).scalar() == "error"
+        session.close()
+
+    def test_nothing_recorded_outside_scope(self, span_session):
+        with trace_span("backfill"):
+            pass
+
+        session = span_session()
+        assert session.query(PipelineSpan).count() == 0
+        session.close()
+
+    def test_nothing_recorded_when_disabled(self, span_session):
+        with (
+            patch("shit.events.tracing.settings.PIPELINE_TRACING_ENABLED", False),
+            trace_span("backfill", correlation_id="corr-1"),
+        ):
+            pass
+
+        session = span_session()
+        assert session.query(PipelineSpan).count() == 0
+        session.close()
+
+    def test_write_failure_is_swallowed(self):
+        @contextmanager
+        def broken_session():
+            raise RuntimeError("db down")
+            yield
+
+        with (
+            patch("shit.events.tracing.get_session", broken_session),
+            patch("shit.events.tracing.settings.PIPELINE_TRACING_ENABLED", True),
+        ):
+            with trace_span("harvest", correlation_id="corr-1") as span:
+                span["harvested"] = 1
+
+
+class TestLoadSpans:
+    def test_loads_whole_traces_started_in_window(self, span_session):
+        now = datetime.now()
+        session = span_session()
+        session.add_all([
+            PipelineSpan(
+                correlation_id="recent", stage="harvest", started_at=now,
+                ended_at=now, duration_ms=0, attributes={},
+            ),
+            PipelineSpan(
+                correlation_id="old", stage="harvest",
+                started_at=now - timedelta(days=3),
+                ended_at=now - timedelta(days=3), duration_ms=0, attributes={},
+            ),
+        ])
+        session.commit()
+
+        spans = load_spans(session, hours=24)
+
+        assert [s.correlation_id for s in spans] == ["recent"]
+        session.close()
+
+
+class TestBuildTraceReport:
+    def test_empty(self):
+        report = build_trace_report([])
+
+        assert report["traces"] == 0
+        assert report["post_to_alert"]["count"] == 0
+        assert report["stages"]["alert"]["duration"]["p50"] is None
+
+    def test_stage_durations_waits_and_post_to_alert(self):
+        published = (T0 - timedelta(seconds=120)).isoformat()
+        spans = [
+            _span("a", "harvest", 0, 10),
+            _span("a", "s3_processor", 15, 20),
+            _span("a", "analysis", 30, 50),
+            _span("a", "backfill", 55, 70),
+            _span("a", "alert", 52, 60, alerts_sent=2, post_published_at=published),
+            # Alert with no recipients: not a delivered alert
+            _span("a", "alert", 53, 54, alerts_sent=0),
+            _span("b", "harvest", 0, 5),
+            _span("b", "s3_processor", 6, 8),
+        ]
+
+        report = build_trace_report(spans)
+
+        assert report["traces"] == 2
+        assert report["post_to_alert"]["count"] == 1
+        assert report["post_to_alert"]["p50"] == 60.0
+        assert report["published_to_alert"]["p50"] == 180.0
+
+        stages = report["stages"]
+        assert stages["harvest"]["duration"]["count"] == 2
+        assert stages["s3_processor"]["wait"]["p99"] == 5.0
+        assert stages["analysis"]["wait"]["p50"] == 10.0
+        # Both alert spans: first start 52 to last end 60
+        assert stages["alert"]["duration"]["p50"] == 8.0
+        assert stages["alert"]["wait"]["p50"] == 2.0
+        assert stages["backfill"]["wait"]["p50"] == 5.0
@@ -1,7 +1,9 @@
 """Tests for the EventWorker base class."""
 
+import threading
+
 import pytest
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 from contextlib import contextmanager
 from sqlalchemy.orm import sessionmaker
 
@@ -26,6 +28,20 @@ class DummyWorker(EventWorker):
         return {"ok": True}
 
 
+class BatchWorker(DummyWorker):
+    """Concrete batch-mode worker for testing."""
+
+    batch_mode = True
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.batches = []
+
+    def process_events(self, events):
+        self.batches.append([e.id for e in events])
+        return super().process_events(events)
+
+
 class TestEventWorker:
     """Tests for the EventWorker base class."""
 
@@ -339,3 +355,358 @@ class TestEventWorker:
 
         assert len(sleep_calls) == 1
         assert len(worker.processed_events) == 1
+
+    def test_run_blocks_on_listener_instead_of_sleeping(self):
+        """Test that an idle worker waits on LISTEN rather than sleeping."""
+        self._seed_events(1)
+        worker = DummyWorker(poll_interval=0.1, listen_timeout=5)
+        listener = MagicMock(channel="events_test_consumer")
+
+        def wake_then_shutdown(timeout):
+            worker._shutdown = True
+            return True
+
+        listener.wait.side_effect = wake_then_shutdown
+
+        with (
+            patch("shit.events.worker.EventListener.open", return_value=listener),
+            patch("shit.events.worker.time.sleep") as mock_sleep,
+            patch("shit.events.worker.signal.signal"),
+        ):
+            worker.run()
+
+        mock_sleep.assert_not_called()
+        assert listener.wait.call_count == 1
+        assert listener.wait.call_args.args[0] <= 1.0
+        listener.close.assert_called_once()
+        assert len(worker.processed_events) == 1
+
+    def test_listener_wait_is_bounded_by_listen_timeout(self):
+        """Test that a quiet listener returns after listen_timeout for a safety poll."""
+        worker = DummyWorker(listen_timeout=2.5)
+        listener = MagicMock()
+        listener.wait.return_value = False
+
+        assert worker._wait_for_events(listener) is listener
+        assert [c.args[0] for c in listener.wait.call_args_list] == [1.0, 1.0, 0.5]
+
+    def test_broken_listener_is_reopened(self):
+        """Test that a failed LISTEN connection is closed and re-opened."""
+        worker = DummyWorker(poll_interval=0.01)
+        broken = MagicMock()
+        broken.wait.side_effect = OSError("connection lost")
+        fresh = MagicMock()
+
+        with (
+            patch("shit.events.worker.EventListener.open", return_value=fresh),
+            patch("shit.events.worker.time.sleep"),
+        ):
+            assert worker._wait_for_events(broken) is fresh
+        broken.close.assert_called_once()
+
+    def test_open_listener_returns_none_on_sqlite(self):
+        """Test that SQLite keeps the worker on interval polling."""
+        assert DummyWorker()._open_listener() is None
+
+    def test_process_event_runs_in_correlation_scope(self):
+        """Test that each event is processed under its own correlation_id."""
+        from shit.events.tracing import current_correlation_id
+
+        self._seed_events(1)
+        session = self._TestSession()
+        session.query(Event).update({"correlation_id": "corr-42"})
+        session.commit()
+        session.close()
+
+        seen = []
+        worker = DummyWorker()
+        worker.process_event = lambda event_type, payload: seen.append(
+            current_correlation_id()
+        ) or {}
+
+        worker.run_once()
+
+        assert seen == ["corr-42"]
+        assert current_correlation_id() is None
+
+    def test_claim_unbounded_when_not_partitioned(self):
+        """Test that SQLite claims without a created_at floor."""
+        self._seed_events(1)
+        worker = DummyWorker()
+
+        assert worker.run_once() == 1
+        assert worker._partitioned is False
+        assert worker._claim_floor is None
+
+    def test_claim_bounded_by_floor_when_partitioned(self):
+        """Test that a partitioned table bounds the claim by the claim floor."""
+        from datetime import datetime, timedelta
+
+        self._seed_events(2)
+        worker = DummyWorker()
+        future = datetime.now() + timedelta(days=1)
+
+        with (
+            patch("shit.events.worker.is_partitioned", return_value=True),
+            patch("shit.events.worker.claim_floor", return_value=future) as mock_floor,
+        ):
+            # Every event is below the floor: nothing claimable, floor reset
+            assert worker._poll_and_process() == 0
+            assert worker._claim_floor is None
+
+            mock_floor.return_value = future - timedelta(days=2)
+            assert worker._poll_and_process() == 2
+
+        assert mock_floor.call_count == 2
+
+    def test_claim_floor_cached_between_polls(self):
+        """Test that the floor is re-derived only after CLAIM_FLOOR_REFRESH."""
+        worker = DummyWorker()
+        worker._partitioned = True
+        session = MagicMock()
+
+        with patch("shit.events.worker.claim_floor", return_value="floor") as mock_floor:
+            worker._get_claim_floor(session, None)
+            worker._get_claim_floor(session, None)
+            assert mock_floor.call_count == 1
+
+            worker._claim_floor_at -= 301
+            worker._get_claim_floor(session, None)
+            assert mock_floor.call_count == 2
+
+
+class TestBatchMode:
+    """Tests for EventWorker batch mode (process_events + bulk transitions)."""
+
+    @pytest.fixture(autouse=True)
+    def _patch_session(self, event_engine):
+        TestSession = sessionmaker(event_engine, expire_on_commit=False)
+        self._TestSession = TestSession
+        with patch("shit.events.worker.SessionLocal", TestSession):
+            yield
+
+    def _seed_events(self, count: int) -> list[int]:
+        session = self._TestSession()
+        events = [
+            Event(
+                event_type=f"test_event_{i}",
+                consumer_group="test_consumer",
+                payload={"index": i},
+                source_service="test",
+            )
+            for i in range(count)
+        ]
+        session.add_all(events)
+        session.commit()
+        ids = [e.id for e in events]
+        session.close()
+        return ids
+
+    def _events(self) -> dict[int, Event]:
+        session = self._TestSession()
+        events = {e.id: e for e in session.query(Event).all()}
+        session.close()
+        return events
+
+    def test_outcomes_written_in_bulk(self):
+        """Completed and failed events are recorded with their own values."""
+        ids = self._seed_events(3)
+        worker = BatchWorker(batch_size=10)
+        worker.fail_on_types = {"test_event_1"}
+
+        assert worker.run_once() == 3
+
+        events = self._events()
+        assert worker.batches == [ids]
+        assert events[ids[0]].status == "completed"
+        assert events[ids[0]].result == {"ok": True}
+        assert events[ids[0]].completed_at is not None
+        assert events[ids[0]].attempt == 1
+        assert events[ids[0]].claimed_by == worker.worker_id
+        assert events[ids[1]].status == "pending"
+        assert events[ids[1]].error == "Simulated failure for test_event_1"
+        assert events[ids[1]].next_retry_at is not None
+        assert events[ids[1]].result is None
+        assert events[ids[2]].status == "completed"
+
+    def test_batch_exception_fails_every_event(self):
+        """An exception from process_events fails the whole batch."""
+        ids = self._seed_events(2)
+        worker = BatchWorker()
+        worker.process_events = MagicMock(side_effect=RuntimeError("boom"))
+
+        worker._poll_and_process()
+
+        events = self._events()
+        assert {events[i].error for i in ids} == {"boom"}
+        assert {events[i].status for i in ids} == {"pending"}
+
+    def test_dead_letter_in_batch(self):
+        """Failing on the last attempt dead-letters the event."""
+        [event_id] = self._seed_events(1)
+        session = self._TestSession()
+        session.get(Event, event_id).attempt = 2
+        session.commit()
+        session.close()
+        worker = BatchWorker()
+        worker.fail_on_types = {"test_event_0"}
+
+        worker._poll_and_process()
+
+        event = self._events()[event_id]
+        assert event.status == "dead_letter"
+        assert event.attempt == 3
+
+    def test_claim_size_adapts_to_queue_depth(self):
+        """Full batches double the next claim; a short batch resets it."""
+        self._seed_events(15)
+        worker = BatchWorker(batch_size=2, max_batch_size=8)
+
+        assert worker.run_once() == 15
+
+        assert [len(b) for b in worker.batches] == [2, 4, 8, 1]
+        assert worker._claim_limit == 2
+        assert {e.status for e in self._events().values()} == {"completed"}
+
+    def test_transitions_skip_events_no_longer_claimed(self):
+        """Rows reset by someone else while processing are not overwritten."""
+        [event_id] = self._seed_events(1)
+        worker = BatchWorker()
+
+        def reset_then_process(events):
+            session = self._TestSession()
+            session.get(Event, event_id).status = "pending"
+            session.commit()
+            session.close()
+            return [{"ok": True}]
+
+        worker.process_events = reset_then_process
+        worker._poll_and_process()
+
+        assert self._events()[event_id].status == "pending"
+
+
+class TestConcurrency:
+    """Tests for concurrent processing and shutdown drain."""
+
+    @pytest.fixture(autouse=True)
+    def _patch_session(self, event_engine):
+        TestSession = sessionmaker(event_engine, expire_on_commit=False)
+        self._TestSession = TestSession
+        with patch("shit.events.worker.SessionLocal", TestSession):
+            yield
+
+    def _seed_events(self, count: int) -> list[int]:
+        session = self._TestSession()
+        events = [
+            Event(
+                event_type=f"test_event_{i}",
+                consumer_group="test_consumer",
+                payload={"index": i},
+                source_service="test",
+            )
+            for i in range(count)
+        ]
+        session.add_all(events)
+        session.commit()
+        ids = [e.id for e in events]
+        session.close()
+        return ids
+
+    def _statuses(self) -> dict[int, Event]:
+        session = self._TestSession()
+        events = {e.id: e for e in session.query(Event).all()}
+        session.close()
+        return events
+
+    @pytest.mark.parametrize("worker_class", [DummyWorker, BatchWorker])
+    def test_events_run_in_parallel(self, worker_class):
+        """All events of a batch are in flight at the same time."""
+        self._seed_events(4)
+        barrier = threading.Barrier(4, timeout=5)
+        worker = worker_class(concurrency=4, batch_size=4)
+        process = worker.process_event
+
+        def wait_for_all(event_type, payload):
+            barrier.wait()  # Raises BrokenBarrierError if run sequentially
+            return process(event_type, payload)
+
+        worker.process_event = wait_for_all
+
+        assert worker.run_once() == 4
+        assert {e.status for e in self._statuses().values()} == {"completed"}
+
+    def test_failures_accounted_per_event(self):
+        """A failing event doesn't affect the others processed alongside it."""
+        ids = self._seed_events(3)
+        worker = DummyWorker(concurrency=3)
+        worker.fail_on_types = {"test_event_1"}
+
+        worker.run_once()
+
+        events = self._statuses()
+        assert [events[i].status for i in ids] == ["completed", "pending", "completed"]
+
+    @pytest.mark.parametrize("worker_class", [DummyWorker, BatchWorker])
+    def test_shutdown_releases_unstarted_events(self, worker_class):
+        """On shutdown, running events finish and unstarted ones go back to pending."""
+        ids = self._seed_events(3)
+        worker = worker_class(concurrency=1, batch_size=3)
+        process = worker.process_event
+
+        def stop_after_first(event_type, payload):
+            worker._shutdown = True
+            return process(event_type, payload)
+
+        worker.process_event = stop_after_first
+
+        assert worker._poll_and_process() == 1
+
+        events = self._statuses()
+        assert events[ids[0]].status == "completed"
+        for event_id in ids[1:]:
+            assert events[event_id].status == "pending"
+            assert events[event_id].attempt == 0
+            assert events[event_id].claimed_by is None
+
+    @pytest.mark.parametrize("batch_size", [1, 3])
+    def test_run_once_stops_draining_on_sigterm(self, batch_size):
+        """--once honours SIGTERM: in-flight work finishes, the rest stays pending."""
+        import os
+        import signal as sig_mod
+
+        ids = self._seed_events(3)
+        worker = DummyWorker(concurrency=1, batch_size=batch_size)
+        process = worker.process_event
+
+        def sigterm_during_first(event_type, payload):
+            if not worker.processed_events:
+                os.kill(os.getpid(), sig_mod.SIGTERM)
+            return process(event_type, payload)
+
+        worker.process_event = sigterm_during_first
+        original = sig_mod.getsignal(sig_mod.SIGTERM)
+
+        assert worker.run_once() == 1
+
+        events = self._statuses()
+        assert events[ids[0]].status == "completed"
+        for event_id in ids[1:]:
+            assert events[event_id].status == "pending"
+            assert events[event_id].claimed_by is None
+        assert sig_mod.getsignal(sig_mod.SIGTERM) is original
+
+    def test_claims_at_least_concurrency(self):
+        """The claim size is raised to keep every thread busy."""
+        self._seed_events(6)
+        worker = DummyWorker(batch_size=2, concurrency=6)
+
+        assert worker._poll_and_process() == 6
+
+    def test_concurrency_defaults_to_class_attribute(self):
+        class ParallelWorker(DummyWorker):
+            concurrency = 3
+
+        assert ParallelWorker().concurrency == 3
+        assert ParallelWorker(concurrency=5).concurrency == 5
+        assert DummyWorker().concurrency == 1
@@ -84,6 +84,18 @@ class TestDatabaseClient:
             mock_engine.assert_called_once()
             assert client.engine is not None
 
+    @pytest.mark.asyncio
+    async def test_initialization_without_create_tables(self, db_client):
+        """create_tables=False only builds the engine (read-only API use)."""
+        with patch('shit.db.database_client.create_async_engine') as mock_engine:
+            mock_engine_instance = self._create_mock_engine()
+            mock_engine.return_value = mock_engine_instance
+
+            await db_client.initialize(create_tables=False)
+
+            mock_engine_instance.begin.assert_not_called()
+            assert db_client.SessionLocal is not None
+
     @pytest.mark.asyncio
     async def test_get_session(self, db_client):
         """Test getting database session."""
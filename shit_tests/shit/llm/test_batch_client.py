@@ -0,0 +1,196 @@
+"""
+Tests for LLMBatchClient against in-process stand-ins for the batch APIs.
+"""
+
+import json
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from shit.llm.batch_client import LLMBatchClient
+from shit.llm.llm_client import LLMClient
+
+
+def answer(prompt):
+    """A complete JSON analysis echoing *prompt*; "TRUNC" prompts get a cut-off one."""
+    text = json.dumps(
+        {"assets": [], "market_impact": {}, "confidence": 0.9, "thesis": prompt}
+    )
+    return text[:20] if "TRUNC" in prompt else text
+
+
+class FakeOpenAIBatches:
+    """Stand-in for the OpenAI files + batches endpoints.
+
+    Answers each request with ``answer(prompt)`` after ``polls_needed``
+    status checks; prompts containing "FAIL" get a 500 response.
+    """
+
+    def __init__(self, final_status="completed", polls_needed=1):
+        self.final_status = final_status
+        self.polls_needed = polls_needed
+        self.polls = 0
+        self.uploads = {}
+        self.batches_created = []
+        self.files = SimpleNamespace(create=self._create_file, content=self._content)
+        self.batches = SimpleNamespace(create=self._create_batch, retrieve=self._retrieve)
+
+    async def _create_file(self, file, purpose):
+        assert purpose == "batch"
+        file_id = f"file-{len(self.uploads)}"
+        self.uploads[file_id] = file[1].decode("utf-8")
+        return SimpleNamespace(id=file_id)
+
+    async def _create_batch(self, input_file_id, endpoint, completion_window):
+        self.batches_created.append(input_file_id)
+        return SimpleNamespace(id="batch-1")
+
+    async def _retrieve(self, batch_id):
+        self.polls += 1
+        done = self.polls > self.polls_needed
+        status = self.final_status if done else "in_progress"
+        has_output = done and self.final_status != "failed"
+        return SimpleNamespace(
+            status=status, output_file_id="out-1" if has_output else None
+        )
+
+    async def _content(self, file_id):
+        lines = []
+        for line in self.uploads[self.batches_created[-1]].splitlines():
+            request = json.loads(line)
+            prompt = request["body"]["messages"][-1]["content"]
+            if "FAIL" in prompt:
+                response = {"status_code": 500, "body": {}}
+            else:
+                response = {
+                    "status_code": 200,
+                    "body": {"choices": [{"message": {"content": answer(prompt)}}]},
+                }
+            lines.append(json.dumps({"custom_id": request["custom_id"], "response": response}))
+        return SimpleNamespace(text="\n".join(lines))
+
+
+class FakeAnthropicBatches:
+    """Stand-in for the Anthropic Message Batches endpoints."""
+
+    def __init__(self):
+        self.requests = []
+        self.messages = SimpleNamespace(
+            batches=SimpleNamespace(
+                create=self._create, retrieve=self._retrieve, results=self._results
+            )
+        )
+
+    async def _create(self, requests):
+        self.requests = requests
+        return SimpleNamespace(id="msgbatch-1")
+
+    async def _retrieve(self, batch_id):
+        return SimpleNamespace(processing_status="ended")
+
+    async def _results(self, batch_id):
+        async def entries():
+            for request in self.requests:
+                prompt = request["params"]["messages"][0]["content"]
+                message = SimpleNamespace(content=[SimpleNamespace(text=answer(prompt))])
+                yield SimpleNamespace(
+                    custom_id=request["custom_id"],
+                    result=SimpleNamespace(type="succeeded", message=message),
+                )
+
+        return entries()
+
+
+def make_client(provider, fake):
+    sdk = "anthropic.AsyncAnthropic" if provider == "anthropic" else "openai.AsyncOpenAI"
+    with patch(sdk, return_value=fake):
+        llm_client = LLMClient(provider=provider, model="test-model", api_key="test-key")
+    return LLMBatchClient(llm_client, poll_interval=0, timeout=5)
+
+
+class TestLLMBatchClient:
+    @pytest.mark.asyncio
+    async def test_openai_round_trip(self):
+        fake = FakeOpenAIBatches(polls_needed=2)
+        batch_client = make_client("openai", fake)
+
+        results = await batch_client.run({"post-0": "first", "post-1": "FAIL me"})
+
+        assert results == {"post-0": answer("first"), "post-1": None}
+        submitted = [json.loads(line) for line in fake.uploads["file-0"].splitlines()]
+        assert submitted[0]["url"] == "/v1/chat/completions"
+        assert submitted[0]["body"]["model"] == "test-model"
+
+    @pytest.mark.asyncio
+    async def test_anthropic_round_trip(self):
+        fake = FakeAnthropicBatches()
+        batch_client = make_client("anthropic", fake)
+
+        results = await batch_client.run({"post-0": "first"})
+
+        assert results == {"post-0": answer("first")}
+        assert fake.requests[0]["params"]["model"] == "test-model"
+
+    @pytest.mark.asyncio
+    async def test_cached_prompts_are_not_resubmitted(self):
+        fake = FakeOpenAIBatches()
+        batch_client = make_client("openai", fake)
+        await batch_client.run({"post-0": "first"})
+
+        results = await batch_client.run({"post-0": "first", "post-1": "second"})
+
+        assert results == {"post-0": answer("first"), "post-1": answer("second")}
+        resubmitted = [json.loads(line) for line in fake.uploads["file-1"].splitlines()]
+        assert [r["custom_id"] for r in resubmitted] == ["post-1"]
+
+    @pytest.mark.asyncio
+    async def test_fully_cached_run_submits_nothing(self):
+        fake = FakeOpenAIBatches()
+        batch_client = make_client("openai", fake)
+        await batch_client.run({"post-0": "first"})
+
+        await batch_client.run({"post-0": "first"})
+
+        assert len(fake.batches_created) == 1
+
+    @pytest.mark.asyncio
+    async def test_incomplete_answers_are_not_cached(self):
+        fake = FakeOpenAIBatches()
+        batch_client = make_client("openai", fake)
+        await batch_client.run({"post-0": "TRUNC"})
+
+        await batch_client.run({"post-0": "TRUNC"})
+
+        assert len(fake.batches_created) == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_raises(self):
+        batch_client = make_client("openai", FakeOpenAIBatches(final_status="failed"))
+
+        with pytest.raises(RuntimeError):
+            await batch_client.run({"post-0": "first"})
+
+    @pytest.mark.asyncio
+    async def test_expired_batch_returns_partial_output(self):
+        batch_client = make_client("openai", FakeOpenAIBatches(final_status="expired"))
+
+        results = await batch_client.run({"post-0": "first"})
+
+        assert results == {"post-0": answer("first")}
+
+    @pytest.mark.asyncio
+    async def test_times_out_when_batch_never_finishes(self):
+        batch_client = make_client("openai", FakeOpenAIBatches(polls_needed=10**6))
+        batch_client.timeout = 0
+
+        with pytest.raises(TimeoutError):
+            await batch_client.run({"post-0": "first"})
+
+    def test_unsupported_provider(self):
+        with patch("openai.AsyncOpenAI", return_value=MagicMock()):
+            llm_client = LLMClient(
+                provider="grok", model="grok-2", api_key="k", base_url="https://api.x.ai/v1"
+            )
+        with pytest.raises(ValueError):
+            LLMBatchClient(llm_client)
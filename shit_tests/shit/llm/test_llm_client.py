@@ -314,6 +314,84 @@ class TestLLMClient:
             
             assert result == "Test response"
 
+    @pytest.mark.asyncio
+    async def test_call_llm_reuses_cached_response(self):
+        """Identical prompts hit the response cache instead of the API."""
+        with patch('openai.AsyncOpenAI') as mock_openai:
+            mock_client = AsyncMock()
+            mock_openai.return_value = mock_client
+            mock_response = MagicMock()
+            answer = json.dumps(
+                {"assets": ["XLE"], "market_impact": {}, "confidence": 0.8, "thesis": "t"}
+            )
+            mock_response.choices = [MagicMock(message=MagicMock(content=answer))]
+            mock_client.chat.completions.create = AsyncMock(return_value=mock_response)
+
+            client = LLMClient(provider="openai", model="gpt-3.5-turbo", api_key="test-key")
+
+            first = await client._call_llm("Same prompt")
+            second = await client._call_llm("Same prompt")
+            other = await client._call_llm("Different prompt")
+
+            assert first == second == other == answer
+            assert mock_client.chat.completions.create.call_count == 2
+            assert client.response_cache.stats()["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_call_llm_bypasses_cache_when_disabled(self):
+        """use_cache=False always calls the API (connection test)."""
+        with patch('openai.AsyncOpenAI') as mock_openai:
+            mock_client = AsyncMock()
+            mock_openai.return_value = mock_client
+            mock_response = MagicMock()
+            mock_response.choices = [MagicMock(message=MagicMock(content="OK"))]
+            mock_client.chat.completions.create = AsyncMock(return_value=mock_response)
+
+            client = LLMClient(provider="openai", model="gpt-3.5-turbo", api_key="test-key")
+
+            await client._call_llm("Ping", use_cache=False)
+            await client._call_llm("Ping", use_cache=False)
+
+            assert mock_client.chat.completions.create.call_count == 2
+            assert client.response_cache.stats()["hits"] == 0
+
+    @pytest.mark.asyncio
+    async def test_call_llm_does_not_cache_failures(self):
+        """A failed call is retried on the next identical prompt."""
+        with patch('openai.AsyncOpenAI') as mock_openai:
+            mock_client = AsyncMock()
+            mock_openai.return_value = mock_client
+            mock_response = MagicMock()
+            mock_response.choices = [MagicMock(message=MagicMock(content="Recovered"))]
+            mock_client.chat.completions.create = AsyncMock(
+                side_effect=[Exception("API Error"), mock_response]
+            )
+
+            client = LLMClient(provider="openai", model="gpt-3.5-turbo", api_key="test-key")
+
+            assert await client._call_llm("Prompt") is None
+            assert await client._call_llm("Prompt") == "Recovered"
+
+    @pytest.mark.asyncio
+    async def test_call_llm_does_not_cache_incomplete_analysis(self):
+        """Truncated or non-JSON completions are requested again, not replayed."""
+        with patch('openai.AsyncOpenAI') as mock_openai:
+            mock_client = AsyncMock()
+            mock_openai.return_value = mock_client
+            truncated = MagicMock()
+            truncated.choices = [
+                MagicMock(message=MagicMock(content='{"assets": ["XLE"], "confid'))
+            ]
+            mock_client.chat.completions.create = AsyncMock(return_value=truncated)
+
+            client = LLMClient(provider="openai", model="gpt-3.5-turbo", api_key="test-key")
+
+            await client._call_llm("Prompt")
+            await client._call_llm("Prompt")
+
+            assert mock_client.chat.completions.create.call_count == 2
+            assert client.response_cache.stats()["hits"] == 0
+
     @pytest.mark.asyncio
     async def test_call_llm_anthropic(self):
         """Test Anthropic LLM call."""
@@ -0,0 +1,84 @@
+"""
+Tests for per-provider LLM rate budgets.
+"""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from shit.llm.rate_budget import ProviderBudget, get_provider_budget
+
+
+class TestProviderBudget:
+    @pytest.mark.asyncio
+    async def test_requests_within_budget_do_not_wait(self):
+        budget = ProviderBudget(requests_per_minute=3)
+        with patch("shit.llm.rate_budget.asyncio.sleep") as mock_sleep:
+            waits = [await budget.acquire(100) for _ in range(3)]
+        assert waits == [0.0, 0.0, 0.0]
+        mock_sleep.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_request_over_budget_waits_for_refill(self):
+        budget = ProviderBudget(requests_per_minute=60)
+        for _ in range(60):
+            await budget.acquire(0)
+        with patch("shit.llm.rate_budget.asyncio.sleep") as mock_sleep:
+            wait = await budget.acquire(0)
+        # One request refills every second at 60 rpm
+        assert wait == pytest.approx(1.0, abs=0.05)
+        mock_sleep.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_token_budget_waits_for_large_requests(self):
+        budget = ProviderBudget(requests_per_minute=0, tokens_per_minute=6000)
+        assert await budget.acquire(6000) == 0.0
+        with patch("shit.llm.rate_budget.asyncio.sleep"):
+            wait = await budget.acquire(1000)
+        assert wait == pytest.approx(10.0, abs=0.05)
+
+    @pytest.mark.asyncio
+    async def test_record_usage_refunds_overestimate(self):
+        budget = ProviderBudget(requests_per_minute=0, tokens_per_minute=6000)
+        await budget.acquire(6000)
+        budget.record_usage(estimated_tokens=6000, actual_tokens=1000)
+        assert await budget.acquire(4000) == 0.0
+
+    @pytest.mark.asyncio
+    async def test_unlimited_budget_never_waits(self):
+        budget = ProviderBudget(requests_per_minute=0, tokens_per_minute=0)
+        for _ in range(100):
+            assert await budget.acquire(10**6) == 0.0
+        budget.record_usage(10, None)
+
+    @pytest.mark.asyncio
+    async def test_concurrent_acquires_are_spaced(self):
+        budget = ProviderBudget(requests_per_minute=60)
+        budget._requests.tokens = 0.0
+        with patch("shit.llm.rate_budget.asyncio.sleep") as mock_sleep:
+            waits = await asyncio.gather(*(budget.acquire(0) for _ in range(3)))
+        assert sorted(waits) == pytest.approx([1.0, 2.0, 3.0], abs=0.05)
+        assert mock_sleep.call_count == 3
+
+
+class TestGetProviderBudget:
+    def test_shared_per_provider(self):
+        assert get_provider_budget("openai") is get_provider_budget("openai")
+        assert get_provider_budget("openai") is not get_provider_budget("anthropic")
+
+    def test_uses_provider_rpm_by_default(self):
+        with patch("shit.llm.rate_budget.settings") as mock_settings:
+            mock_settings.LLM_REQUESTS_PER_MINUTE = None
+            mock_settings.LLM_TOKENS_PER_MINUTE = 0
+            budget = get_provider_budget("anthropic")
+        assert budget._requests.capacity == 60
+        assert budget._tokens is None
+
+    def test_settings_override_rpm(self):
+        with patch("shit.llm.rate_budget.settings") as mock_settings:
+            mock_settings.LLM_REQUESTS_PER_MINUTE = 500
+            mock_settings.LLM_TOKENS_PER_MINUTE = 90000
+            budget = get_provider_budget("openai")
+        assert budget._requests.capacity == 500
+        assert budget._tokens.capacity == 90000
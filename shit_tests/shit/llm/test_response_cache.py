@@ -0,0 +1,103 @@
+"""
+Tests for the persistent LLM response cache.
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from shit.llm.prompts import PROMPT_VERSION
+from shit.llm.response_cache import (
+    LLMResponseCache,
+    get_response_cache,
+    make_cache_key,
+    set_response_cache,
+)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    c = LLMResponseCache(str(tmp_path / "cache.db"), ttl_seconds=3600, max_entries=3)
+    yield c
+    c.close()
+
+
+class TestMakeCacheKey:
+    def test_key_includes_provider_model_and_prompt_version(self):
+        key = make_cache_key("openai", "gpt-5.4", "prompt", "system")
+        assert key.provider == "openai"
+        assert key.model == "gpt-5.4"
+        assert key.prompt_version == PROMPT_VERSION
+        assert len(key.prompt_sha256) == 64
+
+    def test_same_prompt_same_key(self):
+        assert make_cache_key("openai", "m", "p", "s") == make_cache_key("openai", "m", "p", "s")
+
+    def test_prompt_system_and_model_change_key(self):
+        base = make_cache_key("openai", "m", "p", "s")
+        assert make_cache_key("openai", "m", "p2", "s") != base
+        assert make_cache_key("openai", "m", "p", "s2") != base
+        assert make_cache_key("openai", "m2", "p", "s") != base
+        assert make_cache_key("anthropic", "m", "p", "s") != base
+
+
+class TestLLMResponseCache:
+    def test_miss_then_hit(self, cache):
+        key = make_cache_key("openai", "m", "p")
+        assert cache.get(key) is None
+
+        cache.put(key, "response text", latency_seconds=2.5)
+        hit = cache.get(key)
+
+        assert hit.response == "response text"
+        assert hit.latency_seconds == 2.5
+        assert cache.stats() == {
+            "hits": 1,
+            "misses": 1,
+            "hit_rate": 0.5,
+            "saved_seconds": 2.5,
+        }
+
+    def test_entries_persist_across_instances(self, tmp_path):
+        path = str(tmp_path / "cache.db")
+        key = make_cache_key("openai", "m", "p")
+        first = LLMResponseCache(path, ttl_seconds=3600, max_entries=10)
+        first.put(key, "kept", 1.0)
+        first.close()
+
+        second = LLMResponseCache(path, ttl_seconds=3600, max_entries=10)
+        assert second.get(key).response == "kept"
+        second.close()
+
+    def test_expired_entry_is_a_miss(self, cache):
+        key = make_cache_key("openai", "m", "p")
+        with patch("shit.llm.response_cache.time.time", return_value=1000.0):
+            cache.put(key, "old", 1.0)
+        with patch("shit.llm.response_cache.time.time", return_value=1000.0 + 3600):
+            assert cache.get(key) is None
+        assert cache.stats()["misses"] == 1
+
+    def test_evicts_least_recently_used_beyond_max_entries(self, cache):
+        keys = [make_cache_key("openai", "m", f"p{i}") for i in range(4)]
+        clock = iter(range(1000, 2000))
+        with patch("shit.llm.response_cache.time.time", side_effect=lambda: float(next(clock))):
+            for key in keys[:3]:
+                cache.put(key, "r", 1.0)
+            cache.get(keys[0])  # keys[1] is now least recently used
+            cache.put(keys[3], "r", 1.0)
+
+            assert cache.get(keys[1]) is None
+            assert cache.get(keys[0]) is not None
+            assert cache.get(keys[2]) is not None
+            assert cache.get(keys[3]) is not None
+
+
+class TestGetResponseCache:
+    def test_disabled_returns_none(self):
+        with patch("shit.llm.response_cache.settings") as mock_settings:
+            mock_settings.LLM_CACHE_ENABLED = False
+            assert get_response_cache() is None
+
+    def test_returns_installed_cache(self, cache):
+        set_response_cache(cache)
+        assert get_response_cache() is cache
@@ -19,6 +19,8 @@ from shit.market_data.auto_backfill_service import (
     auto_backfill_recent,
     auto_backfill_all,
 )
+from shit.market_data.client import MarketDataClient
+from shit.market_data.price_provider import RawPriceRecord
 
 SESSION_PATCH = "shit.market_data.auto_backfill_service.get_session"
 CLIENT_PATCH = "shit.market_data.auto_backfill_service.MarketDataClient"
@@ -108,6 +110,85 @@ class TestBackfillTicker:
         )
 
 
+class TestNeedsPriceUpdate:
+    """Tests for AutoBackfillService.needs_price_update (served by the price cache)."""
+
+    def test_recent_price_means_no_update(self):
+        ctx, session = _mock_session()
+        session.query.return_value.filter.return_value.all.return_value = [
+            (date.today(), 1.0, 1.0, 1.0, 1.0, 100),
+        ]
+        with patch(SESSION_PATCH, return_value=ctx), patch(REGISTRY_PATCH):
+            service = AutoBackfillService()
+            assert service.needs_price_update("AAPL") is False
+            # Second check is answered from the cache
+            assert service.needs_price_update("AAPL", days_back=1) is False
+        assert session.query.call_count == 1
+
+    def test_stale_history_needs_update(self):
+        ctx, session = _mock_session()
+        session.query.return_value.filter.return_value.all.return_value = [
+            (date(2020, 1, 2), 1.0, 1.0, 1.0, 1.0, 100),
+        ]
+        with patch(SESSION_PATCH, return_value=ctx), patch(REGISTRY_PATCH):
+            service = AutoBackfillService()
+            assert service.needs_price_update("AAPL") is True
+
+
+class TestBackfillTickers:
+    """Tests for AutoBackfillService.backfill_tickers."""
+
+    def test_fetches_all_valid_symbols_in_one_call(self):
+        client = _mock_client()
+        client.update_prices_for_symbols.return_value = {"AAPL": 10, "FAKE": 0}
+        mock_registry = MagicMock()
+
+        with patch(CLIENT_PATCH, return_value=client), patch(REGISTRY_PATCH, return_value=mock_registry):
+            service = AutoBackfillService()
+            result = service.backfill_tickers(["AAPL", "FAKE", "KRX:005930"])
+
+        assert result == {"AAPL": True, "FAKE": False, "KRX:005930": False}
+        client.update_prices_for_symbols.assert_called_once()
+        assert client.update_prices_for_symbols.call_args[0][0] == ["AAPL", "FAKE"]
+        mock_registry.update_price_metadata.assert_called_once_with("AAPL")
+        mock_registry.mark_ticker_invalid.assert_called_once_with(
+            "FAKE", "yfinance returned no price data"
+        )
+
+    def test_store_failure_leaves_registry_untouched(self):
+        mock_session = MagicMock()
+        mock_session.query.return_value.filter.return_value.order_by.return_value.all.return_value = []
+        mock_chain = MagicMock()
+        mock_chain.fetch_bulk_with_fallback.return_value = {
+            "AAPL": [RawPriceRecord(
+                symbol="AAPL", date=date(2026, 1, 2), open=1.0, high=1.0, low=1.0,
+                close=1.0, volume=1, adjusted_close=1.0, source="test",
+            )],
+        }
+        client = MarketDataClient(session=mock_session, provider_chain=mock_chain)
+        mock_registry = MagicMock()
+
+        with patch(CLIENT_PATCH, return_value=client), \
+                patch(REGISTRY_PATCH, return_value=mock_registry), \
+                patch("shit.market_data.client.upsert_prices", side_effect=Exception("DB down")):
+            service = AutoBackfillService()
+            result = service.backfill_tickers(["AAPL"])
+
+        assert result == {"AAPL": False}
+        mock_session.rollback.assert_called_once()
+        mock_registry.mark_ticker_invalid.assert_not_called()
+
+    def test_client_failure_marks_all_failed(self):
+        client = _mock_client()
+        client.update_prices_for_symbols.side_effect = Exception("boom")
+
+        with patch(CLIENT_PATCH, return_value=client), patch(REGISTRY_PATCH):
+            service = AutoBackfillService()
+            result = service.backfill_tickers(["AAPL", "TSLA"])
+
+        assert result == {"AAPL": False, "TSLA": False}
+
+
 class TestProcessSinglePrediction:
     """Tests for AutoBackfillService.process_single_prediction."""
 
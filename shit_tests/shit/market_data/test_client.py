@@ -3,10 +3,14 @@
 import pytest
 from datetime import date, timedelta
 from unittest.mock import MagicMock, patch, PropertyMock
-from sqlalchemy.orm import Session
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from shit.db.data_models import Base
 
 from shit.market_data.client import MarketDataClient
 from shit.market_data.models import MarketPrice
+from shit.market_data.price_cache import PricePoint
 from shit.market_data.price_provider import ProviderChain, ProviderError, RawPriceRecord
 
 
@@ -19,6 +23,7 @@ def mock_session():
 def mock_chain():
     chain = MagicMock(spec=ProviderChain)
     chain.providers = [MagicMock()]
+    chain.fetch_bulk_with_fallback.return_value = {}
     return chain
 
 
@@ -105,9 +110,13 @@ class TestFetchPriceHistory:
         result = client.fetch_price_history("AAPL", date(2026, 1, 1))
         assert len(result) == 1
 
-    def test_stores_raw_records(self, client, mock_session, mock_chain):
+    @patch("shit.market_data.client.upsert_prices")
+    def test_stores_raw_records(self, mock_upsert, client, mock_session, mock_chain):
         mock_session.query.return_value.filter.return_value.order_by.return_value.all.return_value = []
-        mock_session.query.return_value.filter.return_value.first.return_value = None
+        stored = MagicMock(spec=MarketPrice)
+        stored.symbol = "AAPL"
+        stored.date = date(2026, 1, 15)
+        mock_session.query.return_value.filter.return_value.populate_existing.return_value.all.return_value = [stored]
 
         records = [
             RawPriceRecord(
@@ -119,11 +128,13 @@ class TestFetchPriceHistory:
         mock_chain.fetch_with_fallback.return_value = records
 
         result = client.fetch_price_history("AAPL", date(2026, 1, 1))
-        assert len(result) == 1
-        mock_session.add.assert_called_once()
+        assert result == [stored]
+        mock_upsert.assert_called_once()
+        assert mock_upsert.call_args[0][1] == records
         mock_session.commit.assert_called_once()
 
-    def test_rolls_back_on_db_error(self, client, mock_session, mock_chain):
+    @patch("shit.market_data.client.upsert_prices")
+    def test_rolls_back_on_db_error(self, mock_upsert, client, mock_session, mock_chain):
         mock_session.query.return_value.filter.return_value.order_by.return_value.all.return_value = []
         mock_session.query.return_value.filter.return_value.first.return_value = None
 
@@ -198,96 +209,120 @@ class TestFetchWithRetry:
 
 
 class TestStoreRawRecords:
-    def test_creates_new_price_records(self, client, mock_session):
-        # Batch query returns no existing records
-        mock_session.query.return_value.filter.return_value.all.return_value = []
-
-        records = [
-            RawPriceRecord(
-                symbol="AAPL", date=date(2026, 1, 15),
-                open=150.0, high=155.0, low=149.0, close=153.0,
-                volume=1000000, adjusted_close=153.0, source="yfinance",
-            ),
-        ]
+    """Exercises the real ON CONFLICT upsert against SQLite."""
+
+    @pytest.fixture
+    def db_client(self, tmp_path, mock_chain):
+        engine = create_engine(f"sqlite:///{tmp_path / 'prices.db'}")
+        Base.metadata.create_all(engine)
+        session = sessionmaker(engine)()
+        yield MarketDataClient(session=session, provider_chain=mock_chain)
+        session.close()
+
+    @staticmethod
+    def _record(close, day=15, source="yfinance"):
+        return RawPriceRecord(
+            symbol="AAPL", date=date(2026, 1, day),
+            open=close, high=close, low=close, close=close,
+            volume=1000000, adjusted_close=close, source=source,
+        )
+
+    def test_creates_new_price_records(self, db_client):
+        result = db_client._store_raw_records([self._record(153.0), self._record(154.0, day=16)])
+        db_client.session.commit()
+
+        assert [p.close for p in result] == [153.0, 154.0]
+        assert db_client.session.query(MarketPrice).count() == 2
+
+    def test_skips_existing_unless_force(self, db_client):
+        db_client._store_raw_records([self._record(153.0)])
+        result = db_client._store_raw_records([self._record(163.0, source="alphavantage")])
+
+        assert result[0].close == 153.0
+        assert result[0].source == "yfinance"
+        assert db_client.session.query(MarketPrice).count() == 1
+
+    def test_updates_existing_on_force(self, db_client):
+        db_client._store_raw_records([self._record(153.0)])
+        result = db_client._store_raw_records(
+            [self._record(163.0, source="alphavantage")], force_refresh=True
+        )
+
+        assert result[0].close == 163.0
+        assert result[0].source == "alphavantage"
+        assert db_client.session.query(MarketPrice).count() == 1
+
+    def test_duplicate_records_collapse_to_one_row(self, db_client):
+        result = db_client._store_raw_records(
+            [self._record(153.0), self._record(155.0)], force_refresh=True
+        )
 
-        result = client._store_raw_records(records)
         assert len(result) == 1
-        mock_session.add.assert_called_once()
+        assert result[0].close == 155.0
 
-    def test_skips_existing_unless_force(self, client, mock_session):
-        existing = MagicMock(spec=MarketPrice)
-        existing.symbol = "AAPL"
-        existing.date = date(2026, 1, 15)
-        # Batch query returns the existing record
-        mock_session.query.return_value.filter.return_value.all.return_value = [existing]
+    def test_empty_records(self, db_client):
+        assert db_client._store_raw_records([]) == []
 
-        records = [
-            RawPriceRecord(
-                symbol="AAPL", date=date(2026, 1, 15),
-                open=150.0, high=155.0, low=149.0, close=153.0,
-                volume=1000000, adjusted_close=153.0, source="yfinance",
-            ),
-        ]
 
-        result = client._store_raw_records(records, force_refresh=False)
-        assert result[0] is existing
-        mock_session.add.assert_not_called()
-
-    def test_updates_existing_on_force(self, client, mock_session):
-        existing = MagicMock(spec=MarketPrice)
-        existing.symbol = "AAPL"
-        existing.date = date(2026, 1, 15)
-        # Batch query returns the existing record
-        mock_session.query.return_value.filter.return_value.all.return_value = [existing]
-
-        records = [
-            RawPriceRecord(
-                symbol="AAPL", date=date(2026, 1, 15),
-                open=160.0, high=165.0, low=159.0, close=163.0,
-                volume=2000000, adjusted_close=163.0, source="alphavantage",
-            ),
+class TestGetPriceOnDate:
+    @staticmethod
+    def _history(mock_session, *rows):
+        mock_session.query.return_value.filter.return_value.all.return_value = [
+            (d, close, close, close, close, 1000) for d, close in rows
         ]
 
-        result = client._store_raw_records(records, force_refresh=True)
-        assert result[0] is existing
-        assert existing.close == 163.0
-        assert existing.source == "alphavantage"
-        mock_session.add.assert_not_called()  # Updated in-place, no add
-
-
-class TestGetPriceOnDate:
     def test_returns_exact_date_match(self, client, mock_session):
-        mock_price = MagicMock(spec=MarketPrice)
-        mock_price.date = date(2026, 1, 15)
-        mock_session.query.return_value.filter.return_value.order_by.return_value.first.return_value = mock_price
+        self._history(mock_session, (date(2026, 1, 14), 99.0), (date(2026, 1, 15), 100.0))
 
         result = client.get_price_on_date("AAPL", date(2026, 1, 15))
-        assert result is mock_price
+        assert result == PricePoint("AAPL", date(2026, 1, 15), 100.0)
 
     def test_returns_none_when_not_found(self, client, mock_session):
-        mock_session.query.return_value.filter.return_value.order_by.return_value.first.return_value = None
+        self._history(mock_session)
 
         result = client.get_price_on_date("AAPL", date(2026, 1, 15))
         assert result is None
 
     def test_returns_nearest_trading_day(self, client, mock_session):
-        """Single bounded query returns the nearest trading day before target."""
-        mock_price = MagicMock(spec=MarketPrice)
-        mock_price.date = date(2026, 1, 13)  # Monday before target Wednesday
-        mock_session.query.return_value.filter.return_value.order_by.return_value.first.return_value = mock_price
+        """Returns the nearest trading day before target."""
+        self._history(mock_session, (date(2026, 1, 13), 98.0), (date(2026, 1, 16), 101.0))
 
         result = client.get_price_on_date("AAPL", date(2026, 1, 15))
-        assert result is mock_price
+        assert result.date == date(2026, 1, 13)  # Tuesday before target Thursday
+        assert result.close == 98.0
 
-    def test_single_query_instead_of_loop(self, client, mock_session):
-        """Verify only 1 query is issued regardless of lookback window."""
-        mock_session.query.return_value.filter.return_value.order_by.return_value.first.return_value = None
+    def test_respects_lookback_window(self, client, mock_session):
+        self._history(mock_session, (date(2026, 1, 1), 98.0))
 
-        result = client.get_price_on_date("AAPL", date(2026, 1, 15), lookback_days=7)
-        assert result is None
-        # Single query, not N queries walking backward
+        assert client.get_price_on_date("AAPL", date(2026, 1, 15), lookback_days=7) is not None
+        assert client.get_price_on_date("AAPL", date(2026, 1, 16), lookback_days=7) is None
+
+    def test_history_loaded_once_per_symbol(self, client, mock_session):
+        """Repeated lookups are served from the price cache."""
+        self._history(mock_session, (date(2026, 1, 15), 100.0))
+
+        for day in (13, 14, 15, 16):
+            client.get_price_on_date("AAPL", date(2026, 1, day), lookback_days=7)
         assert mock_session.query.call_count == 1
 
+    @patch("shit.market_data.client.upsert_prices")
+    def test_store_invalidates_cached_history(self, mock_upsert, client, mock_session, mock_chain):
+        self._history(mock_session, (date(2026, 1, 14), 99.0))
+        assert client.get_price_on_date("AAPL", date(2026, 1, 15)).close == 99.0
+
+        mock_session.query.return_value.filter.return_value.order_by.return_value.all.return_value = []
+        mock_chain.fetch_with_fallback.return_value = [
+            RawPriceRecord(
+                symbol="AAPL", date=date(2026, 1, 15),
+                open=1.0, high=1.0, low=1.0, close=100.0,
+                volume=1, adjusted_close=100.0, source="test",
+            )
+        ]
+        client.fetch_price_history("AAPL", date(2026, 1, 15), date(2026, 1, 15))
+        self._history(mock_session, (date(2026, 1, 14), 99.0), (date(2026, 1, 15), 100.0))
+
+        assert client.get_price_on_date("AAPL", date(2026, 1, 15)).close == 100.0
+
 
 class TestGetLatestPrice:
     def test_returns_most_recent(self, client, mock_session):
@@ -323,12 +358,65 @@ class TestUpdatePricesForSymbols:
         assert result["ALSO_BAD"] == 0
 
     def test_defaults_to_30_day_range(self, client, mock_session):
-        existing = [MagicMock(spec=MarketPrice)]
+        existing = [MagicMock(spec=MarketPrice, date=date.today())]
         mock_session.query.return_value.filter.return_value.order_by.return_value.all.return_value = existing
 
         result = client.update_prices_for_symbols(["AAPL"])
         assert "AAPL" in result
 
+    def test_bulk_results_stored_in_one_call(self, client, mock_session, mock_chain):
+        mock_session.query.return_value.filter.return_value.order_by.return_value.all.return_value = []
+        aapl = [self._record("AAPL"), self._record("AAPL", day=2)]
+        tsla = [self._record("TSLA")]
+        mock_chain.fetch_bulk_with_fallback.return_value = {"AAPL": aapl, "TSLA": tsla}
+
+        with patch("shit.market_data.client.upsert_prices", return_value=3) as mock_upsert:
+            result = client.update_prices_for_symbols(["AAPL", "TSLA"])
+
+        mock_upsert.assert_called_once()
+        assert mock_upsert.call_args[0][1] == aapl + tsla
+        mock_session.commit.assert_called_once()
+        mock_chain.fetch_with_fallback.assert_not_called()
+        assert result == {"AAPL": 2, "TSLA": 1}
+
+    def test_falls_back_to_per_symbol_fetch(self, client, mock_session, mock_chain):
+        mock_session.query.return_value.filter.return_value.order_by.return_value.all.return_value = []
+        mock_chain.fetch_bulk_with_fallback.return_value = {"AAPL": [self._record("AAPL")]}
+        mock_chain.fetch_with_fallback.return_value = [self._record("BTC-USD")]
+
+        with patch("shit.market_data.client.upsert_prices", return_value=2):
+            result = client.update_prices_for_symbols(["AAPL", "BTC-USD"])
+
+        assert mock_chain.fetch_with_fallback.call_args[0][0] == "BTC-USD"
+        assert result == {"AAPL": 1, "BTC-USD": 1}
+
+    def test_store_failure_rolls_back(self, client, mock_session, mock_chain):
+        mock_session.query.return_value.filter.return_value.order_by.return_value.all.return_value = []
+        mock_chain.fetch_bulk_with_fallback.return_value = {"AAPL": [self._record("AAPL")]}
+
+        with patch("shit.market_data.client.upsert_prices", side_effect=Exception("DB down")):
+            result = client.update_prices_for_symbols(["AAPL"])
+
+        mock_session.rollback.assert_called_once()
+        assert result == {}
+
+    def test_unexpected_fetch_error_left_out(self, client, mock_session, mock_chain):
+        mock_session.query.return_value.filter.return_value.order_by.return_value.all.return_value = []
+        mock_chain.fetch_bulk_with_fallback.return_value = {}
+        mock_chain.fetch_with_fallback.side_effect = RuntimeError("connection reset")
+
+        result = client.update_prices_for_symbols(["AAPL"])
+
+        assert result == {}
+
+    @staticmethod
+    def _record(symbol, day=1):
+        return RawPriceRecord(
+            symbol=symbol, date=date(2026, 1, day),
+            open=1.0, high=1.0, low=1.0, close=1.0,
+            volume=1, adjusted_close=1.0, source="test",
+        )
+
 
 class TestGetPriceStats:
     def test_returns_stats_dict(self, client, mock_session):
@@ -213,3 +213,56 @@ class TestNearestTradingDay:
     def test_weekend_returns_next_monday(self, cal):
         result = cal.nearest_trading_day(date(2025, 6, 14))  # Saturday
         assert result == date(2025, 6, 16)  # Monday
+
+
+class TestSessionIndex:
+    """The precomputed ordinal index must agree with exchange_calendars."""
+
+    def test_index_is_shared_across_instances(self):
+        assert MarketCalendar()._index is MarketCalendar()._index
+
+    def test_matches_exchange_calendars_over_a_year(self, cal):
+        import pandas as pd
+        from datetime import timedelta
+
+        xcal = cal._cal
+        d = date(2024, 11, 1)
+        for _ in range(400):
+            ts = pd.Timestamp(d)
+            assert cal.is_trading_day(d) == xcal.is_session(ts)
+            for offset in (1, 7, -3):
+                direction = "next" if offset > 0 else "previous"
+                anchor = ts if xcal.is_session(ts) else xcal.date_to_session(ts, direction)
+                assert cal.trading_day_offset(d, offset) == xcal.session_offset(anchor, offset).date()
+            d += timedelta(days=1)
+
+    def test_outside_index_falls_back(self, cal):
+        far_future = date(2100, 1, 1)  # Friday, beyond the calendar range
+        assert cal.is_trading_day(far_future) is False
+        assert cal.next_trading_day(far_future) == date(2100, 1, 4)
+        assert cal.trading_day_offset(far_future, 1) == date(2100, 1, 4)
+
+
+class TestOrdinalQueries:
+    def test_offset_ordinals_matches_scalar(self, cal):
+        import numpy as np
+
+        dates = [date(2025, 6, 13), date(2025, 6, 14), date(2025, 7, 3), date(2025, 12, 25)]
+        ordinals = np.array([d.toordinal() for d in dates])
+        for offset in (0, 1, 3, 30, -1):
+            result = cal.trading_day_offset_ordinals(ordinals, offset)
+            expected = [cal.trading_day_offset(d, offset).toordinal() for d in dates]
+            assert result.tolist() == expected
+
+    def test_offset_ordinals_out_of_range_falls_back(self, cal):
+        import numpy as np
+
+        result = cal.trading_day_offset_ordinals(np.array([date(2100, 1, 1).toordinal()]), 1)
+        assert date.fromordinal(int(result[0])) == date(2100, 1, 4)
+
+    def test_trading_day_mask(self, cal):
+        import numpy as np
+
+        dates = [date(2025, 6, 13), date(2025, 6, 14), date(2025, 12, 25), date(2100, 1, 1)]
+        mask = cal.trading_day_mask_ordinals(np.array([d.toordinal() for d in dates]))
+        assert mask.tolist() == [True, False, False, False]
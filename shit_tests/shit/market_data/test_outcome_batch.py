@@ -0,0 +1,258 @@
+"""Tests for the vectorized outcome engine (shit/market_data/outcome_batch.py)."""
+
+import os
+
+# Ensure DATABASE_URL is set before any market_data imports trigger sync_session
+os.environ.setdefault("DATABASE_URL", "sqlite:///:memory:")
+
+import numpy as np
+import pytest
+from datetime import date, timedelta
+from unittest.mock import MagicMock
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from shit.db.data_models import Base
+from shit.market_data import outcome_batch
+from shit.market_data.market_calendar import MarketCalendar
+from shit.market_data.models import MarketPrice, PredictionOutcome
+from shit.market_data.outcome_batch import PriceMatrix
+from shit.market_data.outcome_calculator import OutcomeCalculator
+
+
+# ─── PriceMatrix ────────────────────────────────────────────────────
+
+
+class TestPriceMatrix:
+    def test_exact_date_lookup(self):
+        rows = [("AAPL", date(2025, 6, 13), 100.0), ("AAPL", date(2025, 6, 16), 105.0)]
+        m = PriceMatrix.from_rows(rows, date(2025, 6, 13), date(2025, 6, 16))
+
+        result = m.lookup(["AAPL", "AAPL"], [date(2025, 6, 13).toordinal(), date(2025, 6, 16).toordinal()])
+        assert result.tolist() == [100.0, 105.0]
+
+    def test_weekend_uses_previous_close(self):
+        rows = [("AAPL", date(2025, 6, 13), 100.0)]
+        m = PriceMatrix.from_rows(rows, date(2025, 6, 13), date(2025, 6, 15))
+
+        result = m.lookup(["AAPL"], [date(2025, 6, 15).toordinal()])
+        assert result[0] == 100.0
+
+    def test_lookback_limit_matches_get_price_on_date(self):
+        rows = [("AAPL", date(2025, 6, 1), 100.0)]
+        m = PriceMatrix.from_rows(rows, date(2025, 6, 1), date(2025, 6, 30))
+
+        within = date(2025, 6, 1) + timedelta(days=14)
+        beyond = date(2025, 6, 1) + timedelta(days=15)
+        result = m.lookup(["AAPL", "AAPL"], [within.toordinal(), beyond.toordinal()])
+        assert result[0] == 100.0
+        assert np.isnan(result[1])
+
+    def test_unknown_symbol_and_out_of_range(self):
+        rows = [("AAPL", date(2025, 6, 13), 100.0)]
+        m = PriceMatrix.from_rows(rows, date(2025, 6, 13), date(2025, 6, 13))
+
+        result = m.lookup(
+            ["TSLA", "AAPL"], [date(2025, 6, 13).toordinal(), date(2026, 1, 1).toordinal()]
+        )
+        assert np.isnan(result).all()
+
+    def test_empty_rows(self):
+        m = PriceMatrix.from_rows([], date(2025, 6, 13), date(2025, 6, 20))
+        assert np.isnan(m.lookup(["AAPL"], [date(2025, 6, 13).toordinal()])).all()
+
+
+# ─── Vectorized math ────────────────────────────────────────────────
+
+
+class TestVectorizedMath:
+    def test_compute_returns(self):
+        base = np.array([100.0, 0.0, 100.0])
+        prices = np.array([110.0, 5.0, np.nan])
+        result = outcome_batch.compute_returns(base, prices)
+        assert result[0] == pytest.approx(10.0)
+        assert np.isnan(result[1])
+        assert np.isnan(result[2])
+
+    @pytest.mark.parametrize(
+        "sentiment,return_pct",
+        [
+            ("bullish", 1.0),
+            ("bullish", 0.2),
+            ("Bearish", -1.0),
+            ("bearish", 1.0),
+            ("neutral", 0.3),
+            ("neutral", -2.0),
+            ("unknown", 1.0),
+            (None, 1.0),
+        ],
+    )
+    def test_compute_correct_matches_is_correct(self, sentiment, return_pct):
+        expected = PredictionOutcome().is_correct(sentiment, return_pct)
+        flag = outcome_batch.compute_correct([sentiment], np.array([return_pct]))[0]
+        assert outcome_batch.to_optional_bool(flag) == expected
+
+    def test_compute_correct_nan_return(self):
+        flag = outcome_batch.compute_correct(["bullish"], np.array([np.nan]))[0]
+        assert outcome_batch.to_optional_bool(flag) is None
+
+    def test_compute_pnl(self):
+        assert outcome_batch.compute_pnl(np.array([2.5]))[0] == pytest.approx(25.0)
+
+
+# ─── OutcomeCalculator.mature_outcomes_batch ────────────────────────
+
+
+@pytest.fixture
+def db_session(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'outcomes.db'}")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(engine, expire_on_commit=False)()
+    yield session
+    session.close()
+    engine.dispose()
+
+
+def _add_prices(session, symbol, start, end, base=100.0):
+    """Insert a close for every trading day in [start, end], rising by 1/day."""
+    cal = MarketCalendar()
+    d, price = start, base
+    while d <= end:
+        if cal.is_trading_day(d):
+            session.add(MarketPrice(symbol=symbol, date=d, close=price))
+            price += 1.0
+        d += timedelta(days=1)
+    session.commit()
+
+
+def _add_outcome(session, **kwargs):
+    outcome = PredictionOutcome(is_complete=False, **kwargs)
+    session.add(outcome)
+    session.commit()
+    return outcome
+
+
+@pytest.fixture
+def calculator(db_session):
+    calc = OutcomeCalculator(session=db_session)
+    calc.market_client = MagicMock()
+    return calc
+
+
+class TestMatureOutcomesBatch:
+    def test_fills_all_timeframes_and_marks_complete(self, calculator, db_session):
+        pred_date = date(2025, 6, 13)  # Friday
+        _add_prices(db_session, "AAPL", pred_date - timedelta(days=10), date(2025, 8, 31))
+        outcome = _add_outcome(
+            db_session,
+            prediction_id=1,
+            symbol="AAPL",
+            prediction_date=pred_date,
+            prediction_sentiment="bullish",
+        )
+
+        stats = calculator.mature_outcomes_batch()
+
+        assert stats["total_incomplete"] == 1
+        assert stats["matured"] == 1
+        assert stats["newly_complete"] == 1
+        assert stats["errors"] == 0
+
+        db_session.expire_all()
+        row = db_session.get(PredictionOutcome, outcome.id)
+        cal = MarketCalendar()
+        for n, price_attr, return_attr, correct_attr, pnl_attr in outcome_batch.TIMEFRAMES:
+            target = cal.trading_day_offset(pred_date, n)
+            expected_price = (
+                db_session.query(MarketPrice.close)
+                .filter(MarketPrice.symbol == "AAPL", MarketPrice.date == target)
+                .scalar()
+            )
+            expected_return = row.calculate_return(row.price_at_prediction, expected_price)
+            assert getattr(row, price_attr) == expected_price
+            assert getattr(row, return_attr) == pytest.approx(expected_return)
+            assert getattr(row, correct_attr) is row.is_correct("bullish", expected_return)
+            assert getattr(row, pnl_attr) == pytest.approx(row.calculate_pnl(expected_return))
+        assert row.is_complete is True
+        calculator.market_client.fetch_price_history.assert_not_called()
+
+    def test_keeps_filled_timeframes(self, calculator, db_session):
+        pred_date = date(2025, 6, 13)
+        _add_prices(db_session, "AAPL", pred_date - timedelta(days=10), date(2025, 8, 31))
+        outcome = _add_outcome(
+            db_session,
+            prediction_id=1,
+            symbol="AAPL",
+            prediction_date=pred_date,
+            prediction_sentiment="bearish",
+            price_at_prediction=50.0,
+            price_t1=42.0,
+            return_t1=-16.0,
+            correct_t1=True,
+            pnl_t1=-160.0,
+        )
+
+        calculator.mature_outcomes_batch()
+
+        db_session.expire_all()
+        row = db_session.get(PredictionOutcome, outcome.id)
+        assert row.price_at_prediction == 50.0
+        assert row.price_t1 == 42.0
+        assert row.return_t1 == -16.0
+        assert row.price_t3 is not None
+
+    def test_future_timeframes_stay_incomplete(self, calculator, db_session):
+        pred_date = date.today() - timedelta(days=5)
+        _add_prices(db_session, "AAPL", pred_date - timedelta(days=10), date.today())
+        _add_outcome(
+            db_session,
+            prediction_id=1,
+            symbol="AAPL",
+            prediction_date=pred_date,
+            prediction_sentiment="bullish",
+        )
+
+        stats = calculator.mature_outcomes_batch(fetch_missing=False)
+
+        assert stats["matured"] == 1
+        assert stats["still_incomplete"] == 1
+        row = db_session.query(PredictionOutcome).one()
+        assert row.price_t30 is None
+
+    def test_skips_outcomes_without_base_price(self, calculator, db_session):
+        _add_outcome(
+            db_session,
+            prediction_id=1,
+            symbol="NOPE",
+            prediction_date=date(2025, 6, 13),
+            prediction_sentiment="bullish",
+        )
+
+        stats = calculator.mature_outcomes_batch()
+
+        assert stats["skipped"] == 1
+        assert stats["matured"] == 0
+        assert "NOPE" in calculator._failed_symbols
+        calculator.market_client.fetch_price_history.assert_called_once()
+
+    def test_chunks_and_limit(self, calculator, db_session):
+        pred_date = date(2025, 6, 13)
+        for symbol in ("AAPL", "TSLA", "SPY"):
+            _add_prices(db_session, symbol, pred_date - timedelta(days=10), date(2025, 8, 31))
+        for i, symbol in enumerate(("AAPL", "TSLA", "SPY")):
+            _add_outcome(
+                db_session,
+                prediction_id=i + 1,
+                symbol=symbol,
+                prediction_date=pred_date,
+                prediction_sentiment="neutral",
+            )
+
+        stats = calculator.mature_outcomes_batch(limit=2, chunk_size=1)
+
+        assert stats["total_incomplete"] == 2
+        assert stats["newly_complete"] == 2
+        remaining = db_session.query(PredictionOutcome).filter(
+            PredictionOutcome.is_complete == False  # noqa: E712
+        ).count()
+        assert remaining == 1
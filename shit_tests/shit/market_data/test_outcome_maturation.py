@@ -411,3 +411,30 @@ class TestMatureOutcomesCLI:
 
         result = runner.invoke(cli, ["mature-outcomes"])
         assert result.exit_code != 0
+
+    @patch("shit.market_data.cli_outcomes.OutcomeCalculator")
+    def test_batch_flag_uses_batch_engine(self, mock_calc_class, runner):
+        from shit.market_data.cli import cli
+
+        mock_calc = MagicMock()
+        mock_calc.mature_outcomes_batch.return_value = {
+            "total_incomplete": 4,
+            "matured": 4,
+            "newly_complete": 3,
+            "still_incomplete": 1,
+            "errors": 0,
+            "skipped": 0,
+        }
+        mock_calc.__enter__ = MagicMock(return_value=mock_calc)
+        mock_calc.__exit__ = MagicMock(return_value=False)
+        mock_calc_class.return_value = mock_calc
+
+        result = runner.invoke(
+            cli, ["mature-outcomes", "--batch", "--chunk-size", "100"]
+        )
+        assert result.exit_code == 0
+        assert "Newly complete: 3" in result.output
+        mock_calc.mature_outcomes_batch.assert_called_once_with(
+            limit=None, emit_event=False, chunk_size=100
+        )
+        mock_calc.mature_outcomes.assert_not_called()
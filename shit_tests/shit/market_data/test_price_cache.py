@@ -0,0 +1,113 @@
+"""Tests for the in-process columnar price cache (shit/market_data/price_cache.py)."""
+
+import os
+
+os.environ.setdefault("DATABASE_URL", "sqlite:///:memory:")
+
+from datetime import date
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from shit.market_data.price_cache import PriceCache, PricePoint, PriceSeries
+
+
+def _rows(*days, close=100.0):
+    return [(date(2026, 1, d), close, close, close, close + d, 1000) for d in days]
+
+
+class TestPriceSeries:
+    def test_close_on_or_before_exact_and_previous(self):
+        s = PriceSeries.from_rows("AAPL", _rows(12, 13, 16))
+
+        assert s.close_on_or_before(date(2026, 1, 13), 14) == PricePoint("AAPL", date(2026, 1, 13), 113.0)
+        assert s.close_on_or_before(date(2026, 1, 15), 14).date == date(2026, 1, 13)
+
+    def test_lookback_limit_and_before_history(self):
+        s = PriceSeries.from_rows("AAPL", _rows(1))
+
+        assert s.close_on_or_before(date(2026, 1, 15), 14) is not None
+        assert s.close_on_or_before(date(2026, 1, 16), 14) is None
+        assert s.close_on_or_before(date(2025, 12, 31), 14) is None
+
+    def test_unsorted_rows_and_string_dates(self):
+        rows = [("2026-01-16", 1.0, 1.0, 1.0, 3.0, None), ("2026-01-12", 1.0, 1.0, 1.0, 2.0, 5)]
+        s = PriceSeries.from_rows("AAPL", rows)
+
+        assert s.ordinals[0] == date(2026, 1, 12).toordinal()
+        assert s.rows_since(date(2026, 1, 13)) == [(date(2026, 1, 16), 1.0, 1.0, 1.0, 3.0, None)]
+
+    def test_rows_since_preserves_missing_values(self):
+        s = PriceSeries.from_rows("AAPL", [(date(2026, 1, 12), None, None, None, 2.0, None)])
+        assert s.rows_since(date(2026, 1, 1)) == [(date(2026, 1, 12), None, None, None, 2.0, None)]
+
+    def test_has_data_since(self):
+        s = PriceSeries.from_rows("AAPL", _rows(12))
+        assert s.has_data_since(date(2026, 1, 12))
+        assert not s.has_data_since(date(2026, 1, 13))
+        assert not PriceSeries.from_rows("X", []).has_data_since(date(2026, 1, 1))
+
+
+class TestPriceCache:
+    def test_loader_called_once_per_symbol(self):
+        cache = PriceCache(max_bytes=1 << 20, ttl_seconds=60)
+        loader = MagicMock(return_value=_rows(12))
+
+        cache.get("AAPL", loader)
+        cache.get("AAPL", loader)
+        assert loader.call_count == 1
+        assert cache.stats()["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_aget_shares_entries_with_get(self):
+        cache = PriceCache(max_bytes=1 << 20, ttl_seconds=60)
+        loader = AsyncMock(return_value=_rows(12))
+
+        first = await cache.aget("AAPL", loader)
+        second = await cache.aget("AAPL", loader)
+        assert first is second
+        assert cache.get("AAPL", MagicMock()) is first
+        loader.assert_awaited_once_with("AAPL")
+
+    def test_invalidate_forces_reload(self):
+        cache = PriceCache(max_bytes=1 << 20, ttl_seconds=60)
+        loader = MagicMock(return_value=_rows(12))
+
+        cache.get("AAPL", loader)
+        cache.invalidate(["AAPL"])
+        cache.get("AAPL", loader)
+        assert loader.call_count == 2
+
+    def test_ttl_expiry(self):
+        cache = PriceCache(max_bytes=1 << 20, ttl_seconds=60)
+        loader = MagicMock(return_value=_rows(12))
+
+        with patch("shit.market_data.price_cache.time.monotonic", side_effect=[0.0, 61.0, 61.0]):
+            cache.get("AAPL", loader)
+            cache.get("AAPL", loader)
+        assert loader.call_count == 2
+
+    def test_evicts_least_recently_used_past_budget(self):
+        one = PriceSeries.from_rows("X", _rows(12, 13)).nbytes
+        cache = PriceCache(max_bytes=2 * one, ttl_seconds=60)
+        loader = MagicMock(return_value=_rows(12, 13))
+
+        cache.get("A", loader)
+        cache.get("B", loader)
+        cache.get("A", loader)  # A is now most recently used
+        cache.get("C", loader)
+
+        assert cache.stats()["symbols"] == 2
+        assert cache.stats()["bytes"] == 2 * one
+        cache.get("A", loader)
+        assert loader.call_count == 3  # A stayed cached, B was evicted
+
+    def test_invalidation_during_load_is_not_cached(self):
+        cache = PriceCache(max_bytes=1 << 20, ttl_seconds=60)
+
+        def racing_loader(symbol):
+            cache.invalidate([symbol])  # a write lands while we read
+            return _rows(12)
+
+        cache.get("AAPL", racing_loader)
+        assert cache.stats()["symbols"] == 0
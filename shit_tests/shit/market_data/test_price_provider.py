@@ -2,10 +2,10 @@
 
 import pytest
 from datetime import date
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 from shit.market_data.price_provider import (
-    PriceProvider, ProviderChain, ProviderError, RawPriceRecord,
+    PriceProvider, ProviderChain, ProviderError, RateLimiter, RawPriceRecord,
 )
 
 
@@ -129,3 +129,97 @@ class TestProviderChain:
 
         with pytest.raises(ProviderError, match="all_providers"):
             chain.fetch_with_fallback("AAPL", date(2026, 1, 1), date(2026, 1, 31))
+
+
+class TestRateLimiter:
+    def test_burst_passes_without_waiting(self):
+        limiter = RateLimiter(per_minute=60, burst=3)
+        with patch("shit.market_data.price_provider.time.sleep") as mock_sleep:
+            for _ in range(3):
+                limiter.acquire()
+        mock_sleep.assert_not_called()
+
+    def test_blocks_once_bucket_is_empty(self):
+        limiter = RateLimiter(per_minute=60, burst=1)
+        limiter.acquire()
+        with patch("shit.market_data.price_provider.time.sleep") as mock_sleep:
+            mock_sleep.side_effect = lambda s: setattr(limiter, "_tokens", 1.0)
+            limiter.acquire()
+        mock_sleep.assert_called_once()
+        assert mock_sleep.call_args[0][0] > 0
+
+
+class TestFetchBulkWithFallback:
+    def _make_bulk_provider(self, name, results=None, error=None):
+        p = MagicMock(spec=PriceProvider)
+        p.name = name
+        p.is_available.return_value = True
+        p.supports_bulk_fetch = True
+        p.rate_limit_per_minute = None
+        if error:
+            p.fetch_prices_bulk.side_effect = error
+        else:
+            p.fetch_prices_bulk.side_effect = lambda symbols, s, e: {
+                sym: recs for sym, recs in (results or {}).items() if sym in symbols
+            }
+        return p
+
+    def test_chunks_symbols(self):
+        p = self._make_bulk_provider("bulk", results={"A": [MagicMock()], "B": [MagicMock()], "C": [MagicMock()]})
+        chain = ProviderChain([p])
+
+        result = chain.fetch_bulk_with_fallback(
+            ["A", "B", "C"], date(2026, 1, 1), date(2026, 1, 31), chunk_size=2
+        )
+        assert set(result) == {"A", "B", "C"}
+        assert p.fetch_prices_bulk.call_count == 2
+
+    def test_skips_providers_without_bulk_support(self):
+        p = MagicMock(spec=PriceProvider)
+        p.name = "single"
+        p.is_available.return_value = True
+        p.supports_bulk_fetch = False
+        chain = ProviderChain([p])
+
+        result = chain.fetch_bulk_with_fallback(["A"], date(2026, 1, 1), date(2026, 1, 31))
+        assert result == {}
+        p.fetch_prices_bulk.assert_not_called()
+
+    def test_failed_chunk_leaves_symbols_for_next_provider(self):
+        p1 = self._make_bulk_provider("p1", error=ProviderError("p1", "down"))
+        p2 = self._make_bulk_provider("p2", results={"A": [MagicMock()]})
+        chain = ProviderChain([p1, p2])
+
+        result = chain.fetch_bulk_with_fallback(["A", "B"], date(2026, 1, 1), date(2026, 1, 31))
+        assert set(result) == {"A"}
+        p2.fetch_prices_bulk.assert_called_once()
+
+    def test_throttles_each_chunk(self):
+        p = self._make_bulk_provider("bulk", results={})
+        chain = ProviderChain([p])
+        limiter = MagicMock()
+        chain._limiters["bulk"] = limiter
+
+        chain.fetch_bulk_with_fallback(
+            ["A", "B", "C"], date(2026, 1, 1), date(2026, 1, 31), chunk_size=1
+        )
+        assert limiter.acquire.call_count == 3
+
+
+class TestDefaultFetchPricesBulk:
+    def test_loops_over_fetch_prices_and_drops_failures(self):
+        class _Provider(PriceProvider):
+            name = "loop"
+
+            def is_available(self):
+                return True
+
+            def fetch_prices(self, symbol, start_date, end_date):
+                if symbol == "BAD":
+                    raise ProviderError("loop", "nope")
+                return [MagicMock()] if symbol != "EMPTY" else []
+
+        result = _Provider().fetch_prices_bulk(
+            ["AAPL", "BAD", "EMPTY"], date(2026, 1, 1), date(2026, 1, 31)
+        )
+        assert list(result) == ["AAPL"]
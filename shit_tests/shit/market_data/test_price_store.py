@@ -0,0 +1,99 @@
+"""Tests for the bulk market_prices upsert (shit/market_data/price_store.py)."""
+
+import os
+
+os.environ.setdefault("DATABASE_URL", "sqlite:///:memory:")
+
+import pytest
+from datetime import date
+from unittest.mock import MagicMock
+
+from sqlalchemy.dialects import postgresql
+
+from shit.market_data import price_store
+from shit.market_data.price_provider import RawPriceRecord
+
+
+def _record(symbol="AAPL", day=15, close=100.0):
+    return RawPriceRecord(
+        symbol=symbol, date=date(2026, 1, day),
+        open=close, high=close, low=close, close=close,
+        volume=10, adjusted_close=close, source="yfinance",
+    )
+
+
+def _session(dialect):
+    session = MagicMock()
+    session.get_bind.return_value.dialect.name = dialect
+    session.execute.return_value.rowcount = 1
+    return session
+
+
+class TestRecordsToRows:
+    def test_last_record_wins_per_key(self):
+        rows = price_store.records_to_rows([_record(close=1.0), _record(close=2.0), _record(day=16)])
+        assert len(rows) == 2
+        assert rows[0]["close"] == 2.0
+
+    def test_rows_carry_every_insert_column(self):
+        row = price_store.records_to_rows([_record()])[0]
+        assert set(row) == set(price_store.INSERT_COLUMNS)
+
+
+class TestUpsertPrices:
+    def test_empty_records_skip_database(self):
+        session = _session("postgresql")
+        assert price_store.upsert_prices(session, []) == 0
+        session.execute.assert_not_called()
+
+    def test_unsupported_dialect_raises(self):
+        with pytest.raises(ValueError, match="mysql"):
+            price_store.upsert_prices(_session("mysql"), [_record()])
+
+    def test_postgres_do_update_statement(self):
+        session = _session("postgresql")
+        price_store.upsert_prices(session, [_record()], overwrite=True)
+
+        stmt = session.execute.call_args[0][0]
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+        assert "ON CONFLICT (symbol, date) DO UPDATE" in sql
+        assert "created_at = excluded.created_at" not in sql
+
+    def test_postgres_do_nothing_statement(self):
+        session = _session("postgresql")
+        price_store.upsert_prices(session, [_record()])
+
+        sql = str(session.execute.call_args[0][0].compile(dialect=postgresql.dialect()))
+        assert "ON CONFLICT (symbol, date) DO NOTHING" in sql
+
+    def test_splits_large_batches_into_statements(self, monkeypatch):
+        monkeypatch.setattr(price_store, "ROWS_PER_STATEMENT", 2)
+        session = _session("sqlite")
+
+        written = price_store.upsert_prices(session, [_record(day=d) for d in range(1, 6)])
+        assert session.execute.call_count == 3
+        assert written == 3
+
+    def test_copy_path_above_threshold(self):
+        session = _session("postgresql")
+        conn = session.connection.return_value
+        conn.exec_driver_sql.return_value.rowcount = 3
+        cursor = conn.connection.cursor.return_value
+
+        written = price_store.upsert_prices(
+            session, [_record(day=d) for d in range(1, 4)], overwrite=True, copy_threshold=3
+        )
+
+        assert written == 3
+        session.execute.assert_not_called()
+        copy_sql, buf = cursor.copy_expert.call_args[0]
+        assert copy_sql.startswith("COPY _market_prices_stage")
+        assert len(buf.getvalue().splitlines()) == 3
+        merge_sql = conn.exec_driver_sql.call_args[0][0]
+        assert "ON CONFLICT (symbol, date) DO UPDATE SET" in merge_sql
+
+    def test_copy_path_not_used_below_threshold(self):
+        session = _session("postgresql")
+        price_store.upsert_prices(session, [_record()], copy_threshold=100)
+        session.connection.assert_not_called()
+        session.execute.assert_called_once()
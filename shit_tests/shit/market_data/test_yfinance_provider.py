@@ -0,0 +1,98 @@
+"""Tests for yfinance_provider.py -- multi-ticker bulk fetch and live quotes."""
+
+from datetime import date
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from shit.market_data.price_provider import ProviderError
+from shit.market_data.yfinance_provider import YFinanceProvider, fetch_live_quotes
+
+DOWNLOAD_PATCH = "shit.market_data.yfinance_provider.yf.download"
+
+
+def _frame(symbols, closes):
+    """Build a yf.download-style frame grouped by ticker."""
+    index = pd.DatetimeIndex([pd.Timestamp("2026-01-05"), pd.Timestamp("2026-01-06")])
+    columns = pd.MultiIndex.from_product(
+        [symbols, ["Open", "High", "Low", "Close", "Volume"]]
+    )
+    data = []
+    for i in range(len(index)):
+        row = []
+        for sym in symbols:
+            c = closes[sym][i]
+            row.extend([c, c, c, c, 100 if not np.isnan(c) else np.nan])
+        data.append(row)
+    return pd.DataFrame(data, index=index, columns=columns)
+
+
+class TestFetchPricesBulk:
+    def test_splits_frame_by_ticker(self):
+        frame = _frame(["AAPL", "TSLA"], {"AAPL": [1.0, 2.0], "TSLA": [3.0, 4.0]})
+        with patch(DOWNLOAD_PATCH, return_value=frame) as mock_download:
+            result = YFinanceProvider().fetch_prices_bulk(
+                ["AAPL", "TSLA"], date(2026, 1, 5), date(2026, 1, 6)
+            )
+
+        mock_download.assert_called_once()
+        assert [r.close for r in result["AAPL"]] == [1.0, 2.0]
+        assert [r.close for r in result["TSLA"]] == [3.0, 4.0]
+        assert result["TSLA"][0].date == date(2026, 1, 5)
+        assert result["TSLA"][0].source == "yfinance"
+
+    def test_omits_symbols_without_data(self):
+        frame = _frame(["AAPL", "FAKE"], {"AAPL": [1.0, 2.0], "FAKE": [np.nan, np.nan]})
+        with patch(DOWNLOAD_PATCH, return_value=frame):
+            result = YFinanceProvider().fetch_prices_bulk(
+                ["AAPL", "FAKE"], date(2026, 1, 5), date(2026, 1, 6)
+            )
+
+        assert list(result) == ["AAPL"]
+
+    def test_empty_download_returns_empty_dict(self):
+        with patch(DOWNLOAD_PATCH, return_value=pd.DataFrame()):
+            result = YFinanceProvider().fetch_prices_bulk(
+                ["AAPL"], date(2026, 1, 5), date(2026, 1, 6)
+            )
+        assert result == {}
+
+    def test_download_error_raises_provider_error(self):
+        with patch(DOWNLOAD_PATCH, side_effect=RuntimeError("boom")):
+            with pytest.raises(ProviderError, match="yfinance"):
+                YFinanceProvider().fetch_prices_bulk(
+                    ["AAPL"], date(2026, 1, 5), date(2026, 1, 6)
+                )
+
+
+class TestFetchLiveQuotes:
+    def test_quotes_from_last_two_bars(self):
+        frame = _frame(["AAPL", "TSLA"], {"AAPL": [1.0, 2.0], "TSLA": [3.0, 4.0]})
+        with patch(DOWNLOAD_PATCH, return_value=frame) as mock_download:
+            quotes = fetch_live_quotes(["AAPL", "TSLA"])
+
+        mock_download.assert_called_once()
+        assert quotes["AAPL"].price == 2.0
+        assert quotes["AAPL"].previous_close == 1.0
+        assert quotes["TSLA"].day_high == 4.0
+        assert quotes["TSLA"].volume == 100
+
+    def test_omits_symbols_without_data(self):
+        frame = _frame(["AAPL", "FAKE"], {"AAPL": [1.0, 2.0], "FAKE": [np.nan, np.nan]})
+        with patch(DOWNLOAD_PATCH, return_value=frame):
+            quotes = fetch_live_quotes(["AAPL", "FAKE"])
+
+        assert list(quotes) == ["AAPL"]
+
+    def test_single_bar_has_no_previous_close(self):
+        frame = _frame(["AAPL"], {"AAPL": [np.nan, 2.0]})
+        with patch(DOWNLOAD_PATCH, return_value=frame):
+            quotes = fetch_live_quotes(["AAPL"])
+
+        assert quotes["AAPL"].previous_close is None
+
+    def test_download_error_returns_empty_dict(self):
+        with patch(DOWNLOAD_PATCH, side_effect=RuntimeError("boom")):
+            assert fetch_live_quotes(["AAPL"]) == {}
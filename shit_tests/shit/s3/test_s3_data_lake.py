@@ -412,6 +412,41 @@ class TestS3DataLake:
             assert len(results) == 1
             assert results[0] == sample_raw_data
 
+    @pytest.mark.asyncio
+    async def test_iter_raw_data_concurrent_in_key_order(self, data_lake):
+        """GETs overlap up to the concurrency limit; results keep key order."""
+        in_flight = 0
+        peak = 0
+
+        async def fake_get(key):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            # Later keys finish first
+            await asyncio.sleep(0.001 * (10 - int(key)))
+            in_flight -= 1
+            return None if key == "3" else {"key": key}
+
+        keys = [str(i) for i in range(8)]
+        with patch.object(data_lake, 'get_raw_data', side_effect=fake_get):
+            results = [r async for r in data_lake.iter_raw_data(keys, concurrency=4)]
+
+        assert results == [None if k == "3" else {"key": k} for k in keys]
+        assert peak == 4
+
+    @pytest.mark.asyncio
+    async def test_iter_raw_data_propagates_errors(self, data_lake):
+        """A failing GET is raised to the consumer."""
+        async def fake_get(key):
+            if key == "1":
+                raise RuntimeError("S3 error")
+            return {"key": key}
+
+        with patch.object(data_lake, 'get_raw_data', side_effect=fake_get):
+            with pytest.raises(RuntimeError, match="S3 error"):
+                async for _ in data_lake.iter_raw_data(["0", "1", "2"], concurrency=2):
+                    pass
+
     @pytest.mark.asyncio
     async def test_stream_raw_data_error(self, data_lake, mock_s3_client):
         """Test raw data streaming with error."""
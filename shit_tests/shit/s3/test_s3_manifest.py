@@ -0,0 +1,245 @@
+"""
+Tests for S3Manifest - day-partitioned index of raw S3 objects.
+"""
+
+import io
+from datetime import date, datetime
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from shit.s3.s3_config import S3Config
+from shit.s3.s3_data_lake import S3DataLake
+from shit.s3.s3_manifest import S3Manifest
+from shit.s3.s3_models import S3ManifestEntry
+
+
+class FakeS3:
+    """In-memory stand-in for the boto3 S3 client calls the manifest uses."""
+
+    def __init__(self):
+        self.objects = {}
+        self.list_calls = []
+
+    def put_object(self, Bucket, Key, Body, **kwargs):
+        self.objects[Key] = Body.encode("utf-8") if isinstance(Body, str) else Body
+
+    def get_object(self, Bucket, Key):
+        return {"Body": io.BytesIO(self.objects[Key])}
+
+    def delete_objects(self, Bucket, Delete):
+        for obj in Delete["Objects"]:
+            self.objects.pop(obj["Key"], None)
+
+    def get_paginator(self, name):
+        fake = self
+
+        class Paginator:
+            def paginate(self, Bucket, Prefix):
+                fake.list_calls.append(Prefix)
+                contents = [
+                    {"Key": key, "Size": len(body)}
+                    for key, body in sorted(fake.objects.items())
+                    if key.startswith(Prefix)
+                ]
+                return [{"Contents": contents}] if contents else [{}]
+
+        return Paginator()
+
+
+@pytest.fixture
+def config():
+    return S3Config(bucket_name="test-bucket", prefix="test-prefix")
+
+
+@pytest.fixture
+def fake_s3():
+    return FakeS3()
+
+
+@pytest.fixture
+def manifest(config, fake_s3):
+    return S3Manifest(SimpleNamespace(client=fake_s3), config)
+
+
+def raw_key(day, post_id):
+    return f"test-prefix/raw/{day}/{post_id}.json"
+
+
+def entry(day, post_id, size=100):
+    return S3ManifestEntry(post_id=str(post_id), key=raw_key(day, post_id), size=size)
+
+
+async def build(manifest, fake_s3, raw_objects):
+    """Seed raw objects and rebuild the manifest from them."""
+    for day, post_id in raw_objects:
+        fake_s3.objects[raw_key(day, post_id)] = b"x" * 10
+    return await manifest.rebuild()
+
+
+class TestS3Manifest:
+    @pytest.mark.asyncio
+    async def test_not_built_returns_none(self, manifest, fake_s3):
+        manifest.add(entry("2024/01/15", 1))
+        await manifest.flush()
+
+        assert await manifest.entries() is None
+        assert await manifest.stats() is None
+
+    @pytest.mark.asyncio
+    async def test_flush_writes_one_part_per_day(self, manifest, fake_s3):
+        manifest.add(entry("2024/01/15", 1))
+        manifest.add(entry("2024/01/15", 2))
+        manifest.add(entry("2024/01/16", 3))
+
+        assert await manifest.flush() == 3
+        parts = [k for k in fake_s3.objects if "/part-" in k]
+        assert len(parts) == 2
+        assert manifest.pending_count == 0
+
+    @pytest.mark.asyncio
+    async def test_failed_flush_keeps_entries_pending(self, manifest, fake_s3):
+        manifest.add(entry("2024/01/15", 1))
+        with patch.object(fake_s3, "put_object", side_effect=Exception("S3 down")):
+            assert await manifest.flush() == 0
+
+        assert manifest.pending_count == 1
+
+    @pytest.mark.asyncio
+    async def test_rebuild_indexes_raw_objects(self, manifest, fake_s3):
+        indexed = await build(manifest, fake_s3, [("2024/01/15", 1), ("2024/01/16", 2)])
+
+        assert indexed == 2
+        assert "test-prefix/manifest/_complete.json" in fake_s3.objects
+        assert "test-prefix/manifest/2024/01/15/compacted-1-10.jsonl" in fake_s3.objects
+
+    @pytest.mark.asyncio
+    async def test_entries_merge_parts_newest_first(self, manifest, fake_s3):
+        await build(manifest, fake_s3, [("2024/01/15", 1), ("2024/01/16", 2)])
+        manifest.add(entry("2024/01/16", 3))
+        manifest.add(entry("2024/01/17", 4))
+        await manifest.flush()
+
+        entries = await manifest.entries()
+
+        assert [e.post_id for e in entries] == ["4", "3", "2", "1"]
+
+    @pytest.mark.asyncio
+    async def test_entries_stop_at_until_post_id(self, manifest, fake_s3):
+        await build(manifest, fake_s3, [
+            ("2024/01/14", 1), ("2024/01/15", 2), ("2024/01/16", 3), ("2024/01/16", 4),
+        ])
+        reads = []
+        original = manifest._get_entries
+
+        async def tracking_get(key):
+            reads.append(key)
+            return await original(key)
+
+        with patch.object(manifest, "_get_entries", side_effect=tracking_get):
+            entries = await manifest.entries(until_post_id="3")
+
+        assert [e.post_id for e in entries] == ["4", "3"]
+        assert len(reads) == 1  # Only the newest day partition was read
+
+    @pytest.mark.asyncio
+    async def test_entries_limit_and_start_date(self, manifest, fake_s3):
+        await build(manifest, fake_s3, [("2024/01/15", 1), ("2024/01/15", 2), ("2024/01/16", 3)])
+
+        assert [e.post_id for e in await manifest.entries(limit=2)] == ["3", "2"]
+        day = await manifest.entries(start_date=datetime(2024, 1, 15))
+        assert [e.post_id for e in day] == ["2", "1"]
+
+    @pytest.mark.asyncio
+    async def test_duplicate_post_counted_once(self, manifest, fake_s3):
+        await build(manifest, fake_s3, [("2024/01/15", 1)])
+        manifest.add(entry("2024/01/15", 1, size=10))
+        await manifest.flush()
+
+        assert await manifest.stats() == (1, 10)
+        assert len(await manifest.entries()) == 1
+
+    @pytest.mark.asyncio
+    async def test_compact_merges_closed_days(self, manifest, fake_s3):
+        await build(manifest, fake_s3, [("2024/01/15", 1)])
+        manifest.add(entry("2024/01/15", 2, size=5))
+        manifest.add(entry("2024/01/16", 3, size=7))
+        await manifest.flush()
+
+        compacted = await manifest.compact(before=date(2024, 1, 16))
+
+        assert compacted == 1
+        day_keys = [k for k in fake_s3.objects if "/2024/01/15/" in k and "/manifest/" in k]
+        assert day_keys == ["test-prefix/manifest/2024/01/15/compacted-2-15.jsonl"]
+        assert any("/2024/01/16/part-" in k for k in fake_s3.objects)
+        assert await manifest.stats() == (3, 22)
+
+    @pytest.mark.asyncio
+    async def test_compact_skips_already_compacted_days(self, manifest, fake_s3):
+        await build(manifest, fake_s3, [("2024/01/15", 1)])
+
+        assert await manifest.compact(before=date(2024, 2, 1)) == 0
+
+    @pytest.mark.asyncio
+    async def test_compact_indexes_unflushed_raw_objects(self, manifest, fake_s3):
+        """Raw objects whose entries were lost before a flush are indexed."""
+        await build(manifest, fake_s3, [("2024/01/15", 1)])
+        manifest.add(entry("2024/01/15", 2, size=10))
+        await manifest.flush()
+        # A harvester stored these, then died before flushing their entries
+        for day, post_id in [("2024/01/15", 3), ("2024/01/14", 4), ("2024/01/10", 5)]:
+            fake_s3.objects[raw_key(day, post_id)] = b"x" * 10
+
+        compacted = await manifest.compact(before=date(2024, 1, 16))
+
+        assert compacted == 2
+        assert "test-prefix/manifest/2024/01/15/compacted-3-30.jsonl" in fake_s3.objects
+        assert "test-prefix/manifest/2024/01/14/compacted-1-10.jsonl" in fake_s3.objects
+        # Outside the reconcile window and without parts: left for rebuild
+        assert [e.post_id for e in await manifest.entries()] == ["4", "3", "2", "1"]
+        assert await manifest.stats() == (4, 40)
+
+
+class TestS3DataLakeManifest:
+    @pytest.fixture
+    def data_lake(self, config, fake_s3):
+        lake = S3DataLake(config)
+        lake.s3_client._client = fake_s3
+        return lake
+
+    @pytest.mark.asyncio
+    async def test_store_raw_data_indexes_and_flushes_on_cleanup(self, data_lake, fake_s3):
+        await data_lake.manifest.rebuild()
+        await data_lake.store_raw_data({"id": "42", "created_at": "2024-01-15T12:00:00Z"})
+
+        assert data_lake.manifest.pending_count == 1
+        await data_lake.cleanup()
+
+        assert data_lake.manifest.pending_count == 0
+        assert await data_lake.list_raw_data() == [raw_key("2024/01/15", 42)]
+        stats = await data_lake.get_data_stats()
+        assert stats.total_files == 1
+        assert stats.total_size_bytes == len(fake_s3.objects[raw_key("2024/01/15", 42)])
+
+    @pytest.mark.asyncio
+    async def test_list_raw_data_reads_manifest_not_raw_prefix(self, data_lake, fake_s3):
+        for post_id in (1, 2, 3):
+            fake_s3.objects[raw_key("2024/01/15", post_id)] = b"{}"
+        await data_lake.manifest.rebuild()
+        fake_s3.list_calls.clear()
+
+        keys = await data_lake.list_raw_data(until_post_id="2")
+
+        assert keys == [raw_key("2024/01/15", 3), raw_key("2024/01/15", 2)]
+        assert fake_s3.list_calls == ["test-prefix/manifest/"]
+
+    @pytest.mark.asyncio
+    async def test_list_raw_data_falls_back_to_listing(self, data_lake, fake_s3):
+        for post_id in (1, 2, 3):
+            fake_s3.objects[raw_key("2024/01/15", post_id)] = b"{}"
+
+        keys = await data_lake.list_raw_data(until_post_id="2")
+
+        assert keys == [raw_key("2024/01/15", 3), raw_key("2024/01/15", 2)]
+        assert "test-prefix/raw/" in fake_s3.list_calls
@@ -127,6 +127,27 @@ class TestCreateAnalyzerParser:
         
         assert args.batch_size == 10
 
+    def test_parser_concurrency_default(self):
+        """Test parser concurrency defaults to the setting (None)."""
+        parser = create_analyzer_parser("Test analyzer")
+        args = parser.parse_args([])
+
+        assert args.concurrency is None
+
+    def test_parser_concurrency_custom(self):
+        """Test parser concurrency custom value."""
+        parser = create_analyzer_parser("Test analyzer")
+        args = parser.parse_args(["--concurrency", "8"])
+
+        assert args.concurrency == 8
+
+    def test_parser_batch_api_flag(self):
+        """Test parser batch-api flag defaults off."""
+        parser = create_analyzer_parser("Test analyzer")
+
+        assert parser.parse_args([]).batch_api is False
+        assert parser.parse_args(["--batch-api"]).batch_api is True
+
     def test_parser_dry_run_flag(self):
         """Test parser dry-run flag."""
         parser = create_analyzer_parser("Test analyzer")
@@ -25,6 +25,8 @@ class TestMain:
                 self.end_date = None
                 self.limit = None
                 self.batch_size = 5
+                self.concurrency = None
+                self.batch_api = False
                 self.verbose = False
                 self.dry_run = False
         
@@ -134,6 +136,8 @@ class TestMain:
                 self.end_date = "2024-01-31"
                 self.limit = 100
                 self.batch_size = 10
+                self.concurrency = 8
+                self.batch_api = True
                 self.verbose = True
                 self.dry_run = False
         
@@ -165,7 +169,9 @@ class TestMain:
                 start_date="2024-01-01",
                 end_date="2024-01-31",
                 limit=100,
-                batch_size=10
+                batch_size=10,
+                concurrency=8,
+                batch_api=True
             )
             mock_print_start.assert_called_once_with("range", 100, 10)
 
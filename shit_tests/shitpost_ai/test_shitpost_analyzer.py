@@ -5,6 +5,7 @@ Tests that will break if analyzer functionality changes.
 
 import pytest
 import asyncio
+import json
 from unittest.mock import AsyncMock, patch, MagicMock
 from datetime import datetime
 
@@ -49,6 +50,7 @@ class TestShitpostAnalyzer:
         with patch('shitpost_ai.shitpost_analyzer.settings') as mock_settings:
             mock_settings.DATABASE_URL = "sqlite:///:memory:"
             mock_settings.SYSTEM_LAUNCH_DATE = "2024-01-01"
+            mock_settings.ANALYSIS_CONCURRENCY = 4
             analyzer = ShitpostAnalyzer(
                 mode="incremental",
                 start_date=None,
@@ -331,6 +333,23 @@ class TestShitpostAnalyzer:
             # Should stop when reaching posts before start date
             assert mock_batch.call_count == 0
 
+    def test_log_cache_summary(self, analyzer):
+        """Cache hits and saved latency for the run are logged."""
+        before = {"hits": 2, "misses": 3, "hit_rate": 0.4, "saved_seconds": 4.0}
+        after = {"hits": 5, "misses": 4, "hit_rate": 0.55, "saved_seconds": 10.5}
+        with patch('shitpost_ai.shitpost_analyzer.logger') as mock_logger:
+            analyzer._log_cache_summary(before, after)
+        message = mock_logger.info.call_args[0][0]
+        assert "3/4 hits (75%)" in message
+        assert "~6.5s" in message
+
+    def test_log_cache_summary_no_lookups(self, analyzer):
+        """Nothing is logged when the run made no LLM calls."""
+        stats = {"hits": 1, "misses": 1, "hit_rate": 0.5, "saved_seconds": 1.0}
+        with patch('shitpost_ai.shitpost_analyzer.logger') as mock_logger:
+            analyzer._log_cache_summary(stats, stats)
+        mock_logger.info.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_analyze_batch(self, analyzer, sample_shitpost_data):
         """Test batch analysis."""
@@ -338,19 +357,17 @@ class TestShitpostAnalyzer:
         
         shitposts = [sample_shitpost_data]
         
+        analysis = {'assets': ['TSLA'], 'confidence': 0.85}
         with patch.object(analyzer.prediction_ops, 'check_prediction_exists', new_callable=AsyncMock, return_value=False) as mock_check, \
-             patch.object(analyzer, '_analyze_shitpost', new_callable=AsyncMock) as mock_analyze:
-            
-            mock_analyze.return_value = {
-                'assets': ['TSLA'],
-                'confidence': 0.85
-            }
-            
+             patch.object(analyzer, '_generate_analysis', new_callable=AsyncMock, return_value=analysis) as mock_generate, \
+             patch.object(analyzer, '_commit_analysis', new_callable=AsyncMock, return_value=analysis) as mock_commit:
+
             result = await analyzer._analyze_batch(shitposts, dry_run=False, batch_number=1)
-            
+
             assert result == 1
             mock_check.assert_called_once_with(sample_shitpost_data['shitpost_id'])
-            mock_analyze.assert_called_once_with(sample_shitpost_data, False)
+            mock_generate.assert_called_once_with(sample_shitpost_data)
+            mock_commit.assert_called_once_with(sample_shitpost_data, analysis, False)
 
     @pytest.mark.asyncio
     async def test_analyze_batch_with_duplicate(self, analyzer, sample_shitpost_data):
@@ -372,13 +389,10 @@ class TestShitpostAnalyzer:
         
         shitposts = [sample_shitpost_data]
         
+        bypassed = {'analysis_status': 'bypassed', 'analysis_comment': 'no_text'}
         with patch.object(analyzer.prediction_ops, 'check_prediction_exists', new_callable=AsyncMock, return_value=False) as mock_check, \
-             patch.object(analyzer, '_analyze_shitpost', new_callable=AsyncMock) as mock_analyze:
-            
-            mock_analyze.return_value = {
-                'analysis_status': 'bypassed',
-                'analysis_comment': 'no_text'
-            }
+             patch.object(analyzer, '_generate_analysis', new_callable=AsyncMock, return_value=bypassed), \
+             patch.object(analyzer, '_commit_analysis', new_callable=AsyncMock, return_value=bypassed):
             
             result = await analyzer._analyze_batch(shitposts, dry_run=False, batch_number=1)
             
@@ -392,13 +406,13 @@ class TestShitpostAnalyzer:
         shitposts = [sample_shitpost_data]
         
         with patch.object(analyzer.prediction_ops, 'check_prediction_exists', new_callable=AsyncMock, return_value=False) as mock_check, \
-             patch.object(analyzer, '_analyze_shitpost', new_callable=AsyncMock) as mock_analyze:
-            
-            mock_analyze.return_value = None
-            
+             patch.object(analyzer, '_generate_analysis', new_callable=AsyncMock, return_value=None), \
+             patch.object(analyzer, '_commit_analysis', new_callable=AsyncMock) as mock_commit:
+
             result = await analyzer._analyze_batch(shitposts, dry_run=False, batch_number=1)
-            
+
             assert result == 0
+            mock_commit.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_analyze_batch_missing_id(self, analyzer):
@@ -411,6 +425,125 @@ class TestShitpostAnalyzer:
         
         assert result == 0
 
+    @pytest.mark.asyncio
+    async def test_analyze_batch_runs_llm_calls_concurrently(self, analyzer):
+        """LLM phase overlaps up to the configured concurrency."""
+        analyzer.concurrency = 3
+        shitposts = [{'shitpost_id': f'p{i}', 'text': 'x'} for i in range(6)]
+        in_flight = 0
+        peak = 0
+
+        async def generate(shitpost):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return {'assets': [], 'confidence': 0.5}
+
+        with patch.object(analyzer.prediction_ops, 'check_prediction_exists', new_callable=AsyncMock, return_value=False), \
+             patch.object(analyzer, '_generate_analysis', side_effect=generate), \
+             patch.object(analyzer, '_commit_analysis', new_callable=AsyncMock, side_effect=lambda s, a, d: a):
+
+            result = await analyzer._analyze_batch(shitposts, dry_run=False, batch_number=1)
+
+        assert result == 6
+        assert peak == 3
+
+    @pytest.mark.asyncio
+    async def test_analyze_batch_via_batch_api(self, analyzer, sample_analysis_result):
+        """Batch API mode submits all prompts at once and commits in order."""
+        shitposts = [
+            {'shitpost_id': 'p0', 'text': 'Tesla stock is going up'},
+            {'shitpost_id': 'p1', 'text': ''},
+            {'shitpost_id': 'p2', 'text': 'Tariffs on steel imports'},
+        ]
+        analyzer.batch_client = MagicMock()
+        analyzer.batch_client.run = AsyncMock(return_value={
+            'post-0': json.dumps(sample_analysis_result),
+            'post-2': None,
+        })
+        committed = []
+
+        async def commit(shitpost, analysis, dry_run):
+            committed.append(shitpost['shitpost_id'])
+            return analysis
+
+        def bypass(shitpost):
+            return (not shitpost['text'], "no text")
+
+        with patch.object(analyzer.prediction_ops, 'check_prediction_exists', new_callable=AsyncMock, return_value=False), \
+             patch.object(analyzer.bypass_service, 'should_bypass_post', side_effect=bypass), \
+             patch.object(analyzer, '_pre_extract_tickers', return_value=[]), \
+             patch.object(analyzer.ticker_validator, 'validate_symbols', side_effect=lambda s: s), \
+             patch.object(analyzer, '_generate_analysis', new_callable=AsyncMock) as mock_generate, \
+             patch.object(analyzer, '_commit_analysis', side_effect=commit):
+
+            result = await analyzer._analyze_batch(shitposts, dry_run=False, batch_number=1)
+
+        assert result == 1
+        assert committed == ['p0', 'p1']
+        mock_generate.assert_not_called()
+        prompts = analyzer.batch_client.run.call_args[0][0]
+        assert sorted(prompts) == ['post-0', 'post-2']
+        assert 'Tesla stock is going up' in prompts['post-0']
+
+    def test_batch_api_ignored_in_incremental_mode(self):
+        """Batch API mode only applies to backfill and range runs."""
+        with patch('shitpost_ai.shitpost_analyzer.settings') as mock_settings, \
+             patch('shitpost_ai.shitpost_analyzer.LLMClient'), \
+             patch('shitpost_ai.shitpost_analyzer.LLMBatchClient') as mock_batch_client:
+            mock_settings.ANALYSIS_CONCURRENCY = 4
+            incremental = ShitpostAnalyzer(mode="incremental", batch_api=True)
+            backfill = ShitpostAnalyzer(mode="backfill", batch_api=True)
+
+        assert incremental.batch_client is None
+        assert backfill.batch_client is mock_batch_client.return_value
+
+    @pytest.mark.asyncio
+    async def test_analyze_batch_commits_in_order_one_at_a_time(self, analyzer):
+        """Commits follow batch order even when later LLM calls finish first."""
+        shitposts = [{'shitpost_id': f'p{i}', 'text': 'x'} for i in range(4)]
+        delays = {'p0': 0.04, 'p1': 0.0, 'p2': 0.02, 'p3': 0.0}
+        committed = []
+        committing = False
+
+        async def generate(shitpost):
+            await asyncio.sleep(delays[shitpost['shitpost_id']])
+            return {'assets': [], 'confidence': 0.5}
+
+        async def commit(shitpost, analysis, dry_run):
+            nonlocal committing
+            assert not committing, "commits must not overlap"
+            committing = True
+            await asyncio.sleep(0)
+            committed.append(shitpost['shitpost_id'])
+            committing = False
+            return analysis
+
+        with patch.object(analyzer.prediction_ops, 'check_prediction_exists', new_callable=AsyncMock, return_value=False), \
+             patch.object(analyzer, '_generate_analysis', side_effect=generate), \
+             patch.object(analyzer, '_commit_analysis', side_effect=commit):
+
+            result = await analyzer._analyze_batch(shitposts, dry_run=False, batch_number=1)
+
+        assert result == 4
+        assert committed == ['p0', 'p1', 'p2', 'p3']
+
+    @pytest.mark.asyncio
+    async def test_analyze_batch_commit_error_does_not_stop_batch(self, analyzer):
+        """A failing commit counts as a failure and later posts still commit."""
+        shitposts = [{'shitpost_id': 'p0', 'text': 'x'}, {'shitpost_id': 'p1', 'text': 'x'}]
+        analysis = {'assets': [], 'confidence': 0.5}
+
+        with patch.object(analyzer.prediction_ops, 'check_prediction_exists', new_callable=AsyncMock, return_value=False), \
+             patch.object(analyzer, '_generate_analysis', new_callable=AsyncMock, return_value=analysis), \
+             patch.object(analyzer, '_commit_analysis', new_callable=AsyncMock, side_effect=[Exception("db down"), analysis]):
+
+            result = await analyzer._analyze_batch(shitposts, dry_run=False, batch_number=1)
+
+        assert result == 1
+
     @pytest.mark.asyncio
     async def test_analyze_shitpost_success(self, analyzer, sample_shitpost_data, sample_analysis_result):
         """Test successful shitpost analysis."""
@@ -64,3 +64,38 @@ class TestS3ProcessorWorker:
         mock_processor.process_keys.assert_awaited_once_with(
             ["k1.json", "k2.json"], dry_run=False
         )
+
+    def test_process_events_shares_one_connection(self):
+        """process_events opens DB/S3 once and returns one outcome per event."""
+        worker = S3ProcessorWorker()
+        stats = {"total_processed": 1, "successful": 1, "failed": 0, "skipped": 0}
+        boom = RuntimeError("S3 down")
+
+        mock_processor = MagicMock()
+        mock_processor.process_keys = AsyncMock(side_effect=[stats, boom])
+
+        mock_db_client = MagicMock()
+        mock_db_client.get_session = _async_cm(MagicMock())
+        service_calls = []
+
+        @asynccontextmanager
+        async def mock_service():
+            service_calls.append(1)
+            yield mock_db_client, MagicMock()
+
+        events = [
+            MagicMock(payload={"s3_keys": ["k1.json"], "source": "truth_social"}),
+            MagicMock(payload={"s3_keys": []}),
+            MagicMock(payload={"s3_keys": ["k2.json"]}),
+        ]
+
+        with (
+            patch("shit.services.db_and_s3_service", mock_service),
+            patch("shit.db.DatabaseOperations", MagicMock()),
+            patch("shitvault.s3_processor.S3Processor", return_value=mock_processor),
+        ):
+            outcomes = worker.process_events(events)
+
+        assert worker.batch_mode is True
+        assert len(service_calls) == 1
+        assert outcomes == [stats, {"total_processed": 0, "successful": 0}, boom]
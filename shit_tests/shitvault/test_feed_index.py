@@ -0,0 +1,97 @@
+"""
+Tests for shitvault/feed_index.py - feed_index maintenance.
+"""
+
+from datetime import datetime
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from shit.db.data_models import Base
+from shitvault.feed_index import sync_feed_index
+from shitvault.shitpost_models import FeedIndexEntry, Prediction
+from shitvault.signal_models import Signal
+
+
+@pytest.fixture
+def session():
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(
+        engine,
+        tables=[Signal.__table__, Prediction.__table__, FeedIndexEntry.__table__],
+    )
+    session = sessionmaker(engine)()
+    yield session
+    session.close()
+    engine.dispose()
+
+
+def _add(session, prediction_id, assets=("XLE",), status="completed", confidence=0.7):
+    signal_id = f"sig-{prediction_id}"
+    session.add(
+        Signal(
+            signal_id=signal_id,
+            source="truth_social",
+            text="post",
+            author_username="realDonaldTrump",
+            published_at=datetime(2026, 3, prediction_id),
+        )
+    )
+    session.add(
+        Prediction(
+            id=prediction_id,
+            signal_id=signal_id,
+            analysis_status=status,
+            assets=list(assets) if assets is not None else None,
+            confidence=confidence,
+        )
+    )
+    session.flush()
+
+
+def _index(session):
+    return {
+        row.prediction_id: row
+        for row in session.query(FeedIndexEntry).order_by(FeedIndexEntry.prediction_id)
+    }
+
+
+def test_full_sync_indexes_completed_predictions(session):
+    _add(session, 1)
+    _add(session, 2, assets=[])
+    _add(session, 3, status="pending", confidence=None)
+    _add(session, 4, status="bypassed")
+
+    sync_feed_index(session)
+
+    index = _index(session)
+    assert set(index) == {1, 2}
+    assert index[1].has_assets is True
+    assert index[2].has_assets is False
+    assert index[1].published_at == datetime(2026, 3, 1)
+    assert index[1].signal_id == "sig-1"
+
+
+def test_scoped_sync_touches_only_given_predictions(session):
+    _add(session, 1)
+    _add(session, 2)
+
+    sync_feed_index(session, [2])
+
+    assert set(_index(session)) == {2}
+
+
+def test_sync_updates_and_prunes(session):
+    _add(session, 1)
+    _add(session, 2)
+    sync_feed_index(session)
+
+    session.get(Prediction, 1).assets = []
+    session.get(Prediction, 2).analysis_status = "error"
+    session.flush()
+    sync_feed_index(session, [1, 2])
+
+    index = _index(session)
+    assert set(index) == {1}
+    assert index[1].has_assets is False
@@ -85,6 +85,26 @@ class TestPredictionOperations:
         mock_db_ops.session.commit.assert_called_once()
         mock_db_ops.session.refresh.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_store_analysis_syncs_feed_index(self, prediction_ops, mock_db_ops, sample_analysis_data):
+        """The new prediction's feed_index row is written in the same transaction."""
+        def mock_add(prediction):
+            prediction.id = 7
+
+        mock_db_ops.session.add.side_effect = mock_add
+
+        with patch(
+            'shitvault.prediction_operations.sync_feed_index_async', new_callable=AsyncMock
+        ) as mock_sync:
+            await prediction_ops.store_analysis(
+                content_id='123456789',
+                analysis_data=sample_analysis_data,
+            )
+
+        mock_db_ops.session.flush.assert_awaited_once()
+        mock_sync.assert_awaited_once_with(mock_db_ops.session, [7])
+        mock_db_ops.session.commit.assert_called_once()
+
     @pytest.mark.asyncio
     async def test_store_analysis_without_shitpost_data(self, prediction_ops, mock_db_ops, sample_analysis_data):
         """Test storing analysis without shitpost data."""
@@ -37,7 +37,10 @@ class TestS3Processor:
         """S3Processor instance with mocked dependencies."""
         with patch('shitvault.s3_processor.SignalOperations') as mock_signal_ops_class:
             mock_signal_ops = MagicMock()
-            mock_signal_ops.store_signal = AsyncMock(return_value="1")
+            # Every signal in a batch is newly inserted by default
+            mock_signal_ops.store_signals = AsyncMock(
+                side_effect=lambda signals: [f"sig{i}" for i in range(len(signals))]
+            )
             mock_signal_ops_class.return_value = mock_signal_ops
 
             processor = S3Processor(mock_db_ops, mock_s3_data_lake)
@@ -84,7 +87,7 @@ class TestS3Processor:
         assert result['successful'] == 1
         assert result['failed'] == 0
         assert result['skipped'] == 0
-        s3_processor._mock_signal_ops.store_signal.assert_called_once()
+        s3_processor._mock_signal_ops.store_signals.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_process_s3_to_database_dry_run(self, s3_processor, mock_db_ops, mock_s3_data_lake, sample_s3_data):
@@ -106,8 +109,8 @@ class TestS3Processor:
         assert result['successful'] == 1
         assert result['failed'] == 0
         assert result['skipped'] == 0
-        # In dry run, store_signal should not be called
-        s3_processor._mock_signal_ops.store_signal.assert_not_called()
+        # In dry run, store_signals should not be called
+        s3_processor._mock_signal_ops.store_signals.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_process_s3_to_database_incremental_mode_no_existing(self, s3_processor, mock_db_ops, mock_s3_data_lake, sample_s3_data):
@@ -143,9 +146,14 @@ class TestS3Processor:
             ]
             mock_s3_data_lake.list_raw_data.return_value = s3_keys
 
-            # Mock get_raw_data for new posts
+            # Mock concurrent reads for new posts
             sample_data = {'shitpost_id': 'new_post_001'}
-            mock_s3_data_lake.get_raw_data.return_value = sample_data
+
+            async def mock_iter(keys):
+                for _ in keys:
+                    yield sample_data
+
+            mock_s3_data_lake.iter_raw_data = mock_iter
 
             result = await s3_processor.process_s3_to_database(
                 incremental=True,
@@ -171,6 +179,12 @@ class TestS3Processor:
             # Need to mock list_raw_data too for incremental mode
             mock_s3_data_lake.list_raw_data = AsyncMock(return_value=['shitposts/2024/01/15/new_post_001.json'])
 
+            async def mock_iter(keys):
+                for _ in keys:
+                    yield {'shitpost_id': 'new_post_001'}
+
+            mock_s3_data_lake.iter_raw_data = mock_iter
+
             result = await s3_processor.process_s3_to_database(
                 incremental=True,
                 dry_run=False
@@ -207,8 +221,9 @@ class TestS3Processor:
 
         mock_s3_data_lake.stream_raw_data = mock_stream
 
-        # None from store_signal means integrity error (already exists)
-        s3_processor._mock_signal_ops.store_signal.return_value = None
+        # Nothing inserted means the signal already exists
+        s3_processor._mock_signal_ops.store_signals.side_effect = None
+        s3_processor._mock_signal_ops.store_signals.return_value = []
 
         result = await s3_processor.process_s3_to_database(
             incremental=False,
@@ -227,7 +242,7 @@ class TestS3Processor:
 
         mock_s3_data_lake.stream_raw_data = mock_stream
 
-        s3_processor._mock_signal_ops.store_signal.side_effect = Exception("Storage error")
+        s3_processor._mock_signal_ops.store_signals.side_effect = Exception("Storage error")
 
         result = await s3_processor.process_s3_to_database(
             incremental=False,
@@ -335,50 +350,94 @@ class TestS3Processor:
             await s3_processor.get_s3_processing_stats()
 
     @pytest.mark.asyncio
-    async def test_process_single_s3_data_dry_run(self, s3_processor, mock_db_ops):
-        """Test processing single S3 data in dry run mode."""
+    async def test_store_batch_dry_run(self, s3_processor):
+        """Test storing a batch in dry run mode."""
         stats = {'total_processed': 0, 'successful': 0, 'failed': 0, 'skipped': 0}
 
-        await s3_processor._process_single_s3_data(
-            {'shitpost_id': 'test'},
-            stats,
-            dry_run=True
-        )
+        await s3_processor._store_batch([{'shitpost_id': 'a'}, {'shitpost_id': 'b'}], stats, dry_run=True)
 
-        assert stats['successful'] == 1
-        # In dry run, store_signal should not be called
-        s3_processor._mock_signal_ops.store_signal.assert_not_called()
+        assert stats['successful'] == 2
+        # In dry run, store_signals should not be called
+        s3_processor._mock_signal_ops.store_signals.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_process_single_s3_data_success(self, s3_processor, mock_db_ops):
-        """Test successfully processing single S3 data."""
-        stats = {'total_processed': 0, 'successful': 0, 'failed': 0, 'skipped': 0}
+    async def test_store_batch_counts_inserted_and_existing(self, s3_processor):
+        """One bulk insert per batch; signals that already exist are skipped."""
+        stats = {'total_processed': 0, 'successful': 0, 'failed': 0, 'skipped': 0, 'signal_ids': []}
+        s3_processor._mock_signal_ops.store_signals.side_effect = None
+        s3_processor._mock_signal_ops.store_signals.return_value = ['new_1']
 
-        await s3_processor._process_single_s3_data(
-            {'shitpost_id': 'test'},
-            stats,
-            dry_run=False
-        )
+        await s3_processor._store_batch([{'shitpost_id': 'a'}, {'shitpost_id': 'b'}], stats, dry_run=False)
 
         assert stats['successful'] == 1
-        assert stats['failed'] == 0
-        s3_processor._mock_signal_ops.store_signal.assert_called_once()
+        assert stats['skipped'] == 1
+        assert stats['signal_ids'] == ['new_1']
+        s3_processor._mock_signal_ops.store_signals.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_process_single_s3_data_error(self, s3_processor, mock_db_ops):
-        """Test error handling in _process_single_s3_data."""
+    async def test_store_batch_error(self, s3_processor):
+        """A failed bulk insert marks the whole batch as failed."""
         stats = {'total_processed': 0, 'successful': 0, 'failed': 0, 'skipped': 0}
+        s3_processor._mock_signal_ops.store_signals.side_effect = Exception("Storage error")
 
-        s3_processor._mock_signal_ops.store_signal.side_effect = Exception("Storage error")
-
-        await s3_processor._process_single_s3_data(
-            {'shitpost_id': 'test'},
-            stats,
-            dry_run=False
-        )
+        await s3_processor._store_batch([{'shitpost_id': 'a'}, {'shitpost_id': 'b'}], stats, dry_run=False)
 
         assert stats['successful'] == 0
+        assert stats['failed'] == 2
+
+    @pytest.mark.asyncio
+    async def test_store_batch_isolates_bad_record(self, s3_processor):
+        """A failing batch is split so only the bad record is marked failed."""
+        def store(signals):
+            if any(s['shitpost_id'] == 'bad' for s in signals):
+                raise Exception("NOT NULL constraint failed")
+            return [s['shitpost_id'] for s in signals]
+
+        s3_processor._mock_signal_ops.store_signals.side_effect = store
+        s3_processor._transformer = lambda data: data
+        stats = {'total_processed': 0, 'successful': 0, 'failed': 0, 'skipped': 0, 'signal_ids': []}
+        batch = [{'shitpost_id': sid} for sid in ('a', 'b', 'bad', 'c', 'd')]
+
+        await s3_processor._store_batch(batch, stats, dry_run=False)
+
+        assert stats['successful'] == 4
         assert stats['failed'] == 1
+        assert stats['skipped'] == 0
+        assert stats['signal_ids'] == ['a', 'b', 'c', 'd']
+
+    @pytest.mark.asyncio
+    async def test_load_writes_in_batches(self, mock_db_ops, mock_s3_data_lake):
+        """Records are bulk-inserted at most write_batch_size at a time."""
+        with patch('shitvault.s3_processor.SignalOperations') as mock_signal_ops_class:
+            mock_signal_ops = MagicMock()
+            mock_signal_ops.store_signals = AsyncMock(side_effect=lambda signals: ["x"] * len(signals))
+            mock_signal_ops_class.return_value = mock_signal_ops
+            processor = S3Processor(mock_db_ops, mock_s3_data_lake, write_batch_size=2)
+
+        async def records():
+            for i in range(5):
+                yield {'shitpost_id': f'p{i}'}
+            yield None  # missing object
+
+        stats = {'total_processed': 0, 'successful': 0, 'failed': 0, 'skipped': 0}
+        await processor._load(records(), stats, dry_run=False)
+
+        assert stats['total_processed'] == 6
+        assert stats['successful'] == 5
+        batch_sizes = [len(c.args[0]) for c in mock_signal_ops.store_signals.call_args_list]
+        assert sum(batch_sizes) == 5
+        assert max(batch_sizes) <= 2
+
+    @pytest.mark.asyncio
+    async def test_load_propagates_read_errors(self, s3_processor):
+        """An S3 failure stops the load and is raised to the caller."""
+        async def records():
+            yield {'shitpost_id': 'p0'}
+            raise RuntimeError("S3 exploded")
+
+        stats = {'total_processed': 0, 'successful': 0, 'failed': 0, 'skipped': 0}
+        with pytest.raises(RuntimeError, match="S3 exploded"):
+            await s3_processor._load(records(), stats, dry_run=False)
 
     # --- #191: shared process_keys / _emit_signals_stored ---
 
@@ -386,8 +445,12 @@ class TestS3Processor:
     async def test_process_keys_returns_stats_without_signal_ids(
         self, s3_processor, mock_s3_data_lake, sample_s3_data
     ):
-        """process_keys runs the loop and returns stats with signal_ids popped."""
-        mock_s3_data_lake.get_raw_data = AsyncMock(return_value=sample_s3_data)
+        """process_keys runs the pipeline and returns stats with signal_ids popped."""
+        async def mock_iter(keys):
+            for _ in keys:
+                yield sample_s3_data
+
+        mock_s3_data_lake.iter_raw_data = mock_iter
 
         with patch.object(s3_processor, "_emit_signals_stored") as mock_emit:
             result = await s3_processor.process_keys(["k1.json", "k2.json"], dry_run=False)
@@ -71,6 +71,14 @@ class TestCLIParser:
         
         assert args.command == 'processing-stats'
 
+    def test_parser_s3_manifest_subcommands(self):
+        """Test S3 manifest maintenance subcommands."""
+        parser = create_database_parser()
+        
+        assert parser.parse_args(['rebuild-s3-manifest']).command == 'rebuild-s3-manifest'
+        assert parser.parse_args(['compact-s3-manifest']).command == 'compact-s3-manifest'
+        assert parser.parse_args(['sync-feed-index']).command == 'sync-feed-index'
+
     def test_parser_default_mode(self):
         """Test default mode is incremental."""
         parser = create_database_parser()
@@ -438,6 +446,23 @@ class TestMainFunction:
             
             mock_get_stats.assert_called_once_with(mock_args)
 
+    @pytest.mark.asyncio
+    async def test_main_compact_s3_manifest(self):
+        """Test main with compact-s3-manifest command."""
+        with patch('shitvault.cli.create_database_parser') as mock_parser_class, \
+             patch('shitvault.cli.setup_database_logging'), \
+             patch('shitvault.cli.compact_s3_manifest') as mock_compact:
+            
+            mock_parser = MagicMock()
+            mock_args = MagicMock()
+            mock_args.command = 'compact-s3-manifest'
+            mock_parser.parse_args.return_value = mock_args
+            mock_parser_class.return_value = mock_parser
+            
+            await main()
+            
+            mock_compact.assert_called_once_with(mock_args)
+
     @pytest.mark.asyncio
     async def test_main_unknown_command(self):
         """Test main with unknown command."""
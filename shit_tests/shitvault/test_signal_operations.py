@@ -118,6 +118,85 @@ class TestStoreSignal:
         mock_db_ops.session.rollback.assert_awaited_once()
 
 
+class TestStoreSignals:
+    """Tests for SignalOperations.store_signals against a real SQLite database."""
+
+    @pytest_asyncio.fixture
+    async def ops(self):
+        from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+        from shit.db.data_models import Base
+
+        engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        session = AsyncSession(engine, expire_on_commit=False)
+        mock_db_ops = MagicMock()
+        mock_db_ops.session = session
+        yield SignalOperations(mock_db_ops)
+        await session.close()
+        await engine.dispose()
+
+    @pytest.mark.asyncio
+    async def test_inserts_new_and_skips_existing(self, ops):
+        from sqlalchemy import func, select
+
+        first = await ops.store_signals([_make_signal_data(signal_id="a")])
+        second = await ops.store_signals([
+            _make_signal_data(signal_id="a"),
+            _make_signal_data(signal_id="b"),
+            _make_signal_data(signal_id="b"),
+        ])
+
+        assert first == ["a"]
+        assert second == ["b"]
+        count = await ops.db_ops.session.scalar(select(func.count()).select_from(Signal))
+        assert count == 2
+
+    @pytest.mark.asyncio
+    async def test_missing_fields_take_column_defaults(self, ops):
+        data = _make_signal_data(signal_id="a")
+        for field in ("author_verified", "likes_count", "platform_data"):
+            del data[field]
+
+        await ops.store_signals([data])
+
+        from sqlalchemy import select
+        stored = await ops.db_ops.session.scalar(select(Signal))
+        assert stored.author_verified is False
+        assert stored.likes_count == 0
+        assert stored.platform_data == {}
+        assert stored.created_at is not None
+
+    @pytest.mark.asyncio
+    async def test_s3_batch_with_invalid_row_stores_the_rest(self, ops):
+        """An S3 batch with one NOT NULL violation still stores its neighbours."""
+        from sqlalchemy import select
+        from shitvault.s3_processor import S3Processor
+
+        processor = S3Processor(ops.db_ops, MagicMock())
+        processor.signal_ops = ops
+        processor._transformer = lambda data: data
+        stats = {'total_processed': 0, 'successful': 0, 'failed': 0, 'skipped': 0}
+        batch = [
+            _make_signal_data(signal_id="a"),
+            _make_signal_data(signal_id="bad", author_username=None),
+            _make_signal_data(signal_id="c"),
+        ]
+
+        await processor._store_batch(batch, stats, dry_run=False)
+
+        assert stats['successful'] == 2
+        assert stats['failed'] == 1
+        stored = await ops.db_ops.session.scalars(select(Signal.signal_id))
+        assert sorted(stored.all()) == ["a", "c"]
+
+    @pytest.mark.asyncio
+    async def test_empty_input_does_nothing(self):
+        mock_db_ops = AsyncMock()
+        assert await SignalOperations(mock_db_ops).store_signals([]) == []
+        mock_db_ops.session.execute.assert_not_called()
+
+
 class TestGetUnprocessedSignals:
     """Tests for SignalOperations.get_unprocessed_signals."""
 
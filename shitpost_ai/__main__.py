@@ -45,7 +45,9 @@ async def main():
         start_date=args.start_date,
         end_date=args.end_date,
         limit=args.limit,
-        batch_size=args.batch_size
+        batch_size=args.batch_size,
+        concurrency=args.concurrency,
+        batch_api=args.batch_api
     )
     
     try:
@@ -42,6 +42,17 @@ def create_analyzer_parser(description: str, epilog: str = None) -> argparse.Arg
         default=5,
         help="Number of posts to analyze per batch (default: 5)"
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=None,
+        help="LLM calls in flight per batch (default: ANALYSIS_CONCURRENCY setting)"
+    )
+    parser.add_argument(
+        "--batch-api",
+        action="store_true",
+        help="Submit each batch through the provider's batch API (backfill/range modes)"
+    )
     
     return parser
 
@@ -209,6 +220,9 @@ Examples:
   # Limited backfill with custom batch size
   python -m shitpost_ai --mode backfill --limit 100 --batch-size 10
   
+  # Backfill through the provider's asynchronous batch API
+  python -m shitpost_ai --mode backfill --batch-api --batch-size 500
+  
   # Dry run to see what would be analyzed
   python -m shitpost_ai --mode backfill --limit 10 --dry-run
   
@@ -18,6 +18,9 @@ class AnalyzerWorker(EventWorker):
     """Processes signals_stored events by running LLM analysis."""
 
     consumer_group = ConsumerGroup.ANALYZER
+    # Each event re-scans all unanalyzed posts, so parallel runs would
+    # analyze the same posts twice; LLM calls already overlap per batch.
+    concurrency = 1
 
     def process_event(self, event_type: str, payload: dict) -> dict:
         """Process a signals_stored event.
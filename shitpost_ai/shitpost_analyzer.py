@@ -9,12 +9,13 @@ from typing import Dict, List, Optional
 from datetime import datetime
 
 from shit.config.shitpost_settings import settings
-from shit.llm import LLMClient, ProviderComparator, get_analysis_prompt
+from shit.llm import LLMBatchClient, LLMClient, ProviderComparator, get_analysis_prompt
 from shit.db import DatabaseConfig, DatabaseClient, DatabaseOperations
 from shitvault.signal_operations import SignalOperations
 from shitvault.prediction_operations import PredictionOperations
 from shit.utils.error_handling import handle_exceptions
 from shit.content import BypassService
+from shit.events.tracing import trace_span
 from shit.logging import get_service_logger
 from shit.market_data.auto_backfill_service import auto_backfill_prediction
 from shit.market_data.ticker_validator import TickerValidator
@@ -44,6 +45,8 @@ class ShitpostAnalyzer:
         end_date=None,
         limit=None,
         batch_size=5,
+        concurrency=None,
+        batch_api=False,
     ):
         """Initialize the shitpost analyzer.
 
@@ -53,6 +56,10 @@ class ShitpostAnalyzer:
             end_date: End date for range mode (YYYY-MM-DD)
             limit: Maximum number of posts to analyze (optional)
             batch_size: Number of posts to process in each batch
+            concurrency: LLM calls in flight per batch (default:
+                ANALYSIS_CONCURRENCY setting)
+            batch_api: Submit each batch through the provider's asynchronous
+                batch endpoint (backfill and range modes only)
         """
         # Initialize database components
         self.db_config = DatabaseConfig(database_url=settings.DATABASE_URL)
@@ -75,6 +82,19 @@ class ShitpostAnalyzer:
         self.end_date = end_date
         self.limit = limit
         self.batch_size = batch_size
+        self.concurrency = concurrency or settings.ANALYSIS_CONCURRENCY
+
+        # Batch API mode trades latency for throughput, so it is only
+        # worth it for historical runs
+        self.batch_client: LLMBatchClient | None = None
+        if batch_api:
+            if mode in ("backfill", "range"):
+                self.batch_client = LLMBatchClient(self.llm_client)
+            else:
+                logger.warning(
+                    f"Batch API mode is ignored in {mode} mode "
+                    "(backfill and range only)"
+                )
 
         # Parse dates if provided
         if start_date:
@@ -146,6 +166,9 @@ class ShitpostAnalyzer:
         logger.info("═══════════════════════════════════════════════════════════")
         logger.info(f"Starting shitpost analysis in {self.mode} mode...")
 
+        cache = self.llm_client.response_cache
+        cache_before = cache.stats() if cache else None
+
         if self.mode == "backfill":
             result = await self._analyze_backfill(dry_run)
         elif self.mode == "range":
@@ -158,9 +181,24 @@ class ShitpostAnalyzer:
         logger.info("ANALYSIS COMPLETED")
         logger.info("═══════════════════════════════════════════════════════════")
         logger.info(f"Total posts analyzed: {result}")
+        if cache:
+            self._log_cache_summary(cache_before, cache.stats())
 
         return result
 
+    @staticmethod
+    def _log_cache_summary(before: Dict, after: Dict) -> None:
+        """Log LLM response cache hits and saved call time for this run."""
+        hits = after["hits"] - before["hits"]
+        lookups = hits + after["misses"] - before["misses"]
+        if not lookups:
+            return
+        saved = after["saved_seconds"] - before["saved_seconds"]
+        logger.info(
+            f"LLM cache: {hits}/{lookups} hits ({hits / lookups:.0%}), "
+            f"~{saved:.1f}s of LLM latency saved"
+        )
+
     async def _analyze_backfill(self, dry_run: bool = False) -> int:
         """Analyze all unprocessed shitposts from launch date onwards."""
         logger.info("Starting full backfill analysis of unprocessed shitposts...")
@@ -364,9 +402,34 @@ class ShitpostAnalyzer:
 
     async def _analyze_batch(
         self, shitposts: List[Dict], dry_run: bool = False, batch_number: int = 0
+    ) -> int:
+        """Analyze a batch of shitposts, traced as one ``analysis`` span.
+
+        Args:
+            shitposts: List of shitpost dictionaries
+            dry_run: If True, don't actually store results to database
+            batch_number: Batch number for logging
+
+        Returns:
+            Number of posts successfully analyzed
+        """
+        with trace_span("analysis", posts=len(shitposts), batch=batch_number) as span:
+            analyzed = await self._analyze_batch_posts(shitposts, dry_run, batch_number)
+            span["analyzed"] = analyzed
+        return analyzed
+
+    async def _analyze_batch_posts(
+        self, shitposts: List[Dict], dry_run: bool, batch_number: int
     ) -> int:
         """Analyze a batch of shitposts.
 
+        LLM calls run concurrently (up to ``self.concurrency`` in flight, each
+        also gated by the provider's rate budget), or as a single submission
+        to the provider's batch endpoint in batch API mode. Database work never
+        overlaps: deduplication checks run before any call starts, and
+        results are committed one at a time in the batch's original order
+        as soon as every earlier post has been committed.
+
         Args:
             shitposts: List of shitpost dictionaries
             dry_run: If True, don't actually store results to database
@@ -380,6 +443,7 @@ class ShitpostAnalyzer:
         bypassed_count = 0
         failed_count = 0
 
+        pending: List[tuple] = []  # (position, shitpost) still needing analysis
         for i, shitpost in enumerate(shitposts, 1):
             try:
                 # Check if prediction already exists (deduplication)
@@ -408,36 +472,72 @@ class ShitpostAnalyzer:
                 print(
                     f"🔍 Post {i}/{len(shitposts)}: {shitpost_id} ({post_date}) - {post_text}"
                 )
+                pending.append((i, shitpost))
 
-                # Analyze shitpost
-                analysis = await self._analyze_shitpost(shitpost, dry_run)
+            except Exception as e:
+                failed_count += 1
+                logger.error(
+                    f"❌ Post {i}/{len(shitposts)}: Error analyzing {shitpost.get('shitpost_id', 'unknown')}: {e}"
+                )
 
-                if analysis:
-                    if analysis.get("analysis_status") == "bypassed":
-                        bypassed_count += 1
-                        reason = analysis.get("analysis_comment", "Unknown")
-                        print(
-                            f"⏭️  Post {i}/{len(shitposts)}: {shitpost_id} bypassed - {reason}"
+        if self.batch_client is not None and pending:
+            generated = await self._generate_analyses_via_batch_api(
+                [shitpost for _, shitpost in pending]
+            )
+
+            async def generate(n: int) -> Optional[Dict]:
+                return generated[n]
+
+            tasks = [asyncio.create_task(generate(n)) for n in range(len(pending))]
+        else:
+            semaphore = asyncio.Semaphore(max(1, self.concurrency))
+
+            async def generate(shitpost: Dict) -> Optional[Dict]:
+                async with semaphore:
+                    return await self._generate_analysis(shitpost)
+
+            tasks = [
+                asyncio.create_task(generate(shitpost)) for _, shitpost in pending
+            ]
+        try:
+            for (i, shitpost), task in zip(pending, tasks):
+                shitpost_id = shitpost.get("shitpost_id")
+                try:
+                    analysis = await task
+                    if analysis:
+                        analysis = await self._commit_analysis(
+                            shitpost, analysis, dry_run
                         )
+
+                    if analysis:
+                        if analysis.get("analysis_status") == "bypassed":
+                            bypassed_count += 1
+                            reason = analysis.get("analysis_comment", "Unknown")
+                            print(
+                                f"⏭️  Post {i}/{len(shitposts)}: {shitpost_id} bypassed - {reason}"
+                            )
+                        else:
+                            analyzed_count += 1
+                            assets = analysis.get("assets", [])
+                            confidence = analysis.get("confidence", 0.0)
+                            print(
+                                f"✅ Post {i}/{len(shitposts)}: {shitpost_id} analyzed - Assets: {assets}, Confidence: {confidence:.1%}"
+                            )
                     else:
-                        analyzed_count += 1
-                        assets = analysis.get("assets", [])
-                        confidence = analysis.get("confidence", 0.0)
+                        failed_count += 1
                         print(
-                            f"✅ Post {i}/{len(shitposts)}: {shitpost_id} analyzed - Assets: {assets}, Confidence: {confidence:.1%}"
+                            f"❌ Post {i}/{len(shitposts)}: {shitpost_id} failed to analyze"
                         )
-                else:
+
+                except Exception as e:
                     failed_count += 1
-                    print(
-                        f"❌ Post {i}/{len(shitposts)}: {shitpost_id} failed to analyze"
+                    logger.error(
+                        f"❌ Post {i}/{len(shitposts)}: Error analyzing {shitpost_id or 'unknown'}: {e}"
                     )
-
-            except Exception as e:
-                failed_count += 1
-                logger.error(
-                    f"❌ Post {i}/{len(shitposts)}: Error analyzing {shitpost.get('shitpost_id', 'unknown')}: {e}"
-                )
-                continue
+        finally:
+            # Only reached with unfinished tasks if the batch itself is aborted
+            for task in tasks:
+                task.cancel()
 
         # Summary for this batch
         print(
@@ -458,43 +558,37 @@ class ShitpostAnalyzer:
         Returns:
             Analysis result dictionary or None if failed
         """
+        analysis = await self._generate_analysis(shitpost)
+        if not analysis:
+            return None
+        return await self._commit_analysis(shitpost, analysis, dry_run)
+
+    async def _generate_analysis(self, shitpost: Dict) -> Optional[Dict]:
+        """Produce the analysis for a shitpost without touching the database.
+
+        Runs the bypass check, ticker pre-extraction, fundamentals lookup,
+        the LLM (ensemble or single-model) call and ticker validation. Safe to
+        run concurrently for several posts.
+
+        Args:
+            shitpost: Shitpost dictionary
+
+        Returns:
+            Analysis dictionary (``analysis_status == "bypassed"`` for posts
+            that skip the LLM) or None if failed
+        """
         try:
             shitpost_id = shitpost.get("shitpost_id")
             if not shitpost_id:
                 logger.warning("Shitpost missing ID, cannot analyze")
                 return None
 
-            # Check if post should be bypassed using unified bypass service
-            should_bypass, bypass_reason = self.bypass_service.should_bypass_post(
-                shitpost
-            )
-
-            if should_bypass:
-                logger.info(f"Bypassing shitpost {shitpost_id}: {bypass_reason}")
+            bypassed = self._check_bypass(shitpost)
+            if bypassed:
+                return bypassed
 
-                if not dry_run:
-                    # Create bypassed prediction record
-                    await self.prediction_ops.handle_no_text_prediction(
-                        shitpost_id, shitpost, bypass_reason
-                    )
-
-                return {
-                    "shitpost_id": shitpost_id,
-                    "analysis_status": "bypassed",
-                    "analysis_comment": str(bypass_reason),
-                }
-
-            # Pre-extract tickers and look up fundamentals for richer LLM context
-            likely_tickers = self._pre_extract_tickers(shitpost.get("text", ""))
-            fundamentals = (
-                await asyncio.to_thread(self._lookup_fundamentals, likely_tickers)
-                if likely_tickers
-                else []
-            )
-
-            # Prepare enhanced content for LLM analysis
-            enhanced_content = self._prepare_enhanced_content(
-                shitpost, fundamentals=fundamentals
+            enhanced_content, has_fundamentals = await self._build_llm_content(
+                shitpost
             )
 
             # Analyze with LLM (ensemble or single-model)
@@ -533,31 +627,176 @@ class ShitpostAnalyzer:
                 analysis = await self.llm_client.analyze(
                     enhanced_content,
                     prompt_func=get_analysis_prompt,
-                    has_fundamentals=bool(fundamentals),
+                    has_fundamentals=has_fundamentals,
                 )
 
-            if not analysis:
-                logger.warning(f"LLM analysis failed for shitpost {shitpost_id}")
-                return None
+            return self._finalize_analysis(analysis, shitpost)
 
-            # Enhance analysis with shitpost data
-            enhanced_analysis = self._enhance_analysis_with_shitpost_data(
-                analysis, shitpost
+        except Exception as e:
+            logger.error(
+                f"Error analyzing shitpost {shitpost.get('shitpost_id', 'unknown')}: {e}"
             )
+            return None
+
+    async def _generate_analyses_via_batch_api(
+        self, shitposts: List[Dict]
+    ) -> List[Optional[Dict]]:
+        """Produce analyses for several shitposts with one batch API submission.
+
+        Same steps as ``_generate_analysis`` (bypass, fundamentals, ticker
+        validation), but every LLM prompt goes to the provider's batch
+        endpoint at once. Always single-model: ensemble mode does not apply.
+        Errors from the batch as a whole propagate, so the caller's batch
+        loop stops rather than refetching the same posts.
+
+        Args:
+            shitposts: Shitpost dictionaries, all with IDs
+
+        Returns:
+            Analysis dictionaries (or None if failed), in the order given
+        """
+        analyses: List[Optional[Dict]] = [None] * len(shitposts)
+        prompts: Dict[str, str] = {}
+        contents: Dict[str, str] = {}
+
+        for n, shitpost in enumerate(shitposts):
+            try:
+                bypassed = self._check_bypass(shitpost)
+                if bypassed:
+                    analyses[n] = bypassed
+                    continue
+
+                enhanced_content, has_fundamentals = await self._build_llm_content(
+                    shitpost
+                )
+                # Provider custom IDs only allow [A-Za-z0-9_-]
+                custom_id = f"post-{n}"
+                prompts[custom_id] = get_analysis_prompt(
+                    enhanced_content, has_fundamentals=has_fundamentals
+                )
+                contents[custom_id] = enhanced_content
+            except Exception as e:
+                logger.error(
+                    f"Error preparing shitpost {shitpost.get('shitpost_id', 'unknown')}: {e}"
+                )
+
+        if not prompts:
+            return analyses
+
+        logger.info(f"Submitting {len(prompts)} prompts via the batch API...")
+        responses = await self.batch_client.run(prompts)
+
+        for custom_id, enhanced_content in contents.items():
+            n = int(custom_id.split("-", 1)[1])
+            try:
+                analysis = await self.llm_client.build_analysis(
+                    responses.get(custom_id), enhanced_content
+                )
+                analyses[n] = self._finalize_analysis(analysis, shitposts[n])
+            except Exception as e:
+                logger.error(
+                    f"Error analyzing shitpost {shitposts[n].get('shitpost_id', 'unknown')}: {e}"
+                )
+
+        return analyses
+
+    def _check_bypass(self, shitpost: Dict) -> Optional[Dict]:
+        """Return the bypass analysis for a post that skips the LLM, else None."""
+        shitpost_id = shitpost.get("shitpost_id")
+
+        # Check if post should be bypassed using unified bypass service
+        should_bypass, bypass_reason = self.bypass_service.should_bypass_post(shitpost)
+
+        if not should_bypass:
+            return None
+
+        logger.info(f"Bypassing shitpost {shitpost_id}: {bypass_reason}")
+        return {
+            "shitpost_id": shitpost_id,
+            "analysis_status": "bypassed",
+            "analysis_comment": str(bypass_reason),
+            "bypass_reason": bypass_reason,
+        }
 
-            # Validate and normalize extracted ticker symbols
-            raw_assets = enhanced_analysis.get("assets", [])
-            if raw_assets:
-                validated_assets = self.ticker_validator.validate_symbols(raw_assets)
-                if validated_assets != raw_assets:
-                    logger.info(f"Ticker validation: {raw_assets} → {validated_assets}")
-                enhanced_analysis["assets"] = validated_assets
-                valid_set = set(validated_assets)
-                enhanced_analysis["market_impact"] = {
-                    k: v
-                    for k, v in enhanced_analysis.get("market_impact", {}).items()
-                    if k in valid_set
-                }
+    async def _build_llm_content(self, shitpost: Dict) -> tuple[str, bool]:
+        """Build the LLM input for a post, enriched with ticker fundamentals.
+
+        Returns:
+            Tuple of (enhanced content, whether fundamentals were included)
+        """
+        # Pre-extract tickers and look up fundamentals for richer LLM context
+        likely_tickers = self._pre_extract_tickers(shitpost.get("text", ""))
+        fundamentals = (
+            await asyncio.to_thread(self._lookup_fundamentals, likely_tickers)
+            if likely_tickers
+            else []
+        )
+
+        # Prepare enhanced content for LLM analysis
+        enhanced_content = self._prepare_enhanced_content(
+            shitpost, fundamentals=fundamentals
+        )
+        return enhanced_content, bool(fundamentals)
+
+    def _finalize_analysis(
+        self, analysis: Optional[Dict], shitpost: Dict
+    ) -> Optional[Dict]:
+        """Attach shitpost data to an LLM analysis and validate its tickers."""
+        if not analysis:
+            logger.warning(
+                f"LLM analysis failed for shitpost {shitpost.get('shitpost_id')}"
+            )
+            return None
+
+        # Enhance analysis with shitpost data
+        enhanced_analysis = self._enhance_analysis_with_shitpost_data(
+            analysis, shitpost
+        )
+
+        # Validate and normalize extracted ticker symbols
+        raw_assets = enhanced_analysis.get("assets", [])
+        if raw_assets:
+            validated_assets = self.ticker_validator.validate_symbols(raw_assets)
+            if validated_assets != raw_assets:
+                logger.info(f"Ticker validation: {raw_assets} → {validated_assets}")
+            enhanced_analysis["assets"] = validated_assets
+            valid_set = set(validated_assets)
+            enhanced_analysis["market_impact"] = {
+                k: v
+                for k, v in enhanced_analysis.get("market_impact", {}).items()
+                if k in valid_set
+            }
+
+        return enhanced_analysis
+
+    async def _commit_analysis(
+        self, shitpost: Dict, enhanced_analysis: Dict, dry_run: bool = False
+    ) -> Optional[Dict]:
+        """Store an analysis from ``_generate_analysis`` and run its side effects.
+
+        Writes the prediction (or bypass record), emits prediction_created,
+        embeds the post and triggers reactive backfill. Uses the shared
+        database session, so callers must not run two commits at once.
+
+        Args:
+            shitpost: Shitpost dictionary
+            enhanced_analysis: Analysis dictionary for the shitpost
+            dry_run: If True, don't actually store results to database
+
+        Returns:
+            The analysis dictionary, or None if storing raised
+        """
+        try:
+            shitpost_id = shitpost.get("shitpost_id")
+
+            if enhanced_analysis.get("analysis_status") == "bypassed":
+                bypass_reason = enhanced_analysis.pop("bypass_reason", None)
+                if not dry_run:
+                    # Create bypassed prediction record
+                    await self.prediction_ops.handle_no_text_prediction(
+                        shitpost_id, shitpost, bypass_reason
+                    )
+                return enhanced_analysis
 
             if not dry_run:
                 # Store analysis in database
@@ -5,7 +5,8 @@ Abstract interface for all data source harvesters.
 
 import abc
 import asyncio
-from datetime import datetime
+import uuid
+from datetime import datetime, timezone
 from typing import AsyncGenerator, Dict, Optional, List
 
 from shit.s3 import S3DataLake, S3Config
@@ -73,6 +74,8 @@ class SignalHarvester(abc.ABC):
         # Tracking
         self.api_call_count = 0
         self._start_time: Optional[str] = None
+        # Trace id of the latest harvest(); pass to the posts_harvested event
+        self.correlation_id: Optional[str] = None
 
     # -- Abstract methods (must be implemented by each source) --
 
@@ -169,12 +172,42 @@ class SignalHarvester(abc.ABC):
     async def harvest(self, dry_run: bool = False) -> AsyncGenerator[HarvestResult, None]:
         """Harvest items from the source. Main entry point.
 
+        Starts a new trace: ``self.correlation_id`` is set for the run and a
+        ``harvest`` span is recorded under it when the run ends (see
+        ``shit.events.tracing``).
+
         Args:
             dry_run: If True, do not store to S3.
 
         Yields:
             HarvestResult for each successfully processed item.
         """
+        from shit.events.tracing import record_span
+
+        self.correlation_id = str(uuid.uuid4())
+        started_at = datetime.now(timezone.utc)
+        harvested = 0
+        status = "ok"
+        try:
+            async for result in self._harvest_items(dry_run):
+                harvested += 1
+                yield result
+        except Exception:
+            status = "error"
+            raise
+        finally:
+            if not dry_run:
+                record_span(
+                    "harvest",
+                    self.correlation_id,
+                    started_at,
+                    datetime.now(timezone.utc),
+                    status=status,
+                    attributes={"source": self.get_source_name(), "harvested": harvested},
+                )
+
+    async def _harvest_items(self, dry_run: bool) -> AsyncGenerator[HarvestResult, None]:
+        """Fetch, filter and store items for ``harvest()``."""
         logger.info("")
         logger.info("=" * 59)
         logger.info(f"HARVESTING FROM {self.get_source_name().upper()}")
@@ -262,6 +262,7 @@ async def main():
                         "mode": args.mode,
                     },
                     source_service="harvester",
+                    correlation_id=harvester.correlation_id,
                 )
             except Exception as e:
                 logger.warning(f"Failed to emit posts_harvested event: {e}")
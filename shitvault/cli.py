@@ -11,7 +11,7 @@ from typing import Optional
 
 from shit.utils.error_handling import handle_exceptions
 from shit.db import DatabaseOperations
-from shit.services import db_service, db_and_s3_service
+from shit.services import db_service, db_and_s3_service, s3_service
 from shit.logging import (
     setup_database_logging as setup_centralized_database_logging,
     get_service_logger,
@@ -51,6 +51,15 @@ Examples:
 
   # Get processing statistics
   python -m shitvault processing-stats
+
+  # Index the existing bucket in the S3 manifest (one-off full listing)
+  python -m shitvault rebuild-s3-manifest
+
+  # Merge manifest parts of closed days
+  python -m shitvault compact-s3-manifest
+
+  # Rebuild the /api/feed/at navigation index from predictions
+  python -m shitvault sync-feed-index
         """
     )
     
@@ -70,6 +79,13 @@ Examples:
     # Processing statistics command
     processing_stats_parser = subparsers.add_parser('processing-stats', help='Get S3 and database processing statistics')
     
+    # S3 manifest maintenance commands
+    subparsers.add_parser('rebuild-s3-manifest', help='Index every raw S3 object in the manifest')
+    subparsers.add_parser('compact-s3-manifest', help='Merge S3 manifest parts of days before today')
+
+    # Feed index maintenance
+    subparsers.add_parser('sync-feed-index', help='Rebuild the feed navigation index from predictions')
+    
     return parser
 
 
@@ -217,6 +233,51 @@ async def get_processing_stats(args):
         raise
 
 
+async def rebuild_s3_manifest(args):
+    """Index the whole raw/ prefix in the S3 manifest."""
+    try:
+        print_database_start(args)
+        async with s3_service() as s3_data_lake:
+            indexed = await s3_data_lake.manifest.rebuild()
+            print_database_complete({'indexed_objects': indexed})
+
+    except Exception as e:
+        print_database_error(e)
+        raise
+
+
+async def compact_s3_manifest(args):
+    """Compact the S3 manifest's closed day partitions."""
+    try:
+        print_database_start(args)
+        async with s3_service() as s3_data_lake:
+            compacted = await s3_data_lake.manifest.compact()
+            print_database_complete({'compacted_days': compacted})
+
+    except Exception as e:
+        print_database_error(e)
+        raise
+
+
+async def sync_feed_index_cmd(args):
+    """Rebuild feed_index from predictions."""
+    from sqlalchemy import text
+
+    from shit.db.sync_session import get_session
+    from .feed_index import sync_feed_index
+
+    try:
+        print_database_start(args)
+        with get_session() as session:
+            sync_feed_index(session)
+            indexed = session.execute(text('SELECT COUNT(*) FROM feed_index')).scalar()
+        print_database_complete({'indexed_predictions': indexed})
+
+    except Exception as e:
+        print_database_error(e)
+        raise
+
+
 async def main():
     """Main CLI entry point."""
     parser = create_database_parser()
@@ -237,6 +298,12 @@ async def main():
             await get_database_stats(args)
         elif args.command == 'processing-stats':
             await get_processing_stats(args)
+        elif args.command == 'rebuild-s3-manifest':
+            await rebuild_s3_manifest(args)
+        elif args.command == 'compact-s3-manifest':
+            await compact_s3_manifest(args)
+        elif args.command == 'sync-feed-index':
+            await sync_feed_index_cmd(args)
         else:
             print_error(f"Unknown command: {args.command}")
             parser.print_help()
@@ -18,6 +18,7 @@ class S3ProcessorWorker(EventWorker):
     """Processes posts_harvested events by loading S3 data into the database."""
 
     consumer_group = ConsumerGroup.S3_PROCESSOR
+    batch_mode = True
 
     def process_event(self, event_type: str, payload: dict) -> dict:
         """Process a posts_harvested event.
@@ -50,13 +51,58 @@ class S3ProcessorWorker(EventWorker):
                     db_ops = DatabaseOperations(session)
                     processor = S3Processor(db_ops, s3_data_lake, source=source)
                     # Delegate to the shared path: builds stats, runs the
-                    # get_raw_data -> _process_single_s3_data loop, and emits
-                    # SIGNALS_STORED once (best-effort). No more cross-module
-                    # reach into the private _process_single_s3_data.
+                    # concurrent-read -> bulk-write pipeline, and emits
+                    # SIGNALS_STORED once (best-effort). No cross-module
+                    # reach into the processor's private helpers.
                     return await processor.process_keys(s3_keys, dry_run=False)
 
         return asyncio.run(_process())
 
+    def process_events(self, events: list) -> list:
+        """Process a batch of posts_harvested events over one connection.
+
+        Opens the database and S3 clients once for the whole batch and runs
+        each event's keys through ``S3Processor.process_keys`` in turn, so a
+        backfill burst doesn't pay connection setup per event.
+
+        Args:
+            events: Claimed posts_harvested events.
+
+        Returns:
+            Processing statistics dict (or the exception) per event.
+        """
+        import asyncio
+        from shit.db import DatabaseOperations
+        from shit.events.tracing import correlation_scope
+        from shit.services import db_and_s3_service
+        from shitvault.s3_processor import S3Processor
+
+        async def _process():
+            outcomes = []
+            async with db_and_s3_service() as (db_client, s3_data_lake):
+                async with db_client.get_session() as session:
+                    db_ops = DatabaseOperations(session)
+                    for event in events:
+                        s3_keys = event.payload.get("s3_keys", [])
+                        if not s3_keys:
+                            logger.info("No S3 keys in event payload, skipping")
+                            outcomes.append({"total_processed": 0, "successful": 0})
+                            continue
+                        processor = S3Processor(
+                            db_ops, s3_data_lake,
+                            source=event.payload.get("source", "truth_social"),
+                        )
+                        try:
+                            with correlation_scope(event.correlation_id):
+                                outcomes.append(
+                                    await processor.process_keys(s3_keys, dry_run=False)
+                                )
+                        except Exception as exc:
+                            outcomes.append(exc)
+            return outcomes
+
+        return asyncio.run(_process())
+
 
 def main() -> int:
     """CLI entry point for the S3 processor event consumer."""
@@ -0,0 +1,80 @@
+"""
+Feed Index Maintenance
+Keeps the ``feed_index`` table (FeedIndexEntry) in step with predictions.
+
+``/api/feed/at`` navigates ``feed_index`` by ``(published_at, prediction_id)``
+instead of running the full ``signals JOIN predictions`` with JSON-text
+filters per request. A row exists for every completed prediction with a
+confidence, and ``has_assets`` precomputes the ``assets`` non-empty check.
+
+Writers call ``sync_feed_index`` (or the async variant) with the
+predictions they touched, in the same transaction:
+
+- ``PredictionOperations.store_analysis`` after inserting a prediction;
+- ticker-registry asset rewrites (``remap-tickers``,
+  ``clean-concept-tickers``), which resync everything.
+
+``python -m shitvault sync-feed-index`` rebuilds the whole index.
+"""
+
+from typing import Iterable, List, Optional
+
+from sqlalchemy import bindparam, text
+from sqlalchemy.sql.elements import TextClause
+
+_UPSERT = """
+    INSERT INTO feed_index (prediction_id, signal_id, published_at, has_assets)
+    SELECT
+        p.id,
+        p.signal_id,
+        s.published_at,
+        (p.assets IS NOT NULL AND CAST(p.assets AS TEXT) NOT IN ('[]', 'null'))
+    FROM predictions p
+    JOIN signals s ON s.signal_id = p.signal_id
+    WHERE p.analysis_status = 'completed'
+        AND p.confidence IS NOT NULL
+        {scope}
+    ON CONFLICT (prediction_id) DO UPDATE SET
+        signal_id = excluded.signal_id,
+        published_at = excluded.published_at,
+        has_assets = excluded.has_assets
+"""
+
+_PRUNE = """
+    DELETE FROM feed_index
+    WHERE NOT EXISTS (
+        SELECT 1 FROM predictions p
+        WHERE p.id = feed_index.prediction_id
+            AND p.analysis_status = 'completed'
+            AND p.confidence IS NOT NULL
+    )
+    {scope}
+"""
+
+
+def feed_index_statements(
+    prediction_ids: Optional[Iterable[int]] = None,
+) -> List[TextClause]:
+    """Upsert-then-prune statements syncing *prediction_ids* (default: all)."""
+    if prediction_ids is None:
+        return [text(_UPSERT.format(scope="")), text(_PRUNE.format(scope=""))]
+
+    ids = bindparam("ids", value=list(prediction_ids), expanding=True)
+    return [
+        text(_UPSERT.format(scope="AND p.id IN :ids")).bindparams(ids),
+        text(_PRUNE.format(scope="AND feed_index.prediction_id IN :ids")).bindparams(ids),
+    ]
+
+
+def sync_feed_index(session, prediction_ids: Optional[Iterable[int]] = None) -> None:
+    """Sync feed_index rows for *prediction_ids* (default: all) in *session*."""
+    for statement in feed_index_statements(prediction_ids):
+        session.execute(statement)
+
+
+async def sync_feed_index_async(
+    session, prediction_ids: Optional[Iterable[int]] = None
+) -> None:
+    """``sync_feed_index`` for an AsyncSession."""
+    for statement in feed_index_statements(prediction_ids):
+        await session.execute(statement)
@@ -10,6 +10,7 @@ from sqlalchemy import and_, select
 
 from shit.db.database_operations import DatabaseOperations
 from shit.db.database_utils import DatabaseUtils
+from shitvault.feed_index import sync_feed_index_async
 from shitvault.shitpost_models import Prediction
 from shit.content import BypassService, BypassReason
 
@@ -135,6 +136,8 @@ class PredictionOperations:
             )
 
             self.db_ops.session.add(prediction)
+            await self.db_ops.session.flush()
+            await sync_feed_index_async(self.db_ops.session, [prediction.id])
             await self.db_ops.session.commit()
             await self.db_ops.session.refresh(prediction)
 
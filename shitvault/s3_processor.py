@@ -4,8 +4,8 @@ Domain-specific operations for S3 to database processing.
 Extracted from ShitpostDatabase for modularity.
 """
 
-
-from typing import Dict, Optional, Any, List
+import asyncio
+from typing import Dict, Optional, Any, List, AsyncIterator, Tuple
 from datetime import datetime
 
 from shit.db.database_operations import DatabaseOperations
@@ -20,13 +20,19 @@ from shit.logging.service_loggers import DatabaseLogger
 db_logger = DatabaseLogger("s3_processor")
 logger = db_logger.logger
 
+# Signals per bulk insert; the read-ahead queue holds two batches
+WRITE_BATCH_SIZE = 500
+
+
 class S3Processor:
     """Operations for processing S3 data to database."""
     
-    def __init__(self, db_ops: DatabaseOperations, s3_data_lake: S3DataLake, source: str = "truth_social"):
+    def __init__(self, db_ops: DatabaseOperations, s3_data_lake: S3DataLake, source: str = "truth_social",
+                 write_batch_size: int = WRITE_BATCH_SIZE):
         self.db_ops = db_ops
         self.s3_data_lake = s3_data_lake
         self.source = source
+        self.write_batch_size = max(1, write_batch_size)
         self.signal_ops = SignalOperations(db_ops)
         self._transformer = SignalTransformer.get_transformer(source)
     
@@ -62,8 +68,10 @@ class S3Processor:
                 most_recent_post_id = await self._get_most_recent_post_id()
                 if most_recent_post_id:
                     logger.info(f"Incremental mode: Found most recent post ID: {most_recent_post_id}")
-                    # Get S3 keys and find the cutoff point
-                    s3_keys = await self.s3_data_lake.list_raw_data(start_date, end_date, limit)
+                    # Get S3 keys down to the last loaded post and find the cutoff point
+                    s3_keys = await self.s3_data_lake.list_raw_data(
+                        start_date, end_date, limit, until_post_id=most_recent_post_id
+                    )
                     cutoff_index = await self._find_cutoff_index(s3_keys, most_recent_post_id)
                     if cutoff_index is not None:
                         # Only process keys before the cutoff (newer posts)
@@ -84,7 +92,7 @@ class S3Processor:
             # Process S3 data (use filtered keys if in incremental mode)
             if incremental and most_recent_post_id and 's3_keys' in locals():
                 # Delegate to the shared key-processing path (builds stats, runs
-                # the get_raw_data -> _process_single_s3_data loop, and emits
+                # the concurrent-read -> bulk-write pipeline, and emits
                 # SIGNALS_STORED once via _emit_signals_stored).
                 stats = await self.process_keys(s3_keys, dry_run)
             else:
@@ -96,13 +104,11 @@ class S3Processor:
                     'skipped': 0,
                     'signal_ids': [],
                 }
-                async for s3_data in self.s3_data_lake.stream_raw_data(start_date, end_date, limit):
-                    stats['total_processed'] += 1
-                    await self._process_single_s3_data(s3_data, stats, dry_run)
-
-                # Log progress (less frequently)
-                if stats['total_processed'] % 500 == 0:
-                    logger.info(f"Processed {stats['total_processed']} records...")
+                await self._load(
+                    self.s3_data_lake.stream_raw_data(start_date, end_date, limit),
+                    stats,
+                    dry_run,
+                )
 
                 # Emit once for the streamed signals (shared best-effort helper).
                 signal_ids = stats.pop('signal_ids', [])
@@ -132,11 +138,13 @@ class S3Processor:
 
         Single shared entry point for both the incremental branch of
         process_s3_to_database and the event-driven S3ProcessorWorker, so the
-        stats-building + get_raw_data -> _process_single_s3_data loop + event
-        emission live in exactly one place (no cross-module reach into the
-        private _process_single_s3_data). Handles an empty key list gracefully
-        (returns a zeroed stats dict and emits nothing).
+        stats-building + read/write pipeline + event emission live in exactly
+        one place (no cross-module reach into the private _load). Handles an
+        empty key list gracefully (returns a zeroed stats dict and emits
+        nothing).
         """
+        from shit.events.tracing import trace_span
+
         stats = {
             'total_processed': 0,
             'successful': 0,
@@ -144,14 +152,12 @@ class S3Processor:
             'skipped': 0,
             'signal_ids': [],
         }
-        for s3_key in s3_keys:
-            stats['total_processed'] += 1
-            s3_data = await self.s3_data_lake.get_raw_data(s3_key)
-            if s3_data:
-                await self._process_single_s3_data(s3_data, stats, dry_run)
-
-        signal_ids = stats.pop('signal_ids', [])
-        self._emit_signals_stored(signal_ids, dry_run)
+        with trace_span("s3_processor", keys=len(s3_keys)) as span:
+            await self._load(self.s3_data_lake.iter_raw_data(s3_keys), stats, dry_run)
+
+            signal_ids = stats.pop('signal_ids', [])
+            self._emit_signals_stored(signal_ids, dry_run)
+            span["signals_stored"] = len(signal_ids)
         return stats
 
     def _emit_signals_stored(self, signal_ids, dry_run: bool = False) -> None:
@@ -227,36 +233,112 @@ class S3Processor:
             logger.error(f"Error finding cutoff index: {e}")
             return None
     
-    async def _process_single_s3_data(self, s3_data: Dict, stats: Dict, dry_run: bool):
-        """Process a single S3 data record.
-        
+    async def _load(self, records: AsyncIterator[Optional[Dict]], stats: Dict, dry_run: bool) -> None:
+        """Pipe S3 records into batched database writes.
+
+        A reader task drains *records* (fetched with concurrent GETs by the
+        data lake) into a bounded queue while this coroutine bulk-inserts
+        what has arrived, so S3 reads and database writes overlap. A batch
+        is written once it is full or the reader has nothing more ready.
+
         Args:
-            s3_data: S3 data to process
+            records: Raw S3 data per object (None for a missing object)
             stats: Statistics dictionary to update
             dry_run: If True, don't actually store to database
         """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=2 * self.write_batch_size)
+        done = object()
+
+        async def read():
+            try:
+                async for s3_data in records:
+                    await queue.put(s3_data)
+            finally:
+                await queue.put(done)
+
+        reader = asyncio.create_task(read())
         try:
-            if dry_run:
-                # In dry run, just count what would be processed
-                stats['successful'] += 1
-            else:
-                # Transform using source-specific transformer and store in signals table
-                signal_data = self._transformer(s3_data)
-                result = await self.signal_ops.store_signal(signal_data)
-
-                if result:
-                    stats['successful'] += 1
-                    # Collect signal_id for event emission
-                    signal_id = signal_data.get("signal_id")
-                    if signal_id and 'signal_ids' in stats:
-                        stats['signal_ids'].append(signal_id)
-                else:
-                    stats['skipped'] += 1  # Already exists
+            batch: List[Dict] = []
+            while True:
+                s3_data = await queue.get()
+                if s3_data is done:
+                    break
+                stats['total_processed'] += 1
+                if s3_data:
+                    batch.append(s3_data)
+                if batch and (len(batch) >= self.write_batch_size or queue.empty()):
+                    await self._store_batch(batch, stats, dry_run)
+                    batch = []
+
+                # Log progress (less frequently)
+                if stats['total_processed'] % 500 == 0:
+                    logger.info(f"Processed {stats['total_processed']} records...")
 
+            if batch:
+                await self._store_batch(batch, stats, dry_run)
+            # Re-raise S3 errors from the reader
+            await reader
+        finally:
+            reader.cancel()
+
+    async def _store_batch(self, batch: List[Dict], stats: Dict, dry_run: bool) -> None:
+        """Transform and bulk-store a batch of S3 records.
+
+        Args:
+            batch: S3 data records to store
+            stats: Statistics dictionary to update
+            dry_run: If True, don't actually store to database
+        """
+        if dry_run:
+            # In dry run, just count what would be processed
+            stats['successful'] += len(batch)
+            return
+
+        signals = []
+        for s3_data in batch:
+            try:
+                # Transform using source-specific transformer
+                signals.append(self._transformer(s3_data))
+            except Exception as e:
+                logger.error(f"Error processing S3 data: {e}")
+                stats['failed'] += 1
+
+        if not signals:
+            return
+
+        inserted, failed = await self._store_signals_isolating(signals)
+
+        stats['successful'] += len(inserted)
+        stats['failed'] += failed
+        stats['skipped'] += len(signals) - len(inserted) - failed  # Already exist
+        if 'signal_ids' in stats:
+            # Collect signal_ids for event emission
+            stats['signal_ids'].extend(inserted)
+
+    async def _store_signals_isolating(
+        self, signals: List[Dict]
+    ) -> Tuple[List[str], int]:
+        """Bulk-store signals, bisecting a failed batch so one bad record fails alone.
+
+        Returns:
+            Newly inserted signal_ids and the number of signals that could
+            not be stored.
+        """
+        try:
+            return await self.signal_ops.store_signals(signals), 0
         except Exception as e:
-            logger.error(f"Error processing S3 data: {e}")
-            stats['failed'] += 1
-    
+            if len(signals) == 1:
+                logger.error(f"Error storing signal {signals[0].get('signal_id')}: {e}")
+                return [], 1
+            logger.warning(
+                f"Bulk insert of {len(signals)} signals failed, splitting batch: {e}"
+            )
+
+        mid = len(signals) // 2
+        left, left_failed = await self._store_signals_isolating(signals[:mid])
+        right, right_failed = await self._store_signals_isolating(signals[mid:])
+        return left + right, left_failed + right_failed
+
     async def get_s3_processing_stats(self) -> Dict[str, any]:
         """Get statistics about S3 and database data.
         
@@ -183,6 +183,27 @@ class Prediction(Base, IDMixin, TimestampMixin):
         return f"<Prediction(id={self.id}, confidence={self.confidence}, assets={self.assets})>"
 
 
+class FeedIndexEntry(Base):
+    """Narrow keyset index over feed-eligible predictions for /api/feed/at.
+
+    One row per completed prediction with a confidence, keyed by the source
+    post's publish time. Kept in sync by shitvault/feed_index.py whenever
+    predictions are stored or their assets rewritten.
+    """
+
+    __tablename__ = "feed_index"
+
+    prediction_id = Column(
+        Integer, ForeignKey("predictions.id", ondelete="CASCADE"), primary_key=True
+    )
+    signal_id = Column(String(255), nullable=False)
+    published_at = Column(DateTime, nullable=False)
+    has_assets = Column(Boolean, nullable=False, default=False)
+
+    def __repr__(self):
+        return f"<FeedIndexEntry(prediction_id={self.prediction_id}, published_at={self.published_at})>"
+
+
 # TelegramSubscription moved to notifications/models.py — re-export for compatibility
 from notifications.models import TelegramSubscription  # noqa: F401
 
@@ -203,3 +224,11 @@ def prediction_to_dict(prediction: Prediction) -> Dict[str, Any]:
 Index("idx_predictions_signal_id", Prediction.signal_id)
 Index("idx_predictions_analysis_status", Prediction.analysis_status)
 Index("idx_predictions_created_at", Prediction.created_at)
+
+# Feed order for keyset navigation; partial so only posts with assets are scanned
+Index(
+    "ix_feed_index_feed_order",
+    FeedIndexEntry.published_at,
+    FeedIndexEntry.prediction_id,
+    postgresql_where=FeedIndexEntry.has_assets,
+)
@@ -6,6 +6,8 @@ Source-agnostic operations for managing signals from any platform.
 from typing import Dict, List, Optional, Any
 from datetime import datetime
 from sqlalchemy import select, and_, not_, exists
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.exc import IntegrityError
 
 from shit.db.database_operations import DatabaseOperations
@@ -17,6 +19,9 @@ from shit.logging.service_loggers import DatabaseLogger
 db_logger = DatabaseLogger("signal_operations")
 logger = db_logger.logger
 
+# ~25 bind parameters per row keeps a statement under SQLite's 32766 limit
+SIGNALS_PER_STATEMENT = 500
+
 
 class SignalOperations:
     """CRUD operations for source-agnostic signals."""
@@ -64,6 +69,56 @@ class SignalOperations:
             )
             raise
 
+    async def store_signals(self, signals: List[Dict[str, Any]]) -> List[str]:
+        """Bulk-store signals, skipping any whose signal_id already exists.
+
+        Writes go through multi-row ``INSERT ... ON CONFLICT (signal_id)
+        DO NOTHING`` statements and a single commit, so no existence check
+        is needed per signal.
+
+        Args:
+            signals: Dictionaries matching Signal model fields.
+
+        Returns:
+            signal_ids of the newly inserted signals, in input order.
+        """
+        rows = _signal_rows(signals)
+        if not rows:
+            return []
+
+        session = self.db_ops.session
+        dialect = session.get_bind().dialect.name
+        if dialect == "postgresql":
+            insert_fn = pg_insert
+        elif dialect == "sqlite":
+            insert_fn = sqlite_insert
+        else:
+            raise ValueError(f"Bulk signal insert is not supported on {dialect!r}")
+
+        table = Signal.__table__
+        inserted = set()
+        try:
+            for i in range(0, len(rows), SIGNALS_PER_STATEMENT):
+                stmt = (
+                    insert_fn(table)
+                    .values(rows[i : i + SIGNALS_PER_STATEMENT])
+                    .on_conflict_do_nothing(index_elements=["signal_id"])
+                    .returning(table.c.signal_id)
+                )
+                result = await session.execute(stmt)
+                inserted.update(result.scalars().all())
+            await session.commit()
+        except Exception as e:
+            await session.rollback()
+            logger.error(f"Error bulk-storing {len(rows)} signals: {e}")
+            raise
+
+        logger.info(
+            f"Stored {len(inserted)}/{len(rows)} signals "
+            f"({len(rows) - len(inserted)} already existed)"
+        )
+        return [row["signal_id"] for row in rows if row["signal_id"] in inserted]
+
     async def get_unprocessed_signals(
         self,
         launch_date: str,
@@ -202,3 +257,30 @@ class SignalOperations:
         except Exception as e:
             logger.error(f"Error retrieving unprocessed signals: {e}")
             raise
+
+
+def _signal_rows(signals: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Build insert rows with every Signal column, one per signal_id.
+
+    A multi-row VALUES clause needs the same keys in every row, so missing
+    fields take the column's Python-side default (or None).
+    """
+    columns = [c for c in Signal.__table__.columns if c.name != "id"]
+    rows: Dict[str, Dict[str, Any]] = {}
+    for data in signals:
+        signal_id = data.get("signal_id")
+        if not signal_id or signal_id in rows:
+            continue
+        row = {}
+        for column in columns:
+            if column.name in data:
+                row[column.name] = data[column.name]
+            elif column.default is None:
+                row[column.name] = None
+            elif column.default.is_scalar:
+                row[column.name] = column.default.arg
+            else:
+                # SQLAlchemy wraps callable defaults to take an execution context
+                row[column.name] = column.default.arg(None)
+        rows[signal_id] = row
+    return list(rows.values())